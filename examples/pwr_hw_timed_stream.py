@@ -1,8 +1,6 @@
 """Examples for hw timed power stream operation."""
 import pprint
 
-import numpy
-
 import nidaqmx
 from nidaqmx.constants import AcquisitionType, PowerIdleOutputBehavior, Sense
 from nidaqmx.stream_readers import PowerSingleChannelReader
@@ -30,26 +28,18 @@ with nidaqmx.Task() as task:
 
     task.timing.cfg_samp_clk_timing(sample_rate, sample_mode=AcquisitionType.CONTINUOUS)
 
-    stream = PowerSingleChannelReader(task.in_stream)
-    voltage_data = numpy.zeros(number_of_samples_per_channel, dtype=numpy.float64)
-    current_data = numpy.zeros(number_of_samples_per_channel, dtype=numpy.float64)
-
     task.start()
 
     try:
         print("Press Ctrl+C to stop")
-        while True:
+        for voltage_data, current_data in task.in_stream.iter_chunks(
+            number_of_samples_per_channel, reader_cls=PowerSingleChannelReader
+        ):
             # Note: at runtime, you can write the following channel attributes:
             # * pwr_voltage_setpoint
             # * pwr_current_setpoint
             # * pwr_output_enable
 
-            stream.read_many_sample(
-                voltage_data,
-                current_data,
-                number_of_samples_per_channel=number_of_samples_per_channel,
-            )
-
             print(f"Voltage Data:")
             pp.pprint(voltage_data)
 
@@ -0,0 +1,41 @@
+class AttributeCache:
+    """
+    Caches the values of attributes that do not change while a device is
+    present.
+
+    Values are keyed by the arguments of the interpreter getter, such as
+    the device or physical channel name and the attribute ID, so a cache
+    can be shared by a device and its physical channels.
+    """
+    __slots__ = ['_values']
+
+    def __init__(self):
+        self._values = {}
+
+    def clear(self):
+        """
+        Discards the cached values.
+        """
+        self._values.clear()
+
+    def get(self, getter, *args):
+        """
+        Returns the cached value for args, calling getter(*args) if
+        necessary.
+        """
+        try:
+            val = self._values[args]
+        except KeyError:
+            val = getter(*args)
+            self._values[args] = val
+        # Callers may modify the lists that the getters return.
+        return list(val) if isinstance(val, list) else val
+
+
+def get_cached_attribute(attribute_cache, getter, *args):
+    """
+    Returns getter(*args), using attribute_cache unless it is None.
+    """
+    if attribute_cache is None:
+        return getter(*args)
+    return attribute_cache.get(getter, *args)
@@ -1,12 +1,17 @@
 # Do not edit this file; it was automatically generated.
 
 from __future__ import annotations
+import collections
+import concurrent.futures
+import contextlib
+import functools
 import logging
 import threading
 import typing
 import warnings
 from typing import Callable, Generic, Optional, TypeVar
 
+import google.protobuf.descriptor
 import google.protobuf.message
 import grpc
 import numpy
@@ -20,6 +25,9 @@ from nidaqmx.error_codes import DAQmxErrors
 
 _logger = logging.getLogger(__name__)
 
+# The maximum number of calls that call_concurrently() has in flight at once.
+_MAX_CONCURRENT_CALLS = 16
+
 _UNABLE_TO_LOCATE_ERROR_RESOURCES_ERROR_MESSAGE = (
     "Error code could not be found. Reinstalling the driver might fix the issue. "
     "Otherwise, contact National Instruments technical support."
@@ -76,19 +84,140 @@ class GrpcEventHandler(BaseEventHandler, Generic[TEventResponse]):
             return
 
 
+class _GrpcCallBatch:
+    """
+    Sends batched calls without waiting for their responses.
+
+    Calls that target the same task and channel (or devices, or watchdog
+    lines) are sent one after another, in the order they were added, so that
+    the server applies them in that order. Calls that target different
+    channels are in flight at the same time.
+    """
+    __slots__ = [
+        "_lock",
+        "_idle",
+        "_calls",
+        "_pending_calls",
+    ]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # All calls in the order they were added. Each call is [func, request, rpc_error].
+        self._calls: typing.List[list] = []
+        # For each target with a call in flight, the calls waiting to be sent.
+        self._pending_calls: typing.Dict[tuple, typing.Deque[list]] = {}
+
+    def add(self, func, request) -> None:
+        target = _get_batch_target(request)
+        call = [func, request, None]
+        with self._lock:
+            self._calls.append(call)
+            pending_calls = self._pending_calls.get(target)
+            if pending_calls is not None:
+                pending_calls.append(call)
+                return
+            self._pending_calls[target] = collections.deque()
+        self._send(target, call)
+
+    def wait(self) -> Optional[grpc.RpcError]:
+        """Waits for the calls to complete and returns the error from the first failed call."""
+        with self._idle:
+            while self._pending_calls:
+                self._idle.wait()
+            calls, self._calls = self._calls, []
+        for _, _, rpc_error in calls:
+            if rpc_error is not None:
+                return rpc_error
+        return None
+
+    def _send(self, target, call) -> None:
+        func, request, _ = call
+        future = func.future(request)
+        future.add_done_callback(functools.partial(self._on_done, target, call))
+
+    def _on_done(self, target, call, future) -> None:
+        call[2] = future.exception()
+        with self._lock:
+            pending_calls = self._pending_calls[target]
+            if call[2] is None and pending_calls:
+                next_call = pending_calls.popleft()
+            else:
+                # Do not send the remaining calls for this target because they may depend on the
+                # failed call. wait() reports the first error, which precedes them.
+                del self._pending_calls[target]
+                self._idle.notify_all()
+                return
+        self._send(target, next_call)
+
+
+def _get_batch_target(request) -> tuple:
+    """Returns the task and the channel, devices, or watchdog lines that the request targets."""
+    target = [request.task.name]
+    for field_name in ("channel", "device_names", "lines"):
+        if field_name in request.DESCRIPTOR.fields_by_name:
+            target.append(getattr(request, field_name))
+    return tuple(target)
+
+
 class GrpcStubInterpreter(BaseInterpreter):
     '''Interpreter for interacting with a gRPC Stub class'''
     # Do not add per-task state to the interpreter class.
     __slots__ = [
         '_grpc_options',
         '_client',
+        '_batch_state',
+        '_executor_lock',
+        '_executor',
     ]
 
     def __init__(self, grpc_options):
         self._grpc_options = grpc_options
         self._client = nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_channel)
+        # Batches are per thread, so other threads using this interpreter are not affected.
+        self._batch_state = threading.local()
+        self._executor_lock = threading.Lock()
+        # Created by the first call_concurrently() call and shut down by close().
+        self._executor = None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Batches attribute setter and resetter calls made by this thread.
+
+        Within the context, batched calls are sent without waiting for their
+        responses. Any other call waits for the batched calls to complete
+        first. Errors from batched calls are raised by the next call that
+        waits, or when the context exits.
+        """
+        if getattr(self._batch_state, "batch", None) is not None:
+            yield
+            return
+        batch = _GrpcCallBatch()
+        self._batch_state.batch = batch
+        try:
+            yield
+            self._wait_for_batch()
+        finally:
+            batch.wait()
+            self._batch_state.batch = None
+
+    def _wait_for_batch(self):
+        batch = getattr(self._batch_state, "batch", None)
+        if batch is not None:
+            rpc_error = batch.wait()
+            if rpc_error is not None:
+                self._handle_rpc_error(rpc_error)
+
+    def _invoke_batchable(self, func, request):
+        batch = getattr(self._batch_state, "batch", None)
+        if batch is None:
+            self._invoke(func, request)
+        else:
+            batch.add(func, request)
 
     def _invoke(self, func, request, metadata=None):
+        self._wait_for_batch()
         try:
             response = func(request, metadata=metadata)
         except grpc.RpcError as rpc_error:
@@ -2685,12 +2814,12 @@ class GrpcStubInterpreter(BaseInterpreter):
                 override_reservation=override_reservation))
 
     def reset_buffer_attribute(self, task, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetBufferAttribute,
             grpc_types.ResetBufferAttributeRequest(task=task, attribute_raw=attribute))
 
     def reset_chan_attribute(self, task, channel, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetChanAttribute,
             grpc_types.ResetChanAttributeRequest(
                 task=task, channel=channel, attribute_raw=attribute))
@@ -2701,39 +2830,39 @@ class GrpcStubInterpreter(BaseInterpreter):
             grpc_types.ResetDeviceRequest(device_name=device_name))
 
     def reset_exported_signal_attribute(self, task, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetExportedSignalAttribute,
             grpc_types.ResetExportedSignalAttributeRequest(task=task, attribute_raw=attribute))
 
     def reset_read_attribute(self, task, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetReadAttribute,
             grpc_types.ResetReadAttributeRequest(task=task, attribute_raw=attribute))
 
     def reset_timing_attribute(self, task, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetTimingAttribute,
             grpc_types.ResetTimingAttributeRequest(task=task, attribute_raw=attribute))
 
     def reset_timing_attribute_ex(self, task, device_names, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetTimingAttributeEx,
             grpc_types.ResetTimingAttributeExRequest(
                 task=task, device_names=device_names, attribute_raw=attribute))
 
     def reset_trig_attribute(self, task, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetTrigAttribute,
             grpc_types.ResetTrigAttributeRequest(task=task, attribute_raw=attribute))
 
     def reset_watchdog_attribute(self, task, lines, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetWatchdogAttribute,
             grpc_types.ResetWatchdogAttributeRequest(
                 task=task, lines=lines, attribute_raw=attribute))
 
     def reset_write_attribute(self, task, attribute):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.ResetWriteAttribute,
             grpc_types.ResetWriteAttributeRequest(task=task, attribute_raw=attribute))
 
@@ -2782,48 +2911,48 @@ class GrpcStubInterpreter(BaseInterpreter):
                 channel_type_array=channel_type_array))
 
     def set_buffer_attribute_uint32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetBufferAttributeUInt32,
             grpc_types.SetBufferAttributeUInt32Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_chan_attribute_bool(self, task, channel, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetChanAttributeBool,
             grpc_types.SetChanAttributeBoolRequest(
                 task=task, channel=channel, attribute_raw=attribute,
                 value=value))
 
     def set_chan_attribute_double(self, task, channel, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetChanAttributeDouble,
             grpc_types.SetChanAttributeDoubleRequest(
                 task=task, channel=channel, attribute_raw=attribute,
                 value=value))
 
     def set_chan_attribute_double_array(self, task, channel, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetChanAttributeDoubleArray,
             grpc_types.SetChanAttributeDoubleArrayRequest(
                 task=task, channel=channel, attribute_raw=attribute,
                 value=value))
 
     def set_chan_attribute_int32(self, task, channel, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetChanAttributeInt32,
             grpc_types.SetChanAttributeInt32Request(
                 task=task, channel=channel, attribute_raw=attribute,
                 value_raw=value))
 
     def set_chan_attribute_string(self, task, channel, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetChanAttributeString,
             grpc_types.SetChanAttributeStringRequest(
                 task=task, channel=channel, attribute_raw=attribute,
                 value=value))
 
     def set_chan_attribute_uint32(self, task, channel, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetChanAttributeUInt32,
             grpc_types.SetChanAttributeUInt32Request(
                 task=task, channel=channel, attribute_raw=attribute,
@@ -2857,67 +2986,67 @@ class GrpcStubInterpreter(BaseInterpreter):
                 pull_up_pull_down_states=pull_up_pull_down_states))
 
     def set_exported_signal_attribute_bool(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetExportedSignalAttributeBool,
             grpc_types.SetExportedSignalAttributeBoolRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_exported_signal_attribute_double(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetExportedSignalAttributeDouble,
             grpc_types.SetExportedSignalAttributeDoubleRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_exported_signal_attribute_int32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetExportedSignalAttributeInt32,
             grpc_types.SetExportedSignalAttributeInt32Request(
                 task=task, attribute_raw=attribute, value_raw=value))
 
     def set_exported_signal_attribute_string(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetExportedSignalAttributeString,
             grpc_types.SetExportedSignalAttributeStringRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_exported_signal_attribute_uint32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetExportedSignalAttributeUInt32,
             grpc_types.SetExportedSignalAttributeUInt32Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_read_attribute_bool(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetReadAttributeBool,
             grpc_types.SetReadAttributeBoolRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_read_attribute_double(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetReadAttributeDouble,
             grpc_types.SetReadAttributeDoubleRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_read_attribute_int32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetReadAttributeInt32,
             grpc_types.SetReadAttributeInt32Request(
                 task=task, attribute_raw=attribute, value_raw=value))
 
     def set_read_attribute_string(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetReadAttributeString,
             grpc_types.SetReadAttributeStringRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_read_attribute_uint32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetReadAttributeUInt32,
             grpc_types.SetReadAttributeUInt32Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_read_attribute_uint64(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetReadAttributeUInt64,
             grpc_types.SetReadAttributeUInt64Request(
                 task=task, attribute_raw=attribute, value=value))
@@ -2948,20 +3077,20 @@ class GrpcStubInterpreter(BaseInterpreter):
                 scale_name=scale_name, attribute_raw=attribute, value=value))
 
     def set_timing_attribute_bool(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeBool,
             grpc_types.SetTimingAttributeBoolRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_timing_attribute_double(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeDouble,
             grpc_types.SetTimingAttributeDoubleRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_timing_attribute_ex_bool(
             self, task, device_names, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeExBool,
             grpc_types.SetTimingAttributeExBoolRequest(
                 task=task, device_names=device_names, attribute_raw=attribute,
@@ -2969,7 +3098,7 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def set_timing_attribute_ex_double(
             self, task, device_names, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeExDouble,
             grpc_types.SetTimingAttributeExDoubleRequest(
                 task=task, device_names=device_names, attribute_raw=attribute,
@@ -2977,7 +3106,7 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def set_timing_attribute_ex_int32(
             self, task, device_names, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeExInt32,
             grpc_types.SetTimingAttributeExInt32Request(
                 task=task, device_names=device_names, attribute_raw=attribute,
@@ -2985,7 +3114,7 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def set_timing_attribute_ex_string(
             self, task, device_names, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeExString,
             grpc_types.SetTimingAttributeExStringRequest(
                 task=task, device_names=device_names, attribute_raw=attribute,
@@ -2993,7 +3122,7 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def set_timing_attribute_ex_uint32(
             self, task, device_names, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeExUInt32,
             grpc_types.SetTimingAttributeExUInt32Request(
                 task=task, device_names=device_names, attribute_raw=attribute,
@@ -3001,135 +3130,135 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def set_timing_attribute_ex_uint64(
             self, task, device_names, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeExUInt64,
             grpc_types.SetTimingAttributeExUInt64Request(
                 task=task, device_names=device_names, attribute_raw=attribute,
                 value=value))
 
     def set_timing_attribute_int32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeInt32,
             grpc_types.SetTimingAttributeInt32Request(
                 task=task, attribute_raw=attribute, value_raw=value))
 
     def set_timing_attribute_string(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeString,
             grpc_types.SetTimingAttributeStringRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_timing_attribute_uint32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeUInt32,
             grpc_types.SetTimingAttributeUInt32Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_timing_attribute_uint64(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTimingAttributeUInt64,
             grpc_types.SetTimingAttributeUInt64Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_trig_attribute_bool(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeBool,
             grpc_types.SetTrigAttributeBoolRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_trig_attribute_double(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeDouble,
             grpc_types.SetTrigAttributeDoubleRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_trig_attribute_double_array(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeDoubleArray,
             grpc_types.SetTrigAttributeDoubleArrayRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_trig_attribute_int32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeInt32,
             grpc_types.SetTrigAttributeInt32Request(
                 task=task, attribute_raw=attribute, value_raw=value))
 
     def set_trig_attribute_int32_array(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeInt32Array,
             grpc_types.SetTrigAttributeInt32ArrayRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_trig_attribute_string(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeString,
             grpc_types.SetTrigAttributeStringRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_trig_attribute_uint32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetTrigAttributeUInt32,
             grpc_types.SetTrigAttributeUInt32Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_watchdog_attribute_bool(self, task, lines, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWatchdogAttributeBool,
             grpc_types.SetWatchdogAttributeBoolRequest(
                 task=task, lines=lines, attribute_raw=attribute, value=value))
 
     def set_watchdog_attribute_double(self, task, lines, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWatchdogAttributeDouble,
             grpc_types.SetWatchdogAttributeDoubleRequest(
                 task=task, lines=lines, attribute_raw=attribute, value=value))
 
     def set_watchdog_attribute_int32(self, task, lines, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWatchdogAttributeInt32,
             grpc_types.SetWatchdogAttributeInt32Request(
                 task=task, lines=lines, attribute_raw=attribute,
                 value_raw=value))
 
     def set_watchdog_attribute_string(self, task, lines, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWatchdogAttributeString,
             grpc_types.SetWatchdogAttributeStringRequest(
                 task=task, lines=lines, attribute_raw=attribute, value=value))
 
     def set_write_attribute_bool(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWriteAttributeBool,
             grpc_types.SetWriteAttributeBoolRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_write_attribute_double(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWriteAttributeDouble,
             grpc_types.SetWriteAttributeDoubleRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_write_attribute_int32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWriteAttributeInt32,
             grpc_types.SetWriteAttributeInt32Request(
                 task=task, attribute_raw=attribute, value_raw=value))
 
     def set_write_attribute_string(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWriteAttributeString,
             grpc_types.SetWriteAttributeStringRequest(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_write_attribute_uint32(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWriteAttributeUInt32,
             grpc_types.SetWriteAttributeUInt32Request(
                 task=task, attribute_raw=attribute, value=value))
 
     def set_write_attribute_uint64(self, task, attribute, value):
-        response = self._invoke(
+        self._invoke_batchable(
             self._client.SetWriteAttributeUInt64,
             grpc_types.SetWriteAttributeUInt64Request(
                 task=task, attribute_raw=attribute, value=value))
@@ -3191,12 +3320,12 @@ class GrpcStubInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.float64)
-        response = self._invoke(
-            self._client.WriteAnalogF64,
-            grpc_types.WriteAnalogF64Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteAnalogF64Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteAnalogF64, request)
         return response.samps_per_chan_written
 
     def write_analog_scalar_f64(self, task, auto_start, timeout, value):
@@ -3210,48 +3339,48 @@ class GrpcStubInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.int16)
-        response = self._invoke(
-            self._client.WriteBinaryI16,
-            grpc_types.WriteBinaryI16Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteBinaryI16Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteBinaryI16, request)
         return response.samps_per_chan_written
 
     def write_binary_i32(
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.int32)
-        response = self._invoke(
-            self._client.WriteBinaryI32,
-            grpc_types.WriteBinaryI32Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteBinaryI32Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteBinaryI32, request)
         return response.samps_per_chan_written
 
     def write_binary_u16(
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.uint16)
-        response = self._invoke(
-            self._client.WriteBinaryU16,
-            grpc_types.WriteBinaryU16Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteBinaryU16Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteBinaryU16, request)
         return response.samps_per_chan_written
 
     def write_binary_u32(
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.uint32)
-        response = self._invoke(
-            self._client.WriteBinaryU32,
-            grpc_types.WriteBinaryU32Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteBinaryU32Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteBinaryU32, request)
         return response.samps_per_chan_written
 
     def write_ctr_freq(
@@ -3259,13 +3388,13 @@ class GrpcStubInterpreter(BaseInterpreter):
             frequency, duty_cycle):
         _validate_array_dtype(frequency, numpy.float64)
         _validate_array_dtype(duty_cycle, numpy.float64)
-        response = self._invoke(
-            self._client.WriteCtrFreq,
-            grpc_types.WriteCtrFreqRequest(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, frequency=frequency.flat,
-                duty_cycle=duty_cycle.flat))
+        request = grpc_types.WriteCtrFreqRequest(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'frequency', frequency)
+        _pack_numpy_array(request, 'duty_cycle', duty_cycle)
+        response = self._invoke(self._client.WriteCtrFreq, request)
         return response.num_samps_per_chan_written
 
     def write_ctr_freq_scalar(
@@ -3281,13 +3410,13 @@ class GrpcStubInterpreter(BaseInterpreter):
             high_ticks, low_ticks):
         _validate_array_dtype(high_ticks, numpy.uint32)
         _validate_array_dtype(low_ticks, numpy.uint32)
-        response = self._invoke(
-            self._client.WriteCtrTicks,
-            grpc_types.WriteCtrTicksRequest(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, high_ticks=high_ticks.flat,
-                low_ticks=low_ticks.flat))
+        request = grpc_types.WriteCtrTicksRequest(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'high_ticks', high_ticks)
+        _pack_numpy_array(request, 'low_ticks', low_ticks)
+        response = self._invoke(self._client.WriteCtrTicks, request)
         return response.num_samps_per_chan_written
 
     def write_ctr_ticks_scalar(
@@ -3303,13 +3432,13 @@ class GrpcStubInterpreter(BaseInterpreter):
             high_time, low_time):
         _validate_array_dtype(high_time, numpy.float64)
         _validate_array_dtype(low_time, numpy.float64)
-        response = self._invoke(
-            self._client.WriteCtrTime,
-            grpc_types.WriteCtrTimeRequest(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, high_time=high_time.flat,
-                low_time=low_time.flat))
+        request = grpc_types.WriteCtrTimeRequest(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'high_time', high_time)
+        _pack_numpy_array(request, 'low_time', low_time)
+        response = self._invoke(self._client.WriteCtrTime, request)
         return response.num_samps_per_chan_written
 
     def write_ctr_time_scalar(
@@ -3344,24 +3473,24 @@ class GrpcStubInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.uint16)
-        response = self._invoke(
-            self._client.WriteDigitalU16,
-            grpc_types.WriteDigitalU16Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteDigitalU16Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteDigitalU16, request)
         return response.samps_per_chan_written
 
     def write_digital_u32(
             self, task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array):
         _validate_array_dtype(write_array, numpy.uint32)
-        response = self._invoke(
-            self._client.WriteDigitalU32,
-            grpc_types.WriteDigitalU32Request(
-                task=task, num_samps_per_chan=num_samps_per_chan,
-                auto_start=auto_start, timeout=timeout,
-                data_layout_raw=data_layout, write_array=write_array.flat))
+        request = grpc_types.WriteDigitalU32Request(
+            task=task, num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start, timeout=timeout,
+            data_layout_raw=data_layout)
+        _pack_numpy_array(request, 'write_array', write_array)
+        response = self._invoke(self._client.WriteDigitalU32, request)
         return response.samps_per_chan_written
 
     def write_digital_u8(
@@ -3406,6 +3535,36 @@ class GrpcStubInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.name)
 
+    def close(self):
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def call_concurrently(self, funcs):
+        """
+        Calls each function on a pool of threads, so that the round trips to the
+        server overlap, and returns the results in order.
+        """
+        # The batch belongs to this thread, so the pool threads do not wait for it.
+        self._wait_for_batch()
+        funcs = list(funcs)
+        if len(funcs) <= 1:
+            return [func() for func in funcs]
+        executor = self._get_executor()
+        futures = [executor.submit(func) for func in funcs]
+        return [future.result() for future in futures]
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_CALLS,
+                    thread_name_prefix="nidaqmx concurrent call",
+                )
+            return self._executor
+
     def get_error_string(self, error_code):
         try:
             # Do not use self._invoke() because it may call back into self.get_error_string().
@@ -3423,22 +3582,69 @@ def _assign_numpy_array(numpy_array, grpc_array):
     """
     Assigns grpc array to numpy array maintaining the original shape.
 
-    Checks for the instance of grpc_array with bytes, if validated to True,
-    the numpy array is assigned to a 1D array of the grpc arrray.
+    The grpc array is converted to the numpy array's dtype in a single bulk
+    operation (numpy.frombuffer() for bytes) and copied into the start of the
+    numpy array's buffer.
     """
-    grpc_array_size = len(grpc_array)
     if isinstance(grpc_array, bytes):
-        assert numpy_array.nbytes >= grpc_array_size
-        numpy_array.flat[:grpc_array_size] = numpy.frombuffer(grpc_array, dtype=numpy_array.dtype)
+        assert numpy_array.nbytes >= len(grpc_array)
+        grpc_array = numpy.frombuffer(grpc_array, dtype=numpy_array.dtype)
     else:
-        assert numpy_array.size >= grpc_array_size
-        numpy_array.flat[:grpc_array_size] = grpc_array
+        assert numpy_array.size >= len(grpc_array)
+        grpc_array = numpy.asarray(grpc_array, dtype=numpy_array.dtype)
+    if numpy_array.flags.c_contiguous:
+        # reshape(-1) is a view of a C-contiguous array, so this copies directly into its buffer.
+        numpy_array.reshape(-1)[:grpc_array.size] = grpc_array
+    else:
+        numpy_array.flat[:grpc_array.size] = grpc_array
 
 def _validate_array_dtype(numpy_array, expected_numpy_array_dtype):
     """Raises TypeError if array type doesn't match with expected numpy.dtype"""
     if expected_numpy_array_dtype != numpy.generic and numpy_array.dtype != expected_numpy_array_dtype:
         raise TypeError(f"array must have data type {expected_numpy_array_dtype}")
 
+# Little-endian numpy dtypes for the repeated fields whose packed wire encoding is the raw array
+# buffer. Other numeric fields are varint encoded and must be converted element by element.
+_PACKED_FIXED_WIDTH_DTYPES = {
+    google.protobuf.descriptor.FieldDescriptor.TYPE_DOUBLE: "<f8",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_FLOAT: "<f4",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_FIXED32: "<u4",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_FIXED64: "<u8",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_SFIXED32: "<i4",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_SFIXED64: "<i8",
+}
+_WIRETYPE_LENGTH_DELIMITED = 2
+
+def _pack_numpy_array(message, field_name, numpy_array):
+    """
+    Assigns numpy array to a repeated numeric field of the message in bulk.
+
+    Fixed-width fields are serialized from the array buffer as a single packed
+    field and merged into the message, so protobuf never iterates over the
+    array in Python. Varint fields are extended from a list, which is still
+    much faster than assigning numpy_array.flat.
+    """
+    field = message.DESCRIPTOR.fields_by_name[field_name]
+    packed_dtype = _PACKED_FIXED_WIDTH_DTYPES.get(field.type)
+    if packed_dtype is not None:
+        data = numpy.ascontiguousarray(numpy_array, dtype=packed_dtype).tobytes()
+        message.MergeFromString(
+            _encode_varint((field.number << 3) | _WIRETYPE_LENGTH_DELIMITED)
+            + _encode_varint(len(data))
+            + data
+        )
+    else:
+        getattr(message, field_name).extend(numpy_array.ravel().tolist())
+
+def _encode_varint(value):
+    """Encodes a non-negative integer as a protobuf base 128 varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
 def _is_cancelled(ex: Exception) -> bool:
     """Returns True if the given exception is a cancelled RPC exception."""
     return (
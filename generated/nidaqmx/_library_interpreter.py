@@ -1,7 +1,9 @@
 # Do not edit this file; it was automatically generated.
 
+import contextlib
 import ctypes
 import logging
+import threading
 import warnings
 from typing import Optional
 
@@ -16,6 +18,11 @@ from nidaqmx.errors import DaqError, DaqReadError, DaqWarning, DaqWriteError
 
 _logger = logging.getLogger(__name__)
 
+# The size of the reusable string buffers. Most strings, such as channel and device names, fit.
+_STRING_BUFFER_SIZE = 2048
+# Larger buffers are not kept for reuse, so that a long string does not hold on to memory.
+_MAX_REUSED_STRING_BUFFER_SIZE = 65536
+
 
 class LibraryEventHandler(BaseEventHandler):
     """Manage the lifetime of a ctypes callback method pointer.
@@ -32,6 +39,28 @@ class LibraryEventHandler(BaseEventHandler):
         self._callback_method_ptr = None
 
 
+class _StringBufferPool(threading.local):
+    """Reusable string buffers for the string getters, one per thread."""
+
+    def __init__(self) -> None:
+        self._buffer = ctypes.create_string_buffer(_STRING_BUFFER_SIZE)
+
+    def get(self, size: int = 0) -> ctypes.Array:
+        """Returns a buffer that holds at least size characters.
+
+        The buffer is only valid until the next call to this method on the same thread.
+        """
+        if size <= len(self._buffer):
+            return self._buffer
+        buffer = ctypes.create_string_buffer(size)
+        if size <= _MAX_REUSED_STRING_BUFFER_SIZE:
+            self._buffer = buffer
+        return buffer
+
+
+_string_buffers = _StringBufferPool()
+
+
 class LibraryInterpreter(BaseInterpreter):
     """
     Library C<->Python interpreter.
@@ -46,24 +75,12 @@ class LibraryInterpreter(BaseInterpreter):
 
     def add_cdaq_sync_connection(self, port_list):
         cfunc = lib_importer.windll.DAQmxAddCDAQSyncConnection
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             port_list)
         self.check_for_error(error_code)
 
     def add_global_chans_to_task(self, task, channel_names):
         cfunc = lib_importer.windll.DAQmxAddGlobalChansToTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str]
-
         error_code = cfunc(
             task, channel_names)
         self.check_for_error(error_code)
@@ -71,25 +88,22 @@ class LibraryInterpreter(BaseInterpreter):
     def add_network_device(
             self, ip_address, device_name, attempt_reservation, timeout):
         cfunc = lib_importer.windll.DAQmxAddNetworkDevice
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str, c_bool32,
-                        ctypes.c_double, ctypes.c_char_p, ctypes.c_uint]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        device_name_out = _string_buffers.get()
+        temp_size = len(device_name_out)
         while True:
-            device_name_out = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 ip_address, device_name, attempt_reservation, timeout,
                 device_name_out, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                device_name_out = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -100,13 +114,6 @@ class LibraryInterpreter(BaseInterpreter):
         disconnected_ports_exist = c_bool32()
 
         cfunc = lib_importer.windll.DAQmxAreConfiguredCDAQSyncPortsDisconnected
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_double,
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             chassis_devices_ports, timeout,
             ctypes.byref(disconnected_ports_exist))
@@ -116,12 +123,6 @@ class LibraryInterpreter(BaseInterpreter):
     def auto_configure_cdaq_sync_connections(
             self, chassis_devices_ports, timeout):
         cfunc = lib_importer.windll.DAQmxAutoConfigureCDAQSyncConnections
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_double]
-
         error_code = cfunc(
             chassis_devices_ports, timeout)
         self.check_for_error(error_code)
@@ -133,16 +134,6 @@ class LibraryInterpreter(BaseInterpreter):
         reverse_coeffs = numpy.zeros(size, dtype=numpy.float64)
 
         cfunc = lib_importer.windll.DAQmxCalculateReversePolyCoeff
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W'))]
-
         error_code = cfunc(
             forward_coeffs, len(forward_coeffs), min_val_x, max_val_x,
             num_points_to_compute, reverse_poly_order, reverse_coeffs)
@@ -153,13 +144,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_source, pretrigger_samples, trigger_slope,
             trigger_level):
         cfunc = lib_importer.windll.DAQmxCfgAnlgEdgeRefTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_uint]
-
         error_code = cfunc(
             task, trigger_source, trigger_slope, trigger_level,
             pretrigger_samples)
@@ -168,13 +152,6 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_anlg_edge_start_trig(
             self, task, trigger_source, trigger_slope, trigger_level):
         cfunc = lib_importer.windll.DAQmxCfgAnlgEdgeStartTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_double]
-
         error_code = cfunc(
             task, trigger_source, trigger_slope, trigger_level)
         self.check_for_error(error_code)
@@ -193,14 +170,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_source, window_top, window_bottom,
             pretrigger_samples, trigger_when):
         cfunc = lib_importer.windll.DAQmxCfgAnlgWindowRefTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_uint]
-
         error_code = cfunc(
             task, trigger_source, trigger_when, window_top, window_bottom,
             pretrigger_samples)
@@ -210,13 +179,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, window_top, window_bottom, trigger_source,
             trigger_when):
         cfunc = lib_importer.windll.DAQmxCfgAnlgWindowStartTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, trigger_source, trigger_when, window_top, window_bottom)
         self.check_for_error(error_code)
@@ -226,14 +188,6 @@ class LibraryInterpreter(BaseInterpreter):
             samps_per_chan, sample_clk_pulse_polarity, pause_when,
             ready_event_active_level):
         cfunc = lib_importer.windll.DAQmxCfgBurstHandshakingTimingExportClock
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_ulonglong, ctypes.c_double, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int]
-
         error_code = cfunc(
             task, sample_mode, samps_per_chan, sample_clk_rate,
             sample_clk_outp_term, sample_clk_pulse_polarity, pause_when,
@@ -245,14 +199,6 @@ class LibraryInterpreter(BaseInterpreter):
             samps_per_chan, sample_clk_active_edge, pause_when,
             ready_event_active_level):
         cfunc = lib_importer.windll.DAQmxCfgBurstHandshakingTimingImportClock
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_ulonglong, ctypes.c_double, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int]
-
         error_code = cfunc(
             task, sample_mode, samps_per_chan, sample_clk_rate,
             sample_clk_src, sample_clk_active_edge, pause_when,
@@ -263,13 +209,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, rising_edge_chan, falling_edge_chan, sample_mode,
             samps_per_chan):
         cfunc = lib_importer.windll.DAQmxCfgChangeDetectionTiming
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_ulonglong]
-
         error_code = cfunc(
             task, rising_edge_chan, falling_edge_chan, sample_mode,
             samps_per_chan)
@@ -278,26 +217,12 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_dig_edge_ref_trig(
             self, task, trigger_source, pretrigger_samples, trigger_edge):
         cfunc = lib_importer.windll.DAQmxCfgDigEdgeRefTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int, ctypes.c_uint]
-
         error_code = cfunc(
             task, trigger_source, trigger_edge, pretrigger_samples)
         self.check_for_error(error_code)
 
     def cfg_dig_edge_start_trig(self, task, trigger_source, trigger_edge):
         cfunc = lib_importer.windll.DAQmxCfgDigEdgeStartTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int]
-
         error_code = cfunc(
             task, trigger_source, trigger_edge)
         self.check_for_error(error_code)
@@ -306,13 +231,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, trigger_source, trigger_pattern, pretrigger_samples,
             trigger_when):
         cfunc = lib_importer.windll.DAQmxCfgDigPatternRefTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_uint]
-
         error_code = cfunc(
             task, trigger_source, trigger_pattern, trigger_when,
             pretrigger_samples)
@@ -321,39 +239,18 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_dig_pattern_start_trig(
             self, task, trigger_source, trigger_pattern, trigger_when):
         cfunc = lib_importer.windll.DAQmxCfgDigPatternStartTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             task, trigger_source, trigger_pattern, trigger_when)
         self.check_for_error(error_code)
 
     def cfg_handshaking_timing(self, task, sample_mode, samps_per_chan):
         cfunc = lib_importer.windll.DAQmxCfgHandshakingTiming
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_ulonglong]
-
         error_code = cfunc(
             task, sample_mode, samps_per_chan)
         self.check_for_error(error_code)
 
     def cfg_implicit_timing(self, task, sample_mode, samps_per_chan):
         cfunc = lib_importer.windll.DAQmxCfgImplicitTiming
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_ulonglong]
-
         error_code = cfunc(
             task, sample_mode, samps_per_chan)
         self.check_for_error(error_code)
@@ -362,14 +259,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, rate, source, active_edge, sample_mode,
             samps_per_chan):
         cfunc = lib_importer.windll.DAQmxCfgPipelinedSampClkTiming
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_ulonglong]
-
         error_code = cfunc(
             task, source, rate, active_edge, sample_mode, samps_per_chan)
         self.check_for_error(error_code)
@@ -378,14 +267,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, rate, source, active_edge, sample_mode,
             samps_per_chan):
         cfunc = lib_importer.windll.DAQmxCfgSampClkTiming
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_ulonglong]
-
         error_code = cfunc(
             task, source, rate, active_edge, sample_mode, samps_per_chan)
         self.check_for_error(error_code)
@@ -393,15 +274,6 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_watchdog_ao_expir_states(
             self, task, channel_names, expir_state_array, output_type_array):
         cfunc = lib_importer.windll.DAQmxCfgWatchdogAOExpirStates
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.c_uint]
-
         error_code = cfunc(
             task, channel_names, expir_state_array, output_type_array,
             len(output_type_array))
@@ -410,14 +282,6 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_watchdog_co_expir_states(
             self, task, channel_names, expir_state_array):
         cfunc = lib_importer.windll.DAQmxCfgWatchdogCOExpirStates
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.c_uint]
-
         error_code = cfunc(
             task, channel_names, expir_state_array, len(expir_state_array))
         self.check_for_error(error_code)
@@ -425,38 +289,18 @@ class LibraryInterpreter(BaseInterpreter):
     def cfg_watchdog_do_expir_states(
             self, task, channel_names, expir_state_array):
         cfunc = lib_importer.windll.DAQmxCfgWatchdogDOExpirStates
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.c_uint]
-
         error_code = cfunc(
             task, channel_names, expir_state_array, len(expir_state_array))
         self.check_for_error(error_code)
 
     def clear_task(self, task):
         cfunc = lib_importer.windll.DAQmxClearTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
-
         error_code = cfunc(
             task)
         self.check_for_error(error_code)
 
     def clear_teds(self, physical_channel):
         cfunc = lib_importer.windll.DAQmxClearTEDS
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             physical_channel)
         self.check_for_error(error_code)
@@ -464,25 +308,12 @@ class LibraryInterpreter(BaseInterpreter):
     def configure_logging(
             self, task, file_path, logging_mode, group_name, operation):
         cfunc = lib_importer.windll.DAQmxConfigureLogging
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int, ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             task, file_path, logging_mode, group_name, operation)
         self.check_for_error(error_code)
 
     def configure_teds(self, physical_channel, file_path):
         cfunc = lib_importer.windll.DAQmxConfigureTEDS
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str]
-
         error_code = cfunc(
             physical_channel, file_path)
         self.check_for_error(error_code)
@@ -490,24 +321,12 @@ class LibraryInterpreter(BaseInterpreter):
     def connect_terms(
             self, source_terminal, destination_terminal, signal_modifiers):
         cfunc = lib_importer.windll.DAQmxConnectTerms
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             source_terminal, destination_terminal, signal_modifiers)
         self.check_for_error(error_code)
 
     def control_watchdog_task(self, task, action):
         cfunc = lib_importer.windll.DAQmxControlWatchdogTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, action)
         self.check_for_error(error_code)
@@ -518,16 +337,6 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, voltage_excit_source, voltage_excit_val,
             use_excit_for_scaling, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIAccel4WireDCVoltageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double, c_bool32,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, sensitivity,
@@ -541,16 +350,6 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, current_excit_source, current_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIAccelChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, sensitivity,
@@ -563,15 +362,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, sensitivity,
             sensitivity_units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIAccelChargeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, sensitivity,
@@ -583,15 +373,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, bridge_config, voltage_excit_source,
             voltage_excit_val, nominal_bridge_resistance, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIBridgeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -602,14 +383,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIChargeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name)
@@ -620,15 +393,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
             ext_shunt_resistor_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAICurrentChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
@@ -640,15 +404,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
             ext_shunt_resistor_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAICurrentRMSChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
@@ -662,19 +417,6 @@ class LibraryInterpreter(BaseInterpreter):
             reverse_coeffs, electrical_units, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIForceBridgePolynomialChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C')), ctypes.c_uint, ctypes.c_int,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -690,19 +432,6 @@ class LibraryInterpreter(BaseInterpreter):
             electrical_units, physical_vals, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIForceBridgeTableChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -719,17 +448,6 @@ class LibraryInterpreter(BaseInterpreter):
             first_physical_val, second_physical_val, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIForceBridgeTwoPointLinChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -745,16 +463,6 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, current_excit_source, current_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIForceIEPEChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, sensitivity,
@@ -766,15 +474,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, threshold_level, hysteresis, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIFreqVoltageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, threshold_level, hysteresis, custom_scale_name)
@@ -785,15 +484,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, units, mic_sensitivity, max_snd_press_level,
             current_excit_source, current_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIMicrophoneChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, units, mic_sensitivity, max_snd_press_level,
@@ -805,15 +495,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, sensitivity, sensitivity_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIPosEddyCurrProxProbeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, sensitivity, sensitivity_units, custom_scale_name)
@@ -825,16 +506,6 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_excit_source, voltage_excit_val, voltage_excit_freq,
             ac_excit_wire_mode, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIPosLVDTChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_int,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, sensitivity, sensitivity_units,
@@ -848,16 +519,6 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_excit_source, voltage_excit_val, voltage_excit_freq,
             ac_excit_wire_mode, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIPosRVDTChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_int,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, sensitivity, sensitivity_units,
@@ -869,14 +530,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, voltage_setpoint, current_setpoint,
             output_enable, name_to_assign_to_channel):
         cfunc = lib_importer.windll.DAQmxCreateAIPowerChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        c_bool32]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             voltage_setpoint, current_setpoint, output_enable)
@@ -889,19 +542,6 @@ class LibraryInterpreter(BaseInterpreter):
             reverse_coeffs, electrical_units, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIPressureBridgePolynomialChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C')), ctypes.c_uint, ctypes.c_int,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -917,19 +557,6 @@ class LibraryInterpreter(BaseInterpreter):
             electrical_units, physical_vals, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIPressureBridgeTableChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -946,17 +573,6 @@ class LibraryInterpreter(BaseInterpreter):
             first_physical_val, second_physical_val, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIPressureBridgeTwoPointLinChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -971,15 +587,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIResistanceChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, current_excit_source,
@@ -993,18 +600,6 @@ class LibraryInterpreter(BaseInterpreter):
             gage_factor, nominal_gage_resistance, poisson_ratio,
             lead_wire_resistance):
         cfunc = lib_importer.windll.DAQmxCreateAIRosetteStrainGageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, rosette_type, gage_orientation, rosette_meas_types,
@@ -1020,17 +615,6 @@ class LibraryInterpreter(BaseInterpreter):
             nominal_gage_resistance, poisson_ratio, lead_wire_resistance,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIStrainGageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, strain_config, voltage_excit_source,
@@ -1042,13 +626,6 @@ class LibraryInterpreter(BaseInterpreter):
     def create_ai_temp_built_in_sensor_chan(
             self, task, physical_channel, name_to_assign_to_channel, units):
         cfunc = lib_importer.windll.DAQmxCreateAITempBuiltInSensorChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, units)
         self.check_for_error(error_code)
@@ -1058,15 +635,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, thermocouple_type, cjc_source, cjc_val,
             cjc_channel):
         cfunc = lib_importer.windll.DAQmxCreateAIThrmcplChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, thermocouple_type, cjc_source, cjc_val,
@@ -1078,16 +646,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val, a, b, c):
         cfunc = lib_importer.windll.DAQmxCreateAIThrmstrChanIex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, current_excit_source,
@@ -1099,16 +657,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, voltage_excit_source,
             voltage_excit_val, a, b, c, r_1):
         cfunc = lib_importer.windll.DAQmxCreateAIThrmstrChanVex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, voltage_excit_source,
@@ -1122,19 +670,6 @@ class LibraryInterpreter(BaseInterpreter):
             reverse_coeffs, electrical_units, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAITorqueBridgePolynomialChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C')), ctypes.c_uint, ctypes.c_int,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -1150,19 +685,6 @@ class LibraryInterpreter(BaseInterpreter):
             electrical_units, physical_vals, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAITorqueBridgeTableChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -1179,17 +701,6 @@ class LibraryInterpreter(BaseInterpreter):
             first_physical_val, second_physical_val, physical_units,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAITorqueBridgeTwoPointLinChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, bridge_config, voltage_excit_source,
@@ -1205,16 +716,6 @@ class LibraryInterpreter(BaseInterpreter):
             sensitivity_units, current_excit_source, current_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIVelocityIEPEChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, sensitivity,
@@ -1226,14 +727,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIVoltageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name)
@@ -1245,16 +738,6 @@ class LibraryInterpreter(BaseInterpreter):
             voltage_excit_source, voltage_excit_val, use_excit_for_scaling,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIVoltageChanWithExcit
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_int, ctypes.c_double, c_bool32,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, bridge_config,
@@ -1266,14 +749,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAIVoltageRMSChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name)
@@ -1284,15 +759,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, rtd_type, resistance_config, current_excit_source,
             current_excit_val, r_0):
         cfunc = lib_importer.windll.DAQmxCreateAIRTDChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_int, ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, rtd_type, resistance_config, current_excit_source,
@@ -1303,14 +769,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAOCurrentChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, custom_scale_name)
@@ -1320,14 +778,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, type,
             freq, amplitude, offset):
         cfunc = lib_importer.windll.DAQmxCreateAOFuncGenChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, type, freq,
             amplitude, offset)
@@ -1337,14 +787,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateAOVoltageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, custom_scale_name)
@@ -1355,15 +797,6 @@ class LibraryInterpreter(BaseInterpreter):
             zidx_enable, zidx_val, zidx_phase, units, pulses_per_rev,
             initial_angle, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIAngEncoderChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_uint, ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, decoding_type,
             zidx_enable, zidx_val, zidx_phase, units, pulses_per_rev,
@@ -1374,15 +807,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             decoding_type, units, pulses_per_rev, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIAngVelocityChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_uint,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val,
             decoding_type, units, pulses_per_rev, custom_scale_name)
@@ -1392,14 +816,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, edge,
             initial_count, count_direction):
         cfunc = lib_importer.windll.DAQmxCreateCICountEdgesChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_uint,
-                        ctypes.c_int]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, edge, initial_count,
             count_direction)
@@ -1409,14 +825,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_freq,
             max_freq, edge, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIDutyCycleChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_freq, max_freq,
             edge, custom_scale_name)
@@ -1426,15 +834,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, edge, meas_method, meas_time, divisor, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIFreqChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_uint, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units,
             edge, meas_method, meas_time, divisor, custom_scale_name)
@@ -1445,15 +844,6 @@ class LibraryInterpreter(BaseInterpreter):
             zidx_enable, zidx_val, zidx_phase, units, dist_per_pulse,
             initial_pos, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCILinEncoderChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, decoding_type,
             zidx_enable, zidx_val, zidx_phase, units, dist_per_pulse,
@@ -1464,15 +854,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             decoding_type, units, dist_per_pulse, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCILinVelocityChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val,
             decoding_type, units, dist_per_pulse, custom_scale_name)
@@ -1482,15 +863,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, edge, meas_method, meas_time, divisor, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIPeriodChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_uint, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units,
             edge, meas_method, meas_time, divisor, custom_scale_name)
@@ -1500,14 +872,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units):
         cfunc = lib_importer.windll.DAQmxCreateCIPulseChanFreq
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units)
         self.check_for_error(error_code)
@@ -1516,14 +880,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, source_terminal,
             min_val, max_val):
         cfunc = lib_importer.windll.DAQmxCreateCIPulseChanTicks
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes_byte_str, ctypes.c_double,
-                        ctypes.c_double]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, source_terminal,
             min_val, max_val)
@@ -1533,14 +889,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units):
         cfunc = lib_importer.windll.DAQmxCreateCIPulseChanTime
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units)
         self.check_for_error(error_code)
@@ -1549,14 +897,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, starting_edge, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIPulseWidthChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units,
             starting_edge, custom_scale_name)
@@ -1566,14 +906,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCISemiPeriodChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units,
             custom_scale_name)
@@ -1583,15 +915,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, min_val, max_val,
             units, first_edge, second_edge, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCITwoEdgeSepChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, min_val, max_val, units,
             first_edge, second_edge, custom_scale_name)
@@ -1601,14 +924,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, units,
             sync_method, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateCIGPSTimestampChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, units, sync_method,
             custom_scale_name)
@@ -1618,14 +933,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, units, idle_state,
             initial_delay, freq, duty_cycle):
         cfunc = lib_importer.windll.DAQmxCreateCOPulseChanFreq
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, units, idle_state,
             initial_delay, freq, duty_cycle)
@@ -1635,14 +942,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, source_terminal, name_to_assign_to_channel,
             idle_state, initial_delay, low_ticks, high_ticks):
         cfunc = lib_importer.windll.DAQmxCreateCOPulseChanTicks
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes_byte_str, ctypes.c_int,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, source_terminal,
             idle_state, initial_delay, low_ticks, high_ticks)
@@ -1652,14 +951,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, counter, name_to_assign_to_channel, units, idle_state,
             initial_delay, low_time, high_time):
         cfunc = lib_importer.windll.DAQmxCreateCOPulseChanTime
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, counter, name_to_assign_to_channel, units, idle_state,
             initial_delay, low_time, high_time)
@@ -1668,13 +959,6 @@ class LibraryInterpreter(BaseInterpreter):
     def create_di_chan(
             self, task, lines, name_to_assign_to_lines, line_grouping):
         cfunc = lib_importer.windll.DAQmxCreateDIChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             task, lines, name_to_assign_to_lines, line_grouping)
         self.check_for_error(error_code)
@@ -1682,13 +966,6 @@ class LibraryInterpreter(BaseInterpreter):
     def create_do_chan(
             self, task, lines, name_to_assign_to_lines, line_grouping):
         cfunc = lib_importer.windll.DAQmxCreateDOChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             task, lines, name_to_assign_to_lines, line_grouping)
         self.check_for_error(error_code)
@@ -1696,13 +973,6 @@ class LibraryInterpreter(BaseInterpreter):
     def create_lin_scale(
             self, name, slope, y_intercept, pre_scaled_units, scaled_units):
         cfunc = lib_importer.windll.DAQmxCreateLinScale
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             name, slope, y_intercept, pre_scaled_units, scaled_units)
         self.check_for_error(error_code)
@@ -1711,14 +981,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, name, prescaled_min, prescaled_max, scaled_min, scaled_max,
             pre_scaled_units, scaled_units):
         cfunc = lib_importer.windll.DAQmxCreateMapScale
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             name, prescaled_min, prescaled_max, scaled_min, scaled_max,
             pre_scaled_units, scaled_units)
@@ -1728,16 +990,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, name, forward_coeffs, reverse_coeffs, pre_scaled_units,
             scaled_units):
         cfunc = lib_importer.windll.DAQmxCreatePolynomialScale
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C')), ctypes.c_uint, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             name, forward_coeffs, len(forward_coeffs), reverse_coeffs,
             len(reverse_coeffs), pre_scaled_units, scaled_units)
@@ -1747,16 +999,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, name, prescaled_vals, scaled_vals, pre_scaled_units,
             scaled_units):
         cfunc = lib_importer.windll.DAQmxCreateTableScale
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C')), ctypes.c_uint, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             name, prescaled_vals, len(prescaled_vals), scaled_vals,
             len(scaled_vals), pre_scaled_units, scaled_units)
@@ -1767,13 +1009,6 @@ class LibraryInterpreter(BaseInterpreter):
         task = lib_importer.task_handle(0)
 
         cfunc = lib_importer.windll.DAQmxCreateTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str,
-                        ctypes.POINTER(lib_importer.task_handle)]
-
         error_code = cfunc(
             session_name, ctypes.byref(task))
         self.check_for_error(error_code)
@@ -1784,15 +1019,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, current_excit_source,
             current_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIAccelChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, current_excit_source,
@@ -1804,15 +1030,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIBridgeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -1824,15 +1041,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
             ext_shunt_resistor_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAICurrentChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, shunt_resistor_loc,
@@ -1844,15 +1052,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIForceBridgeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -1864,15 +1063,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, current_excit_source,
             current_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIForceIEPEChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, current_excit_source,
@@ -1884,15 +1074,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, units, max_snd_press_level, current_excit_source,
             current_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIMicrophoneChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, units, max_snd_press_level, current_excit_source,
@@ -1904,15 +1085,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             voltage_excit_freq, ac_excit_wire_mode, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIPosLVDTChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -1924,15 +1096,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             voltage_excit_freq, ac_excit_wire_mode, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIPosRVDTChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -1944,15 +1107,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIPressureBridgeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -1964,15 +1118,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIResistanceChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, current_excit_source,
@@ -1984,15 +1129,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             initial_bridge_voltage, lead_wire_resistance, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIStrainGageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -2003,15 +1139,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, cjc_source, cjc_val, cjc_channel):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIThrmcplChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, cjc_source, cjc_val, cjc_channel)
@@ -2022,15 +1149,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIThrmstrChanIex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, current_excit_source,
@@ -2042,15 +1160,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, voltage_excit_source,
             voltage_excit_val, r_1):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIThrmstrChanVex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, voltage_excit_source,
@@ -2062,15 +1171,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, voltage_excit_source, voltage_excit_val,
             custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAITorqueBridgeChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_double,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, voltage_excit_source, voltage_excit_val,
@@ -2081,14 +1181,6 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIVoltageChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, custom_scale_name)
@@ -2099,15 +1191,6 @@ class LibraryInterpreter(BaseInterpreter):
             terminal_config, min_val, max_val, units, voltage_excit_source,
             voltage_excit_val, custom_scale_name):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIVoltageChanWithExcit
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_int, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double, ctypes_byte_str]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel,
             terminal_config, min_val, max_val, units, voltage_excit_source,
@@ -2119,15 +1202,6 @@ class LibraryInterpreter(BaseInterpreter):
             max_val, units, resistance_config, current_excit_source,
             current_excit_val):
         cfunc = lib_importer.windll.DAQmxCreateTEDSAIRTDChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_double, ctypes.c_double,
-                        ctypes.c_int, ctypes.c_int, ctypes.c_int,
-                        ctypes.c_double]
-
         error_code = cfunc(
             task, physical_channel, name_to_assign_to_channel, min_val,
             max_val, units, resistance_config, current_excit_source,
@@ -2140,14 +1214,6 @@ class LibraryInterpreter(BaseInterpreter):
         task = lib_importer.task_handle(0)
 
         cfunc = lib_importer.windll.DAQmxCreateWatchdogTimerTaskEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str,
-                        ctypes.POINTER(lib_importer.task_handle),
-                        ctypes.c_double]
-
         error_code = cfunc(
             device_name, session_name, ctypes.byref(task), timeout)
         self.check_for_error(error_code)
@@ -2155,97 +1221,48 @@ class LibraryInterpreter(BaseInterpreter):
 
     def delete_network_device(self, device_name):
         cfunc = lib_importer.windll.DAQmxDeleteNetworkDevice
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             device_name)
         self.check_for_error(error_code)
 
     def delete_saved_global_chan(self, channel_name):
         cfunc = lib_importer.windll.DAQmxDeleteSavedGlobalChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             channel_name)
         self.check_for_error(error_code)
 
     def delete_saved_scale(self, scale_name):
         cfunc = lib_importer.windll.DAQmxDeleteSavedScale
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             scale_name)
         self.check_for_error(error_code)
 
     def delete_saved_task(self, task_name):
         cfunc = lib_importer.windll.DAQmxDeleteSavedTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task_name)
         self.check_for_error(error_code)
 
     def disable_ref_trig(self, task):
         cfunc = lib_importer.windll.DAQmxDisableRefTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
-
         error_code = cfunc(
             task)
         self.check_for_error(error_code)
 
     def disable_start_trig(self, task):
         cfunc = lib_importer.windll.DAQmxDisableStartTrig
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
-
         error_code = cfunc(
             task)
         self.check_for_error(error_code)
 
     def disconnect_terms(self, source_terminal, destination_terminal):
         cfunc = lib_importer.windll.DAQmxDisconnectTerms
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str]
-
         error_code = cfunc(
             source_terminal, destination_terminal)
         self.check_for_error(error_code)
 
     def export_signal(self, task, signal_id, output_terminal):
         cfunc = lib_importer.windll.DAQmxExportSignal
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes_byte_str]
-
         error_code = cfunc(
             task, signal_id, output_terminal)
         self.check_for_error(error_code)
@@ -2257,15 +1274,6 @@ class LibraryInterpreter(BaseInterpreter):
         array_size = ctypes.c_uint32(array_size)
 
         cfunc = lib_importer.cdll.DAQmxGetAnalogPowerUpStatesWithOutputType
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), wrapped_ndpointer(dtype=numpy.int32,
-                        flags=('C','W')), ctypes.POINTER(ctypes.c_uint)]
-
         error_code = cfunc(
             channel_names, state_array, channel_type_array,
             ctypes.byref(array_size))
@@ -2274,23 +1282,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_auto_configured_cdaq_sync_connections(self):
         cfunc = lib_importer.windll.DAQmxGetAutoConfiguredCDAQSyncConnections
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes.c_char_p, ctypes.c_uint]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        port_list = _string_buffers.get()
+        temp_size = len(port_list)
         while True:
-            port_list = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 port_list, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                port_list = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2300,12 +1306,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetBufferAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2315,13 +1315,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2331,13 +1324,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2345,12 +1331,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_chan_attribute_double_array(self, task, channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -2373,13 +1353,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2387,24 +1360,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_chan_attribute_string(self, task, channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, channel, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2414,13 +1384,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2430,12 +1393,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             device_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2445,12 +1402,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             device_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2458,11 +1409,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_double_array(self, device_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -2485,12 +1431,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             device_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2498,11 +1438,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_int32_array(self, device_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -2523,23 +1458,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_string(self, device_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 device_name, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2549,12 +1482,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             device_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2562,11 +1489,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_device_attribute_uint32_array(self, device_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetDeviceAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -2589,12 +1511,6 @@ class LibraryInterpreter(BaseInterpreter):
         logic_family = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxGetDigitalLogicFamilyPowerUpState
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.POINTER(ctypes.c_int)]
-
         error_code = cfunc(
             device_name, ctypes.byref(logic_family))
         self.check_for_error(error_code)
@@ -2654,23 +1570,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_disconnected_cdaq_sync_ports(self):
         cfunc = lib_importer.windll.DAQmxGetDisconnectedCDAQSyncPorts
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes.c_char_p, ctypes.c_uint]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        port_list = _string_buffers.get()
+        temp_size = len(port_list)
         while True:
-            port_list = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 port_list, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                port_list = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2680,12 +1594,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2695,12 +1603,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2710,12 +1612,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2723,23 +1619,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_exported_signal_attribute_string(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2749,12 +1643,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2764,12 +1652,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetPersistedChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2777,23 +1659,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_persisted_chan_attribute_string(self, channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPersistedChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 channel, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2803,12 +1683,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetPersistedScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2816,23 +1690,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_persisted_scale_attribute_string(self, scale_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPersistedScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 scale_name, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2842,12 +1714,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetPersistedTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             task_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2855,23 +1721,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_persisted_task_attribute_string(self, task_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPersistedTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task_name, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -2881,12 +1745,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             physical_channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2894,11 +1752,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_physical_chan_attribute_bytes(self, physical_channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -2921,12 +1774,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             physical_channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2935,11 +1782,6 @@ class LibraryInterpreter(BaseInterpreter):
     def get_physical_chan_attribute_double_array(
             self, physical_channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -2962,12 +1804,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             physical_channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -2976,11 +1812,6 @@ class LibraryInterpreter(BaseInterpreter):
     def get_physical_chan_attribute_int32_array(
             self, physical_channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -3001,23 +1832,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_physical_chan_attribute_string(self, physical_channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 physical_channel, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3027,12 +1856,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             physical_channel, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3041,11 +1864,6 @@ class LibraryInterpreter(BaseInterpreter):
     def get_physical_chan_attribute_uint32_array(
             self, physical_channel, attribute):
         cfunc = lib_importer.cdll.DAQmxGetPhysicalChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -3068,12 +1886,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3083,12 +1895,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3098,12 +1904,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3111,23 +1911,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_read_attribute_string(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3137,12 +1935,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3152,12 +1944,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         cfunc = lib_importer.cdll.DAQmxGetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3167,12 +1953,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3180,11 +1960,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_scale_attribute_double_array(self, scale_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -3207,12 +1982,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3220,23 +1989,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_scale_attribute_string(self, scale_name, attribute):
         cfunc = lib_importer.cdll.DAQmxGetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 scale_name, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3244,23 +2011,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_system_info_attribute_string(self, attribute):
         cfunc = lib_importer.cdll.DAQmxGetSystemInfoAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3270,12 +2035,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetSystemInfoAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes.c_int32]
-
         error_code = cfunc(
             attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3285,12 +2044,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3298,23 +2051,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_task_attribute_string(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3324,12 +2075,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetTaskAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3339,12 +2084,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3354,12 +2093,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3369,13 +2102,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3385,13 +2111,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3401,13 +2120,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3415,24 +2127,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_timing_attribute_ex_string(self, task, device_names, attribute):
         cfunc = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, device_names, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3442,13 +2151,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3458,13 +2160,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3474,12 +2169,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3487,23 +2176,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_timing_attribute_string(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3513,12 +2200,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3528,12 +2209,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         cfunc = lib_importer.cdll.DAQmxGetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3543,12 +2218,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3558,12 +2227,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3571,11 +2234,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_trig_attribute_double_array(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -3598,12 +2256,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3611,11 +2263,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_trig_attribute_int32_array(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
         temp_size = 0
         while True:
@@ -3636,23 +2283,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_trig_attribute_string(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3662,12 +2307,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3677,13 +2316,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3693,13 +2325,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3709,13 +2334,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3723,24 +2341,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_watchdog_attribute_string(self, task, lines, attribute):
         cfunc = lib_importer.cdll.DAQmxGetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, lines, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3750,12 +2365,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = c_bool32()
 
         cfunc = lib_importer.cdll.DAQmxGetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3765,12 +2374,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.cdll.DAQmxGetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3780,12 +2383,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_int32()
 
         cfunc = lib_importer.cdll.DAQmxGetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3793,23 +2390,21 @@ class LibraryInterpreter(BaseInterpreter):
 
     def get_write_attribute_string(self, task, attribute):
         cfunc = lib_importer.cdll.DAQmxGetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
 
-        temp_size = 0
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        value = _string_buffers.get()
+        temp_size = len(value)
         while True:
-            value = ctypes.create_string_buffer(temp_size)
             size_or_code = cfunc(
                 task, attribute, value, temp_size)
             if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
+                # The buffer is too small, or the size changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
                 # Buffer size obtained, use to retrieve data.
                 temp_size = size_or_code
+                value = _string_buffers.get(temp_size)
             else:
                 break
         self.check_for_error(size_or_code)
@@ -3819,12 +2414,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint32()
 
         cfunc = lib_importer.cdll.DAQmxGetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3834,12 +2423,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint64()
 
         cfunc = lib_importer.cdll.DAQmxGetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.byref(value))
         self.check_for_error(error_code)
@@ -3849,12 +2432,6 @@ class LibraryInterpreter(BaseInterpreter):
         is_task_done = c_bool32()
 
         cfunc = lib_importer.windll.DAQmxIsTaskDone
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, ctypes.byref(is_task_done))
         self.check_for_error(error_code)
@@ -3865,13 +2442,6 @@ class LibraryInterpreter(BaseInterpreter):
         task = lib_importer.task_handle(0)
 
         cfunc = lib_importer.windll.DAQmxLoadTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str,
-                        ctypes.POINTER(lib_importer.task_handle)]
-
         error_code = cfunc(
             session_name, ctypes.byref(task))
         self.check_for_error(error_code)
@@ -3882,16 +2452,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadAnalogF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -3902,14 +2462,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.windll.DAQmxReadAnalogScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
         self.check_for_error(error_code)
@@ -3920,16 +2472,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadBinaryI16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -3941,16 +2483,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadBinaryI32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -3962,16 +2494,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadBinaryU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -3983,16 +2505,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadBinaryU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -4003,16 +2515,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCounterF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, read_array, read_array.size,
             ctypes.byref(samps_per_chan_read), None)
@@ -4024,16 +2526,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCounterF64Ex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -4044,14 +2536,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_double()
 
         cfunc = lib_importer.windll.DAQmxReadCounterScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
         self.check_for_error(error_code)
@@ -4061,14 +2545,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint()
 
         cfunc = lib_importer.windll.DAQmxReadCounterScalarU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_uint),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
         self.check_for_error(error_code)
@@ -4078,15 +2554,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCounterU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, read_array, read_array.size,
             ctypes.byref(samps_per_chan_read), None)
@@ -4098,16 +2565,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCounterU32Ex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -4120,18 +2577,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCtrFreq
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')),
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, interleaved,
             read_array_frequency, read_array_duty_cycle,
@@ -4145,15 +2590,6 @@ class LibraryInterpreter(BaseInterpreter):
         duty_cycle = ctypes.c_double()
 
         cfunc = lib_importer.windll.DAQmxReadCtrFreqScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(frequency), ctypes.byref(duty_cycle),
             None)
@@ -4166,18 +2602,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCtrTicks
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')),
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, interleaved,
             read_array_high_ticks, read_array_low_ticks,
@@ -4190,15 +2614,6 @@ class LibraryInterpreter(BaseInterpreter):
         low_ticks = ctypes.c_uint()
 
         cfunc = lib_importer.windll.DAQmxReadCtrTicksScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_uint),
-                        ctypes.POINTER(ctypes.c_uint),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(high_ticks), ctypes.byref(low_ticks),
             None)
@@ -4211,18 +2626,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadCtrTime
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')),
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, interleaved,
             read_array_high_time, read_array_low_time,
@@ -4235,15 +2638,6 @@ class LibraryInterpreter(BaseInterpreter):
         low_time = ctypes.c_double()
 
         cfunc = lib_importer.windll.DAQmxReadCtrTimeScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(high_time), ctypes.byref(low_time),
             None)
@@ -4256,16 +2650,6 @@ class LibraryInterpreter(BaseInterpreter):
         num_bytes_per_samp = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadDigitalLines
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=bool, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read),
@@ -4277,14 +2661,6 @@ class LibraryInterpreter(BaseInterpreter):
         value = ctypes.c_uint()
 
         cfunc = lib_importer.windll.DAQmxReadDigitalScalarU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_uint),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
         self.check_for_error(error_code)
@@ -4295,16 +2671,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadDigitalU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -4316,16 +2682,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadDigitalU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -4337,16 +2693,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadDigitalU8
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint8, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
             read_array.size, ctypes.byref(samps_per_chan_read), None)
@@ -4358,15 +2704,6 @@ class LibraryInterpreter(BaseInterpreter):
         current = ctypes.c_double()
 
         cfunc = lib_importer.windll.DAQmxReadPowerScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, timeout, ctypes.byref(voltage), ctypes.byref(current), None)
         self.check_for_error(error_code)
@@ -4379,13 +2716,6 @@ class LibraryInterpreter(BaseInterpreter):
             ctypes.c_void_p)
 
         cfunc = lib_importer.windll.DAQmxRegisterDoneEvent
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_uint,
-                        DAQmxDoneEventCallbackPtr,
-                        ctypes.POINTER(ctypes.c_void_p)]
 
         assert callback_function is not None
         callback_method_ptr = DAQmxDoneEventCallbackPtr(callback_function)
@@ -4404,13 +2734,6 @@ class LibraryInterpreter(BaseInterpreter):
             ctypes.c_uint, ctypes.c_void_p)
 
         cfunc = lib_importer.windll.DAQmxRegisterEveryNSamplesEvent
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
-                        ctypes.c_uint, DAQmxEveryNSamplesEventCallbackPtr,
-                        ctypes.POINTER(ctypes.c_void_p)]
 
         assert callback_function is not None
         callback_method_ptr = DAQmxEveryNSamplesEventCallbackPtr(callback_function)
@@ -4429,13 +2752,6 @@ class LibraryInterpreter(BaseInterpreter):
             ctypes.c_void_p)
 
         cfunc = lib_importer.windll.DAQmxRegisterSignalEvent
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
-                        DAQmxSignalEventCallbackPtr,
-                        ctypes.POINTER(ctypes.c_void_p)]
 
         assert callback_function is not None
         callback_method_ptr = DAQmxSignalEventCallbackPtr(callback_function)
@@ -4448,198 +2764,96 @@ class LibraryInterpreter(BaseInterpreter):
 
     def remove_cdaq_sync_connection(self, port_list):
         cfunc = lib_importer.windll.DAQmxRemoveCDAQSyncConnection
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             port_list)
         self.check_for_error(error_code)
 
     def reserve_network_device(self, device_name, override_reservation):
         cfunc = lib_importer.windll.DAQmxReserveNetworkDevice
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, c_bool32]
-
         error_code = cfunc(
             device_name, override_reservation)
         self.check_for_error(error_code)
 
     def reset_buffer_attribute(self, task, attribute):
         cfunc = lib_importer.windll.DAQmxResetBufferAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute)
         self.check_for_error(error_code)
 
     def reset_chan_attribute(self, task, channel, attribute):
         cfunc = lib_importer.windll.DAQmxResetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute)
         self.check_for_error(error_code)
 
     def reset_device(self, device_name):
         cfunc = lib_importer.windll.DAQmxResetDevice
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             device_name)
         self.check_for_error(error_code)
 
     def reset_exported_signal_attribute(self, task, attribute):
         cfunc = lib_importer.windll.DAQmxResetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, attribute)
         self.check_for_error(error_code)
 
     def reset_read_attribute(self, task, attribute):
         cfunc = lib_importer.windll.DAQmxResetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, attribute)
         self.check_for_error(error_code)
 
     def reset_timing_attribute(self, task, attribute):
         cfunc = lib_importer.windll.DAQmxResetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, attribute)
         self.check_for_error(error_code)
 
     def reset_timing_attribute_ex(self, task, device_names, attribute):
         cfunc = lib_importer.windll.DAQmxResetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int]
-
         error_code = cfunc(
             task, device_names, attribute)
         self.check_for_error(error_code)
 
     def reset_trig_attribute(self, task, attribute):
         cfunc = lib_importer.windll.DAQmxResetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, attribute)
         self.check_for_error(error_code)
 
     def reset_watchdog_attribute(self, task, lines, attribute):
         cfunc = lib_importer.windll.DAQmxResetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int]
-
         error_code = cfunc(
             task, lines, attribute)
         self.check_for_error(error_code)
 
     def reset_write_attribute(self, task, attribute):
         cfunc = lib_importer.windll.DAQmxResetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, attribute)
         self.check_for_error(error_code)
 
     def save_global_chan(self, task, channel_name, save_as, author, options):
         cfunc = lib_importer.windll.DAQmxSaveGlobalChan
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes_byte_str, ctypes.c_uint32]
-
         error_code = cfunc(
             task, channel_name, save_as, author, options)
         self.check_for_error(error_code)
 
     def save_scale(self, scale_name, save_as, author, options):
         cfunc = lib_importer.windll.DAQmxSaveScale
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str, ctypes_byte_str,
-                        ctypes.c_uint32]
-
         error_code = cfunc(
             scale_name, save_as, author, options)
         self.check_for_error(error_code)
 
     def save_task(self, task, save_as, author, options):
         cfunc = lib_importer.windll.DAQmxSaveTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes_byte_str, ctypes.c_uint32]
-
         error_code = cfunc(
             task, save_as, author, options)
         self.check_for_error(error_code)
 
     def self_test_device(self, device_name):
         cfunc = lib_importer.windll.DAQmxSelfTestDevice
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             device_name)
         self.check_for_error(error_code)
@@ -4672,15 +2886,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_analog_power_up_states_with_output_type(
             self, channel_names, state_array, channel_type_array):
         cfunc = lib_importer.cdll.DAQmxSetAnalogPowerUpStatesWithOutputType
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.c_uint]
-
         error_code = cfunc(
             channel_names, state_array, channel_type_array,
             len(channel_type_array))
@@ -4688,51 +2893,24 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_buffer_attribute_uint32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetBufferAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
 
     def set_chan_attribute_bool(self, task, channel, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_chan_attribute_double(self, task, channel, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_chan_attribute_double_array(self, task, channel, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, value.ctypes.data_as(ctypes.c_void_p),
             len(value))
@@ -4740,39 +2918,18 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_chan_attribute_int32(self, task, channel, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_chan_attribute_string(self, task, channel, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_chan_attribute_uint32(self, task, channel, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetChanAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, channel, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
@@ -4780,12 +2937,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_digital_logic_family_power_up_state(
             self, device_name, logic_family):
         cfunc = lib_importer.windll.DAQmxSetDigitalLogicFamilyPowerUpState
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             device_name, logic_family)
         self.check_for_error(error_code)
@@ -4835,156 +2986,78 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_exported_signal_attribute_bool(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_exported_signal_attribute_double(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_exported_signal_attribute_int32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_exported_signal_attribute_string(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_exported_signal_attribute_uint32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetExportedSignalAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
 
     def set_read_attribute_bool(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_read_attribute_double(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_read_attribute_int32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_read_attribute_string(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_read_attribute_uint32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
 
     def set_read_attribute_uint64(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetReadAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint64(value))
         self.check_for_error(error_code)
 
     def set_scale_attribute_double(self, scale_name, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_scale_attribute_double_array(self, scale_name, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, value.ctypes.data_as(ctypes.c_void_p),
             len(value))
@@ -4992,48 +3065,24 @@ class LibraryInterpreter(BaseInterpreter):
 
     def set_scale_attribute_int32(self, scale_name, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_scale_attribute_string(self, scale_name, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetScaleAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes.c_int32]
-
         error_code = cfunc(
             scale_name, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_timing_attribute_bool(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_timing_attribute_double(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
@@ -5041,13 +3090,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_bool(
             self, task, device_names, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, c_bool32(value))
         self.check_for_error(error_code)
@@ -5055,13 +3097,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_double(
             self, task, device_names, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
@@ -5069,13 +3104,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_int32(
             self, task, device_names, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
@@ -5083,13 +3111,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_string(
             self, task, device_names, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
@@ -5097,13 +3118,6 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_uint32(
             self, task, device_names, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
@@ -5111,329 +3125,162 @@ class LibraryInterpreter(BaseInterpreter):
     def set_timing_attribute_ex_uint64(
             self, task, device_names, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttributeEx
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, device_names, attribute, ctypes.c_uint64(value))
         self.check_for_error(error_code)
 
     def set_timing_attribute_int32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_timing_attribute_string(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_timing_attribute_uint32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
 
     def set_timing_attribute_uint64(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTimingAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint64(value))
         self.check_for_error(error_code)
 
     def set_trig_attribute_bool(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_trig_attribute_double(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_trig_attribute_double_array(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.ctypes.data_as(ctypes.c_void_p), len(value))
         self.check_for_error(error_code)
 
     def set_trig_attribute_int32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_trig_attribute_int32_array(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.ctypes.data_as(ctypes.c_void_p), len(value))
         self.check_for_error(error_code)
 
     def set_trig_attribute_string(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_trig_attribute_uint32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetTrigAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
 
     def set_watchdog_attribute_bool(self, task, lines, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_watchdog_attribute_double(self, task, lines, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_watchdog_attribute_int32(self, task, lines, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_watchdog_attribute_string(self, task, lines, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWatchdogAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str,
-                        ctypes.c_int32]
-
         error_code = cfunc(
             task, lines, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_write_attribute_bool(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, c_bool32(value))
         self.check_for_error(error_code)
 
     def set_write_attribute_double(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_double(value))
         self.check_for_error(error_code)
 
     def set_write_attribute_int32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_int32(value))
         self.check_for_error(error_code)
 
     def set_write_attribute_string(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, value.encode('ascii'))
         self.check_for_error(error_code)
 
     def set_write_attribute_uint32(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint32(value))
         self.check_for_error(error_code)
 
     def set_write_attribute_uint64(self, task, attribute, value):
         cfunc = lib_importer.cdll.DAQmxSetWriteAttribute
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int32]
-
         error_code = cfunc(
             task, attribute, ctypes.c_uint64(value))
         self.check_for_error(error_code)
 
     def start_new_file(self, task, file_path):
         cfunc = lib_importer.windll.DAQmxStartNewFile
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes_byte_str]
-
         error_code = cfunc(
             task, file_path)
         self.check_for_error(error_code)
 
     def start_task(self, task):
         cfunc = lib_importer.windll.DAQmxStartTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
-
         error_code = cfunc(
             task)
         self.check_for_error(error_code)
 
     def stop_task(self, task):
         cfunc = lib_importer.windll.DAQmxStopTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
-
         error_code = cfunc(
             task)
         self.check_for_error(error_code)
 
     def task_control(self, task, action):
         cfunc = lib_importer.windll.DAQmxTaskControl
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int]
-
         error_code = cfunc(
             task, action)
         self.check_for_error(error_code)
 
     def tristate_output_term(self, output_terminal):
         cfunc = lib_importer.windll.DAQmxTristateOutputTerm
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             output_terminal)
         self.check_for_error(error_code)
@@ -5444,13 +3291,6 @@ class LibraryInterpreter(BaseInterpreter):
             ctypes.c_void_p)
 
         cfunc = lib_importer.windll.DAQmxRegisterDoneEvent
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_uint,
-                        DAQmxDoneEventCallbackPtr,
-                        ctypes.POINTER(ctypes.c_void_p)]
 
         options = 0
         callback_method_ptr = DAQmxDoneEventCallbackPtr()  # type: ignore  # typeshed is missing no-argument constructor overload
@@ -5467,13 +3307,6 @@ class LibraryInterpreter(BaseInterpreter):
             ctypes.c_uint, ctypes.c_void_p)
 
         cfunc = lib_importer.windll.DAQmxRegisterEveryNSamplesEvent
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
-                        ctypes.c_uint, DAQmxEveryNSamplesEventCallbackPtr,
-                        ctypes.POINTER(ctypes.c_void_p)]
 
         n_samples = 0
         options = 0
@@ -5491,13 +3324,6 @@ class LibraryInterpreter(BaseInterpreter):
             ctypes.c_void_p)
 
         cfunc = lib_importer.windll.DAQmxRegisterSignalEvent
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
-                        DAQmxSignalEventCallbackPtr,
-                        ctypes.POINTER(ctypes.c_void_p)]
 
         options = 0
         callback_method_ptr = DAQmxSignalEventCallbackPtr()  # type: ignore  # typeshed is missing no-argument constructor overload
@@ -5509,24 +3335,12 @@ class LibraryInterpreter(BaseInterpreter):
 
     def unreserve_network_device(self, device_name):
         cfunc = lib_importer.windll.DAQmxUnreserveNetworkDevice
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str]
-
         error_code = cfunc(
             device_name)
         self.check_for_error(error_code)
 
     def wait_until_task_done(self, task, time_to_wait):
         cfunc = lib_importer.windll.DAQmxWaitUntilTaskDone
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double]
-
         error_code = cfunc(
             task, time_to_wait)
         self.check_for_error(error_code)
@@ -5537,15 +3351,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteAnalogF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5554,13 +3359,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_analog_scalar_f64(self, task, auto_start, timeout, value):
         cfunc = lib_importer.windll.DAQmxWriteAnalogScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_double, ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, auto_start, timeout, value, None)
         self.check_for_error(error_code)
@@ -5571,15 +3369,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteBinaryI16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5592,15 +3381,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteBinaryI32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5613,15 +3393,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteBinaryU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5634,15 +3405,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteBinaryU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5655,16 +3417,6 @@ class LibraryInterpreter(BaseInterpreter):
         num_samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteCtrFreq
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             frequency, duty_cycle, ctypes.byref(num_samps_per_chan_written),
@@ -5675,14 +3427,6 @@ class LibraryInterpreter(BaseInterpreter):
     def write_ctr_freq_scalar(
             self, task, auto_start, timeout, frequency, duty_cycle):
         cfunc = lib_importer.windll.DAQmxWriteCtrFreqScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double,
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, auto_start, timeout, frequency, duty_cycle, None)
         self.check_for_error(error_code)
@@ -5693,16 +3437,6 @@ class LibraryInterpreter(BaseInterpreter):
         num_samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteCtrTicks
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             high_ticks, low_ticks, ctypes.byref(num_samps_per_chan_written),
@@ -5713,13 +3447,6 @@ class LibraryInterpreter(BaseInterpreter):
     def write_ctr_ticks_scalar(
             self, task, auto_start, timeout, high_ticks, low_ticks):
         cfunc = lib_importer.windll.DAQmxWriteCtrTicksScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, auto_start, timeout, high_ticks, low_ticks, None)
         self.check_for_error(error_code)
@@ -5730,16 +3457,6 @@ class LibraryInterpreter(BaseInterpreter):
         num_samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteCtrTime
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             high_time, low_time, ctypes.byref(num_samps_per_chan_written),
@@ -5750,14 +3467,6 @@ class LibraryInterpreter(BaseInterpreter):
     def write_ctr_time_scalar(
             self, task, auto_start, timeout, high_time, low_time):
         cfunc = lib_importer.windll.DAQmxWriteCtrTimeScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double,
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, auto_start, timeout, high_time, low_time, None)
         self.check_for_error(error_code)
@@ -5768,15 +3477,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteDigitalLines
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=bool, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5785,13 +3485,6 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_digital_scalar_u32(self, task, auto_start, timeout, value):
         cfunc = lib_importer.windll.DAQmxWriteDigitalScalarU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_uint, ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, auto_start, timeout, value, None)
         self.check_for_error(error_code)
@@ -5802,15 +3495,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteDigitalU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5823,15 +3507,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteDigitalU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5844,15 +3519,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteDigitalU8
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
             write_array, ctypes.byref(samps_per_chan_written), None)
@@ -5862,13 +3528,6 @@ class LibraryInterpreter(BaseInterpreter):
     def write_to_teds_from_array(
             self, physical_channel, bit_stream, basic_teds_options):
         cfunc = lib_importer.windll.DAQmxWriteToTEDSFromArray
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, wrapped_ndpointer(dtype=numpy.uint8,
-                        flags=('C')), ctypes.c_uint, ctypes.c_int]
-
         error_code = cfunc(
             physical_channel, bit_stream, len(bit_stream), basic_teds_options)
         self.check_for_error(error_code)
@@ -5876,12 +3535,6 @@ class LibraryInterpreter(BaseInterpreter):
     def write_to_teds_from_file(
             self, physical_channel, file_path, basic_teds_options):
         cfunc = lib_importer.windll.DAQmxWriteToTEDSFromFile
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ctypes_byte_str, ctypes_byte_str, ctypes.c_int]
-
         error_code = cfunc(
             physical_channel, file_path, basic_teds_options)
         self.check_for_error(error_code)
@@ -5890,12 +3543,6 @@ class LibraryInterpreter(BaseInterpreter):
         error_buffer = ctypes.create_string_buffer(2048)
 
         cfunc = lib_importer.windll.DAQmxGetErrorString
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [ctypes.c_int, ctypes.c_char_p,
-                                      ctypes.c_uint]
-
         query_error_code = cfunc(error_code, error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get error string for error code %d. DAQmxGetErrorString returned error code %d.', error_code, query_error_code)
@@ -5906,11 +3553,6 @@ class LibraryInterpreter(BaseInterpreter):
         error_buffer = ctypes.create_string_buffer(2048)
 
         cfunc = lib_importer.windll.DAQmxGetExtendedErrorInfo
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [ctypes.c_char_p, ctypes.c_uint]
-
         query_error_code = cfunc(error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get extended error info. DAQmxGetExtendedErrorInfo returned error code %d.', query_error_code)
@@ -5923,17 +3565,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadPowerBinaryI16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
-                        c_bool32,
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode,
             read_voltage_array, read_current_array, read_voltage_array.size,
@@ -5948,17 +3579,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadPowerF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
-                        c_bool32,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode,
             read_voltage_array, read_current_array, read_voltage_array.size,
@@ -5972,15 +3592,6 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_bytes_per_sample = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadRaw
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
-                        wrapped_ndpointer(dtype=read_array.dtype, flags=('C', 'W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, read_array,
             read_array.nbytes, ctypes.byref(samples_read),
@@ -5994,16 +3605,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteRaw
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy_array.dtype,
-                                        flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task_handle, num_samps_per_chan, auto_start, timeout, numpy_array,
             ctypes.byref(samps_per_chan_written), None)
@@ -6014,6 +3615,18 @@ class LibraryInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.value)
 
+    def batch(self):
+        # Library calls have no round trip to save, so there is nothing to batch.
+        return contextlib.nullcontext()
+
+    def close(self):
+        # The library interpreter does not create any resources.
+        pass
+
+    def call_concurrently(self, funcs):
+        # Library calls have no round trip to overlap.
+        return [func() for func in funcs]
+
     def check_for_error(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
         if not error_code:
             return
@@ -6041,4 +3654,777 @@ def is_string_buffer_too_small(error_code):
 
 
 def is_array_buffer_too_small(error_code):
-    return error_code == DAQmxErrors.WRITE_BUFFER_TOO_SMALL
\ No newline at end of file
+    return error_code == DAQmxErrors.WRITE_BUFFER_TOO_SMALL
+
+
+# The argument types of the NI-DAQmx C functions that this module calls. This module registers
+# them with lib_importer, and DaqFunctionImporter sets them once, when it first looks up each
+# function, so the interpreter methods call the functions without checking them. They are lambdas
+# because the task handle type depends on the driver version.
+_FUNCTION_ARGTYPES = {
+    'DAQmxAddCDAQSyncConnection': lambda: [
+        ctypes_byte_str],
+    'DAQmxAddGlobalChansToTask': lambda: [
+        lib_importer.task_handle, ctypes_byte_str],
+    'DAQmxAddNetworkDevice': lambda: [
+        ctypes_byte_str, ctypes_byte_str, c_bool32, ctypes.c_double,
+        ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxAreConfiguredCDAQSyncPortsDisconnected': lambda: [
+        ctypes_byte_str, ctypes.c_double, ctypes.POINTER(c_bool32)],
+    'DAQmxAutoConfigureCDAQSyncConnections': lambda: [
+        ctypes_byte_str, ctypes.c_double],
+    'DAQmxCalculateReversePolyCoeff': lambda: [
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W'))],
+    'DAQmxCfgAnlgEdgeRefTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+        ctypes.c_double, ctypes.c_uint],
+    'DAQmxCfgAnlgEdgeStartTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+        ctypes.c_double],
+    'DAQmxCfgAnlgWindowRefTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+        ctypes.c_double, ctypes.c_double, ctypes.c_uint],
+    'DAQmxCfgAnlgWindowStartTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+        ctypes.c_double, ctypes.c_double],
+    'DAQmxCfgBurstHandshakingTimingExportClock': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong,
+        ctypes.c_double, ctypes_byte_str, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int],
+    'DAQmxCfgBurstHandshakingTimingImportClock': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong,
+        ctypes.c_double, ctypes_byte_str, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int],
+    'DAQmxCfgChangeDetectionTiming': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_ulonglong],
+    'DAQmxCfgDigEdgeRefTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int, ctypes.c_uint],
+    'DAQmxCfgDigEdgeStartTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int],
+    'DAQmxCfgDigPatternRefTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_uint],
+    'DAQmxCfgDigPatternStartTrig': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int],
+    'DAQmxCfgHandshakingTiming': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong],
+    'DAQmxCfgImplicitTiming': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_ulonglong],
+    'DAQmxCfgPipelinedSampClkTiming': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_double,
+        ctypes.c_int, ctypes.c_int, ctypes.c_ulonglong],
+    'DAQmxCfgSampClkTiming': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_double,
+        ctypes.c_int, ctypes.c_int, ctypes.c_ulonglong],
+    'DAQmxCfgWatchdogAOExpirStates': lambda: [
+        lib_importer.task_handle, ctypes_byte_str,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        wrapped_ndpointer(dtype=numpy.int32, flags=('C')), ctypes.c_uint],
+    'DAQmxCfgWatchdogCOExpirStates': lambda: [
+        lib_importer.task_handle, ctypes_byte_str,
+        wrapped_ndpointer(dtype=numpy.int32, flags=('C')), ctypes.c_uint],
+    'DAQmxCfgWatchdogDOExpirStates': lambda: [
+        lib_importer.task_handle, ctypes_byte_str,
+        wrapped_ndpointer(dtype=numpy.int32, flags=('C')), ctypes.c_uint],
+    'DAQmxClearTEDS': lambda: [
+        ctypes_byte_str],
+    'DAQmxClearTask': lambda: [
+        lib_importer.task_handle],
+    'DAQmxConfigureLogging': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int,
+        ctypes_byte_str, ctypes.c_int],
+    'DAQmxConfigureTEDS': lambda: [
+        ctypes_byte_str, ctypes_byte_str],
+    'DAQmxConnectTerms': lambda: [
+        ctypes_byte_str, ctypes_byte_str, ctypes.c_int],
+    'DAQmxControlWatchdogTask': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxCreateAIAccel4WireDCVoltageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+        c_bool32, ctypes_byte_str],
+    'DAQmxCreateAIAccelChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+        ctypes_byte_str],
+    'DAQmxCreateAIAccelChargeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIBridgeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAIChargeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes_byte_str],
+    'DAQmxCreateAICurrentChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAICurrentRMSChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAIForceBridgePolynomialChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIForceBridgeTableChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIForceBridgeTwoPointLinChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIForceIEPEChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+        ctypes_byte_str],
+    'DAQmxCreateAIFreqVoltageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_double,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAIMicrophoneChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAIPosEddyCurrProxProbeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_double,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIPosLVDTChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_double,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIPosRVDTChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_double,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIPowerChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, c_bool32],
+    'DAQmxCreateAIPressureBridgePolynomialChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIPressureBridgeTableChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIPressureBridgeTwoPointLinChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIRTDChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double],
+    'DAQmxCreateAIResistanceChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAIRosetteStrainGageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.int32, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_double, ctypes.c_double],
+    'DAQmxCreateAIStrainGageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_double, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAITempBuiltInSensorChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int],
+    'DAQmxCreateAIThrmcplChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateAIThrmstrChanIex': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double],
+    'DAQmxCreateAIThrmstrChanVex': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_double],
+    'DAQmxCreateAITorqueBridgePolynomialChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAITorqueBridgeTableChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')), ctypes.c_uint,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAITorqueBridgeTwoPointLinChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAIVelocityIEPEChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_double, ctypes.c_int, ctypes.c_int, ctypes.c_double,
+        ctypes_byte_str],
+    'DAQmxCreateAIVoltageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes_byte_str],
+    'DAQmxCreateAIVoltageChanWithExcit': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, c_bool32, ctypes_byte_str],
+    'DAQmxCreateAIVoltageRMSChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes_byte_str],
+    'DAQmxCreateAOCurrentChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateAOFuncGenChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_double],
+    'DAQmxCreateAOVoltageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateCIAngEncoderChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, c_bool32, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_uint, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateCIAngVelocityChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_uint, ctypes_byte_str],
+    'DAQmxCreateCICountEdgesChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_uint, ctypes.c_int],
+    'DAQmxCreateCIDutyCycleChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateCIFreqChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_uint, ctypes_byte_str],
+    'DAQmxCreateCIGPSTimestampChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateCILinEncoderChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, c_bool32, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateCILinVelocityChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateCIPeriodChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_uint, ctypes_byte_str],
+    'DAQmxCreateCIPulseChanFreq': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int],
+    'DAQmxCreateCIPulseChanTicks': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes_byte_str, ctypes.c_double, ctypes.c_double],
+    'DAQmxCreateCIPulseChanTime': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int],
+    'DAQmxCreateCIPulseWidthChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes_byte_str],
+    'DAQmxCreateCISemiPeriodChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateCITwoEdgeSepChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateCOPulseChanFreq': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double],
+    'DAQmxCreateCOPulseChanTicks': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes_byte_str, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int],
+    'DAQmxCreateCOPulseChanTime': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double],
+    'DAQmxCreateDIChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int],
+    'DAQmxCreateDOChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int],
+    'DAQmxCreateLinScale': lambda: [
+        ctypes_byte_str, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes_byte_str],
+    'DAQmxCreateMapScale': lambda: [
+        ctypes_byte_str, ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreatePolynomialScale': lambda: [
+        ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateTEDSAIAccelChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIBridgeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAICurrentChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIForceBridgeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIForceIEPEChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIMicrophoneChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIPosLVDTChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateTEDSAIPosRVDTChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateTEDSAIPressureBridgeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIRTDChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double],
+    'DAQmxCreateTEDSAIResistanceChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIStrainGageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes.c_double, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIThrmcplChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIThrmstrChanIex': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double],
+    'DAQmxCreateTEDSAIThrmstrChanVex': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double],
+    'DAQmxCreateTEDSAITorqueBridgeChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_double, ctypes.c_double, ctypes.c_int, ctypes.c_int,
+        ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTEDSAIVoltageChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes_byte_str],
+    'DAQmxCreateTEDSAIVoltageChanWithExcit': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_int, ctypes.c_double, ctypes.c_double, ctypes.c_int,
+        ctypes.c_int, ctypes.c_double, ctypes_byte_str],
+    'DAQmxCreateTableScale': lambda: [
+        ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.c_uint, ctypes.c_int, ctypes_byte_str],
+    'DAQmxCreateTask': lambda: [
+        ctypes_byte_str, ctypes.POINTER(lib_importer.task_handle)],
+    'DAQmxCreateWatchdogTimerTaskEx': lambda: [
+        ctypes_byte_str, ctypes_byte_str,
+        ctypes.POINTER(lib_importer.task_handle), ctypes.c_double],
+    'DAQmxDeleteNetworkDevice': lambda: [
+        ctypes_byte_str],
+    'DAQmxDeleteSavedGlobalChan': lambda: [
+        ctypes_byte_str],
+    'DAQmxDeleteSavedScale': lambda: [
+        ctypes_byte_str],
+    'DAQmxDeleteSavedTask': lambda: [
+        ctypes_byte_str],
+    'DAQmxDisableRefTrig': lambda: [
+        lib_importer.task_handle],
+    'DAQmxDisableStartTrig': lambda: [
+        lib_importer.task_handle],
+    'DAQmxDisconnectTerms': lambda: [
+        ctypes_byte_str, ctypes_byte_str],
+    'DAQmxExportSignal': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes_byte_str],
+    'DAQmxGetAnalogPowerUpStatesWithOutputType': lambda: [
+        ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64,
+        flags=('C','W')), wrapped_ndpointer(dtype=numpy.int32,
+        flags=('C','W')), ctypes.POINTER(ctypes.c_uint)],
+    'DAQmxGetAutoConfiguredCDAQSyncConnections': lambda: [
+        ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxGetBufferAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxGetChanAttribute': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetDeviceAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetDigitalLogicFamilyPowerUpState': lambda: [
+        ctypes_byte_str, ctypes.POINTER(ctypes.c_int)],
+    'DAQmxGetDisconnectedCDAQSyncPorts': lambda: [
+        ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxGetExportedSignalAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxGetPersistedChanAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetPersistedScaleAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetPersistedTaskAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetPhysicalChanAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetReadAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxGetScaleAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetSystemInfoAttribute': lambda: [
+        ctypes.c_int32],
+    'DAQmxGetTaskAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxGetTimingAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxGetTimingAttributeEx': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetTrigAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxGetWatchdogAttribute': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxGetWriteAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxIsTaskDone': lambda: [
+        lib_importer.task_handle, ctypes.POINTER(c_bool32)],
+    'DAQmxLoadTask': lambda: [
+        ctypes_byte_str, ctypes.POINTER(lib_importer.task_handle)],
+    'DAQmxReadAnalogF64': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadAnalogScalarF64': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+    'DAQmxReadBinaryI16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.int16, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadBinaryI32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.int32, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadBinaryU16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint16, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadBinaryU32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCounterF64': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCounterF64Ex': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCounterScalarF64': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCounterScalarU32': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCounterU32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCounterU32Ex': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCtrFreq': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCtrFreqScalar': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(c_bool32)],
+    'DAQmxReadCtrTicks': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')),
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCtrTicksScalar': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint),
+        ctypes.POINTER(c_bool32)],
+    'DAQmxReadCtrTime': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadCtrTimeScalar': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(c_bool32)],
+    'DAQmxReadDigitalLines': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=bool, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(c_bool32)],
+    'DAQmxReadDigitalScalarU32': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(c_bool32)],
+    'DAQmxReadDigitalU16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint16, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadDigitalU32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadDigitalU8': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, ctypes.c_int,
+        wrapped_ndpointer(dtype=numpy.uint8, flags=('C','W')), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadPowerScalarF64': lambda: [
+        lib_importer.task_handle, ctypes.c_double,
+        ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(c_bool32)],
+    'DAQmxRegisterDoneEvent': lambda: [
+        lib_importer.task_handle, ctypes.c_uint,
+        ctypes.CFUNCTYPE(ctypes.c_int32, lib_importer.task_handle,
+        ctypes.c_int, ctypes.c_void_p), ctypes.POINTER(ctypes.c_void_p)],
+    'DAQmxRegisterEveryNSamplesEvent': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_uint, ctypes.c_uint,
+        ctypes.CFUNCTYPE(ctypes.c_int32, lib_importer.task_handle,
+        ctypes.c_int, ctypes.c_uint, ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_void_p)],
+    'DAQmxRegisterSignalEvent': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
+        ctypes.CFUNCTYPE(ctypes.c_int32, lib_importer.task_handle,
+        ctypes.c_int, ctypes.c_void_p), ctypes.POINTER(ctypes.c_void_p)],
+    'DAQmxRemoveCDAQSyncConnection': lambda: [
+        ctypes_byte_str],
+    'DAQmxReserveNetworkDevice': lambda: [
+        ctypes_byte_str, c_bool32],
+    'DAQmxResetBufferAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxResetChanAttribute': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxResetDevice': lambda: [
+        ctypes_byte_str],
+    'DAQmxResetExportedSignalAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxResetReadAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxResetTimingAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxResetTimingAttributeEx': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int],
+    'DAQmxResetTrigAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxResetWatchdogAttribute': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int],
+    'DAQmxResetWriteAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxSaveGlobalChan': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes_byte_str, ctypes.c_uint32],
+    'DAQmxSaveScale': lambda: [
+        ctypes_byte_str, ctypes_byte_str, ctypes_byte_str, ctypes.c_uint32],
+    'DAQmxSaveTask': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes_byte_str,
+        ctypes.c_uint32],
+    'DAQmxSelfTestDevice': lambda: [
+        ctypes_byte_str],
+    'DAQmxSetAnalogPowerUpStatesWithOutputType': lambda: [
+        ctypes_byte_str, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        wrapped_ndpointer(dtype=numpy.int32, flags=('C')), ctypes.c_uint],
+    'DAQmxSetBufferAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxSetChanAttribute': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxSetDigitalLogicFamilyPowerUpState': lambda: [
+        ctypes_byte_str, ctypes.c_int],
+    'DAQmxSetExportedSignalAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxSetReadAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxSetScaleAttribute': lambda: [
+        ctypes_byte_str, ctypes.c_int32],
+    'DAQmxSetTimingAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxSetTimingAttributeEx': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxSetTrigAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxSetWatchdogAttribute': lambda: [
+        lib_importer.task_handle, ctypes_byte_str, ctypes.c_int32],
+    'DAQmxSetWriteAttribute': lambda: [
+        lib_importer.task_handle, ctypes.c_int32],
+    'DAQmxStartNewFile': lambda: [
+        lib_importer.task_handle, ctypes_byte_str],
+    'DAQmxStartTask': lambda: [
+        lib_importer.task_handle],
+    'DAQmxStopTask': lambda: [
+        lib_importer.task_handle],
+    'DAQmxTaskControl': lambda: [
+        lib_importer.task_handle, ctypes.c_int],
+    'DAQmxTristateOutputTerm': lambda: [
+        ctypes_byte_str],
+    'DAQmxUnreserveNetworkDevice': lambda: [
+        ctypes_byte_str],
+    'DAQmxWaitUntilTaskDone': lambda: [
+        lib_importer.task_handle, ctypes.c_double],
+    'DAQmxWriteAnalogF64': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteAnalogScalarF64': lambda: [
+        lib_importer.task_handle, c_bool32, ctypes.c_double, ctypes.c_double,
+        ctypes.POINTER(c_bool32)],
+    'DAQmxWriteBinaryI16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.int16, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteBinaryI32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteBinaryU16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteBinaryU32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteCtrFreq': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteCtrFreqScalar': lambda: [
+        lib_importer.task_handle, c_bool32, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.POINTER(c_bool32)],
+    'DAQmxWriteCtrTicks': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteCtrTicksScalar': lambda: [
+        lib_importer.task_handle, c_bool32, ctypes.c_double, ctypes.c_uint,
+        ctypes.c_uint, ctypes.POINTER(c_bool32)],
+    'DAQmxWriteCtrTime': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteCtrTimeScalar': lambda: [
+        lib_importer.task_handle, c_bool32, ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.POINTER(c_bool32)],
+    'DAQmxWriteDigitalLines': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=bool, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteDigitalScalarU32': lambda: [
+        lib_importer.task_handle, c_bool32, ctypes.c_double, ctypes.c_uint,
+        ctypes.POINTER(c_bool32)],
+    'DAQmxWriteDigitalU16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteDigitalU32': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteDigitalU8': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteToTEDSFromArray': lambda: [
+        ctypes_byte_str, wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
+        ctypes.c_uint, ctypes.c_int],
+    'DAQmxWriteToTEDSFromFile': lambda: [
+        ctypes_byte_str, ctypes_byte_str, ctypes.c_int],
+    'DAQmxGetErrorString': lambda: [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxGetExtendedErrorInfo': lambda: [ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxReadPowerBinaryI16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, c_bool32,
+        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
+        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadPowerF64': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, c_bool32,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    # Raw reads and writes accept arrays of any data type.
+    'DAQmxReadRaw': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+        wrapped_ndpointer(flags=('C', 'W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteRaw': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        wrapped_ndpointer(flags=('C')), ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(c_bool32)],
+}
+
+lib_importer.register_function_argtypes(_FUNCTION_ARGTYPES)
@@ -24,11 +24,11 @@ class AIChannelCollection(ChannelCollection):
     """
     Contains the collection of analog input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task, interpreter):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ai_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task, interpreter)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -55,6 +55,8 @@ class AIChannelCollection(ChannelCollection):
         else:
             name = physical_channel
 
+        # The channels in the task changed, so the task must rebuild its read and write plans.
+        self._task._invalidate_channel_plans()
         return AIChannel(self._handle, name, self._interpreter)
 
     def add_ai_accel_4_wire_dc_voltage_chan(
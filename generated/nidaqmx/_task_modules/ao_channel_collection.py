@@ -11,11 +11,11 @@ class AOChannelCollection(ChannelCollection):
     """
     Contains the collection of analog output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task, interpreter):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ao_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task, interpreter)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -42,6 +42,8 @@ class AOChannelCollection(ChannelCollection):
         else:
             name = physical_channel
 
+        # The channels in the task changed, so the task must rebuild its read and write plans.
+        self._task._invalidate_channel_plans()
         return AOChannel(self._handle, name, self._interpreter)
 
     def add_ao_current_chan(
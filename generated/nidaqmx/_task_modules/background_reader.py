@@ -0,0 +1,253 @@
+import collections
+import queue
+
+import numpy
+
+from nidaqmx._task_modules.chunk_stream import ChunkStream
+from nidaqmx.constants import ChannelType, UsageTypeCI
+from nidaqmx.stream_readers import (
+    AnalogMultiChannelReader,
+    AnalogSingleChannelReader,
+    AnalogUnscaledReader,
+    CounterReader,
+    PowerMultiChannelReader,
+    PowerSingleChannelReader,
+)
+from nidaqmx.types import CtrFreq, CtrTick, CtrTime, PowerMeasurement
+
+
+class BackgroundReader(ChunkStream):
+    """
+    Iterates over chunks of samples that a background thread reads from a
+    task into a pool of reusable NumPy arrays.
+
+    The background thread reads each chunk with a stream reader, directly
+    into an array from the pool, and adds the array to a queue of up to
+    queue_depth chunks. Call :py:meth:`release` when you are done with a
+    chunk to return its array to the pool. The pool grows if the pool is
+    empty when the background thread starts a read.
+
+    Unlike :py:class:`nidaqmx._task_modules.chunk_stream.ChunkStream`, the
+    background thread never waits for the consumer. If the queue is full,
+    the background thread discards the oldest queued chunk and increments
+    :py:attr:`overflow_count`, so that the DAQmx buffer keeps draining even
+    if the consumer falls behind.
+
+    Use :py:meth:`nidaqmx._task_modules.in_stream.InStream.start_background_reader`
+    to create a BackgroundReader.
+    """
+
+    __slots__ = [
+        "_chunk_reader",
+        "_free_arrays",
+        "_chunks_read",
+        "_overflow_count",
+    ]
+
+    _thread_description = "background reader"
+
+    def __init__(self, task, samples_per_chunk, queue_depth, reader_cls, timeout):
+        """
+        Do not construct this object directly; instead, call
+        task.in_stream.start_background_reader().
+        """
+        self._chunk_reader = _ChunkReader(task, reader_cls)
+        self._free_arrays = collections.deque()
+        self._chunks_read = 0
+        self._overflow_count = 0
+        super().__init__(task, samples_per_chunk, queue_depth, timeout)
+
+    @property
+    def chunks_read(self):
+        """
+        int: Indicates the number of chunks that the background thread
+            has read, including chunks that it discarded.
+        """
+        return self._chunks_read
+
+    @property
+    def overflow_count(self):
+        """
+        int: Indicates the number of chunks that the background thread
+            discarded because the queue was full.
+        """
+        return self._overflow_count
+
+    def release(self, chunk):
+        """
+        Returns a chunk's array to the pool so that the background thread
+        can reuse it.
+
+        Do not use the chunk after you release it.
+
+        Args:
+            chunk (numpy.ndarray or namedtuple): Specifies a chunk that
+                this reader returned.
+        """
+        arrays = self._chunk_reader.get_arrays(chunk)
+        if arrays[0].shape[-1] == self._samples_per_chunk:
+            self._free_arrays.append(arrays)
+
+    def _read_chunk(self):
+        try:
+            arrays = self._free_arrays.popleft()
+        except IndexError:
+            arrays = self._chunk_reader.allocate(self._samples_per_chunk)
+        samples_read = self._chunk_reader.read(arrays, self._timeout)
+        self._chunks_read += 1
+        if samples_read < self._samples_per_chunk:
+            # Return a copy of the partial chunk so the full-size arrays stay
+            # in the pool.
+            self._free_arrays.append(arrays)
+            arrays = tuple(array[..., :samples_read].copy() for array in arrays)
+        return self._chunk_reader.get_chunk(arrays, samples_read)
+
+    def _put(self, item):
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            # Discard the oldest chunk to make room. The consumer may take it
+            # first, in which case there is room on the next attempt.
+            try:
+                oldest = self._queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._overflow_count += 1
+            self.release(oldest)
+
+
+class _ChunkReader:
+    """
+    Reads chunks of samples into preallocated NumPy arrays with a stream
+    reader.
+
+    Each chunk is stored in a tuple of arrays: one array for most readers,
+    and one array per field of the chunk type for readers that return a
+    namedtuple, such as a voltage array and a current array for power
+    readers.
+    """
+
+    __slots__ = ["_read_many_sample", "_shape_prefix", "_dtype", "_chunk_type"]
+
+    def __init__(self, task, reader_cls):
+        read_plan = task._get_read_plan()
+        if reader_cls is None:
+            if read_plan.read_chan_type == ChannelType.ANALOG_INPUT:
+                if read_plan.has_power_chan:
+                    reader_cls = PowerMultiChannelReader
+                else:
+                    reader_cls = AnalogMultiChannelReader
+            elif read_plan.read_chan_type == ChannelType.COUNTER_INPUT:
+                reader_cls = CounterReader
+            else:
+                raise ValueError(
+                    "Specify reader_cls to read chunks from {} channels.".format(
+                        read_plan.read_chan_type.name.lower().replace("_", " ")
+                    )
+                )
+
+        stream_reader = reader_cls(task.in_stream)
+        multi_channel_shape_prefix = (read_plan.number_of_channels,)
+        self._chunk_type = None
+        if reader_cls is AnalogMultiChannelReader:
+            self._read_many_sample = stream_reader.read_many_sample
+            self._shape_prefix = multi_channel_shape_prefix
+            self._dtype = numpy.float64
+        elif reader_cls is AnalogUnscaledReader:
+            self._read_many_sample = stream_reader.read_int16
+            self._shape_prefix = multi_channel_shape_prefix
+            self._dtype = numpy.int16
+        elif reader_cls is AnalogSingleChannelReader:
+            self._read_many_sample = stream_reader.read_many_sample
+            self._shape_prefix = ()
+            self._dtype = numpy.float64
+        elif reader_cls is CounterReader:
+            self._shape_prefix = ()
+            meas_type = read_plan.ci_meas_type
+            if meas_type == UsageTypeCI.PULSE_FREQ:
+                self._read_many_sample = stream_reader.read_many_sample_pulse_frequency
+                self._dtype = numpy.float64
+                self._chunk_type = CtrFreq
+            elif meas_type == UsageTypeCI.PULSE_TIME:
+                self._read_many_sample = stream_reader.read_many_sample_pulse_time
+                self._dtype = numpy.float64
+                self._chunk_type = CtrTime
+            elif meas_type == UsageTypeCI.PULSE_TICKS:
+                self._read_many_sample = stream_reader.read_many_sample_pulse_ticks
+                self._dtype = numpy.uint32
+                self._chunk_type = CtrTick
+            elif meas_type == UsageTypeCI.COUNT_EDGES:
+                self._read_many_sample = stream_reader.read_many_sample_uint32
+                self._dtype = numpy.uint32
+            else:
+                self._read_many_sample = stream_reader.read_many_sample_double
+                self._dtype = numpy.float64
+        elif reader_cls is PowerMultiChannelReader:
+            self._read_many_sample = stream_reader.read_many_sample
+            self._shape_prefix = multi_channel_shape_prefix
+            self._dtype = numpy.float64
+            self._chunk_type = PowerMeasurement
+        elif reader_cls is PowerSingleChannelReader:
+            self._read_many_sample = stream_reader.read_many_sample
+            self._shape_prefix = ()
+            self._dtype = numpy.float64
+            self._chunk_type = PowerMeasurement
+        else:
+            raise ValueError(
+                "reader_cls must be AnalogMultiChannelReader, AnalogSingleChannelReader, "
+                "AnalogUnscaledReader, CounterReader, PowerMultiChannelReader, or "
+                "PowerSingleChannelReader."
+            )
+
+    def allocate(self, number_of_samples_per_channel):
+        """
+        Allocates arrays that hold number_of_samples_per_channel samples.
+        """
+        shape = self._shape_prefix + (number_of_samples_per_channel,)
+        number_of_arrays = 1 if self._chunk_type is None else len(self._chunk_type._fields)
+        return tuple(numpy.empty(shape, dtype=self._dtype) for _ in range(number_of_arrays))
+
+    def get_capacity(self, arrays):
+        """
+        Returns the number of samples per channel that the arrays can hold.
+        """
+        return arrays[0].size // int(numpy.prod(self._shape_prefix, dtype=int))
+
+    def get_views(self, arrays, number_of_samples_per_channel):
+        """
+        Returns contiguous views of the start of the arrays with the shape
+        that the stream reader requires to read number_of_samples_per_channel
+        samples.
+        """
+        shape = self._shape_prefix + (number_of_samples_per_channel,)
+        size = int(numpy.prod(shape, dtype=int))
+        return tuple(array.reshape(-1)[:size].reshape(shape) for array in arrays)
+
+    def read(self, arrays, timeout):
+        """
+        Fills the arrays with samples and returns the number of samples per
+        channel read.
+        """
+        return self._read_many_sample(*arrays, arrays[0].shape[-1], timeout)
+
+    def get_chunk(self, arrays, number_of_samples_per_channel):
+        """
+        Returns the chunk for the first number_of_samples_per_channel
+        samples that read() stored in each channel of the arrays.
+        """
+        if number_of_samples_per_channel < arrays[0].shape[-1]:
+            arrays = tuple(array[..., :number_of_samples_per_channel] for array in arrays)
+        if self._chunk_type is not None:
+            return self._chunk_type(*arrays)
+        return arrays[0]
+
+    def get_arrays(self, chunk):
+        """
+        Returns the tuple of arrays that stores a chunk.
+        """
+        if self._chunk_type is not None:
+            return tuple(chunk)
+        return (chunk,)
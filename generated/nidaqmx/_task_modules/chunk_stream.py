@@ -0,0 +1,144 @@
+import queue
+import threading
+
+# Queued by close() to wake up a consumer that is waiting for the next chunk.
+_END_OF_STREAM = object()
+
+
+class ChunkStream:
+    """
+    Iterates over chunks of samples that a background thread reads from a
+    task.
+
+    The background thread issues the next read as soon as the previous one
+    completes, so the consumer's processing time overlaps with the read,
+    including the round trip to the server when using gRPC. Up to
+    queue_depth chunks are buffered on the client. When the queue is full,
+    the background thread stops reading until the consumer catches up, and
+    samples accumulate in the DAQmx buffer instead.
+
+    Use :py:meth:`nidaqmx._task_modules.in_stream.InStream.stream_chunks`
+    to create a ChunkStream.
+    """
+
+    # Identifies the background thread in its name.
+    _thread_description = "chunk stream"
+
+    __slots__ = [
+        "_task",
+        "_samples_per_chunk",
+        "_timeout",
+        "_queue",
+        "_stop_event",
+        "_thread",
+        "_finished",
+    ]
+
+    def __init__(self, task, samples_per_chunk, queue_depth, timeout):
+        """
+        Do not construct this object directly; instead, call
+        task.in_stream.stream_chunks().
+        """
+        if samples_per_chunk < 1:
+            raise ValueError("samples_per_chunk must be greater than 0.")
+        if queue_depth < 1:
+            raise ValueError("queue_depth must be greater than 0.")
+
+        self._task = task
+        self._samples_per_chunk = samples_per_chunk
+        self._timeout = timeout
+        self._queue = queue.Queue(maxsize=queue_depth)
+        self._stop_event = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._thread_main,
+            name=f"nidaqmx {task.name} {self._thread_description} thread",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """
+        Returns the next chunk of samples, waiting for the background thread
+        to read it if necessary.
+
+        Raises:
+            StopIteration: The stream is closed.
+            nidaqmx.errors.DaqError: The background thread failed to read
+                the next chunk. The stream is closed.
+        """
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _END_OF_STREAM:
+            raise StopIteration
+        if isinstance(item, Exception):
+            self.close()
+            raise item
+        return item
+
+    @property
+    def samples_per_chunk(self):
+        """
+        int: Indicates the number of samples per channel in each chunk.
+        """
+        return self._samples_per_chunk
+
+    @property
+    def queued_chunks(self):
+        """
+        int: Indicates the number of chunks that have been read but not
+            yet returned to the consumer.
+        """
+        return self._queue.qsize()
+
+    def close(self):
+        """
+        Stops the background thread and discards any queued chunks.
+
+        If the background thread is in the middle of a read, this method
+        waits for the read to complete. This method does not stop the task.
+        """
+        self._finished = True
+        self._stop_event.set()
+        # Unblock the background thread if it is waiting for space in the queue.
+        while self._thread.is_alive():
+            self._drain_queue()
+            self._thread.join(0.01)
+        self._drain_queue()
+        self._queue.put_nowait(_END_OF_STREAM)
+
+    def _drain_queue(self):
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _read_chunk(self):
+        return self._task.read(self._samples_per_chunk, self._timeout, as_numpy=True)
+
+    def _put(self, item):
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _thread_main(self):
+        try:
+            while not self._stop_event.is_set():
+                self._put(self._read_chunk())
+        except Exception as ex:
+            # Save the exception and re-raise it in the consumer's thread.
+            self._put(ex)
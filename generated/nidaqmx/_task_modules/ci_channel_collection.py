@@ -13,11 +13,11 @@ class CIChannelCollection(ChannelCollection):
     """
     Contains the collection of counter input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task, interpreter):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ci_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task, interpreter)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -44,6 +44,8 @@ class CIChannelCollection(ChannelCollection):
         else:
             name = counter
 
+        # The channels in the task changed, so the task must rebuild its read and write plans.
+        self._task._invalidate_channel_plans()
         return CIChannel(self._handle, name, self._interpreter)
 
     def add_ci_ang_encoder_chan(
@@ -11,11 +11,11 @@ class COChannelCollection(ChannelCollection):
     """
     Contains the collection of counter output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task, interpreter):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.co_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task, interpreter)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -42,6 +42,8 @@ class COChannelCollection(ChannelCollection):
         else:
             name = counter
 
+        # The channels in the task changed, so the task must rebuild its read and write plans.
+        self._task._invalidate_channel_plans()
         return COChannel(self._handle, name, self._interpreter)
 
     def add_co_pulse_chan_freq(
@@ -11,11 +11,11 @@ class DOChannelCollection(ChannelCollection):
     """
     Contains the collection of digital output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    def __init__(self, task, interpreter):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.do_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task, interpreter)
 
     def _create_chan(self, lines, line_grouping, name_to_assign_to_lines=''):
         """
@@ -52,6 +52,8 @@ class DOChannelCollection(ChannelCollection):
             else:
                 name = lines
 
+        # The channels in the task changed, so the task must rebuild its read and write plans.
+        self._task._invalidate_channel_plans()
         return DOChannel(self._handle, name, self._interpreter)
 
     def add_do_chan(
@@ -0,0 +1,243 @@
+import json
+
+import numpy
+
+from nidaqmx.constants import ChannelType, FillMode
+from nidaqmx.errors import DaqError, DaqReadError
+from nidaqmx.stream_readers import scale_raw
+
+__all__ = ['CaptureFile', 'capture_to_file', 'open_capture_file']
+
+_HEADER_VERSION = 1
+
+
+def capture_to_file(task, file_path, number_of_samples_per_channel, samples_per_read=100000,
+                    unscaled=False, timeout=10.0):
+    """
+    Reads a finite number of samples from the analog input channels of a
+    task directly into a memory-mapped file.
+
+    Use this function for acquisitions that are too large to hold in
+    memory. The samples are stored in a NumPy .npy file, one row per
+    sample and one column per channel, so that each read fills a
+    contiguous region of the file without an intermediate copy. A
+    sidecar header file, with the same path as the capture file and a
+    .json extension appended, describes the channels, the data type, the
+    sample rate, and the device scaling coefficients of each channel.
+
+    If a read fails, the header records the number of samples read so
+    far, including the samples that the failed read returned, and this
+    function raises the error.
+
+    Args:
+        task (nidaqmx.task.Task): Specifies the task to read from. The
+            task must contain analog input channels.
+        file_path (str): Specifies the path of the capture file. If the
+            file exists, this function replaces it.
+        number_of_samples_per_channel (int): Specifies the total number of
+            samples per channel to read.
+        samples_per_read (Optional[int]): Specifies the number of samples
+            per channel to read at a time.
+        unscaled (Optional[bool]): Specifies whether to store unscaled
+            integer samples instead of scaled floating-point samples.
+            The integer size is the raw sample size of the channels, 16
+            or 32 bits, so unscaled samples take a quarter or half of
+            the disk space; use :py:meth:`CaptureFile.get_scaled_data`
+            to scale them.
+        timeout (Optional[float]): Specifies the amount of time in seconds
+            to wait for each read.
+    Returns:
+        nidaqmx.capture.CaptureFile:
+
+        Indicates an object that provides read-only access to the
+        captured samples.
+    """
+    read_plan = task._get_read_plan()
+    if read_plan.read_chan_type != ChannelType.ANALOG_INPUT or read_plan.has_power_chan:
+        raise ValueError('capture_to_file() requires a task with analog input channels.')
+    if samples_per_read < 1:
+        raise ValueError('samples_per_read must be greater than 0.')
+
+    channels_to_read = task.in_stream.channels_to_read
+    channel_names = channels_to_read.channel_names
+    if unscaled:
+        samp_size_in_bits = channels_to_read.ai_raw_samp_size
+        if samp_size_in_bits == 16:
+            dtype = numpy.int16
+            read = task._interpreter.read_binary_i16
+        elif samp_size_in_bits == 32:
+            dtype = numpy.int32
+            read = task._interpreter.read_binary_i32
+        else:
+            raise ValueError(
+                'capture_to_file() cannot store unscaled {}-bit samples.'
+                .format(samp_size_in_bits))
+    else:
+        dtype = numpy.float64
+        read = task._interpreter.read_analog_f64
+
+    try:
+        sample_rate = task.timing.samp_clk_rate
+    except DaqError:
+        # The task does not use a sample clock.
+        sample_rate = None
+
+    header = {
+        'version': _HEADER_VERSION,
+        'channel_names': channel_names,
+        'dtype': numpy.dtype(dtype).str,
+        'sample_rate': sample_rate,
+        'scaling_coeffs': [list(coeffs) for coeffs in task._get_ai_dev_scaling_coeffs()],
+        'samples_per_channel': 0,
+    }
+    data = numpy.lib.format.open_memmap(
+        file_path, mode='w+', dtype=dtype,
+        shape=(number_of_samples_per_channel, len(channel_names)))
+
+    samples_per_channel = 0
+    try:
+        while samples_per_channel < number_of_samples_per_channel:
+            samples_to_read = min(
+                samples_per_read, number_of_samples_per_channel - samples_per_channel)
+            try:
+                _, samps_per_chan_read = read(
+                    task._handle, samples_to_read, timeout,
+                    FillMode.GROUP_BY_SCAN_NUMBER.value,
+                    data[samples_per_channel:samples_per_channel + samples_to_read])
+            except DaqReadError as e:
+                # Keep the samples that the failed read stored in the file.
+                samples_per_channel += e.samps_per_chan_read
+                raise
+            samples_per_channel += samps_per_chan_read
+    finally:
+        data.flush()
+        del data
+        header['samples_per_channel'] = samples_per_channel
+        _write_header(file_path, header)
+
+    return open_capture_file(file_path)
+
+
+def open_capture_file(file_path):
+    """
+    Opens a capture file that :py:func:`capture_to_file` created.
+
+    The samples are memory-mapped, not read into memory.
+
+    Args:
+        file_path (str): Specifies the path of the capture file.
+    Returns:
+        nidaqmx.capture.CaptureFile:
+
+        Indicates an object that provides read-only access to the
+        captured samples.
+    """
+    with open(_get_header_path(file_path), encoding='utf-8') as header_file:
+        header = json.load(header_file)
+    if header.get('version') != _HEADER_VERSION:
+        raise ValueError(
+            'The capture file header has version {}, but this version of the '
+            'nidaqmx package supports version {}.'
+            .format(header.get('version'), _HEADER_VERSION))
+    return CaptureFile(numpy.load(file_path, mmap_mode='r'), header)
+
+
+class CaptureFile:
+    """
+    Provides read-only access to the samples in a capture file.
+
+    Do not construct this object directly; instead, call
+    :py:func:`capture_to_file` or :py:func:`open_capture_file`.
+    """
+    __slots__ = ['_data', '_header']
+
+    def __init__(self, data, header):
+        self._data = data
+        self._header = header
+
+    def __repr__(self):
+        return f'CaptureFile(channel_names={self.channel_names})'
+
+    @property
+    def channel_names(self):
+        """
+        List[str]: Indicates the names of the channels, in the order of
+            the columns of :py:attr:`samples`.
+        """
+        return self._header['channel_names']
+
+    @property
+    def channel_data(self):
+        """
+        numpy.ndarray: Indicates the samples that were read, with one row
+            per channel. This array is a view of the memory-mapped file.
+        """
+        return self.samples.T
+
+    @property
+    def sample_rate(self):
+        """
+        float: Indicates the sample clock rate of the task, in samples
+            per second per channel, or None if the task did not use a
+            sample clock.
+        """
+        return self._header['sample_rate']
+
+    @property
+    def samples(self):
+        """
+        numpy.ndarray: Indicates the samples that were read, with one row
+            per sample and one column per channel. This array is a view
+            of the memory-mapped file.
+        """
+        return self._data[:self._header['samples_per_channel']]
+
+    @property
+    def scaling_coeffs(self):
+        """
+        List[List[float]]: Indicates the device scaling coefficients of
+            each channel.
+        """
+        return self._header['scaling_coeffs']
+
+    @property
+    def unscaled(self):
+        """
+        bool: Indicates whether the file contains unscaled integer
+            samples.
+        """
+        return self._data.dtype.kind in 'iu'
+
+    def get_scaled_data(self, start=0, stop=None):
+        """
+        Returns a range of samples scaled to volts, with one row per
+        channel.
+
+        If the file contains unscaled samples, this method scales them
+        with the device scaling coefficients in the header; otherwise,
+        it returns a view of the samples.
+
+        Args:
+            start (Optional[int]): Specifies the index of the first sample
+                to return.
+            stop (Optional[int]): Specifies the index after the last sample
+                to return. If you do not specify an index, this method
+                returns the samples up to the end of the file.
+        Returns:
+            numpy.ndarray:
+
+            The scaled samples.
+        """
+        channel_data = self.channel_data[:, start:stop]
+        if not self.unscaled:
+            return channel_data
+        return scale_raw(channel_data, self.scaling_coeffs)
+
+
+def _get_header_path(file_path):
+    return f'{file_path}.json'
+
+
+def _write_header(file_path, header):
+    with open(_get_header_path(file_path), 'w', encoding='utf-8') as header_file:
+        json.dump(header, header_file, indent=2)
@@ -0,0 +1,221 @@
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+
+__all__ = ['EventDispatcher']
+
+_logger = logging.getLogger(__name__)
+
+
+class EventDispatcher:
+    """
+    Runs task event callbacks on a pool of worker threads or on an asyncio
+    event loop instead of on the NI-DAQmx driver thread.
+
+    By default, NI-DAQmx calls event callbacks on a thread that it owns,
+    so a slow callback delays event delivery for every task in the
+    process. When you assign an EventDispatcher to
+    :py:attr:`nidaqmx.task.Task.event_dispatcher`, the callbacks that you
+    register afterwards only record the event and return. The dispatcher
+    then calls your callback with the same arguments.
+
+    Callbacks for the same task run one at a time, in the order that the
+    events occurred. Callbacks for different tasks can run concurrently on
+    different worker threads. The return value of a dispatched callback is
+    ignored, and the dispatcher logs exceptions that a callback raises.
+
+    You can share one dispatcher between several tasks. Close the
+    dispatcher after you close the tasks that use it.
+
+    Example:
+        >>> with EventDispatcher(max_workers=4) as dispatcher:
+        ...     task.event_dispatcher = dispatcher
+        ...     task.register_every_n_samples_acquired_into_buffer_event(
+        ...         1000, callback)
+    """
+    __slots__ = [
+        '_executor', '_loop', '_lock', '_idle', '_queues', '_closed', '_events_pending',
+        '_max_events_pending', '_events_dispatched', '_total_latency', '_max_latency']
+
+    def __init__(self, max_workers=1, *, loop=None):
+        """
+        Args:
+            max_workers (Optional[int]): Specifies the number of worker
+                threads that run callbacks.
+            loop (Optional[asyncio.AbstractEventLoop]): Specifies an
+                asyncio event loop to run callbacks on. If you specify a
+                loop, the dispatcher does not create worker threads.
+        """
+        if loop is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='nidaqmx event dispatcher')
+        else:
+            self._executor = None
+        self._loop = loop
+        self._lock = threading.Lock()
+        # Notified when the last pending event of all tasks has run.
+        self._idle = threading.Condition(self._lock)
+        # Maps each task with pending events to a queue of (time, callback, args)
+        # records. A task is in this dict if and only if a run of its next event
+        # is scheduled, which keeps the events of a task in order.
+        self._queues = {}
+        self._closed = False
+        self._events_pending = 0
+        self._max_events_pending = 0
+        self._events_dispatched = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def events_dispatched(self):
+        """
+        int: Indicates the number of callbacks that the dispatcher has
+            started running.
+        """
+        return self._events_dispatched
+
+    @property
+    def events_pending(self):
+        """
+        int: Indicates the number of events whose callbacks have not
+            started running yet.
+        """
+        return self._events_pending
+
+    @property
+    def max_events_pending(self):
+        """
+        int: Indicates the largest number of events that have been pending
+            at the same time.
+        """
+        return self._max_events_pending
+
+    @property
+    def max_latency(self):
+        """
+        float: Indicates the longest time, in seconds, between an event
+            and the start of its callback.
+        """
+        return self._max_latency
+
+    @property
+    def mean_latency(self):
+        """
+        float: Indicates the average time, in seconds, between an event
+            and the start of its callback.
+        """
+        if self._events_dispatched == 0:
+            return 0.0
+        return self._total_latency / self._events_dispatched
+
+    def close(self, wait=True):
+        """
+        Stops dispatching events.
+
+        The dispatcher discards events that occur after you close it. Do
+        not call this method from a dispatched callback.
+
+        Args:
+            wait (Optional[bool]): Specifies whether to wait for the
+                callbacks of pending events to run. If the dispatcher runs
+                callbacks on an event loop, it discards pending events.
+        """
+        with self._lock:
+            self._closed = True
+            if wait and self._executor is not None:
+                while self._queues:
+                    self._idle.wait()
+            else:
+                # Runs that are already scheduled find no queue and return, so
+                # nothing is left behind if they never run.
+                for event_queue in self._queues.values():
+                    self._events_pending -= len(event_queue)
+                self._queues.clear()
+                self._idle.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _wrap_callback(self, task_key, callback_method):
+        """
+        Returns a callback to register with NI-DAQmx that dispatches events
+        of a task to callback_method.
+
+        task_key identifies the task by identity, so it must be unique to
+        the task for as long as the task exists.
+        """
+        def _callback(*args):
+            self._post(task_key, callback_method, args)
+            return 0
+
+        return _callback
+
+    def _post(self, task_key, callback_method, args):
+        record = (time.perf_counter(), callback_method, args)
+        with self._lock:
+            if self._closed:
+                return
+            self._events_pending += 1
+            self._max_events_pending = max(self._max_events_pending, self._events_pending)
+            event_queue = self._queues.get(task_key)
+            if event_queue is not None:
+                event_queue.append(record)
+                return
+            self._queues[task_key] = collections.deque([record])
+            self._schedule(task_key)
+
+    def _schedule(self, task_key):
+        # Called with self._lock held, so that close() cannot shut down the
+        # executor between checking for pending events and submitting a run.
+        try:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._run_next, task_key)
+            else:
+                self._executor.submit(self._run_next, task_key)
+        except RuntimeError:
+            # The event loop is closed. Discard the events instead of raising
+            # the error on the NI-DAQmx driver thread.
+            _logger.exception('Could not schedule an event callback.')
+            self._events_pending -= len(self._queues[task_key])
+            self._remove_queue(task_key)
+
+    def _run_next(self, task_key):
+        # Run one event, then reschedule, so that a task with frequent events
+        # does not monopolize a worker thread.
+        with self._lock:
+            event_queue = self._queues.get(task_key)
+            if event_queue is None:
+                # close() discarded the pending events.
+                return
+            event_time, callback_method, args = event_queue.popleft()
+            latency = time.perf_counter() - event_time
+            self._events_pending -= 1
+            self._events_dispatched += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+
+        try:
+            callback_method(*args)
+        except Exception:
+            _logger.exception('Event callback %r raised an exception.', callback_method)
+
+        with self._lock:
+            if self._queues.get(task_key) is not event_queue:
+                # close() discarded the pending events.
+                return
+            if not event_queue:
+                self._remove_queue(task_key)
+                return
+            self._schedule(task_key)
+
+    def _remove_queue(self, task_key):
+        del self._queues[task_key]
+        if not self._queues:
+            self._idle.notify_all()
@@ -1,6 +1,7 @@
 import numpy
-from nidaqmx import DaqError
+from nidaqmx import DaqError, DaqReadError
 
+from nidaqmx._task_modules.channels.channel import Channel
 from nidaqmx.constants import FillMode, READ_ALL_AVAILABLE
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.types import PowerMeasurement, CtrFreq, CtrTick, CtrTime
@@ -8,7 +9,8 @@ from nidaqmx.types import PowerMeasurement, CtrFreq, CtrTick, CtrTime
 __all__ = ['AnalogSingleChannelReader', 'AnalogMultiChannelReader',
            'AnalogUnscaledReader', 'CounterReader',
            'DigitalSingleChannelReader', 'DigitalMultiChannelReader',
-           'PowerSingleChannelReader', 'PowerMultiChannelReader', 'PowerBinaryReader']
+           'PowerSingleChannelReader', 'PowerMultiChannelReader', 'PowerBinaryReader',
+           'RingBufferReader', 'scale_raw']
 
 
 class ChannelReaderBase:
@@ -36,8 +38,9 @@ class ChannelReaderBase:
             NumPy arrays passed to read methods are verified. Defaults
             to True when this object is instantiated.
 
-            Setting this property to True may marginally adversely
-            impact the performance of read methods.
+            The expected shape is computed from channel properties that
+            the task caches until the channels to read change, so
+            verification does not query the driver on every read.
         """
         return self._verify_array_shape
 
@@ -65,8 +68,8 @@ class ChannelReaderBase:
         if not self._verify_array_shape:
             return
 
-        channels_to_read = self._in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
+        # The task caches the number of channels until the channels to read change.
+        number_of_channels = self._task._get_read_plan().number_of_channels
 
         array_shape = None
         if is_many_chan:
@@ -109,9 +112,9 @@ class ChannelReaderBase:
         if not self._verify_array_shape:
             return
 
-        channels_to_read = self._in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
-        number_of_lines = self._in_stream.di_num_booleans_per_chan
+        read_plan = self._task._get_read_plan()
+        number_of_channels = read_plan.number_of_channels
+        number_of_lines = read_plan.di_num_booleans_per_chan
 
         array_shape = None
         if is_many_chan:
@@ -364,6 +367,199 @@ class AnalogMultiChannelReader(ChannelReaderBase):
         self._interpreter.read_analog_f64(self._handle, 1, timeout, FillMode.GROUP_BY_CHANNEL.value, data)
 
 
+class RingBufferReader(ChannelReaderBase):
+    """
+    Reads samples from one or more analog input channels in an NI-DAQmx
+    task into a preallocated ring buffer that this object owns.
+
+    One thread, the acquisition thread, calls :py:meth:`read` in a loop.
+    Each call reads the next chunk of samples directly into the next
+    region of the ring buffer, without an intermediate copy. Other
+    threads call :py:meth:`get_latest` to get views of the most recent
+    samples. Consumers never block the acquisition thread: the
+    acquisition thread publishes the number of samples read only after
+    each read completes, and consumers only view samples that have been
+    published.
+
+    The acquisition thread eventually wraps around and overwrites the
+    samples that a view refers to. Consumers that need to keep samples
+    for longer than one trip around the ring buffer must copy them.
+    """
+
+    def __init__(self, task_in_stream, buffer_size, samples_per_read):
+        """
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an NI-DAQmx task from which to read samples.
+            buffer_size (int): Specifies the number of samples per
+                channel that the ring buffer holds.
+            samples_per_read (int): Specifies the number of samples per
+                channel that each call to :py:meth:`read` requests. The
+                buffer size must be a multiple of this value.
+        """
+        super().__init__(task_in_stream)
+
+        if samples_per_read < 1:
+            raise ValueError("samples_per_read must be greater than 0.")
+        if buffer_size < 2 * samples_per_read or buffer_size % samples_per_read != 0:
+            raise ValueError(
+                "buffer_size must be a multiple of samples_per_read and at least "
+                "twice as large.")
+
+        number_of_channels = self._task._get_read_plan().number_of_channels
+        self._samples_per_read = samples_per_read
+        # Samples are stored grouped by scan number, so the region for each
+        # read is contiguous and DAQmx can read directly into it. Consumers
+        # get transposed views with one row per channel.
+        self._buffer = numpy.zeros(
+            (buffer_size, number_of_channels), dtype=numpy.float64)
+        self._total_samples_read = 0
+
+    @property
+    def buffer_size(self):
+        """
+        int: Indicates the number of samples per channel that the ring
+            buffer holds.
+        """
+        return self._buffer.shape[0]
+
+    @property
+    def number_of_channels(self):
+        """
+        int: Indicates the number of channels in the ring buffer.
+        """
+        return self._buffer.shape[1]
+
+    @property
+    def samples_per_read(self):
+        """
+        int: Indicates the number of samples per channel that each call
+            to :py:meth:`read` requests.
+        """
+        return self._samples_per_read
+
+    @property
+    def total_samples_read(self):
+        """
+        int: Indicates the total number of samples per channel that this
+            object has read into the ring buffer.
+        """
+        return self._total_samples_read
+
+    @property
+    def max_window_size(self):
+        """
+        int: Indicates the largest number of samples per channel that
+            :py:meth:`get_latest` can return. The rest of the ring
+            buffer is reserved for the read in progress.
+        """
+        return self.buffer_size - self._samples_per_read
+
+    def read(self, timeout=10.0):
+        """
+        Reads the next chunk of floating-point samples from the analog
+        input channels in the task into the ring buffer.
+
+        Call this method from one thread only.
+
+        Args:
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to read the requested samples and returns an error
+                if it is unable to.
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+            NI-DAQmx returns a single value because this value is the
+            same for all channels.
+        """
+        if self._verify_array_shape:
+            number_of_channels = self._task._get_read_plan().number_of_channels
+            if number_of_channels != self.number_of_channels:
+                raise DaqError(
+                    'Read cannot be performed because the number of channels '
+                    'to read changed after the ring buffer was created. '
+                    'Create a new RingBufferReader after you change the '
+                    'channels to read.\n\n'
+                    'Number of Channels in Ring Buffer: {}\n'
+                    'Number of Channels to Read: {}'
+                    .format(self.number_of_channels, number_of_channels),
+                    DAQmxErrors.UNKNOWN, task_name=self._task.name)
+
+        total_samples_read = self._total_samples_read
+        start = total_samples_read % self.buffer_size
+        # After a partial read, read only up to the end of the ring buffer so
+        # that the next region is still contiguous.
+        number_of_samples_per_channel = min(
+            self._samples_per_read, self.buffer_size - start)
+
+        try:
+            _, samps_per_chan_read = self._interpreter.read_analog_f64(
+                self._handle, number_of_samples_per_channel, timeout,
+                FillMode.GROUP_BY_SCAN_NUMBER.value,
+                self._buffer[start:start + number_of_samples_per_channel])
+        except DaqReadError as e:
+            # Keep the samples that were read before the error, such as a
+            # timeout, so that the next read does not overwrite them.
+            self._total_samples_read = total_samples_read + e.samps_per_chan_read
+            raise
+
+        # Publish the samples to consumers only after they are in the buffer.
+        self._total_samples_read = total_samples_read + samps_per_chan_read
+        return samps_per_chan_read
+
+    def get_latest(self, number_of_samples_per_channel):
+        """
+        Returns the most recent samples in the ring buffer.
+
+        This method does not block and does not wait for the read in
+        progress. It is safe to call from any thread.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to return. This value must not be
+                greater than :py:attr:`max_window_size`.
+        Returns:
+            numpy.ndarray:
+
+            A 2D NumPy array with one row per channel and one column per
+            sample, oldest sample first. If fewer samples have been read,
+            the array has fewer columns. If the samples are contiguous in
+            the ring buffer, the array is a read-only view into the ring
+            buffer; otherwise, it is a copy.
+        """
+        if not 0 <= number_of_samples_per_channel <= self.max_window_size:
+            raise ValueError(
+                "number_of_samples_per_channel must be between 0 and {}."
+                .format(self.max_window_size))
+
+        # Read the published sample count once so that the window is
+        # consistent even if the acquisition thread publishes more samples.
+        total_samples_read = self._total_samples_read
+        number_of_samples_per_channel = min(
+            number_of_samples_per_channel, total_samples_read)
+        end = total_samples_read % self.buffer_size
+        start = end - number_of_samples_per_channel
+
+        if start >= 0:
+            window = self._buffer[start:end]
+        elif end == 0:
+            window = self._buffer[start:]
+        else:
+            window = numpy.concatenate(
+                (self._buffer[start:], self._buffer[:end]))
+
+        window = window.T
+        window.flags.writeable = False
+        return window
+
+
 class AnalogUnscaledReader(ChannelReaderBase):
     """
     Reads unscaled samples from one or more analog input channels in an
@@ -710,6 +906,79 @@ class AnalogUnscaledReader(ChannelReaderBase):
         
         return samps_per_chan_read
 
+    @property
+    def scaling_coeffs(self):
+        """
+        List[List[float]]: Indicates the device scaling coefficients of
+            each channel to read, in the order of the channels to read.
+            Pass this value to :py:func:`scale_raw` to scale samples that
+            you read with this object later.
+
+            The task queries the coefficients once and reuses them until
+            the channels to read change or the task is started, stopped,
+            or committed. The coefficients depend on the range and gain
+            of each channel, so start or commit the task after you
+            change those properties and before you use this property.
+        """
+        return self._task._get_ai_dev_scaling_coeffs()
+
+    def read_and_scale(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0, scaled_data=None):
+        """
+        Reads one or more unscaled integer samples from one or more
+        analog input channels in a task and scales them to volts.
+
+        This method reads with :py:meth:`read_int16`,
+        :py:meth:`read_int32`, :py:meth:`read_uint16`, or
+        :py:meth:`read_uint32`, depending on the data type of data, and
+        then scales the samples with :py:func:`scale_raw` and the cached
+        :py:attr:`scaling_coeffs`. Scaling in Python does not require a
+        second read from the driver.
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 2D NumPy
+                array of int16, int32, uint16, or uint32 values to hold
+                the unscaled samples requested. Each row corresponds to
+                a channel in the task.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. See :py:meth:`read_int16`.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. See
+                :py:meth:`read_int16`.
+            scaled_data (Optional[numpy.ndarray]): Specifies a
+                preallocated 2D NumPy array of floating-point values, with
+                the same shape as data, to hold the scaled samples. If you
+                do not specify this array, this method creates one.
+        Returns:
+            numpy.ndarray:
+
+            The scaled samples, with one row per channel and one column
+            per sample read.
+        """
+        if data.dtype == numpy.int16:
+            read = self.read_int16
+        elif data.dtype == numpy.int32:
+            read = self.read_int32
+        elif data.dtype == numpy.uint16:
+            read = self.read_uint16
+        elif data.dtype == numpy.uint32:
+            read = self.read_uint32
+        else:
+            raise DaqError(
+                'Read cannot be performed because the NumPy array passed into '
+                'this function has an unsupported data type. Use an int16, '
+                'int32, uint16, or uint32 array.\n\n'
+                'Data type of NumPy Array provided: {}'.format(data.dtype),
+                DAQmxErrors.UNKNOWN, task_name=self._task.name)
+
+        samps_per_chan_read = read(data, number_of_samples_per_channel, timeout)
+
+        if scaled_data is not None:
+            scaled_data = scaled_data[:, :samps_per_chan_read]
+        return scale_raw(
+            data[:, :samps_per_chan_read], self.scaling_coeffs, out=scaled_data)
+
 
 class PowerSingleChannelReader(ChannelReaderBase):
     """
@@ -2449,3 +2718,72 @@ class DigitalMultiChannelReader(ChannelReaderBase):
 
         self._interpreter.read_digital_u32(
             self._handle, 1, timeout, FillMode.GROUP_BY_CHANNEL.value, data)
+
+
+def scale_raw(raw, channels, interleaved=False, out=None):
+    """
+    Scales unscaled analog input samples to volts with the device
+    scaling coefficients of each channel.
+
+    This function evaluates each channel's polynomial with NumPy, so you
+    can read and store unscaled samples at full rate and scale them
+    later, without another read from the driver.
+
+    Args:
+        raw (numpy.ndarray): Specifies the unscaled samples. A 2D array
+            has one row per channel. A 1D array, such as an array that
+            :py:meth:`nidaqmx._task_modules.in_stream.InStream.read`
+            returns, contains the samples of all channels, either one
+            channel after another or interleaved by scan.
+        channels: Specifies the channels that acquired the samples, in
+            the order of the samples: either a
+            :py:class:`nidaqmx._task_modules.channels.ai_channel.AIChannel`
+            object, whose ai_dev_scaling_coeff property this function
+            queries for each channel, or a list with the coefficients of
+            each channel, such as the scaling_coeffs property of
+            :py:class:`AnalogUnscaledReader`. Use the list to avoid
+            querying the coefficients each time you scale samples.
+        interleaved (Optional[bool]): Specifies whether the samples in a
+            1D array are interleaved by scan. This argument is ignored
+            for 2D arrays.
+        out (Optional[numpy.ndarray]): Specifies a preallocated 2D NumPy
+            array of floating-point values to hold the scaled samples.
+    Returns:
+        numpy.ndarray:
+
+        The scaled samples, with one row per channel and one column per
+        sample.
+    """
+    if isinstance(channels, Channel):
+        channels = [channel.ai_dev_scaling_coeff for channel in channels]
+    number_of_channels = len(channels)
+    if number_of_channels == 0:
+        raise ValueError('channels must contain at least one channel.')
+
+    raw = numpy.asarray(raw)
+    if raw.ndim == 1:
+        if interleaved:
+            raw = raw.reshape(-1, number_of_channels).T
+        else:
+            raw = raw.reshape(number_of_channels, -1)
+    elif raw.shape[0] != number_of_channels:
+        raise ValueError(
+            'raw has {} rows, but there are coefficients for {} channels.'
+            .format(raw.shape[0], number_of_channels))
+
+    # Pad the coefficients with zeros so that all channels are scaled with
+    # one polynomial of the same order.
+    number_of_coeffs = max(len(coeffs) for coeffs in channels)
+    coeffs = numpy.zeros((number_of_channels, number_of_coeffs))
+    for i, channel_coeffs in enumerate(channels):
+        coeffs[i, :len(channel_coeffs)] = channel_coeffs
+
+    if out is None:
+        out = numpy.empty(raw.shape, dtype=numpy.float64)
+    # Evaluate the polynomials with Horner's method, one column of
+    # coefficients at a time.
+    out[...] = coeffs[:, -1:]
+    for i in range(number_of_coeffs - 2, -1, -1):
+        out *= raw
+        out += coeffs[:, i:i + 1]
+    return out
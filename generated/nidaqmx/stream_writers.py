@@ -1,12 +1,13 @@
 import numpy
 
-from nidaqmx.constants import FillMode
+from nidaqmx.constants import ChannelType, FillMode, RegenerationMode
 from nidaqmx import DaqError
 from nidaqmx.error_codes import DAQmxErrors
 
 __all__ = ['AnalogSingleChannelWriter', 'AnalogMultiChannelWriter',
            'AnalogUnscaledWriter', 'CounterWriter',
-           'DigitalSingleChannelWriter', 'DigitalMultiChannelWriter']
+           'DigitalSingleChannelWriter', 'DigitalMultiChannelWriter',
+           'StreamingOutputWriter']
 
 
 class UnsetAutoStartSentinel:
@@ -76,8 +77,9 @@ class ChannelWriterBase:
             NumPy arrays passed to read methods are verified. Defaults
             to True when this object is instantiated.
 
-            Setting this property to True may marginally adversely
-            impact the performance of read methods.
+            The expected shape is computed from channel properties that
+            the task caches until the channels in the task change, so
+            verification does not query the driver on every write.
         """
         return self._verify_array_shape
 
@@ -101,8 +103,8 @@ class ChannelWriterBase:
         if not self._verify_array_shape:
             return
 
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        # The task caches the number of channels until the channels in the task change.
+        number_of_channels = self._task._get_write_plan().number_of_channels
 
         expected_num_dimensions = None
         if is_many_chan:
@@ -140,9 +142,9 @@ class ChannelWriterBase:
         if not self._verify_array_shape:
             return
 
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
-        number_of_lines = self._out_stream.do_num_booleans_per_chan
+        write_plan = self._task._get_write_plan()
+        number_of_channels = write_plan.number_of_channels
+        number_of_lines = write_plan.do_num_booleans_per_chan
 
         expected_num_dimensions = None
         if is_many_chan:
@@ -1399,3 +1401,273 @@ class DigitalMultiChannelWriter(ChannelWriterBase):
 
         return self._interpreter.write_digital_u32(
             self._handle, 1, auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data)
+
+
+class StreamingOutputWriter(ChannelWriterBase):
+    """
+    Streams samples from a producer to one or more analog or digital
+    output channels in an NI-DAQmx task, without regeneration.
+
+    The writer primes the output buffer before it starts the task, then
+    keeps the buffer topped up from an every N samples transferred from
+    buffer event. Each time the event occurs, the writer writes as many
+    chunks as there is space for in the buffer. Set the output buffer
+    size of the task explicitly before you start the writer.
+
+    The producer is either a callable or an iterable:
+
+    - A callable receives a preallocated NumPy array to fill and returns
+      the number of samples per channel that it filled. Returning fewer
+      samples than the array holds writes a final, shorter chunk;
+      returning 0 ends the stream. The writer alternates between two
+      arrays and asks the producer for the next chunk right after it
+      writes the current one, so the next chunk is ready when the event
+      occurs.
+    - An iterable yields NumPy arrays, which the writer writes as they
+      are, once the buffer has space for the whole array. The stream
+      ends when the iterable is exhausted.
+
+    The arrays have the shape and data type that the writer class
+    writes: one row per channel for multi-channel writers. The writer
+    tracks how many samples are still in the buffer each time the event
+    occurs, so you can see how close the generation came to an
+    underflow.
+    """
+
+    def __init__(self, task_out_stream, samples_per_write, producer,
+                 writer_cls=None, timeout=10.0):
+        """
+        Args:
+            task_out_stream: Specifies the output stream associated with
+                an NI-DAQmx task which to write samples.
+            samples_per_write (int): Specifies the number of samples per
+                channel in each chunk. This value is also the sample
+                interval of the every N samples event.
+            producer: Specifies a callable that fills arrays with
+                samples, or an iterable of arrays of samples.
+            writer_cls (Optional[type]): Specifies the stream writer class
+                to write with: AnalogMultiChannelWriter,
+                AnalogSingleChannelWriter, AnalogUnscaledWriter,
+                DigitalMultiChannelWriter, or DigitalSingleChannelWriter.
+                The digital writers write uint32 port data. If you do not
+                specify a writer class, this object uses
+                AnalogMultiChannelWriter for analog output tasks and
+                DigitalMultiChannelWriter for digital output tasks.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each write.
+        """
+        super().__init__(task_out_stream, auto_start=False)
+
+        if samples_per_write < 1:
+            raise ValueError("samples_per_write must be greater than 0.")
+
+        write_plan = self._task._get_write_plan()
+        if writer_cls is None:
+            if write_plan.write_chan_type == ChannelType.ANALOG_OUTPUT:
+                writer_cls = AnalogMultiChannelWriter
+            elif write_plan.write_chan_type == ChannelType.DIGITAL_OUTPUT:
+                writer_cls = DigitalMultiChannelWriter
+            else:
+                raise ValueError(
+                    'Specify writer_cls to stream samples to {} channels.'
+                    .format(write_plan.write_chan_type.name.lower().replace('_', ' ')))
+
+        writer = writer_cls(task_out_stream, auto_start=False)
+        multi_channel_shape = (write_plan.number_of_channels, samples_per_write)
+        if writer_cls is AnalogMultiChannelWriter:
+            self._write_many_sample = writer.write_many_sample
+            shape, dtype = multi_channel_shape, numpy.float64
+        elif writer_cls is AnalogSingleChannelWriter:
+            self._write_many_sample = writer.write_many_sample
+            shape, dtype = (samples_per_write,), numpy.float64
+        elif writer_cls is AnalogUnscaledWriter:
+            self._write_many_sample = writer.write_int16
+            shape, dtype = multi_channel_shape, numpy.int16
+        elif writer_cls is DigitalMultiChannelWriter:
+            self._write_many_sample = writer.write_many_sample_port_uint32
+            shape, dtype = multi_channel_shape, numpy.uint32
+        elif writer_cls is DigitalSingleChannelWriter:
+            self._write_many_sample = writer.write_many_sample_port_uint32
+            shape, dtype = (samples_per_write,), numpy.uint32
+        else:
+            raise ValueError(
+                'writer_cls must be AnalogMultiChannelWriter, '
+                'AnalogSingleChannelWriter, AnalogUnscaledWriter, '
+                'DigitalMultiChannelWriter, or DigitalSingleChannelWriter.')
+
+        self._samples_per_write = samples_per_write
+        self._timeout = timeout
+        if callable(producer):
+            self._fill = producer
+            self._producer_iterator = None
+            self._arrays = [numpy.zeros(shape, dtype=dtype) for _ in range(2)]
+        else:
+            self._fill = None
+            self._producer_iterator = iter(producer)
+            self._arrays = None
+        self._array_index = 0
+        self._next_data = None
+        self._is_done = False
+        self._error = None
+        self._buffer_size = None
+        self._total_samples_written = 0
+        self._last_samples_in_buffer = None
+        self._min_samples_in_buffer = None
+        self._is_started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    @property
+    def samples_per_write(self):
+        """
+        int: Indicates the number of samples per channel in each chunk.
+        """
+        return self._samples_per_write
+
+    @property
+    def is_done(self):
+        """
+        bool: Indicates whether the producer has run out of samples or a
+            write failed.
+        """
+        return self._is_done
+
+    @property
+    def total_samples_written(self):
+        """
+        int: Indicates the total number of samples per channel that this
+            object has written to the buffer.
+        """
+        return self._total_samples_written
+
+    @property
+    def last_samples_in_buffer(self):
+        """
+        int: Indicates the number of samples per channel that were in the
+            buffer, waiting to be generated, the last time the every N
+            samples event occurred. None until the event occurs.
+        """
+        return self._last_samples_in_buffer
+
+    @property
+    def min_samples_in_buffer(self):
+        """
+        int: Indicates the lowest number of samples per channel that were
+            in the buffer when the every N samples event occurred. This is
+            the margin by which the generation avoided an underflow. None
+            until the event occurs.
+        """
+        return self._min_samples_in_buffer
+
+    def start(self):
+        """
+        Disables regeneration, fills the output buffer from the producer,
+        registers for the every N samples transferred from buffer event,
+        and starts the task.
+
+        Raises:
+            nidaqmx.errors.DaqError: The output buffer size of the task is
+                not set.
+        """
+        if self._is_started:
+            return
+
+        self._out_stream.regen_mode = RegenerationMode.DONT_ALLOW_REGENERATION
+        # Until the first write, the buffer size is 0 unless it was set
+        # explicitly, because NI-DAQmx sizes the buffer from that write.
+        buffer_size = self._out_stream.output_buf_size
+        if buffer_size == 0:
+            raise DaqError(
+                'Set the output buffer size with the "output_buf_size" property '
+                'or Task.cfg_output_buffer() before you start streaming.',
+                DAQmxErrors.UNKNOWN, task_name=self._task.name)
+        self._buffer_size = buffer_size
+
+        self._next_data = self._produce()
+        self._write_chunks(buffer_size)
+        self._buffer_size = self._out_stream.output_buf_size
+
+        self._task.register_every_n_samples_transferred_from_buffer_event(
+            self._samples_per_write, self._on_samples_transferred)
+        self._is_started = True
+        self._task.start()
+
+    def stop(self):
+        """
+        Unregisters the event and stops the task.
+
+        Raises:
+            nidaqmx.errors.DaqError: A write failed while streaming.
+        """
+        if self._is_started:
+            self._is_started = False
+            try:
+                self._task.stop()
+            finally:
+                self._task.register_every_n_samples_transferred_from_buffer_event(
+                    self._samples_per_write, None)
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _produce(self):
+        if self._fill is not None:
+            data = self._arrays[self._array_index]
+            self._array_index = 1 - self._array_index
+            number_of_samples = self._fill(data)
+            if number_of_samples is None:
+                number_of_samples = self._samples_per_write
+            if number_of_samples <= 0:
+                return None
+            if number_of_samples < self._samples_per_write:
+                data = numpy.ascontiguousarray(data[..., :number_of_samples])
+            return data
+
+        return next(self._producer_iterator, None)
+
+    def _write_chunks(self, space_available):
+        """
+        Writes chunks while the next chunk fits in space_available samples
+        per channel.
+        """
+        while self._next_data is not None:
+            number_of_samples = numpy.shape(self._next_data)[-1]
+            if number_of_samples > self._buffer_size:
+                raise ValueError(
+                    f'The producer returned a chunk of {number_of_samples} samples, which '
+                    f'does not fit in the output buffer of {self._buffer_size} samples.')
+            if number_of_samples > space_available:
+                return
+            self._total_samples_written += self._write_many_sample(
+                self._next_data, self._timeout)
+            space_available -= number_of_samples
+            # Produce the next chunk now, so that it is ready when the buffer has
+            # space for it.
+            self._next_data = self._produce()
+        self._is_done = True
+
+    def _on_samples_transferred(self, task_handle, every_n_samples_event_type,
+                                number_of_samples, callback_data):
+        if self._is_done:
+            return 0
+
+        try:
+            space_available = self._out_stream.space_avail
+            samples_in_buffer = self._buffer_size - space_available
+            self._last_samples_in_buffer = samples_in_buffer
+            if (self._min_samples_in_buffer is None or
+                    samples_in_buffer < self._min_samples_in_buffer):
+                self._min_samples_in_buffer = samples_in_buffer
+
+            self._write_chunks(space_available)
+        except Exception as ex:
+            # Save the exception and re-raise it from stop().
+            self._error = ex
+            self._is_done = True
+        return 0
@@ -1,8 +1,11 @@
 # Do not edit this file; it was automatically generated.
 
+import functools
+
 import deprecation
 
 from nidaqmx import utils
+from nidaqmx._attribute_cache import AttributeCache, get_cached_attribute
 from nidaqmx._bitfield_utils import enum_bitfield_to_list
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.system._collections.physical_channel_collection import (
@@ -21,7 +24,7 @@ class Device:
     """
     Represents a DAQmx device.
     """
-    __slots__ = ['_name', '_interpreter', '__weakref__']
+    __slots__ = ['_name', '_interpreter', '_attribute_cache', '__weakref__']
 
     def __init__(self, name, *, grpc_options=None):
         """
@@ -32,6 +35,7 @@ class Device:
         """
         self._name = name
         self._interpreter = utils._select_interpreter(grpc_options)
+        self._attribute_cache = None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -63,7 +67,8 @@ class Device:
             Indicates a collection that contains all the analog input
             physical channels available on the device.
         """
-        return AIPhysicalChannelCollection(self._name, self._interpreter)
+        return AIPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def ao_physical_chans(self):
@@ -72,7 +77,8 @@ class Device:
             Indicates a collection that contains all the analog output
             physical channels available on the device.
         """
-        return AOPhysicalChannelCollection(self._name, self._interpreter)
+        return AOPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def ci_physical_chans(self):
@@ -81,7 +87,8 @@ class Device:
             Indicates a collection that contains all the counter input
             physical channels available on the device.
         """
-        return CIPhysicalChannelCollection(self._name, self._interpreter)
+        return CIPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def co_physical_chans(self):
@@ -90,7 +97,8 @@ class Device:
             Indicates a collection that contains all the counter output
             physical channels available on the device.
         """
-        return COPhysicalChannelCollection(self._name, self._interpreter)
+        return COPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def di_lines(self):
@@ -99,7 +107,8 @@ class Device:
             Indicates a collection that contains all the digital input
             lines available on the device.
         """
-        return DILinesCollection(self._name, self._interpreter)
+        return DILinesCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def di_ports(self):
@@ -108,7 +117,8 @@ class Device:
             Indicates a collection that contains all the digital input
             ports available on the device.
         """
-        return DIPortsCollection(self._name, self._interpreter)
+        return DIPortsCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def do_lines(self):
@@ -117,7 +127,8 @@ class Device:
             Indicates a collection that contains all the digital output
             lines available on the device.
         """
-        return DOLinesCollection(self._name, self._interpreter)
+        return DOLinesCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def do_ports(self):
@@ -126,7 +137,8 @@ class Device:
             Indicates a collection that contains all the digital output
             ports available on the device.
         """
-        return DOPortsCollection(self._name, self._interpreter)
+        return DOPortsCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     # endregion
 
@@ -177,7 +189,9 @@ class Device:
             value followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2fd0)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2fd0)
         return val
 
     @property
@@ -188,7 +202,9 @@ class Device:
             by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x3111)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x3111)
         return val
 
     @property
@@ -198,7 +214,9 @@ class Device:
             coupling types supported by this device.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x2994)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x2994)
         return enum_bitfield_to_list(
             val, _CouplingTypes, Coupling)
 
@@ -209,7 +227,9 @@ class Device:
             excitation values supported by this device.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x29cb)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x29cb)
         return val
 
     @property
@@ -220,7 +240,9 @@ class Device:
             value, followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2991)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2991)
         return val
 
     @property
@@ -233,7 +255,9 @@ class Device:
             supported frequencies.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x30c8)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x30c8)
         return val
 
     @property
@@ -247,7 +271,9 @@ class Device:
             supported frequencies.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x30c9)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x30c9)
         return val
 
     @property
@@ -257,7 +283,9 @@ class Device:
             digital filter types supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x3107)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x3107)
         return [FilterType(e) for e in val]
 
     @property
@@ -268,7 +296,9 @@ class Device:
             value, followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2992)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2992)
         return val
 
     @property
@@ -278,7 +308,9 @@ class Device:
             device.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2993)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2993)
         return val
 
     @property
@@ -291,7 +323,9 @@ class Device:
             frequencies.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2995)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2995)
         return val
 
     @property
@@ -305,7 +339,9 @@ class Device:
             supported  frequencies.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x29cf)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x29cf)
         return val
 
     @property
@@ -319,7 +355,9 @@ class Device:
             compensation and autozero channels).
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x298d)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x298d)
         return val
 
     @property
@@ -329,7 +367,9 @@ class Device:
             the task contains only a single channel from this device.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x298c)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x298c)
         return val
 
     @property
@@ -341,7 +381,9 @@ class Device:
             specific channels.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fd2)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fd2)
         return [UsageTypeAI(e) for e in val]
 
     @property
@@ -352,7 +394,9 @@ class Device:
             attempt to sample at a slower rate.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x298e)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x298e)
         return val
 
     @property
@@ -362,7 +406,9 @@ class Device:
             supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3163)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3163)
         return val
 
     @property
@@ -372,7 +418,9 @@ class Device:
             sources supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3164)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3164)
         return val
 
     @property
@@ -384,7 +432,9 @@ class Device:
             the low value followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2a15)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2a15)
         return val
 
     @property
@@ -395,7 +445,9 @@ class Device:
             clocked analog input.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fdc)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fdc)
         return [AcquisitionType(e) for e in val]
 
     @property
@@ -404,7 +456,9 @@ class Device:
         bool: Indicates if the device supports simultaneous sampling.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x298f)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x298f)
         return val
 
     @property
@@ -414,7 +468,9 @@ class Device:
             triggers supported by this device for an analog input task.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x2986)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x2986)
         return enum_bitfield_to_list(
             val, _TriggerUsageTypes, TriggerUsage)
 
@@ -428,7 +484,9 @@ class Device:
             excitation values.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x29c9)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x29c9)
         return val
 
     @property
@@ -442,7 +500,9 @@ class Device:
             supported excitation values.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x29ca)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x29ca)
         return val
 
     @property
@@ -453,7 +513,9 @@ class Device:
             followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x2990)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x2990)
         return val
 
     @property
@@ -462,7 +524,9 @@ class Device:
         bool: Indicates if the device supports analog triggering.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x2984)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x2984)
         return val
 
     @property
@@ -473,7 +537,9 @@ class Device:
             followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x299c)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x299c)
         return val
 
     @property
@@ -483,7 +549,9 @@ class Device:
             this device.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x299d)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x299d)
         return val
 
     @property
@@ -492,7 +560,9 @@ class Device:
         float: Indicates the maximum analog output rate of the device.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x2997)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x2997)
         return val
 
     @property
@@ -501,7 +571,9 @@ class Device:
         float: Indicates the minimum analog output rate of the device.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x2998)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x2998)
         return val
 
     @property
@@ -511,7 +583,9 @@ class Device:
             supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3165)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3165)
         return val
 
     @property
@@ -521,7 +595,9 @@ class Device:
             sources supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3166)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3166)
         return val
 
     @property
@@ -533,7 +609,9 @@ class Device:
             specific channels.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fd3)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fd3)
         return [UsageTypeAO(e) for e in val]
 
     @property
@@ -543,7 +621,9 @@ class Device:
             type for analog output tasks.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x2996)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x2996)
         return val
 
     @property
@@ -554,7 +634,9 @@ class Device:
             clocked analog output.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fdd)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fdd)
         return [AcquisitionType(e) for e in val]
 
     @property
@@ -564,7 +646,9 @@ class Device:
             triggers supported by this device for analog output tasks.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x2987)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x2987)
         return enum_bitfield_to_list(
             val, _TriggerUsageTypes, TriggerUsage)
 
@@ -576,7 +660,9 @@ class Device:
             followed by the high value.
         """
 
-        val = self._interpreter.get_device_attribute_double_array(self._name, 0x299b)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double_array,
+            self._name, 0x299b)
         return val
 
     @property
@@ -586,7 +672,9 @@ class Device:
             the device.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x2326)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x2326)
         return BusType(val)
 
     @property
@@ -596,7 +684,9 @@ class Device:
             value is zero if the carrier does not have a serial number.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x2a8a)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x2a8a)
         return val
 
     @property
@@ -616,7 +706,9 @@ class Device:
         int: Indicates in bits the size of the counters on the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x299f)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x299f)
         return val
 
     @property
@@ -626,7 +718,9 @@ class Device:
             frequency.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x29a0)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x29a0)
         return val
 
     @property
@@ -638,7 +732,9 @@ class Device:
             specific channels.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fd4)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fd4)
         return [UsageTypeCI(e) for e in val]
 
     @property
@@ -648,7 +744,9 @@ class Device:
             type for counter input tasks.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x299e)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x299e)
         return val
 
     @property
@@ -659,7 +757,9 @@ class Device:
             clocked counter input.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fde)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fde)
         return [AcquisitionType(e) for e in val]
 
     @property
@@ -669,7 +769,9 @@ class Device:
             triggers supported by this device for counter input tasks.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x298a)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x298a)
         return enum_bitfield_to_list(
             val, _TriggerUsageTypes, TriggerUsage)
 
@@ -679,7 +781,9 @@ class Device:
         int: Indicates in bits the size of the counters on the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x29a1)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x29a1)
         return val
 
     @property
@@ -689,7 +793,9 @@ class Device:
             frequency.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x29a2)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x29a2)
         return val
 
     @property
@@ -701,7 +807,9 @@ class Device:
             specific channels.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fd5)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fd5)
         return [UsageTypeCO(e) for e in val]
 
     @property
@@ -711,7 +819,9 @@ class Device:
             counter output tasks.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x2f5b)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x2f5b)
         return val
 
     @property
@@ -722,7 +832,9 @@ class Device:
             clocked counter output.
         """
 
-        val = self._interpreter.get_device_attribute_int32_array(self._name, 0x2fdf)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32_array,
+            self._name, 0x2fdf)
         return [AcquisitionType(e) for e in val]
 
     @property
@@ -732,7 +844,9 @@ class Device:
             triggers supported by this device for counter output tasks.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x298b)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x298b)
         return enum_bitfield_to_list(
             val, _TriggerUsageTypes, TriggerUsage)
 
@@ -743,7 +857,9 @@ class Device:
             CompactDAQ chassis that contains this module.
         """
 
-        val = self._interpreter.get_device_attribute_string(self._name, 0x29b7)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string,
+            self._name, 0x29b7)
         return _DeviceAlternateConstructor(val, self._interpreter)
 
     @property
@@ -753,7 +869,9 @@ class Device:
             in the CompactDAQ chassis.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x29b8)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x29b8)
         return val
 
     @property
@@ -763,7 +881,9 @@ class Device:
             CompactRIO chassis that contains this module.
         """
 
-        val = self._interpreter.get_device_attribute_string(self._name, 0x3161)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string,
+            self._name, 0x3161)
         return _DeviceAlternateConstructor(val, self._interpreter)
 
     @property
@@ -773,7 +893,9 @@ class Device:
             this module is located.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3162)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3162)
         return val
 
     @property
@@ -782,7 +904,9 @@ class Device:
         float: Indicates the maximum digital input rate of the device.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x2999)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x2999)
         return val
 
     @property
@@ -792,7 +916,9 @@ class Device:
             supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3167)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3167)
         return val
 
     @property
@@ -802,7 +928,9 @@ class Device:
             triggers supported by this device for digital input tasks.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x2988)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x2988)
         return enum_bitfield_to_list(
             val, _TriggerUsageTypes, TriggerUsage)
 
@@ -812,7 +940,9 @@ class Device:
         bool: Indicates if the device supports digital triggering.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x2985)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x2985)
         return val
 
     @property
@@ -821,7 +951,9 @@ class Device:
         float: Indicates the maximum digital output rate of the device.
         """
 
-        val = self._interpreter.get_device_attribute_double(self._name, 0x299a)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_double,
+            self._name, 0x299a)
         return val
 
     @property
@@ -831,7 +963,9 @@ class Device:
             pulse sources supported by the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3168)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3168)
         return val
 
     @property
@@ -841,7 +975,9 @@ class Device:
             triggers supported by this device for digital output tasks.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x2989)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x2989)
         return enum_bitfield_to_list(
             val, _TriggerUsageTypes, TriggerUsage)
 
@@ -863,7 +999,9 @@ class Device:
             device which this bank is located in.
         """
 
-        val = self._interpreter.get_device_attribute_string(self._name, 0x3171)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string,
+            self._name, 0x3171)
         return _DeviceAlternateConstructor(val, self._interpreter)
 
     @property
@@ -872,7 +1010,9 @@ class Device:
         bool: Indicates whether the device supports hardware TEDS.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x2fd6)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x2fd6)
         return val
 
     @property
@@ -881,7 +1021,9 @@ class Device:
         bool: Indicates if the device is a simulated device.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x22ca)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x22ca)
         return val
 
     @property
@@ -890,7 +1032,9 @@ class Device:
         int: Indicates the number of DMA channels on the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x233c)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x233c)
         return val
 
     @property
@@ -900,7 +1044,9 @@ class Device:
             device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3141)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3141)
         return val
 
     @property
@@ -910,7 +1056,9 @@ class Device:
             device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x3142)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x3142)
         return val
 
     @property
@@ -919,7 +1067,9 @@ class Device:
         int: Indicates the PCI bus number of the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x2327)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x2327)
         return val
 
     @property
@@ -928,7 +1078,9 @@ class Device:
         int: Indicates the PCI slot number of the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x2328)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x2328)
         return val
 
     @property
@@ -940,7 +1092,9 @@ class Device:
             simulated devices.
         """
 
-        val = self._interpreter.get_device_attribute_int32(self._name, 0x29a9)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_int32,
+            self._name, 0x29a9)
         return ProductCategory(val)
 
     @property
@@ -950,7 +1104,9 @@ class Device:
             device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x231d)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x231d)
         return val
 
     @property
@@ -959,7 +1115,9 @@ class Device:
         str: Indicates the product name of the device.
         """
 
-        val = self._interpreter.get_device_attribute_string(self._name, 0x631)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string,
+            self._name, 0x631)
         return val
 
     @property
@@ -969,7 +1127,9 @@ class Device:
             identified in MAX.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x2329)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x2329)
         return val
 
     @property
@@ -978,7 +1138,9 @@ class Device:
         int: Indicates the PXI slot number of the device.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x232a)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x232a)
         return val
 
     @property
@@ -988,7 +1150,9 @@ class Device:
             zero if the device does not have a serial number.
         """
 
-        val = self._interpreter.get_device_attribute_uint32(self._name, 0x632)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_uint32,
+            self._name, 0x632)
         return val
 
     @property
@@ -1028,7 +1192,9 @@ class Device:
         List[str]: Indicates a list of all terminals on the device.
         """
 
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2a40)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string,
+            self._name, 0x2a40)
         return unflatten_channel_string(val)
 
     @property
@@ -1037,7 +1203,9 @@ class Device:
         bool: Indicates whether the device supports time triggering.
         """
 
-        val = self._interpreter.get_device_attribute_bool(self._name, 0x301f)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_bool,
+            self._name, 0x301f)
         return val
 
     @property
@@ -1055,6 +1223,66 @@ class Device:
     def tedshwteds_supported(self):
         return self.hwteds_supported
 
+    def self_test_device(self):
+        """
+        Performs a brief test of device resources. If a failure occurs,
+        refer to your device documentation for more information.
+        """
+
+        self._interpreter.self_test_device(
+            self._name)
+
+    def get_attributes(self, attribute_names):
+        """
+        Gets several properties of this device.
+
+        This method is faster than getting each property in turn. With a
+        gRPC session, the calls to the server overlap.
+
+        Args:
+            attribute_names (List[str]): Specifies the names of the
+                properties to get, such as "product_type".
+        Returns:
+            Dict[str, object]:
+
+            Indicates a dictionary that maps each property name to its
+            value.
+        """
+        getters = utils._get_property_getters(Device, attribute_names)
+        values = self._interpreter.call_concurrently(
+            [functools.partial(getter, self) for getter in getters])
+        return dict(zip(attribute_names, values))
+
+    # region Attribute Cache Functions
+
+    def clear_attribute_cache(self):
+        """
+        Discards the attribute values that this device has cached, so
+        that the next access to each attribute queries the driver.
+
+        Call this method if the configuration of the device changes
+        while attribute caching is enabled.
+        """
+        if self._attribute_cache is not None:
+            self._attribute_cache.clear()
+
+    def enable_attribute_caching(self):
+        """
+        Enables caching of the attributes that do not change while the
+        device is present, such as the product type, the supported
+        ranges and rates, and the names of the physical channels.
+
+        Once you enable caching, this Device object queries each of these
+        attributes only once. The physical channel objects that you get
+        from its physical channel collections share the cache. Device
+        objects that you get from :py:attr:`nidaqmx.system.System.devices`
+        do not share the cache, so you get fresh values when you get the
+        device from the system again. Resetting the device clears the
+        cache.
+        """
+        if self._attribute_cache is None:
+            self._attribute_cache = AttributeCache()
+
     def reset_device(self):
         """
         Immediately aborts all active tasks associated with a device,
@@ -1068,15 +1296,9 @@ class Device:
 
         self._interpreter.reset_device(
             self._name)
+        self.clear_attribute_cache()
 
-    def self_test_device(self):
-        """
-        Performs a brief test of device resources. If a failure occurs,
-        refer to your device documentation for more information.
-        """
-
-        self._interpreter.self_test_device(
-            self._name)
+    # endregion
 
     # region Network Device Functions
 
@@ -1168,6 +1390,7 @@ class _DeviceAlternateConstructor(Device):
         """
         self._name = name
         self._interpreter = interpreter
+        self._attribute_cache = None
 
         # Use meta-programming to change the type of this object to Device,
         # so the user isn't confused when doing introspection.
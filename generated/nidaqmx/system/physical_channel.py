@@ -4,6 +4,7 @@ import ctypes
 import numpy
 
 from nidaqmx import utils
+from nidaqmx._attribute_cache import AttributeCache, get_cached_attribute
 from nidaqmx._bitfield_utils import enum_bitfield_to_list
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
@@ -18,7 +19,7 @@ class PhysicalChannel:
     """
     Represents a DAQmx physical channel.
     """
-    __slots__ = ['_name', '_interpreter', '__weakref__']
+    __slots__ = ['_name', '_interpreter', '_attribute_cache', '__weakref__']
 
     def __init__(self, name, *, grpc_options=None):
         """
@@ -29,6 +30,7 @@ class PhysicalChannel:
         """
         self._name = name
         self._interpreter = utils._select_interpreter(grpc_options)
+        self._attribute_cache = None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -59,7 +61,9 @@ class PhysicalChannel:
             connector or one of several calibration signals.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_string(self._name, 0x2fd8)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_string,
+            self._name, 0x2fd8)
         return unflatten_channel_string(val)
 
     @property
@@ -69,7 +73,9 @@ class PhysicalChannel:
             measurement types supported by the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x2fd7)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x2fd7)
         return [UsageTypeAI(e) for e in val]
 
     @property
@@ -228,7 +234,9 @@ class PhysicalChannel:
             channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x3179)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x3179)
         return [SensorPowerType(e) for e in val]
 
     @property
@@ -239,7 +247,9 @@ class PhysicalChannel:
             value followed by the high value.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_double_array(self._name, 0x317a)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_double_array,
+            self._name, 0x317a)
         return val
 
     @property
@@ -250,7 +260,9 @@ class PhysicalChannel:
             the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32(self._name, 0x2342)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32,
+            self._name, 0x2342)
         return enum_bitfield_to_list(
             val, _TermCfg, TerminalConfiguration)
 
@@ -337,7 +349,9 @@ class PhysicalChannel:
             output types supported by the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x2fd9)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x2fd9)
         return [UsageTypeAO(e) for e in val]
 
     @property
@@ -389,7 +403,9 @@ class PhysicalChannel:
         float: Indicates the calibrated gain of the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_double(self._name, 0x3065)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_double,
+            self._name, 0x3065)
         return val
 
     @property
@@ -398,7 +414,9 @@ class PhysicalChannel:
         float: Indicates the calibrated offset of the channel in volts.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_double(self._name, 0x3066)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_double,
+            self._name, 0x3066)
         return val
 
     @property
@@ -418,7 +436,9 @@ class PhysicalChannel:
             used to scale from pre-amplified values.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_double_array(self._name, 0x3063)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_double_array,
+            self._name, 0x3063)
         return val
 
     @property
@@ -429,7 +449,9 @@ class PhysicalChannel:
             channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x304e)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x304e)
         return [AOPowerUpOutputBehavior(e) for e in val]
 
     @property
@@ -440,7 +462,9 @@ class PhysicalChannel:
             the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32(self._name, 0x29a3)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32,
+            self._name, 0x29a3)
         return enum_bitfield_to_list(
             val, _TermCfg, TerminalConfiguration)
 
@@ -451,7 +475,9 @@ class PhysicalChannel:
             measurement types supported by the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x2fda)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x2fda)
         return [UsageTypeCI(e) for e in val]
 
     @property
@@ -461,7 +487,9 @@ class PhysicalChannel:
             output types supported by the channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x2fdb)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x2fdb)
         return [UsageTypeCO(e) for e in val]
 
     @property
@@ -471,7 +499,9 @@ class PhysicalChannel:
             for the digital input physical channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_bool(self._name, 0x29a6)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_bool,
+            self._name, 0x29a6)
         return val
 
     @property
@@ -480,7 +510,9 @@ class PhysicalChannel:
         int: Indicates in bits the width of digital input port.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_uint32(self._name, 0x29a4)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_uint32,
+            self._name, 0x29a4)
         return val
 
     @property
@@ -490,7 +522,9 @@ class PhysicalChannel:
             the digital input physical channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_bool(self._name, 0x29a5)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_bool,
+            self._name, 0x29a5)
         return val
 
     @property
@@ -501,7 +535,9 @@ class PhysicalChannel:
             clocked digital input.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x2fe0)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x2fe0)
         return [AcquisitionType(e) for e in val]
 
     @property
@@ -510,7 +546,9 @@ class PhysicalChannel:
         int: Indicates in bits the width of digital output port.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_uint32(self._name, 0x29a7)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_uint32,
+            self._name, 0x29a7)
         return val
 
     @property
@@ -520,7 +558,9 @@ class PhysicalChannel:
             the digital output physical channel.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_bool(self._name, 0x29a8)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_bool,
+            self._name, 0x29a8)
         return val
 
     @property
@@ -531,7 +571,9 @@ class PhysicalChannel:
             clocked digital output.
         """
 
-        val = self._interpreter.get_physical_chan_attribute_int32_array(self._name, 0x2fe1)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_physical_chan_attribute_int32_array,
+            self._name, 0x2fe1)
         return [AcquisitionType(e) for e in val]
 
     @property
@@ -670,6 +712,31 @@ class PhysicalChannel:
         self._interpreter.write_to_teds_from_file(
             self._name, file_path, basic_teds_options.value)
 
+    # region Attribute Cache Functions
+
+    def clear_attribute_cache(self):
+        """
+        Discards the cached attribute values, so that the next access to
+        each attribute queries the driver. If this physical channel shares
+        the cache of its device, this method clears the cache of the
+        device.
+        """
+        if self._attribute_cache is not None:
+            self._attribute_cache.clear()
+
+    def enable_attribute_caching(self):
+        """
+        Enables caching of the attributes that do not change while the
+        device is present, such as the supported measurement types and
+        terminal configurations.
+
+        Physical channels that you get from a device that has attribute
+        caching enabled already share the cache of the device.
+        """
+        if self._attribute_cache is None:
+            self._attribute_cache = AttributeCache()
+
+    # endregion
 
 
 class _PhysicalChannelAlternateConstructor(PhysicalChannel):
@@ -681,15 +748,17 @@ class _PhysicalChannelAlternateConstructor(PhysicalChannel):
     # Setting __slots__ avoids TypeError: __class__ assignment: 'Base' object layout differs from 'Derived'.
     __slots__ = ()
 
-    def __init__(self, name, interpreter):
+    def __init__(self, name, interpreter, attribute_cache=None):
         """
         Args:
             name: Specifies the name of the Physical Channel.
             interpreter: Specifies the interpreter instance.
+            attribute_cache: Specifies the attribute cache of the device, if any.
 
         """
         self._name = name
         self._interpreter = interpreter
+        self._attribute_cache = attribute_cache
 
         # Use meta-programming to change the type of this object to PhysicalChannel,
         # so the user isn't confused when doing introspection.
@@ -0,0 +1,261 @@
+import struct
+
+import numpy
+
+from nidaqmx.constants import ChannelType
+
+__all__ = ['TdmsWriter']
+
+_TDMS_VERSION = 4713
+_TOC_META_DATA = 1 << 1
+_TOC_NEW_OBJ_LIST = 1 << 2
+_TOC_RAW_DATA = 1 << 3
+_NO_RAW_DATA = 0xFFFFFFFF
+_RAW_DATA_INDEX_LENGTH = 20
+
+_TDS_TYPE_I32 = 0x03
+_TDS_TYPE_DOUBLE = 0x0A
+_TDS_TYPE_STRING = 0x20
+
+# Maps (kind, itemsize) of NumPy data types to TDMS data types.
+_TDS_TYPES = {
+    ('i', 1): 0x01,
+    ('i', 2): 0x02,
+    ('i', 4): 0x03,
+    ('i', 8): 0x04,
+    ('u', 1): 0x05,
+    ('u', 2): 0x06,
+    ('u', 4): 0x07,
+    ('u', 8): 0x08,
+    ('f', 4): 0x09,
+    ('f', 8): 0x0A,
+}
+
+
+class TdmsWriter:
+    """
+    Writes chunks of samples to a TDMS file on the client.
+
+    Unlike the TDMS logging that you configure on the input stream, this
+    writer runs in the Python process, so it works for tasks that run on
+    a gRPC server and for data that you process before you log it. Each
+    call to :py:meth:`write` appends one TDMS segment. The samples are
+    written to the file as they are stored in the NumPy array, so logging
+    does not do any per-sample work in Python. Segments with the same
+    number of samples as the previous segment contain only a 28-byte
+    header and the samples.
+
+    When you write unscaled integer samples, such as the samples that
+    :py:class:`nidaqmx.stream_readers.AnalogUnscaledReader` reads, and you
+    specify scaling coefficients, the writer stores the coefficients as
+    NI polynomial scaling properties of each channel, so that TDMS readers
+    can scale the samples when they read them.
+
+    Example:
+        >>> with TdmsWriter.for_task("capture.tdms", task) as tdms_writer:
+        ...     for chunk in task.in_stream.iter_chunks(1000):
+        ...         tdms_writer.write(chunk)
+    """
+    __slots__ = [
+        '_file', '_group_name', '_channel_names', '_scaling_coeffs', '_sample_rate',
+        '_dtype', '_samples_per_segment']
+
+    def __init__(self, file_path, channel_names, group_name='Data', scaling_coeffs=None,
+                 sample_rate=None):
+        """
+        Creates a TDMS file, replacing the file if it exists.
+
+        Args:
+            file_path (str): Specifies the path of the TDMS file.
+            channel_names (List[str]): Specifies the names of the TDMS
+                channels, in the order of the rows of the chunks.
+            group_name (Optional[str]): Specifies the name of the TDMS
+                group that contains the channels.
+            scaling_coeffs (Optional[List[List[float]]]): Specifies the
+                coefficients of the polynomial that scales the unscaled
+                samples of each channel to volts.
+            sample_rate (Optional[float]): Specifies the sample rate, in
+                samples per second per channel. If you specify this value,
+                the writer stores waveform timing properties for each
+                channel.
+        """
+        if scaling_coeffs is not None and len(scaling_coeffs) != len(channel_names):
+            raise ValueError('scaling_coeffs must have an element for each channel.')
+
+        self._group_name = group_name
+        self._channel_names = list(channel_names)
+        self._scaling_coeffs = scaling_coeffs
+        self._sample_rate = sample_rate
+        self._dtype = None
+        self._samples_per_segment = None
+        self._file = open(file_path, 'wb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @staticmethod
+    def for_task(file_path, task, group_name=None, sample_rate=None):
+        """
+        Creates a TDMS file for the channels to read of a task.
+
+        The channel names come from the "channels_to_read" property of
+        the input stream. For analog input tasks, the writer also stores
+        the device scaling coefficients of each channel, which the task
+        queries once and caches.
+
+        Args:
+            file_path (str): Specifies the path of the TDMS file.
+            task (nidaqmx.task.Task): Specifies the task to log.
+            group_name (Optional[str]): Specifies the name of the TDMS
+                group. If you do not specify a group name, the writer uses
+                the name of the task.
+            sample_rate (Optional[float]): Specifies the sample rate, in
+                samples per second per channel.
+        Returns:
+            nidaqmx.tdms.TdmsWriter:
+
+            Indicates an object that writes to the TDMS file.
+        """
+        read_plan = task._get_read_plan()
+        scaling_coeffs = None
+        if read_plan.read_chan_type == ChannelType.ANALOG_INPUT and not read_plan.has_power_chan:
+            scaling_coeffs = task._get_ai_dev_scaling_coeffs()
+        if group_name is None:
+            group_name = task.name
+        return TdmsWriter(
+            file_path, task.in_stream.channels_to_read.channel_names, group_name,
+            scaling_coeffs, sample_rate)
+
+    @property
+    def channel_names(self):
+        """
+        List[str]: Indicates the names of the TDMS channels.
+        """
+        return self._channel_names
+
+    @property
+    def group_name(self):
+        """
+        str: Indicates the name of the TDMS group.
+        """
+        return self._group_name
+
+    def close(self):
+        """
+        Closes the TDMS file.
+        """
+        self._file.close()
+
+    def flush(self):
+        """
+        Writes buffered segments to the TDMS file.
+        """
+        self._file.flush()
+
+    def write(self, data):
+        """
+        Appends a chunk of samples to the TDMS file.
+
+        Args:
+            data (numpy.ndarray): Specifies the samples. A 2D array has
+                one row per channel; a 1D array is allowed when there is
+                one channel. All chunks must have the same data type.
+        """
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+        if data.ndim != 2 or data.shape[0] != len(self._channel_names):
+            raise ValueError(
+                'data must have one row for each of the {} channels, but its shape is {}.'
+                .format(len(self._channel_names), data.shape))
+        if (data.dtype.kind, data.dtype.itemsize) not in _TDS_TYPES:
+            raise ValueError(f'Samples of type {data.dtype} cannot be written to TDMS files.')
+
+        # TDMS stores non-interleaved samples in little-endian order, which is
+        # the layout of a C-contiguous array with one row per channel.
+        data = numpy.ascontiguousarray(data, dtype=data.dtype.newbyteorder('<'))
+        if self._dtype is not None and data.dtype != self._dtype:
+            raise ValueError(
+                f'All chunks must have the same data type ({self._dtype}), not {data.dtype}.')
+        samples_per_channel = data.shape[1]
+
+        if self._dtype is None:
+            self._dtype = data.dtype
+            toc = _TOC_META_DATA | _TOC_NEW_OBJ_LIST | _TOC_RAW_DATA
+            meta_data = self._get_meta_data(samples_per_channel, include_properties=True)
+        elif samples_per_channel != self._samples_per_segment:
+            toc = _TOC_META_DATA | _TOC_RAW_DATA
+            meta_data = self._get_meta_data(samples_per_channel, include_properties=False)
+        else:
+            # The segment reuses the objects and raw data indexes of the
+            # previous segment.
+            toc = _TOC_RAW_DATA
+            meta_data = b''
+        self._samples_per_segment = samples_per_channel
+
+        self._file.write(struct.pack(
+            '<4sIIQQ', b'TDSm', toc, _TDMS_VERSION, len(meta_data) + data.nbytes,
+            len(meta_data)))
+        self._file.write(meta_data)
+        self._file.write(data.data)
+
+    def _get_meta_data(self, samples_per_channel, include_properties):
+        objects = []
+        if include_properties:
+            objects.append(_pack_object('/', _NO_RAW_DATA, {}))
+            objects.append(_pack_object(_get_path(self._group_name), _NO_RAW_DATA, {}))
+
+        raw_data_index = struct.pack(
+            '<IIQ', _TDS_TYPES[(self._dtype.kind, self._dtype.itemsize)], 1,
+            samples_per_channel)
+        for i, channel_name in enumerate(self._channel_names):
+            properties = self._get_channel_properties(i) if include_properties else {}
+            objects.append(_pack_object(
+                _get_path(self._group_name, channel_name), raw_data_index, properties))
+
+        return struct.pack('<I', len(objects)) + b''.join(objects)
+
+    def _get_channel_properties(self, channel_index):
+        properties = {}
+        if self._sample_rate is not None:
+            properties['wf_start_offset'] = 0.0
+            properties['wf_increment'] = 1.0 / self._sample_rate
+        if self._scaling_coeffs is not None and self._dtype.kind in 'iu':
+            coeffs = self._scaling_coeffs[channel_index]
+            properties['NI_Number_Of_Scales'] = 1
+            properties['NI_Scaling_Status'] = 'unscaled'
+            properties['NI_Scale[0]_Scale_Type'] = 'Polynomial'
+            properties['NI_Scale[0]_Polynomial_Coefficients_Size'] = len(coeffs)
+            for i, coeff in enumerate(coeffs):
+                properties[f'NI_Scale[0]_Polynomial_Coefficients[{i}]'] = float(coeff)
+        return properties
+
+
+def _get_path(*names):
+    return ''.join("/'{}'".format(name.replace("'", "''")) for name in names)
+
+
+def _pack_string(value):
+    encoded = value.encode('utf-8')
+    return struct.pack('<I', len(encoded)) + encoded
+
+
+def _pack_object(path, raw_data_index, properties):
+    if raw_data_index == _NO_RAW_DATA:
+        packed_index = struct.pack('<I', _NO_RAW_DATA)
+    else:
+        packed_index = struct.pack('<I', _RAW_DATA_INDEX_LENGTH) + raw_data_index
+
+    packed_properties = [struct.pack('<I', len(properties))]
+    for name, value in properties.items():
+        packed_properties.append(_pack_string(name))
+        if isinstance(value, str):
+            packed_properties.append(struct.pack('<I', _TDS_TYPE_STRING) + _pack_string(value))
+        elif isinstance(value, float):
+            packed_properties.append(struct.pack('<Id', _TDS_TYPE_DOUBLE, value))
+        else:
+            packed_properties.append(struct.pack('<Ii', _TDS_TYPE_I32, value))
+
+    return _pack_string(path) + packed_index + b''.join(packed_properties)
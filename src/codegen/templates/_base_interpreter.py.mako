@@ -51,4 +51,25 @@ class BaseInterpreter(abc.ABC):
 % endfor
     @abc.abstractmethod
     def hash_task_handle(self, task_handle):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def batch(self):
+        """Returns a context manager that batches attribute setter calls."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def close(self):
+        """Releases resources that the interpreter created for its own use.
+
+        The interpreter remains usable and recreates the resources if necessary.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def call_concurrently(self, funcs):
+        """Calls each function with no arguments and returns the results in order.
+
+        Interpreters with a round trip per call may overlap the calls.
+        """
+        raise NotImplementedError
@@ -17,12 +17,17 @@
 # Do not edit this file; it was automatically generated.
 
 from __future__ import annotations
+import collections
+import concurrent.futures
+import contextlib
+import functools
 import logging
 import threading
 import typing
 import warnings
 from typing import Callable, Generic, Optional, TypeVar
 
+import google.protobuf.descriptor
 import google.protobuf.message
 import grpc
 import numpy
@@ -36,6 +41,9 @@ from nidaqmx.error_codes import DAQmxErrors
 
 _logger = logging.getLogger(__name__)
 
+# The maximum number of calls that call_concurrently() has in flight at once.
+_MAX_CONCURRENT_CALLS = 16
+
 _UNABLE_TO_LOCATE_ERROR_RESOURCES_ERROR_MESSAGE = (
     "Error code could not be found. Reinstalling the driver might fix the issue. "
     "Otherwise, contact National Instruments technical support."
@@ -92,19 +100,140 @@ class GrpcEventHandler(BaseEventHandler, Generic[TEventResponse]):
             return
 
 
+class _GrpcCallBatch:
+    """
+    Sends batched calls without waiting for their responses.
+
+    Calls that target the same task and channel (or devices, or watchdog
+    lines) are sent one after another, in the order they were added, so that
+    the server applies them in that order. Calls that target different
+    channels are in flight at the same time.
+    """
+    __slots__ = [
+        "_lock",
+        "_idle",
+        "_calls",
+        "_pending_calls",
+    ]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # All calls in the order they were added. Each call is [func, request, rpc_error].
+        self._calls: typing.List[list] = []
+        # For each target with a call in flight, the calls waiting to be sent.
+        self._pending_calls: typing.Dict[tuple, typing.Deque[list]] = {}
+
+    def add(self, func, request) -> None:
+        target = _get_batch_target(request)
+        call = [func, request, None]
+        with self._lock:
+            self._calls.append(call)
+            pending_calls = self._pending_calls.get(target)
+            if pending_calls is not None:
+                pending_calls.append(call)
+                return
+            self._pending_calls[target] = collections.deque()
+        self._send(target, call)
+
+    def wait(self) -> Optional[grpc.RpcError]:
+        """Waits for the calls to complete and returns the error from the first failed call."""
+        with self._idle:
+            while self._pending_calls:
+                self._idle.wait()
+            calls, self._calls = self._calls, []
+        for _, _, rpc_error in calls:
+            if rpc_error is not None:
+                return rpc_error
+        return None
+
+    def _send(self, target, call) -> None:
+        func, request, _ = call
+        future = func.future(request)
+        future.add_done_callback(functools.partial(self._on_done, target, call))
+
+    def _on_done(self, target, call, future) -> None:
+        call[2] = future.exception()
+        with self._lock:
+            pending_calls = self._pending_calls[target]
+            if call[2] is None and pending_calls:
+                next_call = pending_calls.popleft()
+            else:
+                # Do not send the remaining calls for this target because they may depend on the
+                # failed call. wait() reports the first error, which precedes them.
+                del self._pending_calls[target]
+                self._idle.notify_all()
+                return
+        self._send(target, next_call)
+
+
+def _get_batch_target(request) -> tuple:
+    """Returns the task and the channel, devices, or watchdog lines that the request targets."""
+    target = [request.task.name]
+    for field_name in ("channel", "device_names", "lines"):
+        if field_name in request.DESCRIPTOR.fields_by_name:
+            target.append(getattr(request, field_name))
+    return tuple(target)
+
+
 class GrpcStubInterpreter(BaseInterpreter):
     '''Interpreter for interacting with a gRPC Stub class'''
     # Do not add per-task state to the interpreter class.
     __slots__ = [
         '_grpc_options',
         '_client',
+        '_batch_state',
+        '_executor_lock',
+        '_executor',
     ]
 
     def __init__(self, grpc_options):
         self._grpc_options = grpc_options
         self._client = nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_channel)
+        # Batches are per thread, so other threads using this interpreter are not affected.
+        self._batch_state = threading.local()
+        self._executor_lock = threading.Lock()
+        # Created by the first call_concurrently() call and shut down by close().
+        self._executor = None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Batches attribute setter and resetter calls made by this thread.
+
+        Within the context, batched calls are sent without waiting for their
+        responses. Any other call waits for the batched calls to complete
+        first. Errors from batched calls are raised by the next call that
+        waits, or when the context exits.
+        """
+        if getattr(self._batch_state, "batch", None) is not None:
+            yield
+            return
+        batch = _GrpcCallBatch()
+        self._batch_state.batch = batch
+        try:
+            yield
+            self._wait_for_batch()
+        finally:
+            batch.wait()
+            self._batch_state.batch = None
+
+    def _wait_for_batch(self):
+        batch = getattr(self._batch_state, "batch", None)
+        if batch is not None:
+            rpc_error = batch.wait()
+            if rpc_error is not None:
+                self._handle_rpc_error(rpc_error)
+
+    def _invoke_batchable(self, func, request):
+        batch = getattr(self._batch_state, "batch", None)
+        if batch is None:
+            self._invoke(func, request)
+        else:
+            batch.add(func, request)
 
     def _invoke(self, func, request, metadata=None):
+        self._wait_for_batch()
         try:
             response = func(request, metadata=metadata)
         except grpc.RpcError as rpc_error:
@@ -206,6 +335,36 @@ class GrpcStubInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.name)
 
+    def close(self):
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def call_concurrently(self, funcs):
+        """
+        Calls each function on a pool of threads, so that the round trips to the
+        server overlap, and returns the results in order.
+        """
+        # The batch belongs to this thread, so the pool threads do not wait for it.
+        self._wait_for_batch()
+        funcs = list(funcs)
+        if len(funcs) <= 1:
+            return [func() for func in funcs]
+        executor = self._get_executor()
+        futures = [executor.submit(func) for func in funcs]
+        return [future.result() for future in futures]
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_CALLS,
+                    thread_name_prefix="nidaqmx concurrent call",
+                )
+            return self._executor
+
     ## get_error_string has special error handling.
     def get_error_string(self, error_code):
         try:
@@ -224,22 +383,69 @@ def _assign_numpy_array(numpy_array, grpc_array):
     """
     Assigns grpc array to numpy array maintaining the original shape.
 
-    Checks for the instance of grpc_array with bytes, if validated to True,
-    the numpy array is assigned to a 1D array of the grpc arrray.
+    The grpc array is converted to the numpy array's dtype in a single bulk
+    operation (numpy.frombuffer() for bytes) and copied into the start of the
+    numpy array's buffer.
     """
-    grpc_array_size = len(grpc_array)
     if isinstance(grpc_array, bytes):
-        assert numpy_array.nbytes >= grpc_array_size
-        numpy_array.flat[:grpc_array_size] = numpy.frombuffer(grpc_array, dtype=numpy_array.dtype)
+        assert numpy_array.nbytes >= len(grpc_array)
+        grpc_array = numpy.frombuffer(grpc_array, dtype=numpy_array.dtype)
+    else:
+        assert numpy_array.size >= len(grpc_array)
+        grpc_array = numpy.asarray(grpc_array, dtype=numpy_array.dtype)
+    if numpy_array.flags.c_contiguous:
+        # reshape(-1) is a view of a C-contiguous array, so this copies directly into its buffer.
+        numpy_array.reshape(-1)[:grpc_array.size] = grpc_array
     else:
-        assert numpy_array.size >= grpc_array_size
-        numpy_array.flat[:grpc_array_size] = grpc_array
+        numpy_array.flat[:grpc_array.size] = grpc_array
 
 def _validate_array_dtype(numpy_array, expected_numpy_array_dtype):
     """Raises TypeError if array type doesn't match with expected numpy.dtype"""
     if expected_numpy_array_dtype != numpy.generic and numpy_array.dtype != expected_numpy_array_dtype:
         raise TypeError(f"array must have data type {expected_numpy_array_dtype}")
 
+# Little-endian numpy dtypes for the repeated fields whose packed wire encoding is the raw array
+# buffer. Other numeric fields are varint encoded and must be converted element by element.
+_PACKED_FIXED_WIDTH_DTYPES = {
+    google.protobuf.descriptor.FieldDescriptor.TYPE_DOUBLE: "<f8",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_FLOAT: "<f4",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_FIXED32: "<u4",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_FIXED64: "<u8",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_SFIXED32: "<i4",
+    google.protobuf.descriptor.FieldDescriptor.TYPE_SFIXED64: "<i8",
+}
+_WIRETYPE_LENGTH_DELIMITED = 2
+
+def _pack_numpy_array(message, field_name, numpy_array):
+    """
+    Assigns numpy array to a repeated numeric field of the message in bulk.
+
+    Fixed-width fields are serialized from the array buffer as a single packed
+    field and merged into the message, so protobuf never iterates over the
+    array in Python. Varint fields are extended from a list, which is still
+    much faster than assigning numpy_array.flat.
+    """
+    field = message.DESCRIPTOR.fields_by_name[field_name]
+    packed_dtype = _PACKED_FIXED_WIDTH_DTYPES.get(field.type)
+    if packed_dtype is not None:
+        data = numpy.ascontiguousarray(numpy_array, dtype=packed_dtype).tobytes()
+        message.MergeFromString(
+            _encode_varint((field.number << 3) | _WIRETYPE_LENGTH_DELIMITED)
+            + _encode_varint(len(data))
+            + data
+        )
+    else:
+        getattr(message, field_name).extend(numpy_array.ravel().tolist())
+
+def _encode_varint(value):
+    """Encodes a non-negative integer as a protobuf base 128 varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
 def _is_cancelled(ex: Exception) -> bool:
     """Returns True if the given exception is a cancelled RPC exception."""
     return (
@@ -1,6 +1,7 @@
 <%
     from codegen.utilities.function_helpers import order_function_parameters_by_optional
     from codegen.utilities.interpreter_helpers import (
+        get_c_function_argtypes,
         get_c_function_call_template,
         get_instantiation_lines_for_output,
         get_interpreter_functions,
@@ -16,8 +17,10 @@
 %>\
 # Do not edit this file; it was automatically generated.
 
+import contextlib
 import ctypes
 import logging
+import threading
 import warnings
 from typing import Optional
 
@@ -32,6 +35,11 @@ from nidaqmx.errors import DaqError, DaqReadError, DaqWarning, DaqWriteError
 
 _logger = logging.getLogger(__name__)
 
+# The size of the reusable string buffers. Most strings, such as channel and device names, fit.
+_STRING_BUFFER_SIZE = 2048
+# Larger buffers are not kept for reuse, so that a long string does not hold on to memory.
+_MAX_REUSED_STRING_BUFFER_SIZE = 65536
+
 
 class LibraryEventHandler(BaseEventHandler):
     """Manage the lifetime of a ctypes callback method pointer.
@@ -48,6 +56,28 @@ class LibraryEventHandler(BaseEventHandler):
         self._callback_method_ptr = None
 
 
+class _StringBufferPool(threading.local):
+    """Reusable string buffers for the string getters, one per thread."""
+
+    def __init__(self) -> None:
+        self._buffer = ctypes.create_string_buffer(_STRING_BUFFER_SIZE)
+
+    def get(self, size: int = 0) -> ctypes.Array:
+        """Returns a buffer that holds at least size characters.
+
+        The buffer is only valid until the next call to this method on the same thread.
+        """
+        if size <= len(self._buffer):
+            return self._buffer
+        buffer = ctypes.create_string_buffer(size)
+        if size <= _MAX_REUSED_STRING_BUFFER_SIZE:
+            self._buffer = buffer
+        return buffer
+
+
+_string_buffers = _StringBufferPool()
+
+
 class LibraryInterpreter(BaseInterpreter):
     """
     Library C<->Python interpreter.
@@ -106,12 +136,6 @@ class LibraryInterpreter(BaseInterpreter):
         error_buffer = ctypes.create_string_buffer(2048)
 
         cfunc = lib_importer.windll.DAQmxGetErrorString
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [ctypes.c_int, ctypes.c_char_p,
-                                      ctypes.c_uint]
-
         query_error_code = cfunc(error_code, error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get error string for error code %d. DAQmxGetErrorString returned error code %d.', error_code, query_error_code)
@@ -124,11 +148,6 @@ class LibraryInterpreter(BaseInterpreter):
         error_buffer = ctypes.create_string_buffer(2048)
 
         cfunc = lib_importer.windll.DAQmxGetExtendedErrorInfo
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [ctypes.c_char_p, ctypes.c_uint]
-
         query_error_code = cfunc(error_buffer, 2048)
         if query_error_code < 0:
             _logger.error('Failed to get extended error info. DAQmxGetExtendedErrorInfo returned error code %d.', query_error_code)
@@ -142,17 +161,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadPowerBinaryI16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
-                        c_bool32,
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode,
             read_voltage_array, read_current_array, read_voltage_array.size,
@@ -168,17 +176,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadPowerF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
-                        c_bool32,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode,
             read_voltage_array, read_current_array, read_voltage_array.size,
@@ -193,15 +190,6 @@ class LibraryInterpreter(BaseInterpreter):
         number_of_bytes_per_sample = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxReadRaw
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
-                        wrapped_ndpointer(dtype=read_array.dtype, flags=('C', 'W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task, num_samps_per_chan, timeout, read_array,
             read_array.nbytes, ctypes.byref(samples_read),
@@ -216,16 +204,6 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_written = ctypes.c_int()
 
         cfunc = lib_importer.windll.DAQmxWriteRaw
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy_array.dtype,
-                                        flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
-
         error_code = cfunc(
             task_handle, num_samps_per_chan, auto_start, timeout, numpy_array,
             ctypes.byref(samps_per_chan_written), None)
@@ -236,6 +214,18 @@ class LibraryInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.value)
 
+    def batch(self):
+        # Library calls have no round trip to save, so there is nothing to batch.
+        return contextlib.nullcontext()
+
+    def close(self):
+        # The library interpreter does not create any resources.
+        pass
+
+    def call_concurrently(self, funcs):
+        # Library calls have no round trip to overlap.
+        return [func() for func in funcs]
+
     def check_for_error(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
         if not error_code:
             return
@@ -263,4 +253,40 @@ def is_string_buffer_too_small(error_code):
 
 
 def is_array_buffer_too_small(error_code):
-    return error_code == DAQmxErrors.WRITE_BUFFER_TOO_SMALL
\ No newline at end of file
+    return error_code == DAQmxErrors.WRITE_BUFFER_TOO_SMALL
+
+
+# The argument types of the NI-DAQmx C functions that this module calls. This module registers
+# them with lib_importer, and DaqFunctionImporter sets them once, when it first looks up each
+# function, so the interpreter methods call the functions without checking them. They are lambdas
+# because the task handle type depends on the driver version.
+_FUNCTION_ARGTYPES = {
+% for c_function_name, argtypes in get_c_function_argtypes(functions):
+    '${c_function_name}': lambda: [
+        ${', '.join(argtypes) | wrap(8, 8)}],
+% endfor
+    ## The functions with hand-written interpreter methods.
+    'DAQmxGetErrorString': lambda: [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxGetExtendedErrorInfo': lambda: [ctypes.c_char_p, ctypes.c_uint],
+    'DAQmxReadPowerBinaryI16': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, c_bool32,
+        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
+        wrapped_ndpointer(dtype=numpy.int16, flags=('C', 'W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxReadPowerF64': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double, c_bool32,
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
+        wrapped_ndpointer(dtype=numpy.float64, flags=('C', 'W')),
+        ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    # Raw reads and writes accept arrays of any data type.
+    'DAQmxReadRaw': lambda: [
+        lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+        wrapped_ndpointer(flags=('C', 'W')), ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)],
+    'DAQmxWriteRaw': lambda: [
+        lib_importer.task_handle, ctypes.c_int, c_bool32, ctypes.c_double,
+        wrapped_ndpointer(flags=('C')), ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(c_bool32)],
+}
+
+lib_importer.register_function_argtypes(_FUNCTION_ARGTYPES)
@@ -6,7 +6,10 @@
 %>\
 # Do not edit this file; it was automatically generated.
 
+import functools
+
 import nidaqmx._task_modules.channels  # circular import: Channel._factory uses derived classes
+from nidaqmx import utils
 from nidaqmx.system.physical_channel import _PhysicalChannelAlternateConstructor
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 from nidaqmx.constants import (
@@ -161,6 +164,36 @@ class Channel:
 ${property_template.script_property(attribute)}\
 %endfor
 \
+    def get_attributes(self, attribute_names):
+        """
+        Gets several properties of each virtual channel that this object
+        represents.
+
+        This method is faster than getting each property of each channel
+        in turn. With a gRPC session, the calls to the server overlap.
+
+        Args:
+            attribute_names (List[str]): Specifies the names of the
+                properties to get, such as "ai_min". The properties must
+                belong to the class of this object.
+        Returns:
+            Dict[str, List]:
+
+            Indicates a dictionary that maps each property name to a list
+            with the value of the property for each channel, in the order
+            of :py:attr:`channel_names`. To create a pandas DataFrame, use
+            ``pandas.DataFrame(values, index=channel.channel_names)``.
+        """
+        getters = utils._get_property_getters(self.__class__, attribute_names)
+        channels = [
+            self.__class__(self._handle, channel_name, self._interpreter)
+            for channel_name in self.channel_names]
+        values = self._interpreter.call_concurrently(
+            [functools.partial(getter, channel) for channel in channels for getter in getters])
+        return {
+            attribute_name: values[i::len(getters)]
+            for i, attribute_name in enumerate(attribute_names)}
+
     def save(self, save_as="", author="", overwrite_existing_channel=False,
              allow_interactive_editing=True, allow_interactive_deletion=True):
         """
@@ -9,7 +9,11 @@
 import numpy
 import deprecation
 
+from nidaqmx._task_modules.background_reader import BackgroundReader, _ChunkReader
 from nidaqmx._task_modules.channels.channel import Channel
+from nidaqmx._task_modules.chunk_stream import ChunkStream
+from nidaqmx.errors import DaqError, DaqReadError
+from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
     ${', '.join([c for c in enums_used]) | wrap(4, 4)})
@@ -68,6 +72,28 @@ class InStream:
     def timeout(self):
         self._timeout = 10.0
 
+    @property
+    def channels_to_read(self):
+        """
+        :class:`nidaqmx._task_modules.channels.channel.Channel`:
+            Specifies a subset of channels in the task from which to
+            read.
+        """
+
+        val = self._interpreter.get_read_attribute_string(self._handle, 0x1823)
+        return Channel._factory(self._handle, val, self._interpreter)
+
+    @channels_to_read.setter
+    def channels_to_read(self, val):
+        val = val.name
+        self._interpreter.set_read_attribute_string(self._handle, 0x1823, val)
+        self._task._invalidate_read_plan()
+
+    @channels_to_read.deleter
+    def channels_to_read(self):
+        self._interpreter.reset_read_attribute(self._handle, 0x1823)
+        self._task._invalidate_read_plan()
+
 <%namespace name="property_template" file="/property_template.py.mako"/>\
 %for attribute in attributes:
 ${property_template.script_property(attribute)}\
@@ -118,6 +144,126 @@ ${property_template.script_property(attribute)}\
         self._interpreter.configure_logging(
             self._handle, file_path, logging_mode.value, group_name, operation.value)
 
+    def iter_chunks(
+            self, samples_per_chunk, reader_cls=None, timeout=None,
+            number_of_buffers=2):
+        """
+        Reads chunks of samples on the calling thread and yields them as
+        NumPy arrays until the task stops.
+
+        Use this method instead of calling a stream reader's
+        read_many_sample() method in a loop. The iteration ends, without
+        an error, when you call :py:meth:`nidaqmx.task.Task.stop` (from
+        the loop or from another thread), stop or abort the task with
+        :py:meth:`nidaqmx.task.Task.control`, or close the task, or when
+        a finite acquisition has returned all of its samples. If a read returns some samples
+        before it stops or fails, for example because it timed out, this
+        method yields them as a shorter chunk first and raises the error
+        on the next iteration.
+
+        This method reads on the calling thread, so reads do not overlap
+        with processing. To read on a background thread, use
+        :py:meth:`start_background_reader`, which reads with the same
+        stream reader classes and discards the oldest chunks when the
+        caller falls behind, or :py:meth:`stream_chunks`, which returns
+        the same arrays as :py:meth:`nidaqmx.task.Task.read` and waits
+        for the caller instead.
+
+        This method validates its arguments when you call it, not when
+        you start iterating.
+
+        The chunks are stored in number_of_buffers sets of preallocated
+        arrays that are reused in turn, so a chunk is overwritten
+        number_of_buffers chunks after it is yielded. Copy a chunk if you
+        need to keep it longer.
+
+        Args:
+            samples_per_chunk (int): Specifies the number of samples per
+                channel to read in each chunk. If you set this input to
+                nidaqmx.constants.READ_ALL_AVAILABLE, each chunk contains
+                the samples that are available when it is read, and this
+                method waits for at least one sample; the arrays grow as
+                needed.
+            reader_cls (Optional[type]): Specifies the stream reader class
+                to read with: nidaqmx.stream_readers.
+                AnalogMultiChannelReader, AnalogSingleChannelReader,
+                AnalogUnscaledReader, CounterReader,
+                PowerMultiChannelReader, or PowerSingleChannelReader. If
+                you do not specify a reader class, this method uses
+                AnalogMultiChannelReader for analog input tasks,
+                PowerMultiChannelReader for tasks that read power
+                channels, and CounterReader for counter input tasks.
+                CounterReader reads with the method that matches the
+                measurement type of the counter input channel.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each chunk. If you do not specify a
+                timeout, this method uses the "timeout" property on the
+                stream.
+            number_of_buffers (Optional[int]): Specifies the number of sets
+                of arrays to reuse.
+        Returns:
+            Iterator[Union[numpy.ndarray, nidaqmx.types.PowerMeasurement,
+            nidaqmx.types.CtrFreq, nidaqmx.types.CtrTime,
+            nidaqmx.types.CtrTick]]:
+
+            An iterator over the chunks of samples. Each chunk has the
+            shape and data type that the stream reader class reads. Power
+            readers yield nidaqmx.types.PowerMeasurement objects that
+            contain a voltage array and a current array. Counter pulse
+            measurements yield nidaqmx.types.CtrFreq, CtrTime, or CtrTick
+            objects that contain an array for each field.
+        """
+        if samples_per_chunk < 1 and samples_per_chunk != READ_ALL_AVAILABLE:
+            raise ValueError(
+                "samples_per_chunk must be greater than 0 or READ_ALL_AVAILABLE.")
+        if number_of_buffers < 1:
+            raise ValueError("number_of_buffers must be greater than 0.")
+        if timeout is None:
+            timeout = self.timeout
+
+        # Validate the arguments and capture the stop count before returning
+        # the generator, instead of on the first call to next().
+        chunk_reader = _ChunkReader(self._task, reader_cls)
+        return self._iter_chunks(
+            chunk_reader, samples_per_chunk, timeout, number_of_buffers,
+            self._task._times_stopped)
+
+    def _iter_chunks(
+            self, chunk_reader, samples_per_chunk, timeout, number_of_buffers,
+            times_stopped):
+        task = self._task
+        buffers = [None] * number_of_buffers
+        buffer_index = 0
+
+        while task._times_stopped == times_stopped:
+            if samples_per_chunk == READ_ALL_AVAILABLE:
+                number_of_samples_per_channel = max(
+                    1, task._calculate_num_samps_per_chan(READ_ALL_AVAILABLE))
+            else:
+                number_of_samples_per_channel = samples_per_chunk
+
+            arrays = buffers[buffer_index]
+            if (arrays is None or
+                    chunk_reader.get_capacity(arrays) < number_of_samples_per_channel):
+                arrays = chunk_reader.allocate(number_of_samples_per_channel)
+                buffers[buffer_index] = arrays
+            buffer_index = (buffer_index + 1) % number_of_buffers
+
+            views = chunk_reader.get_views(arrays, number_of_samples_per_channel)
+            try:
+                samples_read = chunk_reader.read(views, timeout)
+            except DaqError as e:
+                stopped = (
+                    task._times_stopped != times_stopped or
+                    e.error_code == DAQmxErrors.SAMPLES_WILL_NEVER_BE_AVAILABLE)
+                if isinstance(e, DaqReadError) and e.samps_per_chan_read > 0:
+                    yield chunk_reader.get_chunk(views, e.samps_per_chan_read)
+                if stopped:
+                    return
+                raise e
+
+            yield chunk_reader.get_chunk(views, samples_read)
+
     def read(self, number_of_samples_per_channel=READ_ALL_AVAILABLE):
         """
         Reads raw samples from the task or virtual channels you specify.
@@ -319,6 +465,89 @@ ${property_template.script_property(attribute)}\
 
         return samples_read
 
+    def stream_chunks(self, samples_per_chunk, queue_depth=4, timeout=None):
+        """
+        Starts reading chunks of samples on a background thread and returns
+        an iterator over the chunks.
+
+        The background thread reads continuously, so the time it takes to
+        read a chunk (including the round trip to the server when using
+        gRPC) overlaps with the time the caller spends processing the
+        previous chunks. At most queue_depth chunks are buffered on the
+        client; when the caller falls behind, the background thread waits
+        and samples accumulate in the DAQmx buffer.
+
+        Each chunk is a NumPy array with the same shape and data type that
+        :py:meth:`nidaqmx.task.Task.read` returns when you specify
+        samples_per_chunk samples and as_numpy=True. The last chunk may
+        contain fewer samples if a read returns a partial result.
+
+        Use the returned object as a context manager, or call its close()
+        method, to stop the background thread. If a read fails, iterating
+        raises the error and closes the stream.
+
+        Args:
+            samples_per_chunk (int): Specifies the number of samples per
+                channel to read in each chunk.
+            queue_depth (Optional[int]): Specifies the maximum number of
+                chunks to buffer on the client.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each chunk. If you do not specify a
+                timeout, this method uses the "timeout" property on the
+                stream.
+        Returns:
+            nidaqmx._task_modules.chunk_stream.ChunkStream:
+
+            An iterator over the chunks of samples.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return ChunkStream(self._task, samples_per_chunk, queue_depth, timeout)
+
+    def start_background_reader(
+            self, samples_per_chunk, queue_depth=4, reader_cls=None,
+            timeout=None):
+        """
+        Starts reading chunks of samples into preallocated NumPy arrays on a
+        background thread and returns an iterator over the chunks.
+
+        Unlike calling :py:meth:`nidaqmx.task.Task.read` from an every N
+        samples event callback, the background thread does not block the
+        NI-DAQmx event thread and does not allocate an array for each
+        chunk. Call the release() method of the returned object when you
+        are done with a chunk so that its array is reused.
+
+        At most queue_depth chunks are buffered on the client. When the
+        caller falls behind, the background thread discards the oldest
+        chunk and increments the overflow_count property of the returned
+        object.
+
+        Use the returned object as a context manager, or call its close()
+        method, to stop the background thread. If a read fails, iterating
+        raises the error and closes the reader.
+
+        Args:
+            samples_per_chunk (int): Specifies the number of samples per
+                channel to read in each chunk.
+            queue_depth (Optional[int]): Specifies the maximum number of
+                chunks to buffer on the client.
+            reader_cls (Optional[type]): Specifies the stream reader class
+                to read with. See :py:meth:`iter_chunks` for the supported
+                classes and the default.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each chunk. If you do not specify a
+                timeout, this method uses the "timeout" property on the
+                stream.
+        Returns:
+            nidaqmx._task_modules.background_reader.BackgroundReader:
+
+            An iterator over the chunks of samples.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return BackgroundReader(
+            self._task, samples_per_chunk, queue_depth, reader_cls, timeout)
+
     def start_new_file(self, file_path):
         """
         Starts a new TDMS file the next time data is written to disk.
@@ -14,6 +14,8 @@
         is_custom_read_write_function,
         is_event_unregister_function,
         get_samps_per_chan_read_param,
+        get_write_array_params,
+        is_batchable_function,
     )
     from codegen.utilities.function_helpers import order_function_parameters_by_optional
     from codegen.utilities.text_wrappers import wrap
@@ -25,6 +27,8 @@
     compound_parameter = get_compound_parameter(function.base_parameters)
     grpc_interpreter_params = get_grpc_interpreter_call_params(function, sorted_params)
     is_read_method = check_if_parameters_contain_read_array(function.base_parameters)
+    write_array_params = get_write_array_params(function)
+    invoke = "self._invoke_batchable" if is_batchable_function(function) else "response = self._invoke"
 %>\
 %if compound_parameter is not None:
         ${compound_parameter.parameter_name} = []
@@ -41,7 +45,15 @@
         _validate_array_dtype(${parameter_name}, ${parameter_dtype})
     %endfor
 %endif
-        response = self._invoke(
+%if write_array_params:
+        request = grpc_types.${snake_to_pascal(function.function_name)}Request(
+            ${grpc_interpreter_params + ')' | wrap(12, 12)}
+    %for parameter_name in write_array_params:
+        _pack_numpy_array(request, '${parameter_name}', ${parameter_name})
+    %endfor
+        response = self._invoke(self._client.${snake_to_pascal(function.function_name)}, request)
+%else:
+        ${invoke}(
             self._client.${snake_to_pascal(function.function_name)},
 %if (len(function.function_name) + len(grpc_interpreter_params)) > 68:
             grpc_types.${snake_to_pascal(function.function_name)}Request(
@@ -59,6 +71,7 @@
             grpc_types.${snake_to_pascal(function.function_name)}Request(${grpc_interpreter_params + ')'})
     %endif
 %endif
+%endif
 %if is_read_method:
     <%
         samps_per_chan_param = get_samps_per_chan_read_param(function)
@@ -2,7 +2,6 @@
 <%
     from codegen.utilities.interpreter_helpers import (
         generate_interpreter_function_call_args,
-        get_argument_types,
         get_output_param_with_ivi_dance_mechanism,
         get_output_params,
     )
@@ -13,22 +12,32 @@
     explicit_output_param = get_output_param_with_ivi_dance_mechanism(function)
 %>\
         cfunc = lib_importer.${'windll' if function.calling_convention == 'StdCall' else 'cdll'}.DAQmx${function.c_function_name}
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ${', '.join(get_argument_types(function)) | wrap(24, 24)}]
 
-        temp_size = 0
+%if explicit_output_param.ctypes_data_type == 'ctypes.c_char_p':
+        # Try this thread's reusable buffer first, and query the required size only if the
+        # buffer is too small.
+        ${explicit_output_param.parameter_name} = _string_buffers.get()
+        temp_size = len(${explicit_output_param.parameter_name})
         while True:
-            ${instantiate_explicit_output_param(explicit_output_param)}
             size_or_code = cfunc(
                 ${', '.join(function_call_args) | wrap(16, 16)})
-%if explicit_output_param.ctypes_data_type == 'ctypes.c_char_p':
             if is_string_buffer_too_small(size_or_code):
+                # The buffer is too small, or the size changed between calls; check again.
+                temp_size = 0
+            elif size_or_code > 0 and temp_size == 0:
+                # Buffer size obtained, use to retrieve data.
+                temp_size = size_or_code
+                ${explicit_output_param.parameter_name} = _string_buffers.get(temp_size)
+            else:
+                break
+        self.check_for_error(size_or_code)
 %else:
+        temp_size = 0
+        while True:
+            ${instantiate_explicit_output_param(explicit_output_param)}
+            size_or_code = cfunc(
+                ${', '.join(function_call_args) | wrap(16, 16)})
             if is_array_buffer_too_small(size_or_code):
-%endif
                 # Buffer size must have changed between calls; check again.
                 temp_size = 0
             elif size_or_code > 0 and temp_size == 0:
@@ -37,3 +46,4 @@
             else:
                 break
         self.check_for_error(size_or_code)
+%endif
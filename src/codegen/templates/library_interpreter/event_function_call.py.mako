@@ -3,7 +3,6 @@
     import re
     from codegen.utilities.interpreter_helpers import (
         generate_interpreter_function_call_args,
-        get_argument_types,
         get_callback_func_param,
         get_callback_param_data_types,
         get_event_name,
@@ -15,7 +14,6 @@
 
     assert is_event_function(function)
 
-    argument_types = get_argument_types(function)
     callback_func_param = get_callback_func_param(function)
     callback_param_types = get_callback_param_data_types(function)
     event_name = get_event_name(function)
@@ -25,11 +23,6 @@
             ${', '.join(callback_param_types) | wrap(12)})
 
         cfunc = lib_importer.${'windll' if function.calling_convention == 'StdCall' else 'cdll'}.DAQmx${function.c_function_name}
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        ${', '.join(argument_types) | wrap(24)}]
 
 %if is_event_register_function(function):
         assert callback_function is not None
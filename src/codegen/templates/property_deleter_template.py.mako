@@ -16,4 +16,7 @@
         function_call_args.append(hex(attribute.id))
     %>\
         self._interpreter.reset_${generic_attribute_func}(${', '.join(function_call_args)})
+    %if attribute.python_class_name == "Scale":
+        self._software_scale = None
+    %endif
 </%def>
\ No newline at end of file
@@ -1,7 +1,7 @@
 <%def name="script_property_getter(attribute)">\
 <%
         from codegen.utilities.text_wrappers import docstring_wrap
-        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, get_generic_attribute_function_type
+        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, get_generic_attribute_function_type, is_cached_attribute
     %>\
     @property
     def ${attribute.name}(self):
@@ -25,7 +25,13 @@
     function_call_args.append(hex(attribute.id))
 %>
 \
+%if is_cached_attribute(attribute):
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_${generic_attribute_func},
+            ${', '.join(function_call_args)})
+%else:
         val = self._interpreter.get_${generic_attribute_func}(${', '.join(function_call_args)})
+%endif
 \
 ## Script return call.
     %if attribute.bitfield_enum is not None:
@@ -35,4 +35,7 @@
         function_call_args.append('val')
     %>\
         self._interpreter.set_${generic_attribute_func}(${', '.join(function_call_args)})
+    %if attribute.python_class_name == "Scale":
+        self._software_scale = None
+    %endif
 </%def>
\ No newline at end of file
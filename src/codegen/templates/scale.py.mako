@@ -12,14 +12,14 @@ from nidaqmx import utils
 from nidaqmx.constants import (
     ${', '.join([c for c in enums_used]) | wrap(4, 4)})
 
-__all__ = ['Scale']
+__all__ = ['Scale', 'SoftwareScale']
 
 
 class Scale:
     """
     Represents a DAQmx scale.
     """
-    __slots__ = ['_name', '_interpreter', '__weakref__']
+    __slots__ = ['_name', '_interpreter', '_software_scale', '__weakref__']
 
     def __init__(self, name, *, grpc_options=None):
         """
@@ -30,6 +30,7 @@ class Scale:
         """
         self._name = name
         self._interpreter = utils._select_interpreter(grpc_options)
+        self._software_scale = None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -329,6 +330,277 @@ ${property_template.script_property(attribute)}\
         self._interpreter.save_scale(self._name, save_as, author, options)
 
 
+    def apply(self, data):
+        """
+        Scales pre-scaled values to scaled values in NumPy, the way
+        NI-DAQmx scales samples that it reads.
+
+        The first call reads the properties of the scale and caches them
+        in a :class:`SoftwareScale`. Later calls do not use the driver.
+        Setting or resetting a property of this object clears the cache.
+        If you change the properties of the scale with another object or
+        in another process, call :py:meth:`to_software_scale` to update
+        the cache.
+
+        Args:
+            data (numpy.typing.ArrayLike): Specifies the pre-scaled values.
+        Returns:
+            numpy.ndarray:
+
+            The scaled values, with the same shape as data.
+        """
+        return self._get_software_scale().apply(data)
+
+    def apply_inverse(self, data):
+        """
+        Scales scaled values to pre-scaled values in NumPy, the way
+        NI-DAQmx scales samples that you write. See :py:meth:`apply`.
+
+        Args:
+            data (numpy.typing.ArrayLike): Specifies the scaled values.
+        Returns:
+            numpy.ndarray:
+
+            The pre-scaled values, with the same shape as data.
+        """
+        return self._get_software_scale().apply_inverse(data)
+
+    def to_software_scale(self):
+        """
+        Reads the properties of this custom scale and returns an object
+        that evaluates the scale without the driver.
+
+        The returned object can be pickled, so you can scale data on
+        computers that do not have NI-DAQmx installed.
+
+        Returns:
+            nidaqmx.scale.SoftwareScale:
+
+            Indicates an object that evaluates this custom scale.
+        """
+        scale_type = self.scale_type
+        if scale_type == ScaleType.LINEAR:
+            software_scale = SoftwareScale.linear(self.lin_slope, self.lin_y_intercept)
+        elif scale_type == ScaleType.MAP_RANGES:
+            software_scale = SoftwareScale.map_ranges(
+                self.map_pre_scaled_min, self.map_pre_scaled_max,
+                self.map_scaled_min, self.map_scaled_max)
+        elif scale_type == ScaleType.POLYNOMIAL:
+            software_scale = SoftwareScale.polynomial(
+                self.poly_forward_coeff, self.poly_reverse_coeff)
+        elif scale_type == ScaleType.TABLE:
+            software_scale = SoftwareScale.table(
+                self.table_pre_scaled_vals, self.table_scaled_vals)
+        else:
+            raise ValueError(
+                f'Scales of type {scale_type.name} cannot be evaluated in software.')
+
+        self._software_scale = software_scale
+        return software_scale
+
+    def _get_software_scale(self):
+        software_scale = self._software_scale
+        if software_scale is None:
+            software_scale = self.to_software_scale()
+        return software_scale
+
+
+class SoftwareScale:
+    """
+    Evaluates a custom scale with NumPy, without the driver.
+
+    Use :py:meth:`Scale.to_software_scale` to create a SoftwareScale from
+    a custom scale, or use the static methods of this class to create one
+    from the parameters of a scale.
+    """
+    __slots__ = ['_scale_type', '_forward', '_reverse', '_scaled_min', '_scaled_max']
+
+    def __init__(self, scale_type, forward, reverse, scaled_min=None, scaled_max=None):
+        """
+        Do not construct this object directly; instead, call one of the
+        static methods of this class or Scale.to_software_scale().
+        """
+        self._scale_type = scale_type
+        self._forward = forward
+        self._reverse = reverse
+        self._scaled_min = scaled_min
+        self._scaled_max = scaled_max
+
+    def __repr__(self):
+        return f'SoftwareScale(scale_type={self._scale_type})'
+
+    @property
+    def scale_type(self):
+        """
+        :class:`nidaqmx.constants.ScaleType`: Indicates the method or
+            equation form that the scale uses.
+        """
+        return self._scale_type
+
+    @staticmethod
+    def linear(slope, y_intercept=0.0):
+        """
+        Creates a scale that uses the equation y=mx+b.
+
+        Args:
+            slope (float): Is the slope, m, in the equation.
+            y_intercept (Optional[float]): Is the y-intercept, b, in the
+                equation.
+        Returns:
+            nidaqmx.scale.SoftwareScale:
+
+            Indicates an object that evaluates the scale.
+        """
+        if slope == 0:
+            raise ValueError('slope must not be 0.')
+        return SoftwareScale(
+            ScaleType.LINEAR, numpy.float64([y_intercept, slope]),
+            numpy.float64([-y_intercept / slope, 1.0 / slope]))
+
+    @staticmethod
+    def map_ranges(prescaled_min, prescaled_max, scaled_min, scaled_max):
+        """
+        Creates a scale that scales values proportionally from a range of
+        pre-scaled values to a range of scaled values. Like NI-DAQmx
+        reads, :py:meth:`apply` coerces values that are outside the range
+        of scaled values.
+
+        Args:
+            prescaled_min (float): Is the smallest value in the range of
+                pre-scaled values.
+            prescaled_max (float): Is the largest value in the range of
+                pre-scaled values.
+            scaled_min (float): Is the smallest value in the range of
+                scaled values.
+            scaled_max (float): Is the largest value in the range of
+                scaled values.
+        Returns:
+            nidaqmx.scale.SoftwareScale:
+
+            Indicates an object that evaluates the scale.
+        """
+        if prescaled_min == prescaled_max or scaled_min == scaled_max:
+            raise ValueError(
+                'The minimum and maximum of each range must not be equal.')
+        slope = (scaled_max - scaled_min) / (prescaled_max - prescaled_min)
+        y_intercept = scaled_min - slope * prescaled_min
+        return SoftwareScale(
+            ScaleType.MAP_RANGES, numpy.float64([y_intercept, slope]),
+            numpy.float64([-y_intercept / slope, 1.0 / slope]),
+            min(scaled_min, scaled_max), max(scaled_min, scaled_max))
+
+    @staticmethod
+    def polynomial(forward_coeffs, reverse_coeffs):
+        """
+        Creates a scale that uses an nth order polynomial equation.
+
+        Args:
+            forward_coeffs (List[float]): Is a list of coefficients for
+                the polynomial that converts pre-scaled values to scaled
+                values. Each element of the list corresponds to a term
+                of the equation.
+            reverse_coeffs (List[float]): Is a list of coefficients for
+                the polynomial that converts scaled values to pre-scaled
+                values. Each element of the list corresponds to a term
+                of the equation.
+        Returns:
+            nidaqmx.scale.SoftwareScale:
+
+            Indicates an object that evaluates the scale.
+        """
+        if len(forward_coeffs) == 0 or len(reverse_coeffs) == 0:
+            raise ValueError('forward_coeffs and reverse_coeffs must not be empty.')
+        return SoftwareScale(
+            ScaleType.POLYNOMIAL, numpy.float64(forward_coeffs),
+            numpy.float64(reverse_coeffs))
+
+    @staticmethod
+    def table(prescaled_vals, scaled_vals):
+        """
+        Creates a scale that maps a list of pre-scaled values to a list of
+        corresponding scaled values, with linear interpolation between
+        them. Like NI-DAQmx reads, :py:meth:`apply` coerces values that
+        are outside the table to the first or last scaled value. Like
+        NI-DAQmx writes, :py:meth:`apply_inverse` raises an error for
+        values that are outside the table.
+
+        Args:
+            prescaled_vals (List[float]): Is the list of pre-scaled
+                values that map to the values in "scaled_vals".
+            scaled_vals (List[float]): Is the list of scaled values that
+                map to the values in "prescaled_vals".
+        Returns:
+            nidaqmx.scale.SoftwareScale:
+
+            Indicates an object that evaluates the scale.
+        """
+        prescaled_vals = numpy.float64(prescaled_vals)
+        scaled_vals = numpy.float64(scaled_vals)
+        if len(prescaled_vals) != len(scaled_vals) or len(prescaled_vals) < 2:
+            raise ValueError(
+                'prescaled_vals and scaled_vals must have the same length, '
+                'which must be at least 2.')
+
+        # numpy.interp() requires increasing x values.
+        forward_order = numpy.argsort(prescaled_vals)
+        reverse_order = numpy.argsort(scaled_vals)
+        return SoftwareScale(
+            ScaleType.TABLE,
+            (prescaled_vals[forward_order], scaled_vals[forward_order]),
+            (scaled_vals[reverse_order], prescaled_vals[reverse_order]))
+
+    def apply(self, data):
+        """
+        Scales pre-scaled values to scaled values.
+
+        Args:
+            data (numpy.typing.ArrayLike): Specifies the pre-scaled values.
+        Returns:
+            numpy.ndarray:
+
+            The scaled values, with the same shape as data.
+        """
+        data = self._evaluate(self._forward, data)
+        if self._scaled_min is not None:
+            numpy.clip(data, self._scaled_min, self._scaled_max, out=data)
+        return data
+
+    def apply_inverse(self, data):
+        """
+        Scales scaled values to pre-scaled values.
+
+        Args:
+            data (numpy.typing.ArrayLike): Specifies the scaled values.
+        Returns:
+            numpy.ndarray:
+
+            The pre-scaled values, with the same shape as data.
+        Raises:
+            ValueError: The scale is a table scale and data contains
+                values that are outside the table.
+        """
+        if self._scale_type == ScaleType.TABLE:
+            data = numpy.asarray(data, dtype=numpy.float64)
+            scaled_vals = self._reverse[0]
+            if numpy.any((data < scaled_vals[0]) | (data > scaled_vals[-1])):
+                raise ValueError(
+                    'data contains values outside the range of the table, '
+                    f'{scaled_vals[0]} to {scaled_vals[-1]}.')
+        return self._evaluate(self._reverse, data)
+
+    def _evaluate(self, equation, data):
+        data = numpy.asarray(data, dtype=numpy.float64)
+        if self._scale_type == ScaleType.TABLE:
+            x_vals, y_vals = equation
+            return numpy.interp(data, x_vals, y_vals)
+
+        # Evaluate the polynomial with Horner's method.
+        result = numpy.full(data.shape, equation[-1] if len(equation) else 0.0)
+        for coeff in equation[-2::-1]:
+            result *= data
+            result += coeff
+        return result
+
 class _ScaleAlternateConstructor(Scale):
     """
     Provide an alternate constructor for the Scale object.
@@ -347,6 +619,7 @@ class _ScaleAlternateConstructor(Scale):
         """
         self._name = name
         self._interpreter = interpreter
+        self._software_scale = None
 
         # Use meta-programming to change the type of this object to Scale,
         # so the user isn't confused when doing introspection.
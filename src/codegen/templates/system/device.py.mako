@@ -9,9 +9,12 @@
 %>\
 # Do not edit this file; it was automatically generated.
 
+import functools
+
 import deprecation
 
 from nidaqmx import utils
+from nidaqmx._attribute_cache import AttributeCache, get_cached_attribute
 from nidaqmx._bitfield_utils import enum_bitfield_to_list
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.system._collections.physical_channel_collection import (
@@ -30,7 +33,7 @@ class Device:
     """
     Represents a DAQmx device.
     """
-    __slots__ = ['_name', '_interpreter', '__weakref__']
+    __slots__ = ['_name', '_interpreter', '_attribute_cache', '__weakref__']
 
     def __init__(self, name, *, grpc_options=None):
         """
@@ -41,6 +44,7 @@ class Device:
         """
         self._name = name
         self._interpreter = utils._select_interpreter(grpc_options)
+        self._attribute_cache = None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -72,7 +76,8 @@ class Device:
             Indicates a collection that contains all the analog input
             physical channels available on the device.
         """
-        return AIPhysicalChannelCollection(self._name, self._interpreter)
+        return AIPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def ao_physical_chans(self):
@@ -81,7 +86,8 @@ class Device:
             Indicates a collection that contains all the analog output
             physical channels available on the device.
         """
-        return AOPhysicalChannelCollection(self._name, self._interpreter)
+        return AOPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def ci_physical_chans(self):
@@ -90,7 +96,8 @@ class Device:
             Indicates a collection that contains all the counter input
             physical channels available on the device.
         """
-        return CIPhysicalChannelCollection(self._name, self._interpreter)
+        return CIPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def co_physical_chans(self):
@@ -99,7 +106,8 @@ class Device:
             Indicates a collection that contains all the counter output
             physical channels available on the device.
         """
-        return COPhysicalChannelCollection(self._name, self._interpreter)
+        return COPhysicalChannelCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def di_lines(self):
@@ -108,7 +116,8 @@ class Device:
             Indicates a collection that contains all the digital input
             lines available on the device.
         """
-        return DILinesCollection(self._name, self._interpreter)
+        return DILinesCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def di_ports(self):
@@ -117,7 +126,8 @@ class Device:
             Indicates a collection that contains all the digital input
             ports available on the device.
         """
-        return DIPortsCollection(self._name, self._interpreter)
+        return DIPortsCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def do_lines(self):
@@ -126,7 +136,8 @@ class Device:
             Indicates a collection that contains all the digital output
             lines available on the device.
         """
-        return DOLinesCollection(self._name, self._interpreter)
+        return DOLinesCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     @property
     def do_ports(self):
@@ -135,7 +146,8 @@ class Device:
             Indicates a collection that contains all the digital output
             ports available on the device.
         """
-        return DOPortsCollection(self._name, self._interpreter)
+        return DOPortsCollection(
+            self._name, self._interpreter, attribute_cache=self._attribute_cache)
 
     # endregion
 
@@ -148,8 +160,82 @@ ${property_template.script_property(attribute)}\
 ${deprecated_template.script_deprecated_property(attributes)}\
 <%namespace name="function_template" file="/function_template.py.mako"/>\
 %for function_object in functions:
+<%
+    # reset_device() also clears the attribute cache, so it is written by hand below.
+    if function_object.function_name == "reset_device":
+        continue
+%>\
 ${function_template.script_function(function_object)}
 %endfor
+\
+    def get_attributes(self, attribute_names):
+        """
+        Gets several properties of this device.
+
+        This method is faster than getting each property in turn. With a
+        gRPC session, the calls to the server overlap.
+
+        Args:
+            attribute_names (List[str]): Specifies the names of the
+                properties to get, such as "product_type".
+        Returns:
+            Dict[str, object]:
+
+            Indicates a dictionary that maps each property name to its
+            value.
+        """
+        getters = utils._get_property_getters(Device, attribute_names)
+        values = self._interpreter.call_concurrently(
+            [functools.partial(getter, self) for getter in getters])
+        return dict(zip(attribute_names, values))
+
+    # region Attribute Cache Functions
+
+    def clear_attribute_cache(self):
+        """
+        Discards the attribute values that this device has cached, so
+        that the next access to each attribute queries the driver.
+
+        Call this method if the configuration of the device changes
+        while attribute caching is enabled.
+        """
+        if self._attribute_cache is not None:
+            self._attribute_cache.clear()
+
+    def enable_attribute_caching(self):
+        """
+        Enables caching of the attributes that do not change while the
+        device is present, such as the product type, the supported
+        ranges and rates, and the names of the physical channels.
+
+        Once you enable caching, this Device object queries each of these
+        attributes only once. The physical channel objects that you get
+        from its physical channel collections share the cache. Device
+        objects that you get from :py:attr:`nidaqmx.system.System.devices`
+        do not share the cache, so you get fresh values when you get the
+        device from the system again. Resetting the device clears the
+        cache.
+        """
+        if self._attribute_cache is None:
+            self._attribute_cache = AttributeCache()
+
+    def reset_device(self):
+        """
+        Immediately aborts all active tasks associated with a device,
+        disconnects any routes, and returns the device to an initialized
+        state. Aborting a task immediately terminates the currently
+        active operation, such as a read or a write. Aborting a task
+        puts the task into an unstable but recoverable state. To recover
+        the task, use DAQmx Start to restart the task or use DAQmx Stop
+        to reset the task without starting it.
+        """
+
+        self._interpreter.reset_device(
+            self._name)
+        self.clear_attribute_cache()
+
+    # endregion
+
 \
     # region Network Device Functions
 
@@ -241,6 +327,7 @@ class _DeviceAlternateConstructor(Device):
         """
         self._name = name
         self._interpreter = interpreter
+        self._attribute_cache = None
 
         # Use meta-programming to change the type of this object to Device,
         # so the user isn't confused when doing introspection.
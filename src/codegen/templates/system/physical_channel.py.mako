@@ -15,6 +15,7 @@ import ctypes
 import numpy
 
 from nidaqmx import utils
+from nidaqmx._attribute_cache import AttributeCache, get_cached_attribute
 from nidaqmx._bitfield_utils import enum_bitfield_to_list
 from nidaqmx.utils import unflatten_channel_string
 %if enums_used:
@@ -29,7 +30,7 @@ class PhysicalChannel:
     """
     Represents a DAQmx physical channel.
     """
-    __slots__ = ['_name', '_interpreter', '__weakref__']
+    __slots__ = ['_name', '_interpreter', '_attribute_cache', '__weakref__']
 
     def __init__(self, name, *, grpc_options=None):
         """
@@ -40,6 +41,7 @@ class PhysicalChannel:
         """
         self._name = name
         self._interpreter = utils._select_interpreter(grpc_options)
+        self._attribute_cache = None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -71,6 +73,32 @@ ${property_template.script_property(attribute)}\
 %for function_object in functions:
 ${function_template.script_function(function_object)}
 %endfor
+\
+    # region Attribute Cache Functions
+
+    def clear_attribute_cache(self):
+        """
+        Discards the cached attribute values, so that the next access to
+        each attribute queries the driver. If this physical channel shares
+        the cache of its device, this method clears the cache of the
+        device.
+        """
+        if self._attribute_cache is not None:
+            self._attribute_cache.clear()
+
+    def enable_attribute_caching(self):
+        """
+        Enables caching of the attributes that do not change while the
+        device is present, such as the supported measurement types and
+        terminal configurations.
+
+        Physical channels that you get from a device that has attribute
+        caching enabled already share the cache of the device.
+        """
+        if self._attribute_cache is None:
+            self._attribute_cache = AttributeCache()
+
+    # endregion
 
 
 class _PhysicalChannelAlternateConstructor(PhysicalChannel):
@@ -82,15 +110,17 @@ class _PhysicalChannelAlternateConstructor(PhysicalChannel):
     # Setting __slots__ avoids TypeError: __class__ assignment: 'Base' object layout differs from 'Derived'.
     __slots__ = ()
 
-    def __init__(self, name, interpreter):
+    def __init__(self, name, interpreter, attribute_cache=None):
         """
         Args:
             name: Specifies the name of the Physical Channel.
             interpreter: Specifies the interpreter instance.
+            attribute_cache: Specifies the attribute cache of the device, if any.
 
         """
         self._name = name
         self._interpreter = interpreter
+        self._attribute_cache = attribute_cache
 
         # Use meta-programming to change the type of this object to PhysicalChannel,
         # so the user isn't confused when doing introspection.
@@ -48,6 +48,7 @@ EXCLUDED_ATTRIBUTES = [
     "ARM_START_TRIG_TIMESTAMP_VAL",
     "REF_TRIG_TIMESTAMP_VAL",
     "START_TRIG_TIMESTAMP_VAL",
+    "CHANNELS_TO_READ",
 ]
 
 DEPRECATED_ATTRIBUTES = {
@@ -240,6 +241,35 @@ GENERIC_ATTRIBUTE_GROUP_NAME_MAP = {
 }
 
 
+# Classes whose read-only attributes can be cached while the device is present.
+CACHED_ATTRIBUTE_CLASSES = ["Device", "PhysicalChannel"]
+
+# Read-only attributes of those classes that can change while the device is present.
+VOLATILE_ATTRIBUTES = [
+    "accessory_product_nums",
+    "accessory_product_types",
+    "accessory_serial_nums",
+    "ai_sensor_power_open_chan",
+    "ai_sensor_power_overcurrent",
+    "ao_manual_control_amplitude",
+    "ao_manual_control_freq",
+    "ao_manual_control_short_detected",
+    "ao_power_amp_overcurrent",
+    "chassis_module_devices",
+    "field_daq_bank_devices",
+    "tcpip_ethernet_ip",
+    "tcpip_hostname",
+    "tcpip_wireless_ip",
+    "teds_bit_stream",
+    "teds_mfg_id",
+    "teds_model_num",
+    "teds_serial_num",
+    "teds_template_ids",
+    "teds_version_letter",
+    "teds_version_num",
+]
+
+
 def get_attributes(metadata, class_name):
     """Converts the scrapigen metadata into a list of attributes."""
     attributes_metadata = []
@@ -303,3 +333,12 @@ def get_generic_attribute_function_type(attribute):
     if attribute.bitfield_enum:
         return mapped_attribute_type.strip("_array")
     return mapped_attribute_type
+
+
+def is_cached_attribute(attribute):
+    """Returns True if the attribute getter uses the attribute cache."""
+    return (
+        attribute.python_class_name in CACHED_ATTRIBUTE_CLASSES
+        and attribute.access == "read"
+        and attribute.name not in VOLATILE_ATTRIBUTES
+    )
@@ -358,8 +358,9 @@ def get_grpc_interpreter_call_params(func, params):
             else:
                 if is_write_bytes_param(param):
                     grpc_params.append(f"{name}={param.parameter_name}.tobytes()")
-                elif is_write_function:
-                    grpc_params.append(get_write_array_param(param))
+                elif is_write_function and is_numpy_array_datatype(param):
+                    # Packed into the request by _pack_numpy_array().
+                    continue
                 else:
                     grpc_params.append(f"{name}={param.parameter_name}")
 
@@ -465,6 +466,36 @@ def get_c_function_call_template(func):
     return "/default_c_function_call.py.mako"
 
 
+def get_c_function_argtypes(functions):
+    """Gets the argument types of each C function that the library interpreter calls."""
+    c_function_argtypes = {}
+    for func in functions:
+        if (
+            func.function_name in LIBRARY_INTERPRETER_IGNORED_FUNCTIONS
+            or not func.is_python_codegen_method
+            or any(get_varargs_parameters(func))
+        ):
+            # Variadic functions set their argument types on each call.
+            continue
+        argtypes = get_argument_types(func)
+        if is_event_function(func):
+            # ctypes caches function pointer types, so this is the same type that the
+            # interpreter method creates.
+            callback_type = "ctypes.CFUNCTYPE({})".format(
+                ", ".join(get_callback_param_data_types(func))
+            )
+            callback_type_name = get_callback_func_param(func).type
+            argtypes = [
+                callback_type if argtype == callback_type_name else argtype for argtype in argtypes
+            ]
+        c_function_name = f"DAQmx{func.c_function_name}"
+        if c_function_argtypes.setdefault(c_function_name, argtypes) != argtypes:
+            raise ValueError(
+                f"The interpreter functions that call {c_function_name} use different argtypes."
+            )
+    return sorted(c_function_argtypes.items())
+
+
 def get_grpc_function_call_template(func):
     """Gets the template to use for generating the logic of calling the grpc functions."""
     if func.stream_response:
@@ -528,6 +559,15 @@ def is_event_unregister_function(func):
     return func.function_name.startswith("unregister_")
 
 
+def is_batchable_function(func):
+    """Returns True if the grpc interpreter may defer this function while batching calls."""
+    return (
+        re.match(r"(re)?set_\w+_attribute", func.function_name) is not None
+        and any(param.parameter_name == "task" for param in func.base_parameters)
+        and not get_output_params(func)
+    )
+
+
 def get_event_name(func):
     """Gets the event name for an event register/unregister function."""
     if is_event_register_function(func):
@@ -720,8 +760,14 @@ def get_numpy_array_params(func):
     return numpy_params
 
 
-def get_write_array_param(param):
-    """Assigns the numpy array to a flattened numpy array."""
-    if is_numpy_array_datatype(param):
-        return f"{param.parameter_name}={param.parameter_name}.flat"
-    return f"{param.parameter_name}={param.parameter_name}"
+def get_write_array_params(func):
+    """Gets the numpy array parameters that are packed into the grpc request."""
+    if not is_custom_write_function(func):
+        return []
+    return [
+        param.parameter_name
+        for param in func.base_parameters
+        if param.include_in_proto
+        and is_numpy_array_datatype(param)
+        and not is_write_bytes_param(param)
+    ]
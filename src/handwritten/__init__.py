@@ -11,7 +11,7 @@ except ImportError:
 
 __version__ = version(__name__)
 
-__all__ = ["errors", "scale", "stream_readers", "stream_writers", "task"]
+__all__ = ["aio", "capture", "errors", "event_dispatcher", "scale", "stream_readers", "stream_writers", "task", "tdms"]
 
 # Do not add a null logging handler. If the application has not configured logging, the
 # default behavior is to log warnings and errors to stderr.
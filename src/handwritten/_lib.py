@@ -80,49 +80,82 @@ class DaqFunctionImporter:
 
     Allows the NI-DAQmx Python API to fail elegantly if a function is not
     supported in the current version of the API.
+
+    Each function is looked up once and then stored as an attribute of this
+    object, so later lookups are plain attribute accesses that do not call
+    __getattr__. If argtypes specifies the argument types of a function,
+    they are set when the function is looked up, so callers can call the
+    function without configuring it.
     """
 
-    def __init__(self, library):
+    def __init__(self, library, argtypes=None):
+        """
+        Args:
+            library: Specifies the ctypes library.
+            argtypes (Optional[Dict[str, Callable[[], List[type]]]]):
+                Specifies a dictionary that maps function names to
+                functions that return their argument types.
+        """
         self._library = library
+        self._argtypes = {} if argtypes is None else argtypes
         self._lib_lock = threading.Lock()
 
     def __getattr__(self, function):
         try:
             cfunc = getattr(self._library, function)
-            if not hasattr(cfunc, 'arglock'):
-                with self._lib_lock:
-                    if not hasattr(cfunc, 'arglock'):
-                        cfunc.arglock = threading.Lock()
-            return cfunc
         except AttributeError:
             raise DaqFunctionNotSupportedError(
                 'The NI-DAQmx function "{}" is not supported in this '
                 'version of NI-DAQmx. Visit ni.com/downloads to upgrade your '
                 'version of NI-DAQmx.'.format(function))
 
+        # Get the argument types before taking the lock, because getting the
+        # task handle type calls other functions of the library.
+        get_argtypes = self._argtypes.get(function)
+        argtypes = None if get_argtypes is None else get_argtypes()
+        with self._lib_lock:
+            if not hasattr(cfunc, 'arglock'):
+                cfunc.arglock = threading.Lock()
+            if argtypes is not None:
+                cfunc.argtypes = argtypes
+                cfunc.restype = ctypes.c_int32
+            setattr(self, function, cfunc)
+        return cfunc
+
 
 class DaqLibImporter:
     """
     Encapsulates NI-DAQmx library importing and handle type parsing logic.
+
+    The windll and cdll attributes are set when the library is first used,
+    so later accesses are plain attribute accesses.
     """
+    windll: DaqFunctionImporter
+    cdll: DaqFunctionImporter
 
     def __init__(self):
-        self._windll = None
-        self._cdll = None
         self._cal_handle = None
         self._task_handle = None
+        self._function_argtypes = {}
 
-    @property
-    def windll(self):
-        if self._windll is None:
+    def __getattr__(self, name):
+        if name in ('windll', 'cdll'):
             self._import_lib()
-        return self._windll
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
 
-    @property
-    def cdll(self):
-        if self._cdll is None:
-            self._import_lib()
-        return self._cdll
+    def register_function_argtypes(self, function_argtypes):
+        """
+        Registers the argument types of functions in the library, which
+        are set when each function is first looked up.
+
+        Args:
+            function_argtypes (Dict[str, Callable[[], List[type]]]):
+                Specifies a dictionary that maps function names to
+                functions that return their argument types.
+        """
+        self._function_argtypes.update(function_argtypes)
 
     @property
     def task_handle(self):
@@ -140,9 +173,6 @@ class DaqLibImporter:
         """
         Determines the location of and loads the NI-DAQmx CAI DLL.
         """
-        self._windll = None
-        self._cdll = None
-
         windll = None
         cdll = None
 
@@ -170,8 +200,8 @@ class DaqLibImporter:
                 'Please direct any questions or feedback to National '
                 'Instruments.'.format(sys.platform))
 
-        self._windll = DaqFunctionImporter(windll)
-        self._cdll = DaqFunctionImporter(cdll)
+        self.windll = DaqFunctionImporter(windll, self._function_argtypes)
+        self.cdll = DaqFunctionImporter(cdll, self._function_argtypes)
 
     @staticmethod
     def _get_task_handle_type(driver_version):
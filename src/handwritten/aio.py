@@ -0,0 +1,334 @@
+import asyncio
+import concurrent.futures
+import functools
+
+from nidaqmx.constants import READ_ALL_AVAILABLE, TaskMode
+from nidaqmx.task import AUTO_START_UNSET, NUM_SAMPLES_UNSET, Task
+
+__all__ = ['AsyncTask', 'EveryNSamplesEvents']
+
+
+class AsyncTask:
+    """
+    Wraps a DAQmx task to provide asyncio-compatible reads, writes, and
+    waits.
+
+    Each AsyncTask runs the blocking NI-DAQmx calls for its task on a
+    dedicated worker thread, so calls on the same task run in the order
+    they are awaited and one event loop can service many tasks at once.
+    :py:meth:`stop`, :py:meth:`abort`, and :py:meth:`is_task_done` run on
+    a second worker thread, so that they do not wait behind a read or a
+    wait that is blocked.
+
+    Configure channels, timing, and triggers through the wrapped task
+    (the :py:attr:`task` property) before awaiting reads or writes.
+
+    Example:
+        >>> async with AsyncTask() as task:
+        ...     task.task.ai_channels.add_ai_voltage_chan("Dev1/ai0")
+        ...     data = await task.read(number_of_samples_per_channel=100)
+    """
+    __slots__ = ['_task', '_executor', '_control_executor']
+
+    def __init__(self, new_task_name='', *, grpc_options=None, task=None):
+        """
+        Creates a DAQmx task, or wraps an existing one.
+
+        Args:
+            new_task_name (Optional[str]): Specifies the name to assign to
+                the task. Ignored if you specify task.
+            grpc_options (Optional[:class:`~nidaqmx.GrpcSessionOptions`]): Specifies
+                the gRPC session options. Ignored if you specify task.
+            task (Optional[nidaqmx.task.Task]): Specifies an existing task to
+                wrap. Closing the AsyncTask closes this task.
+        """
+        if task is None:
+            task = Task(new_task_name, grpc_options=grpc_options)
+        self._task = task
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"nidaqmx {task.name}")
+        self._control_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"nidaqmx {task.name} control")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    def __repr__(self):
+        return f'AsyncTask(name={self._task.name})'
+
+    @property
+    def task(self):
+        """
+        :class:`nidaqmx.task.Task`: Specifies the wrapped task.
+        """
+        return self._task
+
+    @property
+    def name(self):
+        """
+        str: Indicates the name of the task.
+        """
+        return self._task.name
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _run_control(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._control_executor, func, *args)
+
+    async def abort(self):
+        """
+        Aborts the task without waiting for a read or a wait that is in
+        progress, which then returns an error. See
+        :py:class:`nidaqmx.constants.TaskMode`.
+        """
+        await self._run_control(self._task.control, TaskMode.TASK_ABORT)
+
+    async def close(self):
+        """
+        Clears the task and stops the worker threads.
+
+        This method waits for calls that are already running on the worker
+        thread to complete.
+        """
+        try:
+            await self._run(self._task.close)
+        finally:
+            self._executor.shutdown(wait=False)
+            self._control_executor.shutdown(wait=False)
+
+    async def is_task_done(self):
+        """
+        Queries the status of the task and indicates if it completed
+        execution. See :py:meth:`nidaqmx.task.Task.is_task_done`.
+
+        Returns:
+            bool:
+
+            Indicates if the measurement or generation completed.
+        """
+        return await self._run_control(self._task.is_task_done)
+
+    async def read(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET, timeout=10.0,
+                   as_numpy=False):
+        """
+        Reads samples from the task without blocking the event loop. See
+        :py:meth:`nidaqmx.task.Task.read` for a description of the
+        arguments and the return value.
+
+        Cancelling the awaiting coroutine does not cancel the read in
+        progress; use a timeout to bound how long the read can take.
+        """
+        return await self._run(
+            self._task.read, number_of_samples_per_channel, timeout, as_numpy=as_numpy)
+
+    async def read_all_available(self, timeout=10.0, as_numpy=False):
+        """
+        Reads all the samples currently available in the buffer without
+        blocking the event loop.
+
+        Returns:
+            The samples read, in the format that
+            :py:meth:`nidaqmx.task.Task.read` returns when you specify
+            nidaqmx.constants.READ_ALL_AVAILABLE.
+        """
+        return await self.read(READ_ALL_AVAILABLE, timeout, as_numpy=as_numpy)
+
+    async def start(self):
+        """
+        Transitions the task to the running state. See
+        :py:meth:`nidaqmx.task.Task.start`.
+        """
+        await self._run(self._task.start)
+
+    async def stop(self):
+        """
+        Stops the task. See :py:meth:`nidaqmx.task.Task.stop`.
+
+        This method does not wait for a read or a wait that is in progress
+        to return. To make a blocked read return immediately, use
+        :py:meth:`abort`.
+        """
+        await self._run_control(self._task.stop)
+
+    async def wait_until_done(self, timeout=10.0):
+        """
+        Waits for the measurement or generation to complete without
+        blocking the event loop. See
+        :py:meth:`nidaqmx.task.Task.wait_until_done`.
+
+        Cancelling the awaiting coroutine does not cancel the wait in
+        progress; use a timeout to bound how long the wait can take.
+        """
+        await self._run(self._task.wait_until_done, timeout)
+
+    async def write(self, data, auto_start=AUTO_START_UNSET, timeout=10.0):
+        """
+        Writes samples to the task without blocking the event loop. See
+        :py:meth:`nidaqmx.task.Task.write` for a description of the
+        arguments and the return value.
+        """
+        return await self._run(self._task.write, data, auto_start, timeout)
+
+    def every_n_samples_acquired(self, sample_interval, queue_depth=100):
+        """
+        Registers for every N samples acquired into buffer events and
+        returns an asynchronous iterator over the events.
+
+        Register for the events before starting the task. Leave the
+        returned object's context, or call its close() method, to
+        unregister.
+
+        Example:
+            >>> async with task.every_n_samples_acquired(1000) as events:
+            ...     await task.start()
+            ...     async for number_of_samples in events:
+            ...         data = await task.read(number_of_samples)
+
+        If the consumer falls behind by more than queue_depth events, the
+        iterator discards the oldest event and increments
+        :py:attr:`EveryNSamplesEvents.overflow_count`.
+
+        Args:
+            sample_interval (int): Specifies the number of samples after
+                which each event should occur.
+            queue_depth (Optional[int]): Specifies the number of events
+                that can wait for the consumer.
+        Returns:
+            nidaqmx.aio.EveryNSamplesEvents:
+
+            An asynchronous iterator that yields the number of samples for
+            each event.
+        """
+        return EveryNSamplesEvents(
+            self, self._task.register_every_n_samples_acquired_into_buffer_event,
+            sample_interval, queue_depth)
+
+    def every_n_samples_transferred(self, sample_interval, queue_depth=100):
+        """
+        Registers for every N samples transferred from buffer events and
+        returns an asynchronous iterator over the events.
+
+        See :py:meth:`every_n_samples_acquired` for usage.
+
+        Args:
+            sample_interval (int): Specifies the number of samples after
+                which each event should occur.
+            queue_depth (Optional[int]): Specifies the number of events
+                that can wait for the consumer.
+        Returns:
+            nidaqmx.aio.EveryNSamplesEvents:
+
+            An asynchronous iterator that yields the number of samples for
+            each event.
+        """
+        return EveryNSamplesEvents(
+            self, self._task.register_every_n_samples_transferred_from_buffer_event,
+            sample_interval, queue_depth)
+
+
+class EveryNSamplesEvents:
+    """
+    Asynchronous iterator over every N samples events of an AsyncTask.
+
+    Use :py:meth:`AsyncTask.every_n_samples_acquired` or
+    :py:meth:`AsyncTask.every_n_samples_transferred` to create an
+    EveryNSamplesEvents object.
+    """
+    __slots__ = [
+        '_async_task', '_register_event', '_sample_interval', '_queue_depth', '_loop', '_queue',
+        '_closed', '_overflow_count']
+
+    def __init__(self, async_task, register_event, sample_interval, queue_depth=100):
+        """
+        Do not construct this object directly; instead, call
+        AsyncTask.every_n_samples_acquired() or
+        AsyncTask.every_n_samples_transferred().
+        """
+        if queue_depth < 1:
+            raise ValueError('queue_depth must be greater than 0.')
+
+        self._async_task = async_task
+        self._register_event = register_event
+        self._sample_interval = sample_interval
+        self._queue_depth = queue_depth
+        self._loop = None
+        self._queue = None
+        self._closed = False
+        self._overflow_count = 0
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._queue is None:
+            raise StopAsyncIteration
+        number_of_samples = await self._queue.get()
+        if number_of_samples is None:
+            # Put the end of the events back for other iterations, which
+            # would otherwise wait forever.
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+        return number_of_samples
+
+    @property
+    def overflow_count(self):
+        """
+        int: Indicates the number of events that were discarded because
+            the consumer fell behind.
+        """
+        return self._overflow_count
+
+    async def open(self):
+        """
+        Registers for the events.
+        """
+        self._loop = asyncio.get_running_loop()
+        # Reserve a slot for the end of the events, so that close() never
+        # discards an event to make room for it.
+        self._queue = asyncio.Queue(maxsize=self._queue_depth + 1)
+        await self._async_task._run(self._register_event, self._sample_interval, self._callback)
+
+    async def close(self):
+        """
+        Unregisters from the events and ends the iteration.
+        """
+        if self._queue is None or self._closed:
+            return
+        self._closed = True
+        try:
+            await self._async_task._run(self._register_event, self._sample_interval, None)
+        finally:
+            self._queue.put_nowait(None)
+
+    def _post_event(self, number_of_samples):
+        # Runs on the event loop's thread.
+        if self._closed:
+            return
+        if self._queue.qsize() >= self._queue_depth:
+            self._queue.get_nowait()
+            self._overflow_count += 1
+        self._queue.put_nowait(number_of_samples)
+
+    def _callback(self, task_handle, every_n_samples_event_type, number_of_samples,
+                  callback_data):
+        # NI-DAQmx calls this on its own thread, so hand the event to the event loop's thread.
+        try:
+            self._loop.call_soon_threadsafe(self._post_event, number_of_samples)
+        except RuntimeError:
+            # The event loop is closed, so there is no one to deliver the event to.
+            pass
+        return 0
@@ -92,3 +92,113 @@ class DeviceCollection(Sequence):
         """
         val = self._interpreter.get_system_info_attribute_string(0x193b)
         return unflatten_channel_string(val)
+
+    def snapshot(self):
+        """
+        Returns an immutable collection of the devices that are in this
+        collection now.
+
+        This collection queries the driver for the device names every
+        time you index, iterate over, or measure it. The snapshot queries
+        the names once, so indexing it by position or by name does not
+        call the driver. Get a new snapshot to see devices that were added
+        or removed.
+
+        Returns:
+            nidaqmx.system._collections.device_collection.DeviceCollectionSnapshot:
+
+            Indicates the snapshot of the collection.
+        """
+        return DeviceCollectionSnapshot(self.device_names, self._interpreter)
+
+
+class DeviceCollectionSnapshot(Sequence):
+    """
+    Contains the devices of a DAQmx system at the time of a snapshot.
+
+    This class defines methods that implements a container object.
+    """
+    __slots__ = ['_devices', '_devices_by_name', '_interpreter']
+
+    def __init__(self, device_names, interpreter):
+        """
+        Do not construct this object directly; instead, call nidaqmx.system.System.local().devices.snapshot().
+        """
+        self._interpreter = interpreter
+        self._devices = tuple(
+            _DeviceAlternateConstructor(name, interpreter) for name in device_names)
+        self._devices_by_name = {device.name: device for device in self._devices}
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            items = unflatten_channel_string(item)
+            return all([i in self._devices_by_name for i in items])
+        elif isinstance(item, Device):
+            return item.name in self._devices_by_name
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.device_names == other.device_names
+        return False
+
+    def __getitem__(self, index):
+        """
+        Indexes a subset of devices on this device collection.
+
+        Args:
+            index: The value of the index. The following index types are
+                supported:
+                - str: Name of the device. You also can specify a string
+                    that contains a list or range of names to this input.
+                - int: Index/position of the device in the collection.
+                - slice: Range of the indexes/positions of devices in the
+                    collection.
+        Returns:
+            List[nidaqmx.system.device.Device]:
+
+            Indicates the subset of devices indexed.
+        """
+        if isinstance(index, int):
+            return self._devices[index]
+        elif isinstance(index, slice):
+            return list(self._devices[index])
+        elif isinstance(index, str):
+            devices = [self._get_device(name) for name in unflatten_channel_string(index)]
+            if len(devices) == 1:
+                return devices[0]
+            return devices
+        else:
+            raise DaqError(
+                'Invalid index type "{}" used to access collection.'
+                .format(type(index)), DAQmxErrors.UNKNOWN)
+
+    def __hash__(self):
+        return hash(self.device_names)
+
+    def __iter__(self):
+        return iter(self._devices)
+
+    def __len__(self):
+        return len(self._devices)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __reversed__(self):
+        return reversed(self._devices)
+
+    @property
+    def device_names(self):
+        """
+        Tuple[str]: Indicates the names of all devices on this device
+            collection.
+        """
+        return tuple(self._devices_by_name)
+
+    def _get_device(self, name):
+        device = self._devices_by_name.get(name)
+        if device is None:
+            # Like DeviceCollection, allow devices that are not in the collection.
+            device = _DeviceAlternateConstructor(name, self._interpreter)
+        return device
@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 
+from nidaqmx._attribute_cache import get_cached_attribute
 from nidaqmx.errors import DaqError
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.system.physical_channel import PhysicalChannel, _PhysicalChannelAlternateConstructor
@@ -11,12 +12,13 @@ class PhysicalChannelCollection(Sequence):
     
     This class defines methods that implements a container object.
     """
-    def __init__(self, device_name, interpreter):
+    def __init__(self, device_name, interpreter, *, attribute_cache=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.system.Device and use the appropriate property, such as device.ai_physical_channels.
         """
         self._name = device_name
         self._interpreter = interpreter
+        self._attribute_cache = attribute_cache
 
     def __contains__(self, item):
         channel_names = self.channel_names
@@ -57,11 +59,11 @@ class PhysicalChannelCollection(Sequence):
             Indicates the subset of physical channels indexed.
         """
         if isinstance(index, int):
-            return _PhysicalChannelAlternateConstructor(self.channel_names[index], self._interpreter)
+            return _PhysicalChannelAlternateConstructor(self.channel_names[index], self._interpreter, self._attribute_cache)
         elif isinstance(index, slice):
-            return _PhysicalChannelAlternateConstructor(self.channel_names[index], self._interpreter)
+            return _PhysicalChannelAlternateConstructor(self.channel_names[index], self._interpreter, self._attribute_cache)
         elif isinstance(index, str):
-            return _PhysicalChannelAlternateConstructor(f'{self._name}/{index}', self._interpreter)
+            return _PhysicalChannelAlternateConstructor(f'{self._name}/{index}', self._interpreter, self._attribute_cache)
         else:
             raise DaqError(
                 'Invalid index type "{}" used to access collection.'
@@ -69,7 +71,7 @@ class PhysicalChannelCollection(Sequence):
 
     def __iter__(self):
         for channel_name in self.channel_names:
-            yield _PhysicalChannelAlternateConstructor(channel_name, self._interpreter)
+            yield _PhysicalChannelAlternateConstructor(channel_name, self._interpreter, self._attribute_cache)
 
     def __len__(self):
         return len(self.channel_names)
@@ -82,7 +84,7 @@ class PhysicalChannelCollection(Sequence):
         channel_names.reverse()
 
         for channel_name in channel_names:
-            yield _PhysicalChannelAlternateConstructor(channel_name, self._interpreter)
+            yield _PhysicalChannelAlternateConstructor(channel_name, self._interpreter, self._attribute_cache)
 
     @property
     def all(self):
@@ -91,7 +93,7 @@ class PhysicalChannelCollection(Sequence):
             physical channel object that represents the entire list of
             physical channels on this channel collection.
         """
-        return _PhysicalChannelAlternateConstructor(flatten_channel_string(self.channel_names), self._interpreter)
+        return _PhysicalChannelAlternateConstructor(flatten_channel_string(self.channel_names), self._interpreter, self._attribute_cache)
 
     @property
     def channel_names(self):
@@ -101,6 +103,24 @@ class PhysicalChannelCollection(Sequence):
         """
         raise NotImplementedError()
 
+    def snapshot(self):
+        """
+        Returns an immutable collection of the physical channels that are
+        in this collection now.
+
+        This collection queries the driver for the channel names every
+        time you index, iterate over, or measure it. The snapshot queries
+        the names once, so indexing it by position or by name does not
+        call the driver.
+
+        Returns:
+            nidaqmx.system._collections.physical_channel_collection.PhysicalChannelCollectionSnapshot:
+
+            Indicates the snapshot of the collection.
+        """
+        return PhysicalChannelCollectionSnapshot(
+            self._name, self.channel_names, self._interpreter, self._attribute_cache)
+
 
 class AIPhysicalChannelCollection(PhysicalChannelCollection):
     """
@@ -112,7 +132,8 @@ class AIPhysicalChannelCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x231e)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x231e)
         return unflatten_channel_string(val)
 
 
@@ -126,7 +147,8 @@ class AOPhysicalChannelCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x231f)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x231f)
         return unflatten_channel_string(val)
 
 
@@ -140,7 +162,8 @@ class CIPhysicalChannelCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2324)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x2324)
         return unflatten_channel_string(val)
 
 
@@ -154,7 +177,8 @@ class COPhysicalChannelCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2325)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x2325)
         return unflatten_channel_string(val)
 
 
@@ -167,7 +191,8 @@ class DILinesCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2320)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x2320)
         return unflatten_channel_string(val)
 
 
@@ -180,7 +205,8 @@ class DOLinesCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2322)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x2322)
         return unflatten_channel_string(val)
 
 
@@ -193,7 +219,8 @@ class DIPortsCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2321)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x2321)
         return unflatten_channel_string(val)
 
 
@@ -206,5 +233,114 @@ class DOPortsCollection(PhysicalChannelCollection):
 
     @property
     def channel_names(self):
-        val = self._interpreter.get_device_attribute_string(self._name, 0x2323)
+        val = get_cached_attribute(
+            self._attribute_cache, self._interpreter.get_device_attribute_string, self._name, 0x2323)
         return unflatten_channel_string(val)
+
+
+class PhysicalChannelCollectionSnapshot(Sequence):
+    """
+    Contains the physical channels of a collection at the time of a
+    snapshot.
+
+    This class defines methods that implements a container object.
+    """
+    __slots__ = [
+        '_name', '_channels', '_channels_by_name', '_interpreter', '_attribute_cache']
+
+    def __init__(self, device_name, channel_names, interpreter, attribute_cache=None):
+        """
+        Do not construct this object directly; instead, call the snapshot() method of a physical channel collection, such as device.ai_physical_chans.snapshot().
+        """
+        self._name = device_name
+        self._interpreter = interpreter
+        self._attribute_cache = attribute_cache
+        self._channels = tuple(
+            _PhysicalChannelAlternateConstructor(name, interpreter, attribute_cache)
+            for name in channel_names)
+        self._channels_by_name = {channel.name: channel for channel in self._channels}
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            items = unflatten_channel_string(item)
+            return all([i in self._channels_by_name for i in items])
+        elif isinstance(item, PhysicalChannel):
+            return item._name in self._channels_by_name
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.channel_names == other.channel_names
+        return False
+
+    def __getitem__(self, index):
+        """
+        Indexes a subset of physical channels on this physical channel
+        collection.
+
+        Args:
+            index: The value of the index. The following index types
+                are supported:
+                - str: Name of the physical channel, without the
+                    device name prefix, e.g. 'ai0'. You also can
+                    specify a string that contains a list or range of
+                    names to this input.
+                - int: Index/position of the physical channel in the
+                    collection.
+                - slice: Range of the indexes/positions of physical
+                    channels in the collection.
+        Returns:
+            nidaqmx.system.physical_channel.PhysicalChannel:
+
+            Indicates the subset of physical channels indexed.
+        """
+        if isinstance(index, int):
+            return self._channels[index]
+        elif isinstance(index, slice):
+            return _PhysicalChannelAlternateConstructor(
+                flatten_channel_string(self.channel_names[index]), self._interpreter,
+                self._attribute_cache)
+        elif isinstance(index, str):
+            channel_name = f'{self._name}/{index}'
+            channel = self._channels_by_name.get(channel_name)
+            if channel is None:
+                channel = _PhysicalChannelAlternateConstructor(
+                    channel_name, self._interpreter, self._attribute_cache)
+            return channel
+        else:
+            raise DaqError(
+                'Invalid index type "{}" used to access collection.'
+                .format(type(index)), DAQmxErrors.UNKNOWN)
+
+    def __hash__(self):
+        return hash(self.channel_names)
+
+    def __iter__(self):
+        return iter(self._channels)
+
+    def __len__(self):
+        return len(self._channels)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __reversed__(self):
+        return reversed(self._channels)
+
+    @property
+    def all(self):
+        """
+        nidaqmx.system.physical_channel.PhysicalChannel: Specifies a
+            physical channel object that represents the entire list of
+            physical channels on this channel collection.
+        """
+        return _PhysicalChannelAlternateConstructor(
+            flatten_channel_string(self.channel_names), self._interpreter, self._attribute_cache)
+
+    @property
+    def channel_names(self):
+        """
+        Tuple[str]: Specifies the entire list of physical channels on this
+            collection.
+        """
+        return tuple(self._channels_by_name)
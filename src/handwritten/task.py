@@ -1,3 +1,4 @@
+import collections
 import threading
 import warnings
 from enum import Enum
@@ -5,6 +6,7 @@ from enum import Enum
 import numpy
 
 from nidaqmx import utils
+from nidaqmx._task_modules.channels.ai_channel import AIChannel
 from nidaqmx._task_modules.channels.channel import Channel
 from nidaqmx._task_modules.export_signals import ExportSignals
 from nidaqmx._task_modules.in_stream import InStream
@@ -25,7 +27,7 @@ from nidaqmx._task_modules.do_channel_collection import (
     DOChannelCollection)
 from nidaqmx.constants import (
     AcquisitionType, ChannelType, FillMode, UsageTypeAI, UsageTypeCI, EveryNSamplesEventType,
-    READ_ALL_AVAILABLE, UsageTypeCO, _Save)
+    READ_ALL_AVAILABLE, TaskMode, UsageTypeCO, _Save)
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.errors import (
     DaqError, DaqResourceWarning)
@@ -50,6 +52,46 @@ AUTO_START_UNSET = UnsetAutoStartSentinel()
 del UnsetNumSamplesSentinel
 del UnsetAutoStartSentinel
 
+# Channel information that Task.read() needs to select a read function and
+# allocate buffers. Fields that do not apply to the channel type are None.
+_ReadPlan = collections.namedtuple(
+    '_ReadPlan',
+    ['number_of_channels', 'read_chan_type', 'has_power_chan',
+     'di_num_booleans_per_chan', 'ci_meas_type'])
+
+# Channel information that Task.write() and the stream writers need to
+# validate data. Fields that do not apply to the channel type are None.
+_WritePlan = collections.namedtuple(
+    '_WritePlan',
+    ['number_of_channels', 'write_chan_type', 'do_num_booleans_per_chan',
+     'co_output_type'])
+
+
+def _create_structured_array(sample_type, *field_arrays):
+    """
+    Combines the given arrays into a NumPy structured array whose fields
+    are named after the fields of the given namedtuple type.
+    """
+    dtype = numpy.dtype(
+        [(name, array.dtype) for name, array in zip(sample_type._fields, field_arrays)])
+    data = numpy.empty(field_arrays[0].shape, dtype=dtype)
+    for name, array in zip(sample_type._fields, field_arrays):
+        data[name] = array
+    return data
+
+
+def _is_ctr_array_data(data):
+    """
+    Returns whether counter output pulse data is specified as a NumPy
+    structured array or as a tuple of NumPy arrays instead of as
+    namedtuples of scalars.
+    """
+    if isinstance(data, numpy.ndarray):
+        return data.dtype.names is not None
+    return (
+        isinstance(data, tuple) and len(data) == 2 and
+        all(isinstance(array, numpy.ndarray) for array in data))
+
 
 class Task:
     """
@@ -232,6 +274,21 @@ class Task:
         """
         return self._do_channels
 
+    @property
+    def event_dispatcher(self):
+        """
+        :class:`nidaqmx.event_dispatcher.EventDispatcher`: Specifies the
+            dispatcher that runs the event callbacks of this task. If this
+            property is None, NI-DAQmx calls the callbacks on its own
+            thread. Setting this property affects only the events that you
+            register afterwards.
+        """
+        return self._event_dispatcher
+
+    @event_dispatcher.setter
+    def event_dispatcher(self, val):
+        self._event_dispatcher = val
+
     @property
     def export_signals(self):
         """
@@ -283,12 +340,12 @@ class Task:
         # double closes.
         self._saved_name = self.name
 
-        self._ai_channels = AIChannelCollection(task_handle, interpreter)
-        self._ao_channels = AOChannelCollection(task_handle, interpreter)
-        self._ci_channels = CIChannelCollection(task_handle, interpreter)
-        self._co_channels = COChannelCollection(task_handle, interpreter)
-        self._di_channels = DIChannelCollection(task_handle, interpreter)
-        self._do_channels = DOChannelCollection(task_handle, interpreter)
+        self._ai_channels = AIChannelCollection(self, interpreter)
+        self._ao_channels = AOChannelCollection(self, interpreter)
+        self._ci_channels = CIChannelCollection(self, interpreter)
+        self._co_channels = COChannelCollection(self, interpreter)
+        self._di_channels = DIChannelCollection(self, interpreter)
+        self._do_channels = DOChannelCollection(self, interpreter)
         self._export_signals = ExportSignals(task_handle, interpreter)
         self._in_stream = InStream(self, interpreter)
         self._timing = Timing(task_handle, interpreter)
@@ -296,6 +353,116 @@ class Task:
         self._out_stream = OutStream(self, interpreter)
 
         self._event_handler_lock = threading.Lock()
+        self._event_dispatcher = None
+        # Identifies this task to event dispatchers. Unlike id(self), it
+        # cannot be reused by another task while events are pending, and
+        # unlike the task, its hash does not change when the task closes.
+        self._event_dispatch_key = object()
+
+        self._read_plan = None
+        self._write_plan = None
+        self._ai_dev_scaling_coeffs = None
+        # Incremented by stop(), control() with TASK_STOP or TASK_ABORT, and
+        # close() so that loops that read from the task can tell that it was
+        # stopped.
+        self._times_stopped = 0
+
+    def _get_read_plan(self):
+        """
+        Returns the read plan for this task, creating it if necessary.
+
+        The read plan is created on the first read and reused until the
+        channels in the task or the channels to read change, so that
+        steady-state reads do not query channel properties.
+        """
+        read_plan = self._read_plan
+        if read_plan is None:
+            read_plan = self._create_read_plan()
+            self._read_plan = read_plan
+        return read_plan
+
+    def _create_read_plan(self):
+        channels_to_read = self.in_stream.channels_to_read
+        number_of_channels = len(channels_to_read.channel_names)
+        read_chan_type = channels_to_read.chan_type
+
+        has_power_chan = False
+        di_num_booleans_per_chan = None
+        ci_meas_type = None
+
+        if read_chan_type == ChannelType.ANALOG_INPUT:
+            for chan in channels_to_read:
+                meas_type = chan.ai_meas_type
+                has_power_chan = meas_type == UsageTypeAI.POWER
+                if has_power_chan:
+                    break
+
+        elif (read_chan_type == ChannelType.DIGITAL_INPUT or
+                read_chan_type == ChannelType.DIGITAL_OUTPUT):
+            di_num_booleans_per_chan = self.in_stream.di_num_booleans_per_chan
+
+        elif read_chan_type == ChannelType.COUNTER_INPUT:
+            ci_meas_type = channels_to_read.ci_meas_type
+
+        return _ReadPlan(
+            number_of_channels, read_chan_type, has_power_chan,
+            di_num_booleans_per_chan, ci_meas_type)
+
+    def _invalidate_read_plan(self):
+        self._read_plan = None
+        self._ai_dev_scaling_coeffs = None
+
+    def _get_ai_dev_scaling_coeffs(self):
+        """
+        Returns a list with the device scaling coefficients of each channel to
+        read, querying them if necessary.
+
+        The coefficients are reused until the channels to read change or
+        the task changes state. Properties such as ai_max, ai_min,
+        ai_rng_high, ai_rng_low, and ai_gain change the coefficients, and
+        they cannot change while the task is running, so the coefficients
+        are queried again after the task starts, stops, or is committed.
+        """
+        coeffs = self._ai_dev_scaling_coeffs
+        if coeffs is None:
+            coeffs = [
+                AIChannel(self._handle, channel_name, self._interpreter).ai_dev_scaling_coeff
+                for channel_name in self.in_stream.channels_to_read.channel_names]
+            self._ai_dev_scaling_coeffs = coeffs
+        return coeffs
+
+    def _get_write_plan(self):
+        """
+        Returns the write plan for this task, creating it if necessary.
+
+        The write plan is reused until the channels in the task change.
+        """
+        write_plan = self._write_plan
+        if write_plan is None:
+            write_plan = self._create_write_plan()
+            self._write_plan = write_plan
+        return write_plan
+
+    def _create_write_plan(self):
+        channels_to_write = self.channels
+        number_of_channels = len(channels_to_write.channel_names)
+        write_chan_type = channels_to_write.chan_type
+
+        do_num_booleans_per_chan = None
+        co_output_type = None
+        if write_chan_type == ChannelType.DIGITAL_OUTPUT:
+            do_num_booleans_per_chan = self.out_stream.do_num_booleans_per_chan
+        elif write_chan_type == ChannelType.COUNTER_OUTPUT:
+            co_output_type = channels_to_write.co_output_type
+
+        return _WritePlan(
+            number_of_channels, write_chan_type, do_num_booleans_per_chan,
+            co_output_type)
+
+    def _invalidate_channel_plans(self):
+        self._read_plan = None
+        self._write_plan = None
+        self._ai_dev_scaling_coeffs = None
 
     def _calculate_num_samps_per_chan(self, num_samps_per_chan):
         """
@@ -323,6 +490,16 @@ class Task:
         else:
             return num_samps_per_chan
 
+    def _wrap_event_callback(self, callback_method):
+        """
+        Returns the callback to register with the interpreter for
+        callback_method, which runs callback_method on the event dispatcher
+        of this task, if any.
+        """
+        if self._event_dispatcher is None:
+            return callback_method
+        return self._event_dispatcher._wrap_callback(self._event_dispatch_key, callback_method)
+
     def add_global_channels(self, global_channels):
         """
         Adds global virtual channels from MAX to the given task.
@@ -338,6 +515,40 @@ class Task:
         channels = flatten_channel_string([g._name for g in global_channels])
 
         self._interpreter.add_global_chans_to_task(self._handle, channels)
+        self._invalidate_channel_plans()
+
+    def batch(self):
+        """
+        Returns a context manager that batches property setter calls on
+        this thread.
+
+        When you use gRPC, property setters and resetters for channels,
+        timing, triggers, exported signals, and streams do not wait for
+        the server to respond while the context is active. Setters for
+        the same channel (or the same task-level object) are applied in
+        order, and setters for different channels are applied
+        concurrently. Any other call, such as adding a channel or reading
+        a property, waits for the batched calls to complete first.
+
+        If a batched call fails, the error from the first failed call is
+        raised by the next call that waits, or when the context exits.
+        Setters that were batched after the failed call for the same
+        channel are not applied.
+
+        Do not batch setters for the same physical channel through
+        different channel objects, such as "Dev1/ai0:3" and "Dev1/ai0",
+        if their order matters.
+
+        When you do not use gRPC, this context manager has no effect.
+
+        Example:
+            >>> with task.batch():
+            ...     for channel in task.ai_channels:
+            ...         channel.ai_max = 5.0
+            ...         channel.ai_min = -5.0
+            ...     task.timing.samp_clk_rate = 1000.0
+        """
+        return self._interpreter.batch()
 
     def close(self):
         """
@@ -357,6 +568,7 @@ class Task:
                 'already closed.'.format(self._saved_name), DaqResourceWarning)
             return
 
+        self._times_stopped += 1
         first_exception = None
         try:
             self._interpreter.clear_task(self._handle)
@@ -374,6 +586,11 @@ class Task:
             except Exception as ex:
                 first_exception = first_exception or ex
 
+        try:
+            self._interpreter.close()
+        except Exception as ex:
+            first_exception = first_exception or ex
+
         if first_exception:
             raise first_exception
 
@@ -385,6 +602,9 @@ class Task:
             action (nidaqmx.constants.TaskMode): Specifies how to alter
                 the task state.
         """
+        if action in (TaskMode.TASK_STOP, TaskMode.TASK_ABORT):
+            self._times_stopped += 1
+        self._ai_dev_scaling_coeffs = None
         self._interpreter.task_control(self._handle, action.value)
 
     def is_task_done(self):
@@ -403,7 +623,7 @@ class Task:
         return is_task_done
 
     def read(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET,
-             timeout=10.0):
+             timeout=10.0, as_numpy=False):
         """
         Reads samples from the task or virtual channels you specify.
 
@@ -464,11 +684,24 @@ class Task:
                 indefinitely. If you set timeout to 0, the method tries
                 once to read the requested samples and returns an error
                 if it is unable to.
+            as_numpy (Optional[bool]): Specifies whether to return the
+                samples as a NumPy array instead of a list or a list of
+                lists. A NumPy array avoids creating a Python object for
+                every sample, which matters at high sample rates. If
+                fewer samples than requested are read, the returned
+                array is a view of the samples that were read. Power
+                and counter pulse measurements are returned as NumPy
+                structured arrays with the same field names as
+                PowerMeasurement, CtrFreq, CtrTime, and CtrTick, except
+                that a single sample from a single channel is still
+                returned as a namedtuple. The default is False.
         Returns:
             dynamic:
 
             The samples requested in the form of a scalar, a list, or a
-            list of lists. See method docstring for more info.
+            list of lists. See method docstring for more info. If
+            as_numpy is True, the samples are returned in the form of a
+            NumPy scalar, a 1D NumPy array, or a 2D NumPy array instead.
 
             NI-DAQmx scales the data to the units of the measurement,
             including any custom scaling you apply to the channels. Use a
@@ -483,9 +716,9 @@ class Task:
             >>> type(data[0])
             <type 'float'>
         """
-        channels_to_read = self.in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
-        read_chan_type = channels_to_read.chan_type
+        read_plan = self._get_read_plan()
+        number_of_channels = read_plan.number_of_channels
+        read_chan_type = read_plan.read_chan_type
 
         num_samples_not_set = (number_of_samples_per_channel is
                                NUM_SAMPLES_UNSET)
@@ -504,14 +737,7 @@ class Task:
             array_shape = number_of_samples_per_channel
 
         if read_chan_type == ChannelType.ANALOG_INPUT:
-            has_power_chan = False
-            for chan in channels_to_read:
-                meas_type = chan.ai_meas_type
-                has_power_chan = meas_type == UsageTypeAI.POWER
-                if has_power_chan:
-                    break
-
-            if has_power_chan:
+            if read_plan.has_power_chan:
                 voltages = numpy.zeros(array_shape, dtype=numpy.float64)
                 currents = numpy.zeros(array_shape, dtype=numpy.float64)
 
@@ -519,7 +745,9 @@ class Task:
                     self._handle, number_of_samples_per_channel, timeout,
                     FillMode.GROUP_BY_CHANNEL.value, voltages, currents)
 
-                if number_of_channels > 1:
+                if as_numpy and not (num_samples_not_set and number_of_channels == 1):
+                    data = _create_structured_array(PowerMeasurement, voltages, currents)
+                elif number_of_channels > 1:
                     if number_of_samples_per_channel == 1:
                         # n channel, 1 sample
                         data = []
@@ -555,7 +783,7 @@ class Task:
 
         elif (read_chan_type == ChannelType.DIGITAL_INPUT or
                 read_chan_type == ChannelType.DIGITAL_OUTPUT):
-            if self.in_stream.di_num_booleans_per_chan == 1:
+            if read_plan.di_num_booleans_per_chan == 1:
                 data = numpy.zeros(array_shape, dtype=bool)
                 _, samples_read, _ = self._interpreter.read_digital_lines(
                     self._handle, number_of_samples_per_channel, timeout,
@@ -567,7 +795,7 @@ class Task:
                     FillMode.GROUP_BY_CHANNEL.value, data)
 
         elif read_chan_type == ChannelType.COUNTER_INPUT:
-            meas_type = channels_to_read.ci_meas_type
+            meas_type = read_plan.ci_meas_type
 
             if meas_type == UsageTypeCI.PULSE_FREQ:
                 frequencies = numpy.zeros(array_shape, dtype=numpy.float64)
@@ -577,9 +805,12 @@ class Task:
                     self._handle, number_of_samples_per_channel, timeout,
                     FillMode.GROUP_BY_CHANNEL.value, frequencies, duty_cycles)
 
-                data = []
-                for f, d in zip(frequencies, duty_cycles):
-                    data.append(CtrFreq(freq=f, duty_cycle=d))
+                if as_numpy and not (num_samples_not_set and number_of_channels == 1):
+                    data = _create_structured_array(CtrFreq, frequencies, duty_cycles)
+                else:
+                    data = []
+                    for f, d in zip(frequencies, duty_cycles):
+                        data.append(CtrFreq(freq=f, duty_cycle=d))
 
             elif meas_type == UsageTypeCI.PULSE_TIME:
                 high_times = numpy.zeros(array_shape, dtype=numpy.float64)
@@ -588,9 +819,12 @@ class Task:
                 _, _, samples_read = self._interpreter.read_ctr_time(
                     self._handle, number_of_samples_per_channel, timeout,
                     FillMode.GROUP_BY_CHANNEL.value, high_times, low_times)
-                data = []
-                for h, l in zip(high_times, low_times):
-                    data.append(CtrTime(high_time=h, low_time=l))
+                if as_numpy and not (num_samples_not_set and number_of_channels == 1):
+                    data = _create_structured_array(CtrTime, high_times, low_times)
+                else:
+                    data = []
+                    for h, l in zip(high_times, low_times):
+                        data.append(CtrTime(high_time=h, low_time=l))
 
             elif meas_type == UsageTypeCI.PULSE_TICKS:
                 high_ticks = numpy.zeros(array_shape, dtype=numpy.uint32)
@@ -599,9 +833,12 @@ class Task:
                 _, _ , samples_read = self._interpreter.read_ctr_ticks(
                     self._handle, number_of_samples_per_channel, timeout,
                     FillMode.GROUP_BY_CHANNEL.value, high_ticks, low_ticks)
-                data = []
-                for h, l in zip(high_ticks, low_ticks):
-                    data.append(CtrTick(high_tick=h, low_tick=l))
+                if as_numpy and not (num_samples_not_set and number_of_channels == 1):
+                    data = _create_structured_array(CtrTick, high_ticks, low_ticks)
+                else:
+                    data = []
+                    for h, l in zip(high_ticks, low_ticks):
+                        data.append(CtrTick(high_tick=h, low_tick=l))
 
             elif meas_type == UsageTypeCI.COUNT_EDGES:
                 data = numpy.zeros(array_shape, dtype=numpy.uint32)
@@ -638,14 +875,18 @@ class Task:
             return data
 
         if num_samples_not_set and array_shape == 1:
+            if as_numpy:
+                return data[0]
             return data.tolist()[0]
 
         if samples_read != number_of_samples_per_channel:
             if number_of_channels > 1:
-                return data[:,:samples_read].tolist()
+                data = data[:,:samples_read]
             else:
-                return data[:samples_read].tolist()
+                data = data[:samples_read]
 
+        if as_numpy:
+            return data
         return data.tolist()
 
     def register_done_event(self, callback_method):
@@ -678,6 +919,7 @@ class Task:
         if callback_method is not None:
             # If the event is already registered, the interpreter should raise DaqError with code
             # DAQmxErrors.DONE_EVENT_ALREADY_REGISTERED.
+            callback_method = self._wrap_event_callback(callback_method)
             event_handler = self._interpreter.register_done_event(self._handle, 0, callback_method, None)
             with self._event_handler_lock:
                 assert _TaskEventType.DONE not in self._event_handlers, "Event already registered."
@@ -726,6 +968,7 @@ class Task:
         if callback_method is not None:
             # If the event is already registered, the interpreter should raise DaqError with code
             # DAQmxErrors.EVERY_N_SAMPS_ACQ_INTO_BUFFER_EVENT_ALREADY_REGISTERED.
+            callback_method = self._wrap_event_callback(callback_method)
             event_handler = self._interpreter.register_every_n_samples_event(
                 self._handle, EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value,
                 sample_interval, 0, callback_method, None)
@@ -777,6 +1020,7 @@ class Task:
         if callback_method is not None:
             # If the event is already registered, the interpreter should raise DaqError with code
             # DAQmxErrors.EVERY_N_SAMPS_TRANSFERRED_FROM_BUFFER_EVENT_ALREADY_REGISTERED.
+            callback_method = self._wrap_event_callback(callback_method)
             event_handler = self._interpreter.register_every_n_samples_event(
                 self._handle, EveryNSamplesEventType.TRANSFERRED_FROM_BUFFER.value,
                 sample_interval, 0, callback_method, None)
@@ -823,6 +1067,7 @@ class Task:
         if callback_method is not None:
             # If the event is already registered, the interpreter should raise DaqError with code
             # DAQmxErrors.SIGNAL_EVENT_ALREADY_REGISTERED.
+            callback_method = self._wrap_event_callback(callback_method)
             event_handler = self._interpreter.register_signal_event(
                 self._handle, signal_type.value, 0, callback_method, None)
             with self._event_handler_lock:
@@ -891,6 +1136,7 @@ class Task:
         repeatedly. Starting and stopping a task repeatedly reduces the
         performance of the application.
         """
+        self._ai_dev_scaling_coeffs = None
         self._interpreter.start_task(self._handle)
 
     def stop(self):
@@ -905,6 +1151,8 @@ class Task:
         repeatedly. Starting and stopping a task repeatedly reduces the
         performance of the application.
         """
+        self._times_stopped += 1
+        self._ai_dev_scaling_coeffs = None
         self._interpreter.stop_task(self._handle)
 
     def wait_until_done(self, timeout=10.0):
@@ -978,6 +1226,12 @@ class Task:
         - List of CtrFreq, CtrTime, CtrTick (from nidaqmx.types):
           Multiple samples for 1 channel or 1 sample for multiple
           channels.
+        - 1D NumPy structured array with the same field names as
+          CtrFreq, CtrTime, or CtrTick, or a tuple of two 1D NumPy
+          arrays, such as CtrFreq(freq=frequencies,
+          duty_cycle=duty_cycles): Multiple samples for 1 channel or 1
+          sample for multiple channels. These arrays are passed to
+          NI-DAQmx without processing each sample in Python.
 
         If the task uses on-demand timing, this method returns only
         after the device generates all samples. On-demand is the default
@@ -1020,9 +1274,15 @@ class Task:
             Specifies the actual number of samples this method
             successfully wrote.
         """
-        channels_to_write = self.channels
-        number_of_channels = len(channels_to_write.channel_names)
-        write_chan_type = channels_to_write.chan_type
+        write_plan = self._get_write_plan()
+        number_of_channels = write_plan.number_of_channels
+        write_chan_type = write_plan.write_chan_type
+
+        if (write_chan_type == ChannelType.COUNTER_OUTPUT and
+                _is_ctr_array_data(data)):
+            return self._write_ctr_arrays(
+                write_plan.co_output_type, number_of_channels, data, auto_start,
+                timeout)
 
         element = None
         if number_of_channels == 1:
@@ -1088,7 +1348,7 @@ class Task:
                 timeout, FillMode.GROUP_BY_CHANNEL.value, data)
 
         elif write_chan_type == ChannelType.DIGITAL_OUTPUT:
-            if self.out_stream.do_num_booleans_per_chan == 1:
+            if write_plan.do_num_booleans_per_chan == 1:
                 if (not isinstance(element, bool) and
                         not isinstance(element, numpy.bool_)):
                     raise DaqError(
@@ -1118,7 +1378,7 @@ class Task:
                     auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data)
 
         elif write_chan_type == ChannelType.COUNTER_OUTPUT:
-            output_type = channels_to_write.co_output_type
+            output_type = write_plan.co_output_type
 
             if number_of_samples_per_channel == 1:
                 data = [data]
@@ -1171,6 +1431,108 @@ class Task:
                 DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK,
                 task_name=self.name)
 
+    @staticmethod
+    def _validate_ctr_ticks(field, array):
+        """
+        Returns the counter output pulse ticks as a NumPy array, after
+        checking that they are integers that fit in a uint32.
+        """
+        ticks = numpy.asarray(array)
+        if ticks.dtype.kind not in 'iu':
+            raise ValueError(
+                '{} must contain integers, not values of type {}.'.format(
+                    field, ticks.dtype.name))
+        uint32_info = numpy.iinfo(numpy.uint32)
+        if ticks.size and (ticks.min() < uint32_info.min or
+                           ticks.max() > uint32_info.max):
+            raise ValueError(
+                '{} must contain integers from {} to {}.'.format(
+                    field, uint32_info.min, uint32_info.max))
+        return ticks
+
+    def _write_ctr_arrays(
+            self, output_type, number_of_channels, data, auto_start, timeout):
+        """
+        Writes counter output pulse samples that are specified as a NumPy
+        structured array or as a tuple of two NumPy arrays.
+        """
+        if output_type == UsageTypeCO.PULSE_FREQUENCY:
+            sample_type = CtrFreq
+            dtype = numpy.float64
+            write_function = self._interpreter.write_ctr_freq
+        elif output_type == UsageTypeCO.PULSE_TIME:
+            sample_type = CtrTime
+            dtype = numpy.float64
+            write_function = self._interpreter.write_ctr_time
+        else:
+            sample_type = CtrTick
+            dtype = numpy.uint32
+            write_function = self._interpreter.write_ctr_ticks
+
+        if isinstance(data, numpy.ndarray):
+            if not set(sample_type._fields).issubset(data.dtype.names):
+                raise DaqError(
+                    'Write failed, because the fields of the structured array '
+                    'do not match the counter output type of the task.\n\n'
+                    'Required Fields: {}\n'
+                    'Fields in Data: {}'.format(
+                        ', '.join(sample_type._fields), ', '.join(data.dtype.names)),
+                    DAQmxErrors.UNKNOWN, task_name=self.name)
+            data = [data[name] for name in sample_type._fields]
+
+        if any(numpy.ndim(array) == 0 for array in data):
+            # numpy.ascontiguousarray() would silently turn these into 1D arrays.
+            raise DaqError(
+                'Write failed, because the arrays of counter output pulse '
+                'samples are zero-dimensional. Specify one-dimensional arrays, '
+                'or specify a single sample as a {}.'.format(sample_type.__name__),
+                DAQmxErrors.UNKNOWN, task_name=self.name)
+
+        if sample_type is CtrTick:
+            # Casting to uint32 would silently truncate floats and wrap
+            # negative values, so validate the ticks before the cast.
+            data = [
+                self._validate_ctr_ticks(field, array)
+                for field, array in zip(sample_type._fields, data)]
+
+        try:
+            first_array, second_array = [
+                numpy.ascontiguousarray(array, dtype=dtype) for array in data]
+        except (TypeError, ValueError) as e:
+            raise DaqError(
+                'Write failed, because the counter output pulse samples could '
+                'not be converted to {}.\n\n'
+                'Error: {}'.format(numpy.dtype(dtype).name, e),
+                DAQmxErrors.UNKNOWN, task_name=self.name) from e
+
+        if first_array.shape != second_array.shape:
+            raise DaqError(
+                'Write failed, because the arrays of counter output pulse '
+                'samples have different shapes.\n\n'
+                'Shape of {}: {}\n'
+                'Shape of {}: {}'.format(
+                    sample_type._fields[0], first_array.shape,
+                    sample_type._fields[1], second_array.shape),
+                DAQmxErrors.UNKNOWN, task_name=self.name)
+
+        if number_of_channels == 1:
+            if first_array.ndim != 1:
+                self._raise_invalid_write_num_chans_error(
+                    number_of_channels, first_array.shape[0])
+            number_of_samples_per_channel = len(first_array)
+        else:
+            if first_array.ndim != 1 or len(first_array) != number_of_channels:
+                self._raise_invalid_write_num_chans_error(
+                    number_of_channels, len(first_array))
+            number_of_samples_per_channel = 1
+
+        if auto_start is AUTO_START_UNSET:
+            auto_start = number_of_samples_per_channel == 1
+
+        return write_function(
+            self._handle, number_of_samples_per_channel, auto_start, timeout,
+            FillMode.GROUP_BY_CHANNEL.value, first_array, second_array)
+
 
 class _TaskAlternateConstructor(Task):
     """
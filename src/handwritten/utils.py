@@ -223,3 +223,17 @@ def _select_interpreter(
         else:
             from nidaqmx._library_interpreter import LibraryInterpreter
             return LibraryInterpreter()
+
+
+def _get_property_getters(cls, attribute_names):
+    """
+    Returns the getter function of each named property of a class.
+    """
+    getters = []
+    for attribute_name in attribute_names:
+        prop = getattr(cls, attribute_name, None)
+        if not isinstance(prop, property) or prop.fget is None:
+            raise ValueError(
+                f'"{attribute_name}" is not a property of {cls.__name__} objects.')
+        getters.append(prop.fget)
+    return getters
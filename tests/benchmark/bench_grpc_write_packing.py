@@ -0,0 +1,65 @@
+"""Measures the cost of encoding the samples of gRPC write requests.
+
+It compares assigning ``write_array=array.flat`` when creating a request, which converts each
+sample in Python, with the ``_pack_numpy_array()`` helper that the gRPC interpreter uses. The
+time includes serializing the request, which is what the gRPC channel does before it sends the
+request.
+
+Run it from the root of the repository:
+
+    python -m tests.benchmark.bench_grpc_write_packing
+"""
+
+import timeit
+
+import numpy
+
+from nidaqmx._grpc_interpreter import _pack_numpy_array
+from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+
+NUMBER_OF_SAMPLES = 1_000_000
+
+
+def _encode_flat(request_type, write_array):
+    return request_type(write_array=write_array.flat).SerializeToString()
+
+
+def _encode_packed(request_type, write_array):
+    request = request_type()
+    _pack_numpy_array(request, "write_array", write_array)
+    return request.SerializeToString()
+
+
+def _measure(name, func, write_array):
+    seconds = min(timeit.repeat(func, number=1, repeat=5))
+    megabytes = write_array.nbytes / 2**20
+    print(f"{name:<40} {seconds / megabytes * 1e3:8.1f} ms/MB")
+
+
+def main():
+    """Prints the encoding time per MiB of samples for each request type and method."""
+    rng = numpy.random.default_rng(0)
+    requests = [
+        ("write_analog_f64", grpc_types.WriteAnalogF64Request, rng.random(NUMBER_OF_SAMPLES)),
+        (
+            "write_binary_u32",
+            grpc_types.WriteBinaryU32Request,
+            rng.integers(0, 2**32, NUMBER_OF_SAMPLES, dtype=numpy.uint32),
+        ),
+    ]
+    for name, request_type, write_array in requests:
+        assert _encode_flat(request_type, write_array) == _encode_packed(request_type, write_array)
+        _measure(
+            f"{name}, write_array.flat",
+            lambda: _encode_flat(request_type, write_array),
+            write_array,
+        )
+        _measure(
+            f"{name}, _pack_numpy_array()",
+            lambda: _encode_packed(request_type, write_array),
+            write_array,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measures the overhead of calling NI-DAQmx functions through the library interpreter.
+
+This benchmark does not need NI-DAQmx. It substitutes labs() from the C runtime for
+DAQmxStartTask, which takes one pointer-sized argument and returns 0 when the argument is 0.
+
+Run it from the root of the repository:
+
+    python -m tests.benchmark.bench_library_calls
+"""
+
+import ctypes
+import ctypes.util
+import sys
+import timeit
+from unittest import mock
+
+from nidaqmx._lib import DaqFunctionImporter, lib_importer
+from nidaqmx._library_interpreter import _FUNCTION_ARGTYPES, LibraryInterpreter
+
+NUMBER_OF_CALLS = 1_000_000
+
+
+class _FakeLibrary:
+    """A library whose DAQmxStartTask function is labs() from the C runtime."""
+
+    def __init__(self):
+        if sys.platform.startswith("win"):
+            c_runtime = ctypes.CDLL("msvcrt")
+        else:
+            c_runtime = ctypes.CDLL(ctypes.util.find_library("c"))
+        self.DAQmxStartTask = c_runtime.labs
+
+
+def _start_task_with_per_call_setup(interpreter, task):
+    # The code that the library interpreter used to run on every call.
+    cfunc = lib_importer.windll.DAQmxStartTask
+    if cfunc.argtypes is None:
+        with cfunc.arglock:
+            if cfunc.argtypes is None:
+                cfunc.argtypes = [lib_importer.task_handle]
+    error_code = cfunc(task)
+    interpreter.check_for_error(error_code)
+
+
+def _measure(name, func):
+    seconds = min(timeit.repeat(func, number=NUMBER_OF_CALLS, repeat=5))
+    print(f"{name:<40} {seconds / NUMBER_OF_CALLS * 1e9:8.0f} ns/call")
+
+
+def main():
+    """Prints the time per call of each way to call DAQmxStartTask."""
+    library = _FakeLibrary()
+    # Patch the instance dictionary, because looking up windll loads NI-DAQmx.
+    with mock.patch.dict(
+        vars(lib_importer),
+        {
+            "windll": DaqFunctionImporter(library, _FUNCTION_ARGTYPES),
+            "_task_handle": ctypes.c_void_p,
+        },
+    ):
+        interpreter = LibraryInterpreter()
+        task = ctypes.c_void_p(0)
+        cfunc = lib_importer.windll.DAQmxStartTask
+
+        _measure("ctypes function call", lambda: cfunc(task))
+        _measure("LibraryInterpreter.start_task()", lambda: interpreter.start_task(task))
+        _measure(
+            "per-call argtypes check and lock",
+            lambda: _start_task_with_per_call_setup(interpreter, task),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""The benchmarks are scripts that you run directly, so pytest does not collect them."""
+
+collect_ignore_glob = ["bench_*.py"]
@@ -1,11 +1,24 @@
 """gRPC helper functions."""
+import concurrent.futures
+import contextlib
+import threading
+import time
+from typing import Dict, Generator, List, Tuple
+
+import numpy
 import pytest
 from pytest_mock import MockerFixture
 
 import nidaqmx
+from nidaqmx.constants import ChannelType, UsageTypeAI
+from nidaqmx.utils import flatten_channel_string
 
 try:
     import grpc
+
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+    from nidaqmx._stubs import session_pb2
 except ImportError:
     grpc = None
 
@@ -17,3 +30,109 @@ def create_grpc_options(mocker: MockerFixture, session_name="") -> nidaqmx.GrpcS
     grpc_channel = mocker.create_autospec(grpc.Channel)
     grpc_options = nidaqmx.GrpcSessionOptions(grpc_channel, session_name)
     return grpc_options
+
+
+class FakeNiDAQmxServicer(nidaqmx_grpc.NiDAQmxServicer if grpc else object):  # type: ignore
+    """A stand-in for the NI gRPC Device Server that simulates an AI voltage task."""
+
+    def __init__(
+        self, channel_names: List[str], read_latency: float = 0.0, set_latency: float = 0.0
+    ) -> None:
+        """Create a FakeNiDAQmxServicer."""
+        self.channel_names = channel_names
+        self.read_latency = read_latency
+        self.set_latency = set_latency
+        self.read_count = 0
+        self.samples_per_chan_read = 0
+        # (channel, attribute, value) for each attribute set, in the order the server applied them.
+        self.attributes_set: List[Tuple[str, int, float]] = []
+        # Maps attribute IDs to the DAQmx error code returned when setting them.
+        self.attribute_set_errors: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def CreateTask(self, request, context):  # noqa: N802 - gRPC method name
+        """Create the simulated task."""
+        return grpc_types.CreateTaskResponse(
+            task=session_pb2.Session(name=request.session_name or "FakeTask"),
+            new_session_initialized=True,
+        )
+
+    def ClearTask(self, request, context):  # noqa: N802 - gRPC method name
+        """Clear the simulated task."""
+        return grpc_types.ClearTaskResponse()
+
+    def GetTaskAttributeString(self, request, context):  # noqa: N802 - gRPC method name
+        """Get the task name or channel names."""
+        values = {0x1276: request.task.name, 0x1273: flatten_channel_string(self.channel_names)}
+        return grpc_types.GetTaskAttributeStringResponse(value=values[request.attribute_raw])
+
+    def GetReadAttributeString(self, request, context):  # noqa: N802 - gRPC method name
+        """Get the channels to read."""
+        return grpc_types.GetReadAttributeStringResponse(
+            value=flatten_channel_string(self.channel_names)
+        )
+
+    def GetChanAttributeInt32(self, request, context):  # noqa: N802 - gRPC method name
+        """Get the channel type or measurement type."""
+        values = {0x187F: ChannelType.ANALOG_INPUT.value, 0x695: UsageTypeAI.VOLTAGE.value}
+        return grpc_types.GetChanAttributeInt32Response(value_raw=values[request.attribute_raw])
+
+    def GetChanAttributeDouble(self, request, context):  # noqa: N802 - gRPC method name
+        """Get the last value set for a channel attribute."""
+        with self._lock:
+            for channel, attribute, value in reversed(self.attributes_set):
+                if (channel, attribute) == (request.channel, request.attribute_raw):
+                    return grpc_types.GetChanAttributeDoubleResponse(value=value)
+        return grpc_types.GetChanAttributeDoubleResponse()
+
+    def SetChanAttributeDouble(self, request, context):  # noqa: N802 - gRPC method name
+        """Set a channel attribute."""
+        self._set_attribute(request.channel, request.attribute_raw, request.value, context)
+        return grpc_types.SetChanAttributeDoubleResponse()
+
+    def SetTimingAttributeDouble(self, request, context):  # noqa: N802 - gRPC method name
+        """Set a timing attribute."""
+        self._set_attribute("", request.attribute_raw, request.value, context)
+        return grpc_types.SetTimingAttributeDoubleResponse()
+
+    def _set_attribute(self, channel: str, attribute: int, value: float, context) -> None:
+        time.sleep(self.set_latency)
+        error_code = self.attribute_set_errors.get(attribute)
+        if error_code is not None:
+            context.set_trailing_metadata((("ni-error", str(error_code)),))
+            context.abort(grpc.StatusCode.UNKNOWN, f"Property: {attribute:#x}\nChannel: {channel}")
+        with self._lock:
+            self.attributes_set.append((channel, attribute, value))
+
+    def ReadAnalogF64(self, request, context):  # noqa: N802 - gRPC method name
+        """Read a ramp that continues from the previous read."""
+        time.sleep(self.read_latency)
+        with self._lock:
+            first_sample = self.samples_per_chan_read
+            self.samples_per_chan_read += request.num_samps_per_chan
+            self.read_count += 1
+        ramp = numpy.arange(
+            first_sample, first_sample + request.num_samps_per_chan, dtype=numpy.float64
+        )
+        read_array = numpy.tile(ramp, len(self.channel_names))
+        return grpc_types.ReadAnalogF64Response(
+            read_array=read_array.tolist(), samps_per_chan_read=request.num_samps_per_chan
+        )
+
+
+@contextlib.contextmanager
+def fake_grpc_server(
+    servicer: "FakeNiDAQmxServicer",
+) -> Generator[nidaqmx.GrpcSessionOptions, None, None]:
+    """Run a FakeNiDAQmxServicer on a local port and yield the session options to connect to it."""
+    if grpc is None:
+        pytest.skip("The grpc module is not available.")
+    server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=16))
+    nidaqmx_grpc.add_NiDAQmxServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+            yield nidaqmx.GrpcSessionOptions(channel, "")
+    finally:
+        server.stop(None)
@@ -1,12 +1,14 @@
 """Task helper functions."""
-from typing import Dict, Sequence
+from typing import Dict, List, Sequence
 from unittest.mock import Mock
 
 from pytest_mock import MockerFixture
 
 from nidaqmx import Task
 from nidaqmx._base_interpreter import BaseEventHandler
+from nidaqmx.constants import ChannelType, UsageTypeAI
 from nidaqmx.task import _TaskEventType
+from nidaqmx.utils import flatten_channel_string
 
 
 def expect_create_task(
@@ -33,6 +35,17 @@ def expect_get_task_name(interpreter: Mock, name: str):
     interpreter.get_task_attribute_string.return_value = name
 
 
+def expect_ai_channels(
+    interpreter: Mock, channel_names: List[str], meas_type: UsageTypeAI = UsageTypeAI.VOLTAGE
+) -> None:
+    """Expect calls to get the channels to read and their channel and measurement types."""
+    interpreter.get_read_attribute_string.return_value = flatten_channel_string(channel_names)
+    chan_attributes = {0x187F: ChannelType.ANALOG_INPUT.value, 0x695: meas_type.value}
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task, channel, attribute: chan_attributes[attribute]
+    )
+
+
 def register_event_handler(mocker: MockerFixture, task: Task, event_type: _TaskEventType) -> Mock:
     """Register a mock event handler."""
     event_handler = mocker.create_autospec(BaseEventHandler)
@@ -0,0 +1,125 @@
+from unittest.mock import Mock
+
+from nidaqmx.constants import TerminalConfiguration
+from nidaqmx.system import Device, System
+
+
+def _expect_device_attributes(interpreter: Mock) -> None:
+    device_strings = {0x631: "PCIe-6363", 0x231E: "Dev1/ai0, Dev1/ai1", 0x2F6D: "SCB-68"}
+    interpreter.get_device_attribute_string.side_effect = lambda name, attribute: device_strings[
+        attribute
+    ]
+    interpreter.get_device_attribute_double_array.return_value = [-10.0, 10.0]
+    # Differential and RSE
+    interpreter.get_physical_chan_attribute_int32.return_value = 0x5
+
+
+def test___attribute_caching_disabled___get_attributes_twice___driver_queried_each_time(
+    interpreter: Mock,
+):
+    _expect_device_attributes(interpreter)
+    device = Device("Dev1")
+
+    assert device.product_type == "PCIe-6363"
+    assert device.product_type == "PCIe-6363"
+
+    assert interpreter.get_device_attribute_string.call_count == 2
+
+
+def test___attribute_caching_enabled___get_attributes_twice___driver_queried_once(
+    interpreter: Mock,
+):
+    _expect_device_attributes(interpreter)
+    device = Device("Dev1")
+    device.enable_attribute_caching()
+
+    for _ in range(2):
+        assert device.product_type == "PCIe-6363"
+        assert device.ai_voltage_rngs == [-10.0, 10.0]
+        assert [chan.name for chan in device.ai_physical_chans] == ["Dev1/ai0", "Dev1/ai1"]
+        assert device.ai_physical_chans["ai0"].ai_term_cfgs == [
+            TerminalConfiguration.RSE,
+            TerminalConfiguration.DIFF,
+        ]
+
+    assert interpreter.get_device_attribute_string.call_count == 2
+    assert interpreter.get_device_attribute_double_array.call_count == 1
+    assert interpreter.get_physical_chan_attribute_int32.call_count == 1
+
+
+def test___attribute_caching_enabled___modify_returned_list___cached_value_unchanged(
+    interpreter: Mock,
+):
+    _expect_device_attributes(interpreter)
+    device = Device("Dev1")
+    device.enable_attribute_caching()
+
+    device.ai_voltage_rngs.append(5.0)
+
+    assert device.ai_voltage_rngs == [-10.0, 10.0]
+
+
+def test___attribute_caching_enabled___get_volatile_attribute_twice___driver_queried_each_time(
+    interpreter: Mock,
+):
+    _expect_device_attributes(interpreter)
+    device = Device("Dev1")
+    device.enable_attribute_caching()
+
+    assert device.accessory_product_types == ["SCB-68"]
+    assert device.accessory_product_types == ["SCB-68"]
+
+    assert interpreter.get_device_attribute_string.call_count == 2
+
+
+def test___attribute_caching_enabled___reset_device___cache_cleared(interpreter: Mock):
+    _expect_device_attributes(interpreter)
+    device = Device("Dev1")
+    device.enable_attribute_caching()
+    _ = device.product_type
+
+    device.reset_device()
+    _ = device.product_type
+
+    interpreter.reset_device.assert_called_once_with("Dev1")
+    assert interpreter.get_device_attribute_string.call_count == 2
+
+
+def test___device_snapshot___index_and_iterate___device_names_queried_once(interpreter: Mock):
+    interpreter.get_system_info_attribute_string.return_value = "Dev1, Dev2, cDAQ1"
+    devices = System.local().devices.snapshot()
+
+    assert len(devices) == 3
+    assert [devices[i].name for i in range(len(devices))] == ["Dev1", "Dev2", "cDAQ1"]
+    assert [device.name for device in reversed(devices)] == ["cDAQ1", "Dev2", "Dev1"]
+    assert devices["Dev2"] is devices[1]
+    assert [device.name for device in devices["Dev1,cDAQ1"]] == ["Dev1", "cDAQ1"]
+    assert "Dev1" in devices and Device("cDAQ1") in devices and "Dev3" not in devices
+    assert devices.device_names == ("Dev1", "Dev2", "cDAQ1")
+    interpreter.get_system_info_attribute_string.assert_called_once()
+
+
+def test___physical_channel_snapshot___index_and_iterate___channel_names_queried_once(
+    interpreter: Mock,
+):
+    _expect_device_attributes(interpreter)
+    channels = Device("Dev1").ai_physical_chans.snapshot()
+
+    assert [channel.name for channel in channels] == ["Dev1/ai0", "Dev1/ai1"]
+    assert channels["ai1"] is channels[1]
+    assert channels[0:2].name == "Dev1/ai0:1"
+    assert channels.all.name == "Dev1/ai0:1"
+    assert "Dev1/ai0" in channels and "Dev1/ai2" not in channels
+    assert channels.channel_names == ("Dev1/ai0", "Dev1/ai1")
+    interpreter.get_device_attribute_string.assert_called_once()
+
+
+def test___device___get_attributes___values_returned_by_attribute(interpreter: Mock):
+    _expect_device_attributes(interpreter)
+    interpreter.call_concurrently.side_effect = lambda funcs: [func() for func in funcs]
+    device = Device("Dev1")
+
+    values = device.get_attributes(["product_type", "ai_voltage_rngs"])
+
+    assert values == {"product_type": "PCIe-6363", "ai_voltage_rngs": [-10.0, 10.0]}
+    interpreter.call_concurrently.assert_called_once()
@@ -0,0 +1,207 @@
+import asyncio
+import threading
+from typing import Callable, List
+from unittest.mock import Mock
+
+from nidaqmx import Task
+from nidaqmx.aio import AsyncTask
+from nidaqmx.constants import EveryNSamplesEventType, TaskMode
+from tests.unit._task_utils import (
+    expect_ai_channels,
+    expect_create_task,
+    expect_get_task_name,
+)
+
+
+def test___async_task___read___returns_samples_read_on_worker_thread(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    read_thread_names = []
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_thread_names.append(threading.current_thread().name)
+        read_array.fill(1.5)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    async def _read():
+        return await AsyncTask(task=task).read(number_of_samples_per_channel=3)
+
+    data = asyncio.run(_read())
+
+    assert data == [1.5, 1.5, 1.5]
+    assert read_thread_names[0].startswith("nidaqmx MyTask")
+
+
+def test___async_tasks___read_concurrently___reads_overlap(interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    barrier = threading.Barrier(3, timeout=10.0)
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        # Each read waits until all three reads are in progress at the same time.
+        barrier.wait()
+        read_array.fill(2.0)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+    expect_create_task(interpreter)
+    expect_get_task_name(interpreter, "MyTask")
+
+    async def _read_all():
+        async_tasks = [AsyncTask(f"MyTask{i}") for i in range(3)]
+        try:
+            return await asyncio.gather(*(t.read() for t in async_tasks))
+        finally:
+            for async_task in async_tasks:
+                await async_task.close()
+
+    assert asyncio.run(_read_all()) == [2.0, 2.0, 2.0]
+
+
+def test___async_task___wait_until_done___calls_wait_until_task_done(task: Task, interpreter: Mock):
+    asyncio.run(AsyncTask(task=task).wait_until_done(timeout=5.0))
+
+    interpreter.wait_until_task_done.assert_called_once_with(task._handle, 5.0)
+
+
+def test___async_task___exit_context___task_closed(interpreter: Mock):
+    expect_create_task(interpreter)
+    expect_get_task_name(interpreter, "MyTask")
+
+    async def _open_and_close():
+        async with AsyncTask("MyTask") as async_task:
+            return async_task.task
+
+    task = asyncio.run(_open_and_close())
+
+    interpreter.clear_task.assert_called_once()
+    assert task._handle is None
+
+
+def test___every_n_samples_acquired___iterate___yields_event_sample_counts(
+    task: Task, interpreter: Mock
+):
+    def _register_every_n_samples_event(
+        task_handle, event_type, sample_interval, options, callback, callback_data
+    ):
+        def _send_events():
+            for _ in range(3):
+                callback(task_handle, event_type, sample_interval, callback_data)
+
+        # DAQmx calls the callback from a thread that it owns.
+        threading.Thread(target=_send_events).start()
+        return Mock()
+
+    interpreter.register_every_n_samples_event.side_effect = _register_every_n_samples_event
+
+    async def _collect_events():
+        async_task = AsyncTask(task=task)
+        events = []
+        async with async_task.every_n_samples_acquired(100) as event_iterator:
+            async for number_of_samples in event_iterator:
+                events.append(number_of_samples)
+                if len(events) == 3:
+                    break
+        return events
+
+    assert asyncio.run(_collect_events()) == [100, 100, 100]
+    interpreter.unregister_every_n_samples_event.assert_called_once_with(
+        task._handle, EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value
+    )
+
+
+def _expect_every_n_samples_events(interpreter: Mock, number_of_events: int) -> List[Callable]:
+    """Send the events when the callback is registered and return the registered callbacks."""
+    callbacks = []
+
+    def _register_every_n_samples_event(
+        task_handle, event_type, sample_interval, options, callback, callback_data
+    ):
+        callbacks.append(callback)
+        for _ in range(number_of_events):
+            callback(task_handle, event_type, sample_interval, callback_data)
+        return Mock()
+
+    interpreter.register_every_n_samples_event.side_effect = _register_every_n_samples_event
+    return callbacks
+
+
+def test___read_in_progress___stop___stop_does_not_wait_for_read(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    stopped = threading.Event()
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        # The read is blocked until the task is stopped.
+        assert stopped.wait(10.0)
+        return read_array, 0
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+    interpreter.stop_task.side_effect = lambda task_handle: stopped.set()
+
+    async def _read_and_stop():
+        async_task = AsyncTask(task=task)
+        read = asyncio.ensure_future(async_task.read(number_of_samples_per_channel=10))
+        await asyncio.sleep(0.1)
+        await asyncio.wait_for(async_task.stop(), 10.0)
+        return await read
+
+    assert asyncio.run(_read_and_stop()) == []
+    interpreter.stop_task.assert_called_once_with(task._handle)
+
+
+def test___async_task___abort___aborts_task(task: Task, interpreter: Mock):
+    asyncio.run(AsyncTask(task=task).abort())
+
+    interpreter.task_control.assert_called_once_with(task._handle, TaskMode.TASK_ABORT.value)
+
+
+def test___events_ended___iterate_again_and_concurrently___iterations_end(
+    task: Task, interpreter: Mock
+):
+    _expect_every_n_samples_events(interpreter, 1)
+
+    async def _iterate():
+        async_task = AsyncTask(task=task)
+        async with async_task.every_n_samples_acquired(100) as events:
+            waiting_iterations = [
+                asyncio.ensure_future(_collect(events)),
+                asyncio.ensure_future(_collect(events)),
+            ]
+            await asyncio.sleep(0.1)
+        first_results = await asyncio.wait_for(asyncio.gather(*waiting_iterations), 10.0)
+        return first_results, await asyncio.wait_for(_collect(events), 10.0)
+
+    async def _collect(events):
+        return [number_of_samples async for number_of_samples in events]
+
+    first_results, second_result = asyncio.run(_iterate())
+
+    assert sorted(first_results) == [[], [100]]
+    assert second_result == []
+
+
+def test___consumer_falls_behind___iterate___oldest_events_discarded(task: Task, interpreter: Mock):
+    _expect_every_n_samples_events(interpreter, 5)
+
+    async def _iterate():
+        async_task = AsyncTask(task=task)
+        async with async_task.every_n_samples_acquired(100, queue_depth=2) as events:
+            await asyncio.sleep(0.1)
+        return [number_of_samples async for number_of_samples in events], events
+
+    number_of_samples_seen, events = asyncio.run(_iterate())
+
+    # Closing the events keeps the queued events and does not count as an overflow.
+    assert number_of_samples_seen == [100, 100]
+    assert events.overflow_count == 3
+
+
+def test___event_loop_closed___event_occurs___callback_returns(task: Task, interpreter: Mock):
+    callbacks = _expect_every_n_samples_events(interpreter, 0)
+
+    async def _open():
+        await AsyncTask(task=task).every_n_samples_acquired(100).open()
+
+    asyncio.run(_open())
+
+    assert callbacks[0](task._handle, 1, 100, None) == 0
@@ -0,0 +1,119 @@
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx.constants import ChannelType, UsageTypeCI
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import CtrFreq
+from tests.unit._task_utils import expect_ai_channels
+
+
+def _expect_read_analog_f64_ramp(interpreter: Mock, number_of_reads: int) -> None:
+    samples_per_chan_read = 0
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        nonlocal samples_per_chan_read
+        if interpreter.read_analog_f64.call_count > number_of_reads:
+            raise nidaqmx.DaqError("Task stopped.", DAQmxErrors.INVALID_TASK)
+        read_array[...] = numpy.arange(
+            samples_per_chan_read, samples_per_chan_read + num_samps_per_chan
+        )
+        samples_per_chan_read += num_samps_per_chan
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def test___ai_task___start_background_reader___yields_consecutive_chunks(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64_ramp(interpreter, 3)
+
+    with task.in_stream.start_background_reader(4) as reader:
+        data = []
+        for _ in range(3):
+            chunk = next(reader)
+            data.append(chunk.copy())
+            reader.release(chunk)
+
+    assert [chunk.shape for chunk in data] == [(2, 4)] * 3
+    numpy.testing.assert_array_equal(numpy.concatenate(data, axis=1)[1], numpy.arange(12))
+
+
+def test___released_chunks___background_reader_reads___reuses_arrays(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    read_arrays = []
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_arrays.append(read_array)
+        read_array.fill(0.0)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    with task.in_stream.start_background_reader(4, queue_depth=2) as reader:
+        for _ in range(20):
+            reader.release(next(reader))
+
+    assert len({id(array) for array in read_arrays}) <= 4
+
+
+def test___consumer_falls_behind___background_reader_reads___oldest_chunks_discarded(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp(interpreter, 10)
+
+    reader = task.in_stream.start_background_reader(5, queue_depth=3)
+    reader._thread.join(10.0)
+
+    assert reader.chunks_read == 10
+    # The queue keeps the last two chunks and the error.
+    assert reader.overflow_count == 8
+    numpy.testing.assert_array_equal(next(reader), [numpy.arange(40, 45)])
+    numpy.testing.assert_array_equal(next(reader), [numpy.arange(45, 50)])
+    with pytest.raises(nidaqmx.DaqError) as exc_info:
+        next(reader)
+    assert exc_info.value.error_code == DAQmxErrors.INVALID_TASK
+    assert list(reader) == []
+
+
+def test___ao_task___start_background_reader___raises_value_error(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ao0"])
+    interpreter.get_chan_attribute_int32.side_effect = None
+    interpreter.get_chan_attribute_int32.return_value = ChannelType.ANALOG_OUTPUT.value
+
+    with pytest.raises(ValueError):
+        task.in_stream.start_background_reader(10)
+
+
+def test___ci_pulse_freq_task___start_background_reader___yields_ctr_freq_chunks(
+    task: Task, interpreter: Mock
+):
+    interpreter.get_read_attribute_string.return_value = "Dev1/ctr0"
+    chan_attributes = {
+        0x187F: ChannelType.COUNTER_INPUT.value,
+        0x18A0: UsageTypeCI.PULSE_FREQ.value,
+    }
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task, channel, attribute: chan_attributes[attribute]
+    )
+
+    def _read_ctr_freq(task, num_samps_per_chan, timeout, fill_mode, freqs, duty_cycles):
+        freqs.fill(1000.0)
+        duty_cycles.fill(0.25)
+        return freqs, duty_cycles, num_samps_per_chan
+
+    interpreter.read_ctr_freq.side_effect = _read_ctr_freq
+
+    with task.in_stream.start_background_reader(3) as reader:
+        chunk = next(reader)
+
+    assert isinstance(chunk, CtrFreq)
+    numpy.testing.assert_array_equal(chunk.freq, [1000.0] * 3)
+    numpy.testing.assert_array_equal(chunk.duty_cycle, [0.25] * 3)
+    interpreter.read_counter_f64_ex.assert_not_called()
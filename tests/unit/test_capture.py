@@ -0,0 +1,136 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, DaqReadError, Task
+from nidaqmx.capture import capture_to_file, open_capture_file
+from nidaqmx.constants import FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from tests.unit._task_utils import expect_ai_channels
+
+
+def _expect_reads(interpreter: Mock, read: Mock, number_of_channels: int, fail_after=None):
+    reads = []
+
+    def _read(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        assert fill_mode == FillMode.GROUP_BY_SCAN_NUMBER.value
+        assert read_array.shape == (num_samps_per_chan, number_of_channels)
+        if fail_after is not None and len(reads) == fail_after:
+            raise DaqError("Read failed.", DAQmxErrors.UNKNOWN)
+        start = sum(reads)
+        read_array[...] = numpy.arange(
+            start * number_of_channels, (start + num_samps_per_chan) * number_of_channels
+        ).reshape(num_samps_per_chan, number_of_channels)
+        reads.append(num_samps_per_chan)
+        return read_array, num_samps_per_chan
+
+    read.side_effect = _read
+    interpreter.get_timing_attribute_double.return_value = 1000.0
+    interpreter.get_chan_attribute_double_array.return_value = [0.0, 0.5]
+    return reads
+
+
+def test___ai_task___capture_to_file___reads_chunks_into_file(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    reads = _expect_reads(interpreter, interpreter.read_analog_f64, 2)
+    file_path = tmp_path / "capture.npy"
+
+    capture = capture_to_file(task, file_path, 25, samples_per_read=10)
+
+    assert reads == [10, 10, 5]
+    assert capture.channel_names == ["Dev1/ai0", "Dev1/ai1"]
+    assert capture.sample_rate == 1000.0
+    assert not capture.unscaled
+    numpy.testing.assert_array_equal(capture.channel_data[0], numpy.arange(0, 50, 2))
+    numpy.testing.assert_array_equal(capture.channel_data[1], numpy.arange(1, 50, 2))
+
+
+def test___capture_file___open_capture_file___returns_read_only_memory_map(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_reads(interpreter, interpreter.read_analog_f64, 2)
+    file_path = tmp_path / "capture.npy"
+    capture_to_file(task, file_path, 25, samples_per_read=10)
+
+    capture = open_capture_file(file_path)
+
+    assert isinstance(capture.samples, numpy.memmap)
+    assert not capture.samples.flags.writeable
+    assert capture.samples.shape == (25, 2)
+    numpy.testing.assert_array_equal(capture.get_scaled_data(5, 8), [[10, 12, 14], [11, 13, 15]])
+
+
+def test___unscaled_capture___get_scaled_data___applies_scaling_coeffs(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    interpreter.get_chan_attribute_uint32.return_value = 16
+    _expect_reads(interpreter, interpreter.read_binary_i16, 2)
+    file_path = tmp_path / "capture.npy"
+
+    capture = capture_to_file(task, file_path, 4, unscaled=True)
+
+    assert capture.unscaled
+    assert capture.samples.dtype == numpy.int16
+    assert capture.scaling_coeffs == [[0.0, 0.5], [0.0, 0.5]]
+    numpy.testing.assert_array_equal(
+        capture.get_scaled_data(), [[0, 1, 2, 3], [0.5, 1.5, 2.5, 3.5]]
+    )
+
+
+def test___read_fails___capture_to_file___records_samples_read(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_reads(interpreter, interpreter.read_analog_f64, 1, fail_after=2)
+    file_path = tmp_path / "capture.npy"
+
+    with pytest.raises(DaqError):
+        capture_to_file(task, file_path, 100, samples_per_read=10)
+
+    capture = open_capture_file(file_path)
+    assert capture.samples.shape == (20, 1)
+    numpy.testing.assert_array_equal(capture.channel_data[0], numpy.arange(20))
+
+
+def test___32_bit_raw_samples___unscaled_capture_to_file___stores_int32_samples(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    interpreter.get_chan_attribute_uint32.return_value = 32
+    _expect_reads(interpreter, interpreter.read_binary_i32, 1)
+    file_path = tmp_path / "capture.npy"
+
+    capture = capture_to_file(task, file_path, 4, unscaled=True)
+
+    assert capture.samples.dtype == numpy.int32
+    numpy.testing.assert_array_equal(capture.channel_data[0], numpy.arange(4))
+    interpreter.read_binary_i16.assert_not_called()
+
+
+def test___partial_read_fails___capture_to_file___records_partial_samples(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_reads(interpreter, interpreter.read_analog_f64, 1)
+    read = interpreter.read_analog_f64.side_effect
+
+    def _read(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        if interpreter.read_analog_f64.call_count == 2:
+            read_array[:3] = [[10], [11], [12]]
+            raise DaqReadError("Timed out.", DAQmxErrors.OPERATION_TIMED_OUT, 3)
+        return read(task, num_samps_per_chan, timeout, fill_mode, read_array)
+
+    interpreter.read_analog_f64.side_effect = _read
+    file_path = tmp_path / "capture.npy"
+
+    with pytest.raises(DaqReadError):
+        capture_to_file(task, file_path, 100, samples_per_read=10)
+
+    capture = open_capture_file(file_path)
+    numpy.testing.assert_array_equal(capture.channel_data[0], numpy.arange(13))
@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import Task
+from nidaqmx._task_modules.channels import AIChannel
+
+
+def _call_sequentially(funcs):
+    return [func() for func in funcs]
+
+
+def test___channels___get_attributes___values_returned_by_attribute(task: Task, interpreter: Mock):
+    ai_limits = {
+        ("Dev1/ai0", 0x17DE): -10.0,
+        ("Dev1/ai0", 0x17DD): 10.0,
+        ("Dev1/ai1", 0x17DE): -5.0,
+        ("Dev1/ai1", 0x17DD): 5.0,
+    }
+    interpreter.get_chan_attribute_double.side_effect = lambda task, channel, attribute: ai_limits[
+        (channel, attribute)
+    ]
+    interpreter.call_concurrently.side_effect = _call_sequentially
+    channel = AIChannel(task._handle, "Dev1/ai0:1", interpreter)
+
+    values = channel.get_attributes(["ai_min", "ai_max"])
+
+    assert values == {"ai_min": [-10.0, -5.0], "ai_max": [10.0, 5.0]}
+    interpreter.call_concurrently.assert_called_once()
+    assert len(interpreter.call_concurrently.call_args[0][0]) == 4
+
+
+def test___channels___get_attributes_with_unknown_name___value_error_raised(
+    task: Task, interpreter: Mock
+):
+    channel = AIChannel(task._handle, "Dev1/ai0:1", interpreter)
+
+    with pytest.raises(ValueError) as exc_info:
+        channel.get_attributes(["ai_min", "ai_bogus"])
+
+    assert "ai_bogus" in str(exc_info.value)
+    interpreter.call_concurrently.assert_not_called()
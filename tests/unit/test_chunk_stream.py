@@ -0,0 +1,97 @@
+import time
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx.error_codes import DAQmxErrors
+from tests.unit._grpc_utils import FakeNiDAQmxServicer, fake_grpc_server
+from tests.unit._task_utils import expect_ai_channels
+
+
+def _expect_read_analog_f64_ramp(interpreter: Mock) -> None:
+    samples_per_chan_read = 0
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        nonlocal samples_per_chan_read
+        read_array[...] = numpy.arange(
+            samples_per_chan_read, samples_per_chan_read + num_samps_per_chan
+        )
+        samples_per_chan_read += num_samps_per_chan
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def _wait_for(predicate, timeout=10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for condition."
+        time.sleep(0.001)
+
+
+def test___ai_task___stream_chunks___yields_consecutive_chunks(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64_ramp(interpreter)
+
+    with task.in_stream.stream_chunks(4) as chunks:
+        data = [next(chunks) for _ in range(3)]
+
+    assert [chunk.shape for chunk in data] == [(2, 4)] * 3
+    numpy.testing.assert_array_equal(numpy.concatenate(data, axis=1)[0], numpy.arange(12))
+    assert interpreter.read_analog_f64.call_args.args[2] == task.in_stream.timeout
+
+
+def test___ai_task___stream_chunks_without_consuming___reads_stop_when_queue_full(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp(interpreter)
+
+    with task.in_stream.stream_chunks(10, queue_depth=3) as chunks:
+        _wait_for(lambda: chunks.queued_chunks == 3)
+        time.sleep(0.1)
+
+        # Three chunks are queued and the fourth is waiting for space in the queue.
+        assert interpreter.read_analog_f64.call_count == 4
+        numpy.testing.assert_array_equal(next(chunks), numpy.arange(10))
+
+
+def test___read_error___iterate_chunk_stream___raises_error_and_closes_stream(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    interpreter.read_analog_f64.side_effect = nidaqmx.DaqError(
+        "Task stopped.", DAQmxErrors.INVALID_TASK
+    )
+
+    chunks = task.in_stream.stream_chunks(10)
+    with pytest.raises(nidaqmx.DaqError) as exc_info:
+        next(chunks)
+
+    assert exc_info.value.error_code == DAQmxErrors.INVALID_TASK
+    assert list(chunks) == []
+
+
+def test___closed_chunk_stream___iterate___stops_iteration(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp(interpreter)
+    chunks = task.in_stream.stream_chunks(10)
+
+    chunks.close()
+
+    assert list(chunks) == []
+
+
+def test___fake_grpc_server___stream_chunks___yields_consecutive_chunks():
+    servicer = FakeNiDAQmxServicer(["Dev1/ai0", "Dev1/ai1"], read_latency=0.001)
+    with fake_grpc_server(servicer) as grpc_options:
+        with Task(grpc_options=grpc_options) as task:
+            with task.in_stream.stream_chunks(1000) as chunks:
+                data = [next(chunks) for _ in range(5)]
+
+    samples = numpy.concatenate(data, axis=1)
+    numpy.testing.assert_array_equal(samples[0], numpy.arange(5000))
+    numpy.testing.assert_array_equal(samples[1], numpy.arange(5000))
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+from nidaqmx import Task
+from nidaqmx.constants import EveryNSamplesEventType
+from nidaqmx.event_dispatcher import EventDispatcher
+
+
+def _get_registered_callback(interpreter: Mock) -> Mock:
+    return interpreter.register_every_n_samples_event.call_args[0][4]
+
+
+def test___event_dispatcher___register_event___callback_runs_on_worker_thread(
+    task: Task, interpreter: Mock
+):
+    callback_thread_names = []
+    callback_done = threading.Event()
+
+    def _callback(task_handle, every_n_samples_event_type, number_of_samples, callback_data):
+        callback_thread_names.append(threading.current_thread().name)
+        callback_done.set()
+        return 0
+
+    with EventDispatcher() as dispatcher:
+        task.event_dispatcher = dispatcher
+        task.register_every_n_samples_acquired_into_buffer_event(100, _callback)
+        registered_callback = _get_registered_callback(interpreter)
+
+        assert registered_callback is not _callback
+        assert registered_callback(task._handle, 1, 100, None) == 0
+        assert callback_done.wait(10.0)
+
+    assert callback_thread_names[0].startswith("nidaqmx event dispatcher")
+    assert dispatcher.events_dispatched == 1
+    assert dispatcher.events_pending == 0
+
+
+def test___no_event_dispatcher___register_event___registers_callback_directly(
+    task: Task, interpreter: Mock
+):
+    callback = Mock()
+
+    task.register_every_n_samples_acquired_into_buffer_event(100, callback)
+
+    interpreter.register_every_n_samples_event.assert_called_once_with(
+        task._handle, EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value, 100, 0, callback, None
+    )
+
+
+def test___slow_callback___events_posted___callbacks_run_in_order(task: Task, interpreter: Mock):
+    release_callback = threading.Event()
+    number_of_samples_seen = []
+
+    def _callback(task_handle, every_n_samples_event_type, number_of_samples, callback_data):
+        release_callback.wait(10.0)
+        number_of_samples_seen.append(number_of_samples)
+        return 0
+
+    with EventDispatcher(max_workers=4) as dispatcher:
+        task.event_dispatcher = dispatcher
+        task.register_every_n_samples_acquired_into_buffer_event(100, _callback)
+        registered_callback = _get_registered_callback(interpreter)
+
+        for i in range(10):
+            registered_callback(task._handle, 1, i, None)
+        assert dispatcher.events_pending >= 9
+        release_callback.set()
+
+    assert number_of_samples_seen == list(range(10))
+    assert dispatcher.max_events_pending >= 9
+    assert dispatcher.max_latency >= dispatcher.mean_latency > 0.0
+
+
+def test___callback_raises___event_posted___dispatcher_keeps_running(task: Task, interpreter: Mock):
+    callback = Mock(side_effect=[RuntimeError("Callback failed."), 0])
+
+    with EventDispatcher() as dispatcher:
+        task.event_dispatcher = dispatcher
+        task.register_done_event(callback)
+        registered_callback = interpreter.register_done_event.call_args[0][2]
+        registered_callback(task._handle, 0, None)
+        registered_callback(task._handle, 0, None)
+
+    assert callback.call_count == 2
+    assert dispatcher.events_dispatched == 2
+
+
+def test___loop_event_dispatcher___event_posted___callback_runs_on_loop(
+    task: Task, interpreter: Mock
+):
+    async def _run():
+        loop = asyncio.get_running_loop()
+        callback_done = asyncio.Event()
+        callback_thread_ids = []
+
+        def _callback(task_handle, signal_type, callback_data):
+            callback_thread_ids.append(threading.get_ident())
+            callback_done.set()
+            return 0
+
+        dispatcher = EventDispatcher(loop=loop)
+        task.event_dispatcher = dispatcher
+        task.register_signal_event(Mock(value=1), _callback)
+        registered_callback = interpreter.register_signal_event.call_args[0][3]
+        threading.Thread(target=registered_callback, args=(task._handle, 1, None)).start()
+        await asyncio.wait_for(callback_done.wait(), 10.0)
+        dispatcher.close()
+        return callback_thread_ids == [threading.get_ident()]
+
+    assert asyncio.run(_run())
+
+
+def test___close_without_waiting___events_posted___pending_events_discarded(
+    task: Task, interpreter: Mock
+):
+    callback_started = threading.Event()
+    release_callback = threading.Event()
+    number_of_samples_seen = []
+
+    def _callback(task_handle, every_n_samples_event_type, number_of_samples, callback_data):
+        callback_started.set()
+        release_callback.wait(10.0)
+        number_of_samples_seen.append(number_of_samples)
+        return 0
+
+    dispatcher = EventDispatcher()
+    task.event_dispatcher = dispatcher
+    task.register_every_n_samples_acquired_into_buffer_event(100, _callback)
+    registered_callback = _get_registered_callback(interpreter)
+    registered_callback(task._handle, 1, 0, None)
+    assert callback_started.wait(10.0)
+    registered_callback(task._handle, 1, 1, None)
+
+    dispatcher.close(wait=False)
+    # Events that occur after close() are ignored instead of raising on the driver thread.
+    assert registered_callback(task._handle, 1, 2, None) == 0
+    release_callback.set()
+    dispatcher._executor.shutdown(wait=True)
+
+    assert number_of_samples_seen == [0]
+    assert dispatcher.events_pending == 0
+    assert dispatcher._queues == {}
+
+
+def test___closed_event_loop___event_posted___events_discarded(task: Task, interpreter: Mock):
+    loop = asyncio.new_event_loop()
+    loop.close()
+    callback = Mock()
+
+    with EventDispatcher(loop=loop) as dispatcher:
+        task.event_dispatcher = dispatcher
+        task.register_done_event(callback)
+        registered_callback = interpreter.register_done_event.call_args[0][2]
+
+        assert registered_callback(task._handle, 0, None) == 0
+
+    callback.assert_not_called()
+    assert dispatcher.events_pending == 0
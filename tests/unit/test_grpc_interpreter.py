@@ -0,0 +1,235 @@
+import threading
+from unittest.mock import Mock
+
+import numpy
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx.constants import FillMode
+from tests.unit._grpc_utils import create_grpc_options
+
+try:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from nidaqmx._stubs import session_pb2
+except ImportError:
+    GrpcStubInterpreter = None  # type: ignore
+    grpc_types = None  # type: ignore
+    session_pb2 = None  # type: ignore
+
+
+@pytest.fixture
+def grpc_interpreter(mocker: MockerFixture) -> "GrpcStubInterpreter":
+    """Create a GrpcStubInterpreter whose stub methods are mocks."""
+    grpc_options = create_grpc_options(mocker)
+    return GrpcStubInterpreter(grpc_options)
+
+
+@pytest.fixture
+def task_handle() -> "session_pb2.Session":
+    """Create a gRPC task handle."""
+    return session_pb2.Session(name="MyTask")
+
+
+def _get_request(stub_method: Mock):
+    return stub_method.call_args.args[0]
+
+
+def test___float64_array___write_analog_f64___request_contains_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    write_array = numpy.linspace(-10.0, 10.0, 1000).reshape(2, 500)
+
+    grpc_interpreter.write_analog_f64(
+        task_handle, 500, False, 10.0, FillMode.GROUP_BY_CHANNEL.value, write_array
+    )
+
+    request = _get_request(grpc_interpreter._client.WriteAnalogF64)
+    assert request.num_samps_per_chan == 500
+    assert request.data_layout_raw == FillMode.GROUP_BY_CHANNEL.value
+    numpy.testing.assert_array_equal(request.write_array, write_array.ravel())
+
+
+def test___non_contiguous_float64_array___write_analog_f64___request_contains_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    write_array = numpy.arange(12, dtype=numpy.float64).reshape(3, 4).T
+
+    grpc_interpreter.write_analog_f64(
+        task_handle, 3, False, 10.0, FillMode.GROUP_BY_CHANNEL.value, write_array
+    )
+
+    request = _get_request(grpc_interpreter._client.WriteAnalogF64)
+    numpy.testing.assert_array_equal(request.write_array, write_array.ravel())
+
+
+def test___empty_float64_array___write_analog_f64___request_contains_empty_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    grpc_interpreter.write_analog_f64(
+        task_handle, 0, False, 10.0, FillMode.GROUP_BY_CHANNEL.value, numpy.zeros(0)
+    )
+
+    request = _get_request(grpc_interpreter._client.WriteAnalogF64)
+    assert len(request.write_array) == 0
+
+
+def test___int16_array___write_binary_i16___request_contains_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    write_array = numpy.array([-32768, -1, 0, 1, 32767], dtype=numpy.int16)
+
+    grpc_interpreter.write_binary_i16(
+        task_handle, 5, False, 10.0, FillMode.GROUP_BY_CHANNEL.value, write_array
+    )
+
+    request = _get_request(grpc_interpreter._client.WriteBinaryI16)
+    assert list(request.write_array) == [-32768, -1, 0, 1, 32767]
+
+
+def test___ctr_time_arrays___write_ctr_time___request_contains_both_arrays(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    high_time = numpy.full(300, 0.001)
+    low_time = numpy.full(300, 0.002)
+
+    grpc_interpreter.write_ctr_time(
+        task_handle, 300, False, 10.0, FillMode.GROUP_BY_CHANNEL.value, high_time, low_time
+    )
+
+    request = _get_request(grpc_interpreter._client.WriteCtrTime)
+    numpy.testing.assert_array_equal(request.high_time, high_time)
+    numpy.testing.assert_array_equal(request.low_time, low_time)
+
+
+def test___uint32_arrays___write_ctr_ticks___request_contains_both_arrays(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    high_ticks = numpy.array([1, 2**31, 2**32 - 1], dtype=numpy.uint32)
+    low_ticks = numpy.array([4, 5, 6], dtype=numpy.uint32)
+
+    grpc_interpreter.write_ctr_ticks(
+        task_handle, 3, False, 10.0, FillMode.GROUP_BY_CHANNEL.value, high_ticks, low_ticks
+    )
+
+    request = _get_request(grpc_interpreter._client.WriteCtrTicks)
+    assert list(request.high_ticks) == [1, 2**31, 2**32 - 1]
+    assert list(request.low_ticks) == [4, 5, 6]
+
+
+def test___read_analog_f64___returns_response_array_in_caller_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    expected = numpy.linspace(-10.0, 10.0, 1000).reshape(2, 500)
+    grpc_interpreter._client.ReadAnalogF64.return_value = grpc_types.ReadAnalogF64Response(
+        read_array=expected.ravel().tolist(), samps_per_chan_read=500
+    )
+    read_array = numpy.zeros((2, 500))
+
+    data, samps_per_chan_read = grpc_interpreter.read_analog_f64(
+        task_handle, 500, 10.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+    )
+
+    assert data is read_array
+    assert samps_per_chan_read == 500
+    numpy.testing.assert_array_equal(read_array, expected)
+
+
+def test___partial_read___read_binary_i16___leaves_rest_of_caller_array_unchanged(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    grpc_interpreter._client.ReadBinaryI16.return_value = grpc_types.ReadBinaryI16Response(
+        read_array=[-32768, -1, 32767], samps_per_chan_read=3
+    )
+    read_array = numpy.full(5, 7, dtype=numpy.int16)
+
+    grpc_interpreter.read_binary_i16(
+        task_handle, 5, 10.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+    )
+
+    assert read_array.tolist() == [-32768, -1, 32767, 7, 7]
+
+
+def test___non_contiguous_array___read_analog_f64___returns_response_array_in_caller_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    grpc_interpreter._client.ReadAnalogF64.return_value = grpc_types.ReadAnalogF64Response(
+        read_array=[0.0, 1.0, 2.0, 3.0, 4.0, 5.0], samps_per_chan_read=3
+    )
+    read_array = numpy.zeros((3, 2)).T
+
+    grpc_interpreter.read_analog_f64(
+        task_handle, 3, 10.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+    )
+
+    assert read_array.tolist() == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+
+def test___read_power_f64___returns_response_arrays_in_caller_arrays(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    grpc_interpreter._client.ReadPowerF64.return_value = grpc_types.ReadPowerF64Response(
+        read_array_voltage=[1.0, 2.0], read_array_current=[0.5, 0.25], samps_per_chan_read=2
+    )
+    voltages = numpy.zeros(2)
+    currents = numpy.zeros(2)
+
+    grpc_interpreter.read_power_f64(
+        task_handle, 2, 10.0, FillMode.GROUP_BY_CHANNEL.value, voltages, currents
+    )
+
+    assert voltages.tolist() == [1.0, 2.0]
+    assert currents.tolist() == [0.5, 0.25]
+
+
+def test___multi_byte_array___read_raw___returns_response_bytes_in_caller_array(
+    grpc_interpreter: "GrpcStubInterpreter", task_handle: "session_pb2.Session"
+):
+    expected = numpy.array([-2, 1000, 3], dtype=numpy.int16)
+    grpc_interpreter._client.ReadRaw.return_value = grpc_types.ReadRawResponse(
+        read_array=expected.tobytes(), samps_read=3, num_bytes_per_samp=2
+    )
+    read_array = numpy.zeros(4, dtype=numpy.int16)
+
+    _, samps_read, num_bytes_per_samp = grpc_interpreter.read_raw(task_handle, 3, 10.0, read_array)
+
+    assert (samps_read, num_bytes_per_samp) == (3, 2)
+    assert read_array.tolist() == [-2, 1000, 3, 0]
+
+
+def test___multiple_funcs___call_concurrently___calls_overlap_and_results_in_order(
+    grpc_interpreter: "GrpcStubInterpreter",
+):
+    # Each call waits for all of the others, so the calls must overlap.
+    barrier = threading.Barrier(4, timeout=10.0)
+
+    def _make_func(i: int):
+        def _func():
+            barrier.wait()
+            return i
+
+        return _func
+
+    values = grpc_interpreter.call_concurrently([_make_func(i) for i in range(4)])
+
+    assert values == [0, 1, 2, 3]
+
+
+def test___call_concurrently_twice___close___pool_reused_and_shut_down(
+    grpc_interpreter: "GrpcStubInterpreter",
+):
+    thread_names = set()
+
+    def _func():
+        thread_names.add(threading.current_thread().name)
+
+    grpc_interpreter.call_concurrently([_func, _func])
+    executor = grpc_interpreter._executor
+    grpc_interpreter.call_concurrently([_func, _func])
+
+    assert grpc_interpreter._executor is executor
+    grpc_interpreter.close()
+    assert grpc_interpreter._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(_func)
+    assert all(name.startswith("nidaqmx concurrent call") for name in thread_names)
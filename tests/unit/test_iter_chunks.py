@@ -0,0 +1,155 @@
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx.constants import READ_ALL_AVAILABLE, AcquisitionType, TaskMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers import AnalogSingleChannelReader
+from tests.unit._task_utils import expect_ai_channels
+
+
+def _expect_read_analog_f64_ramp(interpreter: Mock) -> None:
+    samples_per_chan_read = 0
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        nonlocal samples_per_chan_read
+        read_array[...] = numpy.arange(
+            samples_per_chan_read, samples_per_chan_read + num_samps_per_chan
+        )
+        samples_per_chan_read += num_samps_per_chan
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def test___ai_task___iter_chunks___yields_chunks_in_reused_buffers(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64_ramp(interpreter)
+
+    chunks = []
+    for chunk in task.in_stream.iter_chunks(4, number_of_buffers=2):
+        chunks.append(chunk)
+        if len(chunks) == 3:
+            numpy.testing.assert_array_equal(chunks[1], [numpy.arange(4, 8)] * 2)
+            break
+
+    assert [chunk.shape for chunk in chunks] == [(2, 4)] * 3
+    assert numpy.shares_memory(chunks[0], chunks[2])
+    assert not numpy.shares_memory(chunks[0], chunks[1])
+    numpy.testing.assert_array_equal(chunks[2], [numpy.arange(8, 12)] * 2)
+
+
+def test___stop_task_in_loop___iter_chunks___iteration_ends(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp(interpreter)
+
+    chunks = []
+    for chunk in task.in_stream.iter_chunks(10, reader_cls=AnalogSingleChannelReader):
+        chunks.append(chunk.copy())
+        if len(chunks) == 2:
+            task.stop()
+
+    assert len(chunks) == 2
+    assert interpreter.read_analog_f64.call_count == 2
+    interpreter.stop_task.assert_called_once()
+
+
+def test___finite_acquisition_ends_with_partial_read___iter_chunks___yields_partial_chunk(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        if interpreter.read_analog_f64.call_count == 1:
+            read_array[...] = [numpy.arange(4), numpy.arange(10, 14)]
+            return read_array, num_samps_per_chan
+        # Each channel's samples start at the beginning of its row.
+        read_array[:, :2] = [[4, 5], [14, 15]]
+        raise nidaqmx.DaqReadError(
+            "Samples will never be available.", DAQmxErrors.SAMPLES_WILL_NEVER_BE_AVAILABLE, 2
+        )
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    chunks = [chunk.copy() for chunk in task.in_stream.iter_chunks(4)]
+
+    assert [chunk.shape for chunk in chunks] == [(2, 4), (2, 2)]
+    numpy.testing.assert_array_equal(chunks[1], [[4, 5], [14, 15]])
+
+
+def test___read_error___iter_chunks___raises_error(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    interpreter.read_analog_f64.side_effect = nidaqmx.DaqReadError(
+        "Timed out.", DAQmxErrors.OPERATION_TIMED_OUT, 0
+    )
+
+    with pytest.raises(nidaqmx.DaqReadError) as exc_info:
+        next(task.in_stream.iter_chunks(10))
+
+    assert exc_info.value.error_code == DAQmxErrors.OPERATION_TIMED_OUT
+
+
+def test___read_all_available___iter_chunks___reads_available_samples(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp(interpreter)
+    interpreter.get_timing_attribute_int32.return_value = AcquisitionType.CONTINUOUS.value
+    interpreter.get_read_attribute_uint32.side_effect = [3, 0, 5]
+
+    chunk_iterator = task.in_stream.iter_chunks(READ_ALL_AVAILABLE, number_of_buffers=1)
+    chunks = [next(chunk_iterator).copy() for _ in range(3)]
+
+    numpy.testing.assert_array_equal(chunks[0], [[0, 1, 2]])
+    # When no samples are available, wait for one.
+    numpy.testing.assert_array_equal(chunks[1], [[3]])
+    numpy.testing.assert_array_equal(chunks[2], [[4, 5, 6, 7, 8]])
+
+
+def test___invalid_number_of_buffers___iter_chunks___raises_before_iterating(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+
+    with pytest.raises(ValueError):
+        task.in_stream.iter_chunks(10, number_of_buffers=0)
+
+    interpreter.read_analog_f64.assert_not_called()
+
+
+def test___read_times_out_with_partial_read___iter_chunks___yields_partial_chunk_then_raises(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[:, :3] = [[1, 2, 3]]
+        raise nidaqmx.DaqReadError("Timed out.", DAQmxErrors.OPERATION_TIMED_OUT, 3)
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    chunk_iterator = task.in_stream.iter_chunks(10)
+    numpy.testing.assert_array_equal(next(chunk_iterator), [[1, 2, 3]])
+    with pytest.raises(nidaqmx.DaqReadError) as exc_info:
+        next(chunk_iterator)
+
+    assert exc_info.value.error_code == DAQmxErrors.OPERATION_TIMED_OUT
+
+
+@pytest.mark.parametrize("action", [TaskMode.TASK_STOP, TaskMode.TASK_ABORT])
+def test___control_task_in_loop___iter_chunks___iteration_ends(
+    task: Task, interpreter: Mock, action: TaskMode
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp(interpreter)
+
+    chunks = []
+    for chunk in task.in_stream.iter_chunks(10):
+        chunks.append(chunk.copy())
+        task.control(action)
+
+    assert len(chunks) == 1
+    interpreter.task_control.assert_called_once_with(task._handle, action.value)
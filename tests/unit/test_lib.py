@@ -0,0 +1,103 @@
+import ctypes
+import inspect
+import re
+
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx._lib import DaqFunctionImporter, DaqFunctionNotSupportedError
+
+
+def test___function_importer___get_function___function_has_arglock(mocker: MockerFixture):
+    library = mocker.Mock(spec=["DAQmxStartTask"])
+    importer = DaqFunctionImporter(library)
+
+    cfunc = importer.DAQmxStartTask
+
+    assert cfunc is library.DAQmxStartTask
+    assert cfunc.arglock is not None
+
+
+def test___function_imported___get_function_again___function_cached(mocker: MockerFixture):
+    library = mocker.Mock(spec=["DAQmxStartTask"])
+    importer = DaqFunctionImporter(library)
+    cfunc = importer.DAQmxStartTask
+    mocker.patch.object(
+        DaqFunctionImporter, "__getattr__", side_effect=AssertionError("cache miss")
+    )
+
+    assert importer.DAQmxStartTask is cfunc
+    assert importer.DAQmxStartTask.arglock is cfunc.arglock
+
+
+def test___unsupported_function___get_function___raises_function_not_supported_error(
+    mocker: MockerFixture,
+):
+    library = mocker.Mock(spec=[])
+    importer = DaqFunctionImporter(library)
+
+    with pytest.raises(DaqFunctionNotSupportedError):
+        _ = importer.DAQmxNotAFunction
+
+    assert "DAQmxNotAFunction" not in vars(importer)
+
+
+def test___function_with_argtypes___get_function___argtypes_and_restype_set(
+    mocker: MockerFixture,
+):
+    library = mocker.Mock(spec=["DAQmxStartTask"])
+    library.DAQmxStartTask.argtypes = None
+    importer = DaqFunctionImporter(library, {"DAQmxStartTask": lambda: [ctypes.c_void_p]})
+
+    cfunc = importer.DAQmxStartTask
+
+    assert cfunc.argtypes == [ctypes.c_void_p]
+    assert cfunc.restype is ctypes.c_int32
+
+
+def test___function_with_argtypes___get_function_twice___argtypes_evaluated_once(
+    mocker: MockerFixture,
+):
+    library = mocker.Mock(spec=["DAQmxStartTask"])
+    get_argtypes = mocker.Mock(return_value=[ctypes.c_void_p])
+    importer = DaqFunctionImporter(library, {"DAQmxStartTask": get_argtypes})
+
+    _ = importer.DAQmxStartTask
+    _ = importer.DAQmxStartTask
+
+    get_argtypes.assert_called_once_with()
+
+
+def test___function_without_argtypes___get_function___argtypes_not_set(mocker: MockerFixture):
+    library = mocker.Mock(spec=["DAQmxStartTask"])
+    library.DAQmxStartTask.argtypes = None
+    importer = DaqFunctionImporter(library, {"DAQmxStopTask": lambda: [ctypes.c_void_p]})
+
+    cfunc = importer.DAQmxStartTask
+
+    assert cfunc.argtypes is None
+
+
+def test___library_interpreter___get_function_names___all_fixed_argument_functions_have_argtypes():
+    import nidaqmx._library_interpreter
+
+    source = inspect.getsource(nidaqmx._library_interpreter)
+    function_names = set(re.findall(r"lib_importer\.(?:windll|cdll)\.(DAQmx\w+)", source))
+    # Variadic functions set their argument types on each call.
+    variadic_function_names = set(
+        re.findall(r"lib_importer\.cdll\.(DAQmx\w+)\n\s+with cfunc\.arglock:", source)
+    )
+
+    assert variadic_function_names
+    assert function_names - variadic_function_names <= set(
+        nidaqmx._library_interpreter._FUNCTION_ARGTYPES
+    )
+
+
+def test___library_interpreter_imported___get_registered_argtypes___table_registered():
+    import nidaqmx._library_interpreter
+    from nidaqmx._lib import lib_importer
+
+    function_argtypes = lib_importer._function_argtypes
+
+    assert function_argtypes.items() >= nidaqmx._library_interpreter._FUNCTION_ARGTYPES.items()
@@ -0,0 +1,69 @@
+import ctypes
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.error_codes import DAQmxWarnings
+
+
+@pytest.fixture
+def get_task_attribute(mocker: MockerFixture) -> Mock:
+    """Patch the DAQmxGetTaskAttribute function that the library interpreter calls."""
+    lib_importer = mocker.patch("nidaqmx._library_interpreter.lib_importer")
+    return lib_importer.cdll.DAQmxGetTaskAttribute
+
+
+def _expect_string(get_task_attribute: Mock, value: str) -> List[int]:
+    """Simulate a string attribute and return the buffer sizes passed to each call."""
+    encoded = value.encode("ascii")
+    buffer_sizes = []
+
+    def _get_task_attribute(task, attribute, buffer, buffer_size):
+        buffer_sizes.append(buffer_size)
+        if buffer_size == 0:
+            return len(encoded) + 1
+        ctypes.memmove(buffer, encoded, min(len(encoded), buffer_size - 1))
+        buffer[min(len(encoded), buffer_size - 1)] = b"\0"
+        if buffer_size <= len(encoded):
+            return DAQmxWarnings.CAPI_STRING_TRUNCATED_TO_FIT_BUFFER
+        return 0
+
+    get_task_attribute.side_effect = _get_task_attribute
+    return buffer_sizes
+
+
+def test___short_string___get_task_attribute_string___calls_function_once(
+    get_task_attribute: Mock,
+):
+    buffer_sizes = _expect_string(get_task_attribute, "Dev1/ai0,Dev1/ai1")
+
+    value = LibraryInterpreter().get_task_attribute_string(Mock(), 0x1273)
+
+    assert value == "Dev1/ai0,Dev1/ai1"
+    assert len(buffer_sizes) == 1
+
+
+def test___long_string___get_task_attribute_string___queries_size_and_returns_whole_string(
+    get_task_attribute: Mock,
+):
+    expected = ",".join(f"Dev1/ai{i}" for i in range(8000))
+    buffer_sizes = _expect_string(get_task_attribute, expected)
+
+    value = LibraryInterpreter().get_task_attribute_string(Mock(), 0x1273)
+
+    assert value == expected
+    assert buffer_sizes[1:] == [0, len(expected) + 1]
+
+
+def test___strings_of_different_lengths___get_task_attribute_string___returns_each_string(
+    get_task_attribute: Mock,
+):
+    interpreter = LibraryInterpreter()
+    values = ["Dev1/ai0,Dev1/ai1,Dev1/ai2", "x" * 5000, "Dev1/ai0", ""]
+
+    for expected in values:
+        _expect_string(get_task_attribute, expected)
+        assert interpreter.get_task_attribute_string(Mock(), 0x1273) == expected
@@ -0,0 +1,119 @@
+import pickle
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx.constants import ScaleType
+from nidaqmx.scale import Scale, SoftwareScale
+
+
+def _expect_scale_attributes(interpreter: Mock, scale_type: ScaleType, **attributes) -> None:
+    attribute_ids = {
+        "lin_slope": 0x1227,
+        "lin_y_intercept": 0x1228,
+        "poly_forward_coeff": 0x1234,
+        "poly_reverse_coeff": 0x1235,
+        "table_pre_scaled_vals": 0x1237,
+        "table_scaled_vals": 0x1236,
+    }
+    values = {attribute_ids[name]: value for name, value in attributes.items()}
+    interpreter.get_scale_attribute_int32.return_value = scale_type.value
+    interpreter.get_scale_attribute_double.side_effect = lambda name, attribute: values[attribute]
+    interpreter.get_scale_attribute_double_array.side_effect = lambda name, attribute: values[
+        attribute
+    ]
+
+
+def test___linear_scale___apply_twice___attributes_read_once(interpreter: Mock):
+    _expect_scale_attributes(interpreter, ScaleType.LINEAR, lin_slope=2.0, lin_y_intercept=1.0)
+    scale = Scale("MyScale")
+
+    scale.apply([0.0, 1.0])
+    scaled = scale.apply(numpy.array([[0.0, 1.0], [2.0, 3.0]]))
+
+    numpy.testing.assert_allclose(scaled, [[1.0, 3.0], [5.0, 7.0]])
+    numpy.testing.assert_allclose(scale.apply_inverse([1.0, 7.0]), [0.0, 3.0])
+    interpreter.get_scale_attribute_int32.assert_called_once()
+    assert interpreter.get_scale_attribute_double.call_count == 2
+
+
+def test___polynomial_scale___apply___evaluates_forward_and_reverse_polynomials(
+    interpreter: Mock,
+):
+    _expect_scale_attributes(
+        interpreter,
+        ScaleType.POLYNOMIAL,
+        poly_forward_coeff=[1.0, 2.0, 3.0],
+        poly_reverse_coeff=[0.0, 0.5],
+    )
+    scale = Scale("MyScale")
+
+    numpy.testing.assert_allclose(scale.apply(numpy.arange(3)), [1.0, 6.0, 17.0])
+    numpy.testing.assert_allclose(scale.apply_inverse([2.0, 4.0]), [1.0, 2.0])
+
+
+def test___table_scale___apply___interpolates_and_coerces(interpreter: Mock):
+    _expect_scale_attributes(
+        interpreter,
+        ScaleType.TABLE,
+        table_pre_scaled_vals=[0.0, 1.0, 2.0],
+        table_scaled_vals=[0.0, 10.0, 40.0],
+    )
+    scale = Scale("MyScale")
+
+    numpy.testing.assert_allclose(scale.apply([-1.0, 0.5, 1.5, 3.0]), [0.0, 5.0, 25.0, 40.0])
+    numpy.testing.assert_allclose(scale.apply_inverse([5.0, 25.0]), [0.5, 1.5])
+
+
+def test___map_ranges_software_scale___apply___coerces_to_scaled_range():
+    software_scale = SoftwareScale.map_ranges(-10.0, 10.0, 0.0, 100.0)
+
+    numpy.testing.assert_allclose(software_scale.apply([-20.0, 0.0, 5.0]), [0.0, 50.0, 75.0])
+    numpy.testing.assert_allclose(software_scale.apply_inverse([50.0, 100.0]), [0.0, 10.0])
+
+
+def test___software_scale___pickle___scales_without_driver(interpreter: Mock):
+    _expect_scale_attributes(interpreter, ScaleType.LINEAR, lin_slope=2.0, lin_y_intercept=1.0)
+    software_scale = Scale("MyScale").to_software_scale()
+
+    unpickled_scale = pickle.loads(pickle.dumps(software_scale))
+
+    assert unpickled_scale.scale_type == ScaleType.LINEAR
+    numpy.testing.assert_allclose(unpickled_scale.apply([1.0]), [3.0])
+
+
+def test___scale_without_software_support___apply___raises_value_error(interpreter: Mock):
+    interpreter.get_scale_attribute_int32.return_value = ScaleType.NONE.value
+
+    with pytest.raises(ValueError):
+        Scale("MyScale").apply([1.0])
+
+
+def test___linear_scale___set_lin_slope___apply_uses_new_slope(interpreter: Mock):
+    _expect_scale_attributes(interpreter, ScaleType.LINEAR, lin_slope=2.0, lin_y_intercept=1.0)
+    scale = Scale("MyScale")
+    numpy.testing.assert_allclose(scale.apply([1.0]), [3.0])
+
+    scale.lin_slope = 4.0
+    _expect_scale_attributes(interpreter, ScaleType.LINEAR, lin_slope=4.0, lin_y_intercept=1.0)
+
+    numpy.testing.assert_allclose(scale.apply([1.0]), [5.0])
+    interpreter.set_scale_attribute_double.assert_called_once_with("MyScale", 0x1227, 4.0)
+
+
+def test___zero_slope___linear_software_scale___raises_value_error():
+    with pytest.raises(ValueError):
+        SoftwareScale.linear(0.0, 1.0)
+
+
+def test___value_outside_table___table_scale_apply_inverse___raises_value_error():
+    software_scale = SoftwareScale.table([0.0, 1.0, 2.0], [0.0, 10.0, 40.0])
+
+    with pytest.raises(ValueError):
+        software_scale.apply_inverse([5.0, 50.0])
+
+
+def test___no_reverse_coeffs___polynomial_software_scale___raises_value_error():
+    with pytest.raises(ValueError):
+        SoftwareScale.polynomial([0.0, 2.0], [])
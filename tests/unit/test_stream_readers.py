@@ -0,0 +1,223 @@
+from typing import Dict, List
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx.constants import FillMode
+from nidaqmx.stream_readers import (
+    AnalogMultiChannelReader,
+    AnalogUnscaledReader,
+    RingBufferReader,
+    scale_raw,
+)
+from tests.unit._task_utils import expect_ai_channels
+
+
+def _expect_read_analog_f64(interpreter: Mock) -> None:
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array.fill(1.0)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def test___analog_multi_channel_reader___read_twice___channels_to_read_queried_once(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64(interpreter)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    reader.read_many_sample(data, 10)
+    reader.read_many_sample(data, 10)
+
+    assert interpreter.read_analog_f64.call_count == 2
+    interpreter.get_read_attribute_string.assert_called_once()
+
+
+def test___analog_multi_channel_reader___read_wrong_shape___raises_daq_error(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    reader = AnalogMultiChannelReader(task.in_stream)
+    data = numpy.zeros((3, 10), dtype=numpy.float64)
+
+    with pytest.raises(nidaqmx.DaqError) as exc_info:
+        reader.read_many_sample(data, 10)
+
+    assert "(2, 10)" in exc_info.value.args[0]
+    interpreter.read_analog_f64.assert_not_called()
+
+
+def test___analog_multi_channel_reader___set_channels_to_read___new_shape_verified(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64(interpreter)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    reader.read_many_sample(numpy.zeros((2, 10), dtype=numpy.float64), 10)
+
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    task.in_stream.channels_to_read = task.ai_channels["Dev1/ai0"]
+    reader.read_many_sample(numpy.zeros((1, 10), dtype=numpy.float64), 10)
+
+    with pytest.raises(nidaqmx.DaqError):
+        reader.read_many_sample(numpy.zeros((2, 10), dtype=numpy.float64), 10)
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def _expect_read_analog_f64_ramp_by_scan(interpreter: Mock, number_of_channels: int) -> None:
+    samples_per_chan_read = 0
+
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        nonlocal samples_per_chan_read
+        assert fill_mode == FillMode.GROUP_BY_SCAN_NUMBER.value
+        ramp = numpy.arange(samples_per_chan_read, samples_per_chan_read + num_samps_per_chan)
+        read_array[...] = numpy.repeat(ramp, number_of_channels).reshape(read_array.shape)
+        samples_per_chan_read += num_samps_per_chan
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def test___ring_buffer_reader___read___reads_into_ring_buffer_without_copy(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64_ramp_by_scan(interpreter, 2)
+    reader = RingBufferReader(task.in_stream, buffer_size=20, samples_per_read=5)
+
+    reader.read()
+
+    read_array = interpreter.read_analog_f64.call_args.args[4]
+    assert read_array.shape == (5, 2)
+    assert numpy.shares_memory(read_array, reader._buffer)
+    assert reader.total_samples_read == 5
+
+
+def test___ring_buffer_reader___get_latest___returns_view_of_latest_samples(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64_ramp_by_scan(interpreter, 2)
+    reader = RingBufferReader(task.in_stream, buffer_size=20, samples_per_read=5)
+    for _ in range(3):
+        reader.read()
+
+    window = reader.get_latest(8)
+
+    assert window.shape == (2, 8)
+    numpy.testing.assert_array_equal(window, [numpy.arange(7, 15)] * 2)
+    assert numpy.shares_memory(window, reader._buffer)
+    assert not window.flags.writeable
+
+
+def test___ring_buffer_reader___wrap_around___get_latest_returns_samples_in_order(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp_by_scan(interpreter, 1)
+    reader = RingBufferReader(task.in_stream, buffer_size=20, samples_per_read=5)
+    for _ in range(5):
+        reader.read()
+
+    numpy.testing.assert_array_equal(reader.get_latest(15), [numpy.arange(10, 25)])
+    numpy.testing.assert_array_equal(reader.get_latest(5), [numpy.arange(20, 25)])
+
+
+def test___ring_buffer_reader___get_latest_too_many_samples___raises_value_error(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    reader = RingBufferReader(task.in_stream, buffer_size=20, samples_per_read=5)
+
+    with pytest.raises(ValueError):
+        reader.get_latest(16)
+
+
+def _expect_ai_dev_scaling_coeffs(interpreter: Mock, coeffs: Dict[str, List[float]]) -> None:
+    interpreter.get_chan_attribute_double_array.side_effect = lambda task, channel, attribute: (
+        coeffs[channel]
+    )
+
+
+def test___scaling_coeffs___scale_raw___applies_polynomial_per_channel():
+    raw = numpy.array([[0, 1, 2], [0, 1, 2]], dtype=numpy.int16)
+
+    scaled = scale_raw(raw, [[0.5, 2.0], [1.0, 0.0, 3.0]])
+
+    numpy.testing.assert_allclose(scaled, [[0.5, 2.5, 4.5], [1.0, 4.0, 13.0]])
+
+
+def test___interleaved_raw___scale_raw___deinterleaves_samples():
+    raw = numpy.array([0, 10, 1, 11, 2, 12], dtype=numpy.int16)
+
+    scaled = scale_raw(raw, [[0.0, 1.0], [0.0, 2.0]], interleaved=True)
+
+    numpy.testing.assert_allclose(scaled, [[0, 1, 2], [20, 22, 24]])
+
+
+def test___analog_unscaled_reader___read_and_scale_twice___coefficients_queried_once(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_ai_dev_scaling_coeffs(interpreter, {"Dev1/ai0": [0.0, 0.5], "Dev1/ai1": [1.0, 2.0]})
+
+    def _read_binary_i16(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[...] = numpy.arange(num_samps_per_chan)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_binary_i16.side_effect = _read_binary_i16
+    reader = AnalogUnscaledReader(task.in_stream)
+    data = numpy.zeros((2, 4), dtype=numpy.int16)
+
+    reader.read_and_scale(data, 4)
+    scaled = reader.read_and_scale(data, 4)
+
+    numpy.testing.assert_allclose(scaled, [[0.0, 0.5, 1.0, 1.5], [1.0, 3.0, 5.0, 7.0]])
+    assert interpreter.get_chan_attribute_double_array.call_count == 2
+
+
+def test___no_channels___scale_raw___raises_value_error():
+    with pytest.raises(ValueError):
+        scale_raw(numpy.zeros(4, dtype=numpy.int16), [])
+
+
+def test___task_restarted___get_scaling_coeffs___coefficients_queried_again(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_ai_dev_scaling_coeffs(interpreter, {"Dev1/ai0": [0.0, 0.5]})
+    reader = AnalogUnscaledReader(task.in_stream)
+    assert reader.scaling_coeffs == [[0.0, 0.5]]
+
+    # Changing the range changes the coefficients, which take effect when the task starts.
+    _expect_ai_dev_scaling_coeffs(interpreter, {"Dev1/ai0": [0.0, 0.25]})
+    task.start()
+
+    assert reader.scaling_coeffs == [[0.0, 0.25]]
+    assert interpreter.get_chan_attribute_double_array.call_count == 2
+
+
+def test___ring_buffer_reader___partial_read_times_out___samples_read_kept(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64_ramp_by_scan(interpreter, 1)
+    reader = RingBufferReader(task.in_stream, buffer_size=20, samples_per_read=5)
+    reader.read()
+
+    def _read_analog_f64_timeout(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[:3] = [[5], [6], [7]]
+        raise nidaqmx.errors.DaqReadError("Timeout", -200284, 3)
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64_timeout
+    with pytest.raises(nidaqmx.errors.DaqReadError):
+        reader.read()
+
+    assert reader.total_samples_read == 8
+    numpy.testing.assert_array_equal(reader.get_latest(8), [numpy.arange(8)])
@@ -0,0 +1,192 @@
+from typing import List
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx.constants import ChannelType, RegenerationMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_writers import AnalogMultiChannelWriter, StreamingOutputWriter
+from nidaqmx.utils import flatten_channel_string
+
+
+def _expect_ao_channels(interpreter: Mock, channel_names: List[str]) -> None:
+    task_attributes = {0x1276: "MyTask", 0x1273: flatten_channel_string(channel_names)}
+    interpreter.get_task_attribute_string.side_effect = lambda task, attr: task_attributes[attr]
+    interpreter.get_chan_attribute_int32.return_value = ChannelType.ANALOG_OUTPUT.value
+
+
+def _get_channels_queries(interpreter: Mock) -> int:
+    return sum(
+        1 for call in interpreter.get_task_attribute_string.call_args_list if call.args[1] == 0x1273
+    )
+
+
+def test___analog_multi_channel_writer___write_twice___channels_queried_once(
+    task: Task, interpreter: Mock
+):
+    _expect_ao_channels(interpreter, ["Dev1/ao0", "Dev1/ao1"])
+    interpreter.write_analog_f64.return_value = 10
+    writer = AnalogMultiChannelWriter(task.out_stream)
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    writer.write_many_sample(data)
+    writer.write_many_sample(data)
+
+    assert interpreter.write_analog_f64.call_count == 2
+    assert _get_channels_queries(interpreter) == 1
+
+
+def test___analog_multi_channel_writer___add_channel___new_shape_verified(
+    task: Task, interpreter: Mock
+):
+    _expect_ao_channels(interpreter, ["Dev1/ao0"])
+    interpreter.write_analog_f64.return_value = 10
+    writer = AnalogMultiChannelWriter(task.out_stream)
+    writer.write_many_sample(numpy.zeros((1, 10), dtype=numpy.float64))
+
+    _expect_ao_channels(interpreter, ["Dev1/ao0", "Dev1/ao1"])
+    task.ao_channels.add_ao_voltage_chan("Dev1/ao1")
+
+    with pytest.raises(nidaqmx.DaqError) as exc_info:
+        writer.write_many_sample(numpy.zeros((1, 10), dtype=numpy.float64))
+    assert "Number of Channels in Task: 2" in exc_info.value.args[0]
+    writer.write_many_sample(numpy.zeros((2, 10), dtype=numpy.float64))
+    assert _get_channels_queries(interpreter) == 2
+
+
+def _expect_streaming_output(
+    interpreter: Mock, output_buf_size: int, space_avail: List[int]
+) -> List[numpy.ndarray]:
+    written = []
+
+    def _write_analog_f64(task, num_samps_per_chan, auto_start, timeout, data_layout, data):
+        written.append(data.copy())
+        return num_samps_per_chan
+
+    interpreter.write_analog_f64.side_effect = _write_analog_f64
+    interpreter.get_buffer_attribute_uint32.return_value = output_buf_size
+    interpreter.get_write_attribute_uint32.side_effect = space_avail
+    return written
+
+
+def _get_samples_transferred_callback(interpreter: Mock):
+    return interpreter.register_every_n_samples_event.call_args.args[4]
+
+
+def _ramp_producer(number_of_chunks: int):
+    chunks_produced = 0
+
+    def _fill(data):
+        nonlocal chunks_produced
+        if chunks_produced == number_of_chunks:
+            return 0
+        data[...] = numpy.arange(chunks_produced * 10, (chunks_produced + 1) * 10)
+        chunks_produced += 1
+        return 10
+
+    return _fill
+
+
+def test___streaming_output_writer___start___primes_buffer_and_starts_task(
+    task: Task, interpreter: Mock
+):
+    _expect_ao_channels(interpreter, ["Dev1/ao0", "Dev1/ao1"])
+    written = _expect_streaming_output(interpreter, output_buf_size=30, space_avail=[])
+    writer = StreamingOutputWriter(task.out_stream, 10, _ramp_producer(100))
+
+    writer.start()
+
+    interpreter.set_write_attribute_int32.assert_called_once_with(
+        task._handle, 0x1453, RegenerationMode.DONT_ALLOW_REGENERATION.value
+    )
+    assert [data.shape for data in written] == [(2, 10)] * 3
+    numpy.testing.assert_array_equal(written[2], [numpy.arange(20, 30)] * 2)
+    assert interpreter.register_every_n_samples_event.call_args.args[2] == 10
+    interpreter.start_task.assert_called_once_with(task._handle)
+    assert writer.total_samples_written == 30
+
+
+def test___streaming_output_writer___samples_transferred___tops_up_buffer(
+    task: Task, interpreter: Mock
+):
+    _expect_ao_channels(interpreter, ["Dev1/ao0"])
+    written = _expect_streaming_output(interpreter, output_buf_size=30, space_avail=[20, 10])
+    writer = StreamingOutputWriter(task.out_stream, 10, _ramp_producer(100))
+    writer.start()
+    callback = _get_samples_transferred_callback(interpreter)
+
+    callback(task._handle, 2, 10, None)
+    callback(task._handle, 2, 10, None)
+
+    assert len(written) == 6
+    numpy.testing.assert_array_equal(written[5], [numpy.arange(50, 60)])
+    assert writer.last_samples_in_buffer == 20
+    assert writer.min_samples_in_buffer == 10
+
+
+def test___iterable_producer_exhausted___samples_transferred___stops_writing(
+    task: Task, interpreter: Mock
+):
+    _expect_ao_channels(interpreter, ["Dev1/ao0"])
+    written = _expect_streaming_output(interpreter, output_buf_size=20, space_avail=[20])
+    chunks = [numpy.full((1, 10), float(i)) for i in range(3)]
+    writer = StreamingOutputWriter(task.out_stream, 10, chunks)
+    writer.start()
+
+    _get_samples_transferred_callback(interpreter)(task._handle, 2, 10, None)
+
+    assert len(written) == 3
+    assert writer.is_done
+
+
+def test___write_error_while_streaming___stop___raises_error(task: Task, interpreter: Mock):
+    _expect_ao_channels(interpreter, ["Dev1/ao0"])
+    _expect_streaming_output(interpreter, output_buf_size=10, space_avail=[10])
+    writer = StreamingOutputWriter(task.out_stream, 10, _ramp_producer(100))
+    writer.start()
+    interpreter.write_analog_f64.side_effect = nidaqmx.DaqWriteError(
+        "Underflow.", DAQmxErrors.UNKNOWN, 0
+    )
+
+    _get_samples_transferred_callback(interpreter)(task._handle, 2, 10, None)
+
+    assert writer.is_done
+    with pytest.raises(nidaqmx.DaqWriteError):
+        writer.stop()
+    interpreter.stop_task.assert_called_once_with(task._handle)
+    interpreter.unregister_every_n_samples_event.assert_called_once()
+
+
+def test___output_buffer_size_not_set___start___raises_error(task: Task, interpreter: Mock):
+    _expect_ao_channels(interpreter, ["Dev1/ao0"])
+    written = _expect_streaming_output(interpreter, output_buf_size=0, space_avail=[])
+    writer = StreamingOutputWriter(task.out_stream, 10, _ramp_producer(100))
+
+    with pytest.raises(nidaqmx.DaqError):
+        writer.start()
+
+    assert written == []
+    interpreter.start_task.assert_not_called()
+
+
+def test___iterable_producer_with_larger_chunks___samples_transferred___writes_chunks_that_fit(
+    task: Task, interpreter: Mock
+):
+    _expect_ao_channels(interpreter, ["Dev1/ao0"])
+    written = _expect_streaming_output(interpreter, output_buf_size=40, space_avail=[20, 30])
+    chunks = [numpy.full((1, 15), float(i)) for i in range(5)]
+    writer = StreamingOutputWriter(task.out_stream, 10, chunks)
+    writer.start()
+    assert len(written) == 2
+
+    callback = _get_samples_transferred_callback(interpreter)
+    callback(task._handle, 2, 10, None)
+    assert len(written) == 3
+    callback(task._handle, 2, 10, None)
+
+    assert len(written) == 5
+    assert writer.is_done
+    numpy.testing.assert_array_equal(written[4], chunks[4])
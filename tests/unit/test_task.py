@@ -124,6 +124,16 @@ def test___varying_close_on_exit___close___clear_task_called(
     interpreter.clear_task.assert_called_with(task_handle)
 
 
+def test___task___close___interpreter_closed(interpreter: Mock):
+    expect_create_task(interpreter, "MyTaskHandle")
+    expect_get_task_name(interpreter, "MyTask")
+    task = Task("MyTask")
+
+    task.close()
+
+    interpreter.close.assert_called_once_with()
+
+
 def test___close_on_exit___context_manager___clear_task_called(interpreter: Mock):
     expect_create_task(interpreter, "MyTaskHandle", new_session_initialized=True)
     expect_get_task_name(interpreter, "MyTask")
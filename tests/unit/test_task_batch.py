@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx._task_modules.channels.ai_channel import AIChannel
+from nidaqmx.error_codes import DAQmxErrors
+from tests.unit._grpc_utils import FakeNiDAQmxServicer, fake_grpc_server
+
+AI_MAX = 0x17DD
+AI_MIN = 0x17DE
+SAMP_CLK_RATE = 0x1344
+
+
+def _get_ai_channels(task: Task, channel_names):
+    return [AIChannel(task._handle, name, task._interpreter) for name in channel_names]
+
+
+def test___batch___set_channel_properties___setters_for_different_channels_overlap():
+    channel_names = [f"Dev1/ai{i}" for i in range(8)]
+    servicer = FakeNiDAQmxServicer(channel_names, set_latency=0.05)
+    with fake_grpc_server(servicer) as grpc_options:
+        with Task(grpc_options=grpc_options) as task:
+            channels = _get_ai_channels(task, channel_names)
+
+            start_time = time.monotonic()
+            with task.batch():
+                for channel in channels:
+                    channel.ai_max = 5.0
+                    channel.ai_min = -5.0
+                task.timing.samp_clk_rate = 1000.0
+            elapsed_time = time.monotonic() - start_time
+
+    # Sending the 17 setters one at a time takes at least 0.85 seconds.
+    assert elapsed_time < 0.5
+    assert len(servicer.attributes_set) == 17
+    assert ("", SAMP_CLK_RATE, 1000.0) in servicer.attributes_set
+    for channel_name in channel_names:
+        channel_attributes = [a for a in servicer.attributes_set if a[0] == channel_name]
+        assert channel_attributes == [(channel_name, AI_MAX, 5.0), (channel_name, AI_MIN, -5.0)]
+
+
+def test___batch___get_channel_property___waits_for_batched_setters():
+    servicer = FakeNiDAQmxServicer(["Dev1/ai0"], set_latency=0.05)
+    with fake_grpc_server(servicer) as grpc_options:
+        with Task(grpc_options=grpc_options) as task:
+            (channel,) = _get_ai_channels(task, ["Dev1/ai0"])
+
+            with task.batch():
+                channel.ai_max = 2.5
+                value = channel.ai_max
+
+    assert value == 2.5
+
+
+def test___batch___get_attributes___waits_for_batched_setters():
+    servicer = FakeNiDAQmxServicer(["Dev1/ai0", "Dev1/ai1"], set_latency=0.05)
+    with fake_grpc_server(servicer) as grpc_options:
+        with Task(grpc_options=grpc_options) as task:
+            channels = _get_ai_channels(task, ["Dev1/ai0", "Dev1/ai1"])
+            channel = AIChannel(task._handle, "Dev1/ai0:1", task._interpreter)
+
+            with task.batch():
+                channels[0].ai_max = 2.5
+                channels[1].ai_max = 5.0
+                values = channel.get_attributes(["ai_max"])
+
+    assert values == {"ai_max": [2.5, 5.0]}
+
+
+def test___batched_setter_fails___exit_batch___raises_first_error_and_skips_later_setters():
+    servicer = FakeNiDAQmxServicer(["Dev1/ai0", "Dev1/ai1"], set_latency=0.01)
+    servicer.attribute_set_errors[AI_MAX] = DAQmxErrors.INVALID_ATTRIBUTE_VALUE
+    with fake_grpc_server(servicer) as grpc_options:
+        with Task(grpc_options=grpc_options) as task:
+            channels = _get_ai_channels(task, ["Dev1/ai0", "Dev1/ai1"])
+
+            with pytest.raises(nidaqmx.DaqError) as exc_info:
+                with task.batch():
+                    channels[0].ai_min = -5.0
+                    channels[0].ai_max = 5.0
+                    channels[0].ai_min = -1.0
+                    channels[1].ai_min = -2.0
+
+    assert exc_info.value.error_code == DAQmxErrors.INVALID_ATTRIBUTE_VALUE
+    assert "Channel: Dev1/ai0" in str(exc_info.value)
+    assert ("Dev1/ai0", AI_MIN, -5.0) in servicer.attributes_set
+    assert ("Dev1/ai0", AI_MIN, -1.0) not in servicer.attributes_set
+    assert ("Dev1/ai1", AI_MIN, -2.0) in servicer.attributes_set
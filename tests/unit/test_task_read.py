@@ -0,0 +1,235 @@
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import Task
+from nidaqmx.constants import ChannelType, UsageTypeAI, UsageTypeCI
+from nidaqmx.types import CtrFreq, PowerMeasurement
+from tests.unit._task_utils import expect_ai_channels
+
+
+def _expect_ci_channel(interpreter: Mock, channel_name: str, meas_type: UsageTypeCI) -> None:
+    interpreter.get_read_attribute_string.return_value = channel_name
+    chan_attributes = {0x187F: ChannelType.COUNTER_INPUT.value, 0x18A0: meas_type.value}
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task, channel, attribute: chan_attributes[attribute]
+    )
+
+
+def _expect_read_analog_f64(interpreter: Mock, value: float) -> None:
+    def _read_analog_f64(task, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array.fill(value)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def test___ai_task___read_twice___read_plan_created_once(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64(interpreter, 1.5)
+
+    first = task.read()
+    chan_attribute_call_count = interpreter.get_chan_attribute_int32.call_count
+    second = task.read()
+
+    assert first == second == [1.5, 1.5]
+    assert interpreter.read_analog_f64.call_count == 2
+    interpreter.get_read_attribute_string.assert_called_once()
+    assert interpreter.get_chan_attribute_int32.call_count == chan_attribute_call_count
+
+
+def test___ai_task___read_many_samples___returns_list_of_lists(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64(interpreter, 2.0)
+
+    data = task.read(number_of_samples_per_channel=3)
+
+    assert data == [[2.0, 2.0, 2.0], [2.0, 2.0, 2.0]]
+    args = interpreter.read_analog_f64.call_args.args
+    assert args[1] == 3
+    assert args[4].shape == (2, 3)
+
+
+def test___read_plan_created___set_channels_to_read___read_plan_recreated(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64(interpreter, 1.0)
+    _ = task.read()
+    channel = task.in_stream.channels_to_read
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+
+    task.in_stream.channels_to_read = channel
+    data = task.read()
+
+    assert data == 1.0
+    assert task._read_plan.number_of_channels == 1
+
+
+def test___read_plan_created___reset_channels_to_read___read_plan_invalidated(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64(interpreter, 1.0)
+    _ = task.read()
+
+    del task.in_stream.channels_to_read
+
+    assert task._read_plan is None
+
+
+def test___read_plan_created___add_channel___read_plan_recreated(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64(interpreter, 3.0)
+    _ = task.read()
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+
+    task.ai_channels.add_ai_voltage_chan("Dev1/ai1")
+    data = task.read()
+
+    assert data == [3.0, 3.0]
+    interpreter.create_ai_voltage_chan.assert_called_once()
+
+
+@pytest.mark.parametrize("meas_type", [UsageTypeAI.VOLTAGE, UsageTypeAI.POWER])
+def test___ai_task___create_read_plan___detects_power_channels(
+    task: Task, interpreter: Mock, meas_type: UsageTypeAI
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"], meas_type)
+
+    read_plan = task._get_read_plan()
+
+    assert read_plan.read_chan_type == ChannelType.ANALOG_INPUT
+    assert read_plan.has_power_chan == (meas_type == UsageTypeAI.POWER)
+    assert read_plan.di_num_booleans_per_chan is None
+    assert read_plan.ci_meas_type is None
+
+
+def test___ai_task___read_partial___returns_samples_read(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    interpreter.read_analog_f64.return_value = (None, 2)
+
+    data = task.read(number_of_samples_per_channel=5)
+
+    assert data == [0.0, 0.0]
+
+
+def test___ai_task___read_as_numpy___returns_filled_array(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    _expect_read_analog_f64(interpreter, 4.0)
+
+    data = task.read(number_of_samples_per_channel=3, as_numpy=True)
+
+    assert isinstance(data, numpy.ndarray)
+    assert data.shape == (2, 3)
+    assert data is interpreter.read_analog_f64.call_args.args[4]
+    numpy.testing.assert_array_equal(data, numpy.full((2, 3), 4.0))
+
+
+def test___ai_task___read_single_sample_as_numpy___returns_numpy_scalar(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0"])
+    _expect_read_analog_f64(interpreter, 5.0)
+
+    data = task.read(as_numpy=True)
+
+    assert isinstance(data, numpy.float64)
+    assert data == 5.0
+
+
+def test___ai_task___read_partial_as_numpy___returns_view(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    interpreter.read_analog_f64.return_value = (None, 2)
+
+    data = task.read(number_of_samples_per_channel=5, as_numpy=True)
+
+    assert data.shape == (2, 2)
+    assert data.base is interpreter.read_analog_f64.call_args.args[4]
+
+
+def _expect_read_power_f64(interpreter: Mock, voltage: float, current: float) -> None:
+    def _read_power_f64(task, num_samps_per_chan, timeout, fill_mode, voltages, currents):
+        voltages.fill(voltage)
+        currents.fill(current)
+        return voltages, currents, num_samps_per_chan
+
+    interpreter.read_power_f64.side_effect = _read_power_f64
+
+
+def _expect_read_ctr_freq(interpreter: Mock, freq: float, duty_cycle: float) -> None:
+    def _read_ctr_freq(task, num_samps_per_chan, timeout, fill_mode, freqs, duty_cycles):
+        freqs.fill(freq)
+        duty_cycles.fill(duty_cycle)
+        return freqs, duty_cycles, num_samps_per_chan
+
+    interpreter.read_ctr_freq.side_effect = _read_ctr_freq
+
+
+def test___power_task___read_as_numpy___returns_structured_array(task: Task, interpreter: Mock):
+    expect_ai_channels(interpreter, ["Dev1/power0", "Dev1/power1"], UsageTypeAI.POWER)
+    _expect_read_power_f64(interpreter, 1.0, 0.5)
+
+    data = task.read(number_of_samples_per_channel=4, as_numpy=True)
+
+    assert data.shape == (2, 4)
+    assert data.dtype.names == PowerMeasurement._fields
+    numpy.testing.assert_array_equal(data["voltage"], numpy.full((2, 4), 1.0))
+    numpy.testing.assert_array_equal(data["current"], numpy.full((2, 4), 0.5))
+
+
+def test___power_task___read_single_sample_as_numpy___returns_namedtuple(
+    task: Task, interpreter: Mock
+):
+    expect_ai_channels(interpreter, ["Dev1/power0"], UsageTypeAI.POWER)
+    _expect_read_power_f64(interpreter, 1.0, 0.5)
+
+    data = task.read(as_numpy=True)
+
+    assert data == PowerMeasurement(voltage=1.0, current=0.5)
+
+
+def test___ctr_freq_task___read_as_numpy___returns_structured_array(task: Task, interpreter: Mock):
+    _expect_ci_channel(interpreter, "Dev1/ctr0", UsageTypeCI.PULSE_FREQ)
+    _expect_read_ctr_freq(interpreter, 1000.0, 0.25)
+
+    data = task.read(number_of_samples_per_channel=3, as_numpy=True)
+
+    assert data.shape == (3,)
+    assert data.dtype.names == CtrFreq._fields
+    numpy.testing.assert_array_equal(data["freq"], numpy.full(3, 1000.0))
+    numpy.testing.assert_array_equal(data["duty_cycle"], numpy.full(3, 0.25))
+
+
+def test___ctr_freq_task___read_single_sample_as_numpy___returns_namedtuple(
+    task: Task, interpreter: Mock
+):
+    _expect_ci_channel(interpreter, "Dev1/ctr0", UsageTypeCI.PULSE_FREQ)
+    _expect_read_ctr_freq(interpreter, 1000.0, 0.25)
+
+    data = task.read(as_numpy=True)
+
+    assert data == CtrFreq(freq=1000.0, duty_cycle=0.25)
+
+
+def test___multi_channel_ctr_freq_task___read_single_sample_as_numpy___returns_structured_array(
+    task: Task, interpreter: Mock
+):
+    _expect_ci_channel(interpreter, "Dev1/ctr0:1", UsageTypeCI.PULSE_FREQ)
+    _expect_read_ctr_freq(interpreter, 1000.0, 0.25)
+
+    data = task.read(as_numpy=True)
+
+    assert data.shape == (2,)
+    assert data.dtype.names == CtrFreq._fields
+    numpy.testing.assert_array_equal(data["freq"], numpy.full(2, 1000.0))
+
+
+def test___ctr_freq_task___read_many_samples___returns_namedtuples(task: Task, interpreter: Mock):
+    _expect_ci_channel(interpreter, "Dev1/ctr0", UsageTypeCI.PULSE_FREQ)
+    _expect_read_ctr_freq(interpreter, 1000.0, 0.25)
+
+    data = task.read(number_of_samples_per_channel=2)
+
+    assert data == [CtrFreq(freq=1000.0, duty_cycle=0.25)] * 2
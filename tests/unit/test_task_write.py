@@ -0,0 +1,179 @@
+from typing import List
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import Task
+from nidaqmx.constants import ChannelType, UsageTypeCO
+from nidaqmx.types import CtrFreq, CtrTick, CtrTime
+from nidaqmx.utils import flatten_channel_string
+
+
+def _expect_co_channels(
+    interpreter: Mock, channel_names: List[str], output_type: UsageTypeCO
+) -> None:
+    task_attributes = {0x1276: "MyTask", 0x1273: flatten_channel_string(channel_names)}
+    interpreter.get_task_attribute_string.side_effect = lambda task, attr: task_attributes[attr]
+    chan_attributes = {0x187F: ChannelType.COUNTER_OUTPUT.value, 0x18B5: output_type.value}
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task, channel, attribute: chan_attributes[attribute]
+    )
+
+
+def test___ctr_freq_task___write_structured_array___arrays_passed_to_write_ctr_freq(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_FREQUENCY)
+    data = numpy.zeros(4, dtype=[("freq", numpy.float64), ("duty_cycle", numpy.float64)])
+    data["freq"] = [1000.0, 2000.0, 3000.0, 4000.0]
+    data["duty_cycle"] = 0.5
+    interpreter.write_ctr_freq.return_value = 4
+
+    samples_written = task.write(data)
+
+    assert samples_written == 4
+    args = interpreter.write_ctr_freq.call_args.args
+    assert args[1:3] == (4, False)
+    numpy.testing.assert_array_equal(args[5], data["freq"])
+    numpy.testing.assert_array_equal(args[6], data["duty_cycle"])
+
+
+def test___ctr_time_task___write_tuple_of_arrays___arrays_passed_without_copy(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_TIME)
+    high_times = numpy.full(1000, 0.001)
+    low_times = numpy.full(1000, 0.002)
+
+    task.write(CtrTime(high_time=high_times, low_time=low_times))
+
+    args = interpreter.write_ctr_time.call_args.args
+    assert args[1] == 1000
+    assert args[5] is high_times
+    assert args[6] is low_times
+
+
+def test___ctr_ticks_task___write_tuple_of_arrays___arrays_converted_to_uint32(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_TICKS)
+
+    task.write((numpy.array([10, 20]), numpy.array([30, 40])))
+
+    args = interpreter.write_ctr_ticks.call_args.args
+    assert args[5].dtype == numpy.uint32
+    numpy.testing.assert_array_equal(args[5], [10, 20])
+    numpy.testing.assert_array_equal(args[6], [30, 40])
+
+
+def test___multi_channel_ctr_freq_task___write_tuple_of_arrays___one_sample_per_channel(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0", "Dev1/ctr1"], UsageTypeCO.PULSE_FREQUENCY)
+
+    task.write((numpy.array([1000.0, 2000.0]), numpy.array([0.25, 0.75])))
+
+    args = interpreter.write_ctr_freq.call_args.args
+    assert args[1:3] == (1, True)
+
+
+def test___multi_channel_ctr_freq_task___write_wrong_number_of_channels___raises_daq_error(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0", "Dev1/ctr1"], UsageTypeCO.PULSE_FREQUENCY)
+
+    with pytest.raises(nidaqmx.DaqError):
+        task.write((numpy.array([1000.0, 2000.0, 3000.0]), numpy.array([0.25, 0.5, 0.75])))
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "high_ticks",
+    [
+        pytest.param(numpy.array([10.5, 20.0]), id="float"),
+        pytest.param(numpy.array([-1, 20]), id="negative"),
+        pytest.param(numpy.array([2**32, 20]), id="too_large"),
+    ],
+)
+def test___ctr_ticks_task___write_invalid_ticks___raises_value_error(
+    task: Task, interpreter: Mock, high_ticks
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_TICKS)
+
+    with pytest.raises(ValueError):
+        task.write((high_ticks, numpy.array([30, 40])))
+
+    interpreter.write_ctr_ticks.assert_not_called()
+
+
+def test___ctr_freq_task___write_mismatched_arrays___raises_daq_error(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_FREQUENCY)
+
+    with pytest.raises(nidaqmx.DaqError):
+        task.write((numpy.array([1000.0, 2000.0]), numpy.array([0.5])))
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+def test___ctr_ticks_task___write_list_of_namedtuples___arrays_passed_to_write_ctr_ticks(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_TICKS)
+
+    task.write([CtrTick(high_tick=10, low_tick=30), CtrTick(high_tick=20, low_tick=40)])
+
+    args = interpreter.write_ctr_ticks.call_args.args
+    numpy.testing.assert_array_equal(args[5], [10, 20])
+    numpy.testing.assert_array_equal(args[6], [30, 40])
+
+
+def test___ctr_freq_task___write_scalar_namedtuple___auto_start_defaults_to_true(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_FREQUENCY)
+
+    task.write(CtrFreq(freq=1000.0, duty_cycle=0.5))
+
+    args = interpreter.write_ctr_freq.call_args.args
+    assert args[1:3] == (1, True)
+
+
+def test___ctr_freq_task___write_structured_array_with_wrong_fields___raises_daq_error(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_FREQUENCY)
+    data = numpy.zeros(4, dtype=[("high_time", numpy.float64), ("low_time", numpy.float64)])
+
+    with pytest.raises(nidaqmx.DaqError) as exc_info:
+        task.write(data)
+
+    assert "freq, duty_cycle" in exc_info.value.args[0]
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+def test___ctr_freq_task___write_zero_dimensional_arrays___raises_daq_error(
+    task: Task, interpreter: Mock
+):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_FREQUENCY)
+
+    with pytest.raises(nidaqmx.DaqError):
+        task.write((numpy.array(1000.0), numpy.array(0.5)))
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+def test___ctr_freq_task___write_twice___output_type_queried_once(task: Task, interpreter: Mock):
+    _expect_co_channels(interpreter, ["Dev1/ctr0"], UsageTypeCO.PULSE_FREQUENCY)
+
+    task.write(CtrFreq(freq=1000.0, duty_cycle=0.5))
+    task.write((numpy.array([1000.0, 2000.0]), numpy.array([0.25, 0.75])))
+
+    output_type_queries = [
+        call for call in interpreter.get_chan_attribute_int32.call_args_list if call[0][2] == 0x18B5
+    ]
+    assert len(output_type_queries) == 1
@@ -0,0 +1,121 @@
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import Mock
+
+import numpy
+
+from nidaqmx import Task
+from nidaqmx.tdms import TdmsWriter
+from tests.unit._task_utils import expect_ai_channels
+
+_TDS_TYPES = {0x02: numpy.int16, 0x0A: numpy.float64}
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int = 0) -> None:
+        self.data = data
+        self.offset = offset
+
+    def unpack(self, fmt: str) -> Tuple[Any, ...]:
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def string(self) -> str:
+        (length,) = self.unpack("<I")
+        value = self.data[self.offset : self.offset + length].decode("utf-8")
+        self.offset += length
+        return value
+
+
+def _read_tdms(path: Path) -> Tuple[List[int], Dict[str, Dict[str, Any]], Dict[str, numpy.ndarray]]:
+    """Parse the subset of TDMS that TdmsWriter writes."""
+    data = path.read_bytes()
+    tocs = []
+    properties: Dict[str, Dict[str, Any]] = {}
+    indexes: Dict[str, Tuple[int, int]] = {}
+    samples: Dict[str, List[numpy.ndarray]] = {}
+    offset = 0
+    while offset < len(data):
+        tag, toc, version, next_segment_offset, raw_data_offset = struct.unpack_from(
+            "<4sIIQQ", data, offset
+        )
+        assert (tag, version) == (b"TDSm", 4713)
+        tocs.append(toc)
+        reader = _Reader(data, offset + 28)
+        if toc & (1 << 1):
+            (number_of_objects,) = reader.unpack("<I")
+            for _ in range(number_of_objects):
+                path_name = reader.string()
+                (index_length,) = reader.unpack("<I")
+                if index_length == 20:
+                    data_type, _, number_of_values = reader.unpack("<IIQ")
+                    indexes[path_name] = (data_type, number_of_values)
+                    samples.setdefault(path_name, [])
+                (number_of_properties,) = reader.unpack("<I")
+                for _ in range(number_of_properties):
+                    name = reader.string()
+                    (data_type,) = reader.unpack("<I")
+                    if data_type == 0x20:
+                        value: Any = reader.string()
+                    elif data_type == 0x0A:
+                        (value,) = reader.unpack("<d")
+                    else:
+                        (value,) = reader.unpack("<i")
+                    properties.setdefault(path_name, {})[name] = value
+        raw_offset = offset + 28 + raw_data_offset
+        for path_name in samples:
+            data_type, number_of_values = indexes[path_name]
+            channel_samples = numpy.frombuffer(
+                data, _TDS_TYPES[data_type], number_of_values, raw_offset
+            )
+            samples[path_name].append(channel_samples)
+            raw_offset += channel_samples.nbytes
+        offset += 28 + next_segment_offset
+        assert raw_offset == offset
+    return tocs, properties, {name: numpy.concatenate(values) for name, values in samples.items()}
+
+
+def test___tdms_writer___write_chunks___samples_appended_to_channels(tmp_path: Path):
+    path = tmp_path / "capture.tdms"
+
+    with TdmsWriter(path, ["ai0", "ai1"], "Group", sample_rate=1000.0) as tdms_writer:
+        tdms_writer.write(numpy.array([[0.0, 1.0, 2.0], [10.0, 11.0, 12.0]]))
+        tdms_writer.write(numpy.array([[3.0, 4.0, 5.0], [13.0, 14.0, 15.0]]))
+        tdms_writer.write(numpy.array([[6.0], [16.0]]))
+
+    tocs, properties, samples = _read_tdms(path)
+    # Only the first segment lists the objects; only a change in the number of
+    # samples needs new raw data indexes.
+    assert tocs == [0b1110, 0b1000, 0b1010]
+    numpy.testing.assert_array_equal(samples["/'Group'/'ai0'"], numpy.arange(7))
+    numpy.testing.assert_array_equal(samples["/'Group'/'ai1'"], numpy.arange(10, 17))
+    assert properties["/'Group'/'ai0'"]["wf_increment"] == 0.001
+
+
+def test___ai_task___tdms_writer_for_task___unscaled_samples_written_with_scaling(
+    task: Task, interpreter: Mock, tmp_path: Path
+):
+    expect_ai_channels(interpreter, ["Dev1/ai0", "Dev1/ai1"])
+    interpreter.get_chan_attribute_double_array.side_effect = lambda task, channel, attribute: {
+        "Dev1/ai0": [0.0, 0.5],
+        "Dev1/ai1": [1.0, 2.0, 3.0],
+    }[channel]
+    path = tmp_path / "capture.tdms"
+
+    with TdmsWriter.for_task(path, task) as tdms_writer:
+        tdms_writer.write(numpy.array([[1, 2], [3, 4]], dtype=numpy.int16))
+
+    _, properties, samples = _read_tdms(path)
+    assert samples["/'MyTask'/'Dev1/ai1'"].dtype == numpy.int16
+    numpy.testing.assert_array_equal(samples["/'MyTask'/'Dev1/ai1'"], [3, 4])
+    assert properties["/'MyTask'/'Dev1/ai1'"] == {
+        "NI_Number_Of_Scales": 1,
+        "NI_Scaling_Status": "unscaled",
+        "NI_Scale[0]_Scale_Type": "Polynomial",
+        "NI_Scale[0]_Polynomial_Coefficients_Size": 3,
+        "NI_Scale[0]_Polynomial_Coefficients[0]": 1.0,
+        "NI_Scale[0]_Polynomial_Coefficients[1]": 2.0,
+        "NI_Scale[0]_Polynomial_Coefficients[2]": 3.0,
+    }